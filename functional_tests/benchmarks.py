@@ -0,0 +1,394 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks over the geometry used by the functional tests.
+
+Each benchmark times one sweep of an operation (e.g. ``Curve.intersect``)
+over every case in a corpus:
+
+* The curves (and intersection points) in ``candidate_curves``
+* The pairs of surfaces in ``test_surface_surface``
+* The surfaces and points in ``test_surface_locate``
+
+The results are written as JSON so that two runs (e.g. before and after
+an upgrade) can be compared with ``--baseline``.
+
+The benchmarks can be run with either the compiled speedups or the pure
+Python implementation (``--backend python``). The backend is selected
+with :func:`bezier.backend.use`, so any backend added with
+:func:`bezier.backend.register_kernel` can also be benchmarked.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import argparse
+import functools
+import json
+import platform
+import re
+import sys
+import timeit
+
+import numpy as np
+import six
+
+from bezier import backend as backend_mod
+from bezier import curve as curve_mod
+import candidate_curves
+import test_surface_locate
+import test_surface_surface
+
+
+MIN_SWEEP_TIME = 0.1
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_SLOWDOWN = 1.25
+SURFACE_PAIR_PATTERN = re.compile(r'^test_surfaces(\w+)_and_(\w+)$')
+NUM_EVALUATE = 64
+
+
+def get_parser():
+    """Create a command line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: An argument parser for the benchmarks.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the functional test corpora.')
+    parser.add_argument(
+        '--backend', default=backend_mod.SPEEDUP,
+        help=('The backend to use, e.g. the compiled speedups or the '
+              'pure Python implementation.'))
+    parser.add_argument(
+        '--output', help='File to write the (JSON) results to.')
+    parser.add_argument(
+        '--baseline',
+        help='Results (from ``--output``) of a previous run to compare to.')
+    parser.add_argument(
+        '--max-slowdown', dest='max_slowdown', type=float,
+        default=DEFAULT_MAX_SLOWDOWN,
+        help=('Fail if any benchmark is slower than the baseline by '
+              'more than this factor.'))
+    parser.add_argument(
+        '--repeat', type=int, default=DEFAULT_REPEAT,
+        help='The number of times to repeat each timing.')
+    parser.add_argument(
+        '--filter', dest='name_filter', default='',
+        help='Only run the benchmarks containing this substring.')
+    return parser
+
+
+def _intersect_all(pairs, strategy):
+    """Intersect every pair of shapes.
+
+    Args:
+        pairs (List[Tuple[object, object]]): Pairs of curves or surfaces.
+        strategy (.IntersectionStrategy): The intersection strategy.
+    """
+    for shape1, shape2 in pairs:
+        shape1.intersect(shape2, strategy=strategy)
+
+
+def _working_pairs(pairs, strategy):
+    """Filter out pairs that can't be intersected with a strategy.
+
+    Some of the functional tests are for known failures (e.g. parallel
+    line segments), which are not useful to time.
+
+    Args:
+        pairs (List[Tuple[object, object]]): Pairs of curves or surfaces.
+        strategy (.IntersectionStrategy): The intersection strategy.
+
+    Returns:
+        List[Tuple[object, object]]: The pairs that can be intersected.
+    """
+    working = []
+    for shape1, shape2 in pairs:
+        try:
+            shape1.intersect(shape2, strategy=strategy)
+        except (NotImplementedError, ValueError):
+            continue
+        working.append((shape1, shape2))
+
+    return working
+
+
+def _locate_all(shape_points):
+    """Locate every point on a shape.
+
+    Args:
+        shape_points (List[Tuple[object, numpy.ndarray]]): Pairs of a
+            curve or surface and a point.
+    """
+    for shape, point in shape_points:
+        shape.locate(point)
+
+
+def _subdivide_all(shapes):
+    """Subdivide every shape.
+
+    Args:
+        shapes (List[object]): Curves or surfaces.
+    """
+    for shape in shapes:
+        # NOTE: ``_subdivide`` skips the (optional) subdivision cache.
+        shape._subdivide()  # pylint: disable=protected-access
+
+
+def _elevate_all(shapes):
+    """Degree-elevate every shape.
+
+    Args:
+        shapes (List[object]): Curves or surfaces.
+    """
+    for shape in shapes:
+        shape.elevate()
+
+
+def _evaluate_curves(curves, s_vals):
+    """Evaluate every curve at the same parameters.
+
+    Args:
+        curves (List[.Curve]): The curves.
+        s_vals (numpy.ndarray): The parameters.
+    """
+    for curve in curves:
+        curve.evaluate_multi(s_vals)
+
+
+def _evaluate_surfaces(surfaces, param_vals):
+    """Evaluate every surface at the same parameters.
+
+    Args:
+        surfaces (List[.Surface]): The surfaces.
+        param_vals (numpy.ndarray): The parameters.
+    """
+    for surface in surfaces:
+        surface.evaluate_cartesian_multi(param_vals)
+
+
+def surface_pairs(module):
+    """Get the pairs of surfaces intersected by the functional tests.
+
+    The pairs are determined by the test names, e.g.
+    ``test_surfaces1Q_and_3Q`` intersects ``SURFACE1Q`` and ``SURFACE3Q``.
+
+    Args:
+        module (module): The ``test_surface_surface`` module.
+
+    Returns:
+        List[Tuple[.Surface, .Surface]]: The pairs (sorted by test name).
+    """
+    pairs = []
+    for name in sorted(dir(module)):
+        match = SURFACE_PAIR_PATTERN.match(name)
+        if match is None:
+            continue
+        id1, id2 = match.groups()
+        pairs.append((
+            getattr(module, 'SURFACE' + id1),
+            getattr(module, 'SURFACE' + id2),
+        ))
+
+    return pairs
+
+
+def get_benchmarks():
+    """Get the benchmarks over each corpus.
+
+    Returns:
+        List[Tuple[str, int, Callable[[], None]]]: Triples of the name of
+        each benchmark, the number of cases in it and a function that runs
+        one sweep over every case.
+    """
+    # pylint: disable=too-many-locals
+    geometric = curve_mod.IntersectionStrategy.geometric
+    algebraic = curve_mod.IntersectionStrategy.algebraic
+
+    curves = [curve for curve in candidate_curves.CURVES if curve is not None]
+    curve_pairs = [
+        (candidate_curves.CURVES[id1], candidate_curves.CURVES[id2])
+        for id1, id2 in sorted(candidate_curves.INTERSECTION_INFO)
+    ]
+    curve_points = []
+    for (id1, _), info in sorted(
+            six.iteritems(candidate_curves.INTERSECTION_INFO)):
+        curve = candidate_curves.CURVES[id1]
+        for row in six.moves.xrange(info.shape[0]):
+            curve_points.append((curve, np.asfortranarray(info[[row], 2:])))
+
+    pairs = surface_pairs(test_surface_surface)
+    surfaces = []
+    for pair in pairs:
+        for surface in pair:
+            if not any(surface is seen for seen in surfaces):
+                surfaces.append(surface)
+    locate_surfaces = (
+        test_surface_locate.SURFACE1, test_surface_locate.SURFACE2,
+        test_surface_locate.SURFACE3, test_surface_locate.SURFACE4)
+    surface_points = [
+        (surface, test_surface_locate.POINTS[[index], :])
+        for surface in locate_surfaces
+        for index in six.moves.xrange(test_surface_locate.POINTS.shape[0])
+    ]
+
+    s_vals = np.linspace(0.0, 1.0, NUM_EVALUATE)
+    param_vals = np.asfortranarray(
+        np.column_stack([s_vals, 0.5 * (1.0 - s_vals)]))
+
+    geometric_curves = _working_pairs(curve_pairs, geometric)
+    algebraic_curves = _working_pairs(curve_pairs, algebraic)
+    geometric_surfaces = _working_pairs(pairs, geometric)
+    return [
+        ('curve.intersect.geometric', len(geometric_curves),
+         functools.partial(_intersect_all, geometric_curves, geometric)),
+        ('curve.intersect.algebraic', len(algebraic_curves),
+         functools.partial(_intersect_all, algebraic_curves, algebraic)),
+        ('curve.locate', len(curve_points),
+         functools.partial(_locate_all, curve_points)),
+        ('curve.subdivide', len(curves),
+         functools.partial(_subdivide_all, curves)),
+        ('curve.evaluate_multi', len(curves),
+         functools.partial(_evaluate_curves, curves, s_vals)),
+        ('curve.elevate', len(curves),
+         functools.partial(_elevate_all, curves)),
+        ('surface.intersect.geometric', len(geometric_surfaces),
+         functools.partial(_intersect_all, geometric_surfaces, geometric)),
+        ('surface.locate', len(surface_points),
+         functools.partial(_locate_all, surface_points)),
+        ('surface.subdivide', len(surfaces),
+         functools.partial(_subdivide_all, surfaces)),
+        ('surface.evaluate_cartesian_multi', len(surfaces),
+         functools.partial(_evaluate_surfaces, surfaces, param_vals)),
+        ('surface.elevate', len(surfaces),
+         functools.partial(_elevate_all, surfaces)),
+    ]
+    # pylint: enable=too-many-locals
+
+
+def time_sweep(sweep, repeat):
+    """Time a sweep over a corpus.
+
+    The sweep is run enough times (``number``) that each timing takes at
+    least :data:`MIN_SWEEP_TIME` and the best of ``repeat`` timings is
+    used, as recommended by :mod:`timeit`.
+
+    Args:
+        sweep (Callable[[], None]): Runs one sweep over a corpus.
+        repeat (int): The number of times to repeat the timing.
+
+    Returns:
+        Tuple[float, int]: The (best) time for one sweep, in seconds, and
+        the number of sweeps in each timing.
+    """
+    timer = timeit.Timer(sweep)
+    number = 1
+    while timer.timeit(number=number) < MIN_SWEEP_TIME:
+        number *= 2
+
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number, number
+
+
+def run_benchmarks(backend, repeat, name_filter):
+    """Run the benchmarks.
+
+    Args:
+        backend (str): The backend being benchmarked.
+        repeat (int): The number of times to repeat each timing.
+        name_filter (str): Only run the benchmarks containing this
+            substring.
+
+    Returns:
+        dict: The results, along with information about the environment.
+    """
+    results = {}
+    for name, num_cases, sweep in get_benchmarks():
+        if name_filter not in name:
+            continue
+        seconds, number = time_sweep(sweep, repeat)
+        results[name] = {
+            'cases': num_cases,
+            'number': number,
+            'seconds': seconds,
+        }
+        print('{:<36} {:>4d} cases {:>12.3f} us / sweep'.format(
+            name, num_cases, 1e6 * seconds))
+
+    return {
+        'backend': backend,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(current, baseline, max_slowdown):
+    """Compare results to the results of a previous run.
+
+    Args:
+        current (dict): The results of the current run.
+        baseline (dict): The results of the previous run.
+        max_slowdown (float): The factor that a benchmark can be slower
+            than the baseline before it is considered a regression.
+
+    Returns:
+        List[str]: The names of the benchmarks that regressed.
+    """
+    if current['backend'] != baseline['backend']:
+        print('Warning: comparing backend {!r} to {!r}'.format(
+            current['backend'], baseline['backend']))
+
+    regressions = []
+    for name, result in sorted(six.iteritems(current['results'])):
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['seconds'] / previous['seconds']
+        flag = ''
+        if ratio > max_slowdown:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('{:<36} {:>8.3f}x{}'.format(name, ratio, flag))
+
+    return regressions
+
+
+def main():
+    """Run the benchmarks from the command line.
+
+    Returns:
+        int: The exit status (non-zero if there were regressions).
+    """
+    args = get_parser().parse_args()
+    backend_mod.use(args.backend)
+    current = run_benchmarks(args.backend, args.repeat, args.name_filter)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file_obj:
+            json.dump(current, file_obj, indent=2, sort_keys=True)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, 'r') as file_obj:
+        baseline = json.load(file_obj)
+    regressions = compare(current, baseline, args.max_slowdown)
+    if regressions:
+        print('Regressions: {}'.format(', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
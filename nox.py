@@ -116,6 +116,26 @@ def functional(session, python_version):
     session.run(*run_args, env=env)
 
 
+@nox.session
+@nox.parametrize('backend', ['speedup', 'python'])
+def benchmark(session, backend):
+    session.interpreter = SINGLE_INTERP
+    # Install all dependencies.
+    session.install(NUMPY, 'six')
+    # Install this package.
+    session.install('.')
+
+    # Run the benchmarks over the functional test corpora.
+    output = get_path('benchmark_{}.json'.format(backend))
+    run_args = [
+        'python', get_path('functional_tests', 'benchmarks.py'),
+        '--backend', backend,
+        '--output', output,
+    ]
+    run_args += session.posargs
+    session.run(*run_args, env=functional_env())
+
+
 @nox.session
 def docs(session):
     session.interpreter = SINGLE_INTERP
@@ -36,8 +36,14 @@ Submodules
 
 .. toctree::
 
+   bezier.backend
+   bezier.basis
+   bezier.collection
    bezier.curve
+   bezier.curve_index
    bezier.curved_polygon
+   bezier.stats
+   bezier.storage
    bezier.surface
 
 """
@@ -53,8 +59,14 @@ Submodules
 
 .. toctree::
 
+   bezier.backend
+   bezier.basis
+   bezier.collection
    bezier.curve
+   bezier.curve_index
    bezier.curved_polygon
+   bezier.stats
+   bezier.storage
    bezier.surface
 """
 
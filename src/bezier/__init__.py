@@ -22,9 +22,22 @@ Plotting utilities will also be provided.
    :trim:
 """
 
+from bezier.basis import BernsteinBasis
+from bezier.collection import CurveCollection
+from bezier.collection import SurfaceCollection
 from bezier.curve import Curve
+from bezier.curve import curves_from_buffer
+from bezier.curve import intersect_many
+from bezier.curve import intersect_network
+from bezier.curve_index import CurveIndex
 from bezier.curved_polygon import CurvedPolygon
+from bezier.curved_polygon import tessellate_polygons
+from bezier.storage import save_shapes
+from bezier.storage import ShapeLibrary
+from bezier.surface import evaluate_surfaces
 from bezier.surface import Surface
+from bezier.surface import surfaces_from_buffer
+from bezier.surface import tessellate_surfaces
 try:
     import bezier._speedup  # noqa: F401
     _HAS_SPEEDUP = True
@@ -33,7 +46,20 @@ except ImportError:  # pragma: NO COVER
 
 
 __all__ = [
+    'BernsteinBasis',
     'Curve',
+    'CurveIndex',
+    'CurveCollection',
     'CurvedPolygon',
+    'ShapeLibrary',
     'Surface',
+    'SurfaceCollection',
+    'curves_from_buffer',
+    'evaluate_surfaces',
+    'intersect_many',
+    'intersect_network',
+    'save_shapes',
+    'surfaces_from_buffer',
+    'tessellate_polygons',
+    'tessellate_surfaces',
 ]
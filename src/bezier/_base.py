@@ -17,6 +17,103 @@
 """
 
 
+import collections
+
+from bezier import _helpers
+
+
+_MAX_CACHE_ENTRIES = 1024
+
+
+class SubdivisionCache(object):
+    """Memoized subdivision hierarchy for a B |eacute| zier shape.
+
+    Each node in the hierarchy is identified by its ``level`` (the number
+    of subdivisions from the root) and its ``index`` among all nodes at
+    that level. The sub-shapes produced by subdividing a node are stored
+    together and the least recently used entry is evicted once there are
+    more than ``max_entries``.
+
+    Args:
+        max_entries (Optional[int]): The maximum number of subdivided nodes
+            to keep in the cache.
+
+    Raises:
+        ValueError: If ``max_entries`` is not positive.
+    """
+
+    __slots__ = ('_max_entries', '_entries')
+
+    def __init__(self, max_entries=_MAX_CACHE_ENTRIES):
+        if max_entries < 1:
+            raise ValueError(
+                'Cache must allow at least one entry', max_entries)
+        self._max_entries = max_entries
+        self._entries = collections.OrderedDict()
+
+    @property
+    def max_entries(self):
+        """int: The maximum number of entries in the cache."""
+        return self._max_entries
+
+    def __len__(self):
+        """Get the number of entries in the cache.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check if a node has been subdivided and cached.
+
+        Args:
+            key (Tuple[int, int]): The ``level`` and ``index`` of a node.
+
+        Returns:
+            bool: Indicating if ``key`` is in the cache.
+        """
+        return key in self._entries
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        self._entries.clear()
+
+    def subdivide(self, level, index, subdivide):
+        """Get the (possibly cached) sub-shapes of a node.
+
+        If the node is not in the cache, ``subdivide`` is used to compute
+        the sub-shapes and each sub-shape is linked to this cache so that
+        subdividing it also uses the cache.
+
+        Args:
+            level (int): The level of the node being subdivided.
+            index (int): The index of the node (within ``level``).
+            subdivide (Callable[[], tuple]): Computes the sub-shapes
+                of the node.
+
+        Returns:
+            tuple: The sub-shapes of the node.
+        """
+        key = (level, index)
+        children = self._entries.pop(key, None)
+        if children is None:
+            children = subdivide()
+            num_children = len(children)
+            for child_index, child in enumerate(children):
+                # pylint: disable=protected-access
+                child._subdivision = (
+                    self, level + 1, num_children * index + child_index)
+                # pylint: enable=protected-access
+
+        # NOTE: Re-inserting the entry marks it as most recently used.
+        self._entries[key] = children
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        return children
+
+
 class Base(object):
     """Base shape object.
 
@@ -32,7 +129,7 @@ class Base(object):
         ValueError: If the ``nodes`` are not 2D.
     """
 
-    __slots__ = ('_dimension', '_nodes')
+    __slots__ = ('_dimension', '_nodes', '_subdivision', '_bbox')
     _degree = -1
 
     def __init__(self, nodes, _copy=True):
@@ -46,6 +143,8 @@ class Base(object):
             self._nodes = nodes.copy(order='F')
         else:
             self._nodes = nodes
+        self._subdivision = None
+        self._bbox = None
 
     @property
     def degree(self):
@@ -66,6 +165,69 @@ class Base(object):
         """numpy.ndarray: The nodes that define the current shape."""
         return self._nodes.copy(order='F')
 
+    @property
+    def subdivision_cache(self):
+        """Optional[SubdivisionCache]: The cache used when subdividing.
+
+        This is :data:`None` unless it has been enabled via
+        :meth:`enable_subdivision_cache` (on the current shape or on the
+        shape that it was subdivided from).
+        """
+        if self._subdivision is None:
+            return None
+        return self._subdivision[0]
+
+    def enable_subdivision_cache(self, max_entries=_MAX_CACHE_ENTRIES):
+        """Memoize the sub-shapes produced by subdividing the current shape.
+
+        Once enabled, subdividing the current shape (or any of the
+        sub-shapes it produces) returns the same sub-shapes rather than
+        computing new ones, which makes repeated queries on long-lived
+        shapes (e.g. ``locate``) cheaper.
+
+        .. note::
+
+           While the cache is enabled, ``locate`` (and ``locate_multi``)
+           and curve-curve ``intersect`` use the pure Python subdivision
+           process even if the compiled speedups are available, since
+           it is the only one that subdivides via ``subdivide``.
+
+        Args:
+            max_entries (Optional[int]): The maximum number of subdivided
+                shapes to keep in the cache. The least recently used entries
+                are evicted first.
+
+        Returns:
+            SubdivisionCache: The newly created cache.
+        """
+        cache = SubdivisionCache(max_entries=max_entries)
+        self._subdivision = (cache, 0, 0)
+        return cache
+
+    def disable_subdivision_cache(self):
+        """Stop memoizing the sub-shapes of the current shape."""
+        self._subdivision = None
+
+    def _get_bbox(self):
+        """Get the (cached) bounding box of the current shape.
+
+        The nodes of a shape don't change after it has been created, so
+        the bounding box is only computed (via :func:`._helpers.bbox`) the
+        first time it is needed.
+
+        .. note::
+
+           This assumes (but doesn't check) that the shape is
+           two-dimensional.
+
+        Returns:
+            Tuple[float, float, float, float]: The left, right,
+            bottom and top bounds for the box.
+        """
+        if self._bbox is None:
+            self._bbox = _helpers.bbox(self._nodes)
+        return self._bbox
+
     def __repr__(self):
         """Representation of current object.
 
@@ -74,3 +236,36 @@ class Base(object):
         """
         return '<{} (degree={:d}, dimension={:d})>'.format(
             self.__class__.__name__, self._degree, self._dimension)
+
+
+def node_views(nodes, num_nodes):
+    """Split a buffer of nodes into (non-copied) views, one per shape.
+
+    Args:
+        nodes (numpy.ndarray): The ``(K * num_nodes) x D`` buffer of
+            nodes, i.e. the nodes of ``K`` shapes stacked on top of each
+            other.
+        num_nodes (int): The number of nodes in each shape.
+
+    Returns:
+        List[numpy.ndarray]: The ``K`` views (as ``num_nodes x D``
+        arrays) into ``nodes``.
+
+    Raises:
+        ValueError: If ``nodes`` is not 2D.
+        ValueError: If the number of rows in ``nodes`` is not a multiple
+            of ``num_nodes``.
+    """
+    if nodes.ndim != 2:
+        raise ValueError('Nodes must be 2-dimensional, not', nodes.ndim)
+
+    total_nodes, _ = nodes.shape
+    if total_nodes % num_nodes != 0:
+        raise ValueError(
+            'Number of nodes in buffer is not a multiple of the number '
+            'of nodes in each shape', total_nodes, num_nodes)
+
+    return [
+        nodes[start:start + num_nodes, :]
+        for start in range(0, total_nodes, num_nodes)
+    ]
@@ -28,6 +28,9 @@ except ImportError:  # pragma: NO COVER
     _scipy_int = None
 
 from bezier import _helpers
+from bezier import backend as backend_mod
+from bezier import basis as basis_mod
+from bezier import stats as stats_mod
 try:
     from bezier import _speedup
 except ImportError:  # pragma: NO COVER
@@ -36,6 +39,20 @@ except ImportError:  # pragma: NO COVER
 
 _MAX_LOCATE_SUBDIVISIONS = 20
 _LOCATE_STD_CAP = 0.5**20
+# NOTE: This is the sentinel used by the compiled ``locate_point_curve``.
+_LOCATE_MISS = -1.0
+_MAX_FLATTEN_SUBDIVISIONS = 20
+# Initial size of the buffer used by the compiled ``flatten_curve``.
+_FLATTEN_MAX_POINTS = 64
+# Process-wide cache of subdivision matrices, keyed by degree.
+_SUBDIVISION_MATRICES = {}
+# Process-wide cache of degree-elevation matrices, keyed by degree.
+_ELEVATION_MATRICES = {}
+# Gauss-Legendre rule (transformed to [0, 1]) used for the lengths of
+# many curves at once.
+_LENGTH_POINTS, _LENGTH_WEIGHTS = np.polynomial.legendre.leggauss(32)
+_LENGTH_POINTS = 0.5 * (_LENGTH_POINTS + 1.0)
+_LENGTH_WEIGHTS = 0.5 * _LENGTH_WEIGHTS
 _FLOAT64 = np.float64  # pylint: disable=no-member
 _REDUCE_THRESHOLD = 0.5**26  # sqrt(machine precision)
 # Projections onto the space of degree-elevated nodes.
@@ -93,6 +110,18 @@ _REDUCTION3 = np.asfortranarray([
     [ -1.5,   6.0, -9.0,   6.0, 103.5],  # noqa: E201
 ])
 _REDUCTION_DENOM3 = 105.0
+_PROJECTIONS = {
+    2: (_PROJECTION0, _PROJ_DENOM0),
+    3: (_PROJECTION1, _PROJ_DENOM1),
+    4: (_PROJECTION2, _PROJ_DENOM2),
+    5: (_PROJECTION3, _PROJ_DENOM3),
+}
+_REDUCTIONS = {
+    1: (_REDUCTION0, _REDUCTION_DENOM0),
+    2: (_REDUCTION1, _REDUCTION_DENOM1),
+    3: (_REDUCTION2, _REDUCTION_DENOM2),
+    4: (_REDUCTION3, _REDUCTION_DENOM3),
+}
 # pylint: enable=bad-whitespace
 
 
@@ -124,6 +153,83 @@ def make_subdivision_matrices(degree):
     return left, right
 
 
+def subdivision_matrices(degree):
+    """Get the (cached) matrices used to subdivide a curve.
+
+    The matrices are computed via :func:`make_subdivision_matrices` the
+    first time a given degree is requested and are then re-used by every
+    subsequent call. Since they are shared, they are marked read-only.
+
+    Args:
+        degree (int): The degree of the curve.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The matrices used to convert
+           the nodes into left and right nodes, respectively.
+    """
+    matrices = _SUBDIVISION_MATRICES.get(degree)
+    if matrices is None:
+        matrices = make_subdivision_matrices(degree)
+        for matrix in matrices:
+            matrix.flags.writeable = False
+        _SUBDIVISION_MATRICES[degree] = matrices
+
+    return matrices
+
+
+def subdivide_multi(nodes_stack, degree, starts, ends):
+    """Subdivide many curves (of the same degree) at once.
+
+    This is a vectorized version of :meth:`.Curve.subdivide`. The nodes of
+    both halves of every curve are computed with a single stacked matrix
+    product.
+
+    Args:
+        nodes_stack (numpy.ndarray): ``K x N x D`` array of nodes, one
+            ``N x D`` set of nodes for each curve.
+        degree (int): The degree of each of the curves.
+        starts (numpy.ndarray): The ``K`` start parameters of the curves.
+        ends (numpy.ndarray): The ``K`` end parameters of the curves.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, \
+            numpy.ndarray, numpy.ndarray]: The ``K x N x D`` nodes of the
+        left halves, the ``K x N x D`` nodes of the right halves and the
+        ``K`` start, midpoint and end parameters (the left halves span
+        ``start`` to ``midpoint``, the right halves span ``midpoint`` to
+        ``end``).
+    """
+    subdivision = np.vstack(subdivision_matrices(degree))
+    new_nodes = np.matmul(subdivision, nodes_stack)
+    midpoints = 0.5 * (starts + ends)
+    return (
+        new_nodes[:, :degree + 1, :], new_nodes[:, degree + 1:, :],
+        starts, midpoints, ends)
+
+
+def elevation_matrix(degree):
+    """Get the (cached) matrix used to degree-elevate a curve.
+
+    Since degree-elevation is linear in the nodes, the matrix is computed
+    by elevating the identity (via :func:`elevate_nodes`). As the matrix
+    is shared, it is marked read-only.
+
+    Args:
+        degree (int): The degree of the curve.
+
+    Returns:
+        numpy.ndarray: The ``(degree + 2) x (degree + 1)`` matrix that
+        converts the nodes into the nodes of the degree-elevated curve.
+    """
+    matrix = _ELEVATION_MATRICES.get(degree)
+    if matrix is None:
+        matrix = elevate_nodes(_helpers.eye(degree + 1), degree, degree + 1)
+        matrix.flags.writeable = False
+        _ELEVATION_MATRICES[degree] = matrix
+
+    return matrix
+
+
 def _evaluate_multi(nodes, s_vals):
     r"""Computes multiple points along a curve.
 
@@ -265,6 +371,40 @@ def compute_length(nodes, degree):
     return length
 
 
+def compute_length_multi(nodes_stack, degree):
+    r"""Approximately compute the lengths of many curves.
+
+    This is a vectorized version of :func:`compute_length`. Rather than
+    using adaptive quadrature for each curve, the integral
+
+    .. math::
+
+       \ell\left(B\right) =
+           \int_0^1 \| B'(s) \|_2 \, ds
+
+    is approximated with a fixed (high order) Gauss-Legendre rule, so that
+    the hodographs of all of the curves can be evaluated together. This
+    is accurate when :math:`\| B'(s) \|_2` is smooth, i.e. when none of
+    the curves have a cusp. Unlike :func:`compute_length`, SciPy is not
+    required.
+
+    Args:
+        nodes_stack (numpy.ndarray): ``K x N x D`` array of nodes, one
+            ``N x D`` set of nodes for each curve.
+        degree (int): The degree of each of the curves.
+
+    Returns:
+        numpy.ndarray: The ``K`` lengths of the curves.
+    """
+    first_deriv = degree * (nodes_stack[:, 1:, :] - nodes_stack[:, :-1, :])
+    if degree == 1:
+        return np.linalg.norm(first_deriv[:, 0, :], ord=2, axis=1)
+
+    basis = basis_mod.BernsteinBasis.cached(degree - 1, _LENGTH_POINTS)
+    speeds = np.linalg.norm(basis.evaluate_many(first_deriv), ord=2, axis=2)
+    return np.dot(speeds, _LENGTH_WEIGHTS)
+
+
 def elevate_nodes(nodes, degree, dimension):
     r"""Degree-elevate a B |eacute| zier curves.
 
@@ -425,6 +565,62 @@ def _evaluate_hodograph(s, nodes, degree):
         first_deriv, np.asfortranarray([s]))
 
 
+def _evaluate_hodograph_multi(s_vals, nodes, degree):
+    r"""Evaluate the Hodograph curves for many curves of the same degree.
+
+    Vectorized version of :func:`_evaluate_hodograph`, with one parameter
+    for each curve. Uses de Casteljau's algorithm on the forward
+    differences of every curve at once.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Args:
+        s_vals (numpy.ndarray): The ``M`` parameters (one for each curve)
+            at which the Hodographs are to be evaluated.
+        nodes (numpy.ndarray): Stack (``M x (D + 1) x N``) of the nodes
+            of the curves.
+        degree (int): The degree ``D`` of the curves.
+
+    Returns:
+        numpy.ndarray: The ``M x N`` array of points on the Hodographs.
+    """
+    first_deriv = nodes[:, 1:, :] - nodes[:, :-1, :]
+    s_vals = s_vals[:, np.newaxis, np.newaxis]
+    for _ in six.moves.xrange(degree - 1):
+        first_deriv = (
+            (1.0 - s_vals) * first_deriv[:, :-1, :] +
+            s_vals * first_deriv[:, 1:, :])
+
+    return degree * first_deriv[:, 0, :]
+
+
+def _hodograph_multi_speedup(s_vals, nodes, degree):
+    r"""Evaluate the Hodograph curves for many curves of the same degree.
+
+    .. note::
+
+       This uses the compiled ``evaluate_hodograph_multi``, which can't
+       be called with empty arrays.
+
+    Args:
+        s_vals (numpy.ndarray): The ``M`` parameters (one for each curve)
+            at which the Hodographs are to be evaluated.
+        nodes (numpy.ndarray): Stack (``M x (D + 1) x N``) of the nodes
+            of the curves.
+        degree (int): The degree ``D`` of the curves.
+
+    Returns:
+        numpy.ndarray: The ``M x N`` array of points on the Hodographs.
+    """
+    if nodes.shape[0] == 0:
+        return np.empty((0, nodes.shape[2]))
+
+    return _speedup.speedup.evaluate_hodograph_multi(s_vals, nodes, degree)
+
+
 def get_curvature(nodes, degree, tangent_vec, s):
     r"""Compute the signed curvature of a curve at :math:`s`.
 
@@ -673,7 +869,8 @@ def newton_refine(curve, point, s):
     return s + delta_s
 
 
-def locate_point(curve, point):
+@stats_mod.timed('curve.locate')
+def _locate_point(curve, point):
     r"""Locate a point on a curve.
 
     Does so by recursively subdividing the curve and rejecting
@@ -709,6 +906,9 @@ def locate_point(curve, point):
 
         candidates = next_candidates
 
+    stats = stats_mod.active()
+    if stats is not None:
+        stats.increment('locate.candidates', len(candidates))
     if not candidates:
         return None
 
@@ -722,9 +922,241 @@ def locate_point(curve, point):
             'Parameters not close enough to one another', params)
 
     s_approx = np.mean(params)
+    if stats is not None:
+        stats.increment('locate.newton_steps')
     return newton_refine(curve, point, s_approx)
 
 
+@stats_mod.timed('curve.locate')
+def _locate_point_speedup(curve, point):
+    r"""Locate a point on a curve.
+
+    .. note::
+
+       This uses a compiled version of :func:`_locate_point`, which does
+       the subdivision, bounding box checks and Newton refinement without
+       creating any intermediate :class:`.Curve` objects.
+
+    Args:
+        curve (.Curve): A B |eacute| zier curve.
+        point (numpy.ndarray): The point to locate.
+
+    Returns:
+        Optional[float]: The parameter value (:math:`s`) corresponding
+        to ``point`` or :data:`None` if the point is not on the ``curve``.
+
+    Raises:
+        ValueError: If the standard deviation of the remaining start / end
+            parameters among the subdivided intervals exceeds a given
+            threshold (e.g. :math:`2^{-20}`).
+    """
+    # pylint: disable=protected-access
+    s_approx = _speedup.speedup.locate_point_curve(
+        curve._nodes, point, curve._start, curve._end)
+    # pylint: enable=protected-access
+    if s_approx == _LOCATE_MISS:
+        return None
+
+    return s_approx
+
+
+# NOTE: Only the pure Python version subdivides via :meth:`.Curve.subdivide`,
+#       so it is used (with or without the speedup) for curves that have a
+#       subdivision cache.
+locate_point_cached = _locate_point  # pylint: disable=invalid-name
+
+
+def locate_point_cached_multi(curve, points):
+    r"""Locate many points on a curve that has a subdivision cache.
+
+    Unlike :func:`locate_point_multi`, each point is located on its own
+    via :func:`locate_point_cached`, so that every point re-uses (and
+    adds to) the cached sub-curves.
+
+    Args:
+        curve (.Curve): A B |eacute| zier curve.
+        points (numpy.ndarray): The points to locate.
+
+    Returns:
+        numpy.ndarray: The parameter values (:math:`s`) corresponding
+        to each row of ``points``, with NaN for any point that is not
+        on the ``curve``.
+
+    Raises:
+        ValueError: If the standard deviation of the remaining start / end
+            parameters for any one point exceeds a given threshold
+            (e.g. :math:`2^{-20}`).
+    """
+    result = np.full((points.shape[0],), np.nan)
+    for index in six.moves.xrange(points.shape[0]):
+        s = locate_point_cached(curve, points[[index], :])
+        if s is not None:
+            result[index] = s
+
+    return result
+
+
+def _newton_refine_multi(nodes, degree, points, s_vals):
+    r"""Perform one round of Newton's method for many points on a curve.
+
+    This is a vectorized version of :func:`newton_refine`, which
+    updates :math:`s \mapsto s + \Delta s` for every pair of point
+    and parameter at once.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of a curve.
+        degree (int): The degree of the curve.
+        points (numpy.ndarray): ``N x D`` array of points on the curve.
+        s_vals (numpy.ndarray): The ``N`` "almost" solutions to
+            :math:`B(s) = p`.
+
+    Returns:
+        numpy.ndarray: The updated values :math:`s + \\Delta s`.
+    """
+    pt_delta = points - evaluate_multi(nodes, s_vals)
+    first_deriv = nodes[1:, :] - nodes[:-1, :]
+    derivative = degree * evaluate_multi(first_deriv, s_vals)
+    delta_s = (
+        np.sum(pt_delta * derivative, axis=1) /
+        np.sum(derivative * derivative, axis=1))
+    return s_vals + delta_s
+
+
+def _locate_candidates_multi(curve, points):
+    """Find the sub-curves that may contain each of many points.
+
+    Helper for :func:`locate_point_multi`. The sub-curves are shared
+    among all of the points and each sub-curve is subdivided (at most)
+    once per round.
+
+    Args:
+        curve (.Curve): A B |eacute| zier curve.
+        points (numpy.ndarray): The points to locate.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The point
+        (i.e. the row of ``points``), start parameter and end parameter
+        of every remaining (sub-curve, point) pair.
+    """
+    # pylint: disable=protected-access
+    degree = curve._degree
+    # Each sub-curve is a "row" in the stacked arrays below.
+    sub_nodes = curve._nodes[np.newaxis, :, :]
+    starts = np.asarray([curve._start])
+    ends = np.asarray([curve._end])
+    # pylint: enable=protected-access
+    subdivision = np.vstack(subdivision_matrices(degree))
+
+    # Track every (sub-curve, point) pair that hasn't been ruled out.
+    num_points, dimension = points.shape
+    curve_ids = np.zeros((num_points,), dtype=int)
+    point_ids = np.arange(num_points)
+    for _ in six.moves.xrange(_MAX_LOCATE_SUBDIVISIONS + 1):
+        contained = _helpers.contains_nd_multi(
+            sub_nodes, points, curve_ids, point_ids)
+        point_ids = point_ids[contained]
+
+        # Only subdivide the sub-curves that still contain a point.
+        kept, curve_ids = np.unique(
+            curve_ids[contained], return_inverse=True)
+        sub_nodes = np.matmul(subdivision, sub_nodes[kept, :, :]).reshape(
+            (2 * kept.size, degree + 1, dimension))
+        midpoints = 0.5 * (starts[kept] + ends[kept])
+        starts, ends = (
+            np.column_stack([starts[kept], midpoints]).ravel(),
+            np.column_stack([midpoints, ends[kept]]).ravel())
+        # The children of sub-curve ``j`` are ``2j`` and ``2j + 1``.
+        curve_ids = np.concatenate([2 * curve_ids, 2 * curve_ids + 1])
+        point_ids = np.concatenate([point_ids, point_ids])
+
+    return point_ids, starts[curve_ids], ends[curve_ids]
+
+
+def _mean_params_multi(point_ids, pair_starts, pair_ends, num_points):
+    r"""Compute the mean start / end parameter for each of many points.
+
+    Helper for :func:`locate_point_multi`.
+
+    Args:
+        point_ids (numpy.ndarray): The point in each (sub-curve, point)
+            pair.
+        pair_starts (numpy.ndarray): The start parameter of the sub-curve
+            in each pair.
+        pair_ends (numpy.ndarray): The end parameter of the sub-curve in
+            each pair.
+        num_points (int): The number of points.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Boolean mask indicating
+        which points are in at least one pair and the mean parameter of
+        each point (NaN for points in no pair).
+
+    Raises:
+        ValueError: If the standard deviation of the start / end
+            parameters for any one point exceeds a given threshold
+            (e.g. :math:`2^{-20}`).
+    """
+    counts = 2 * np.bincount(point_ids, minlength=num_points)
+    found = counts > 0
+    totals = (
+        np.bincount(point_ids, weights=pair_starts, minlength=num_points) +
+        np.bincount(point_ids, weights=pair_ends, minlength=num_points))
+    means = np.full((num_points,), np.nan)
+    means[found] = totals[found] / counts[found]
+    deviations = (
+        (pair_starts - means[point_ids])**2 +
+        (pair_ends - means[point_ids])**2)
+    variances = np.bincount(
+        point_ids, weights=deviations, minlength=num_points)
+    std_devs = np.sqrt(variances[found] / counts[found])
+    if np.any(std_devs > _LOCATE_STD_CAP):
+        bad_index = np.flatnonzero(found)[np.argmax(std_devs)]
+        raise ValueError(
+            'Parameters not close enough to one another', bad_index)
+
+    return found, means
+
+
+def locate_point_multi(curve, points):
+    r"""Locate many points on a curve.
+
+    This is a vectorized version of :func:`locate_point`. Rather than
+    subdividing the curve once for each point, the sub-curves are shared
+    among all of the points (see :func:`_locate_candidates_multi`).
+    After the sub-curves are sufficiently small, Newton's method is
+    applied to all of the points at once.
+
+    .. note::
+
+       This assumes, but does not check, that ``points`` is ``NxD``,
+       where ``D`` is the dimension that ``curve`` is in.
+
+    Args:
+        curve (.Curve): A B |eacute| zier curve.
+        points (numpy.ndarray): The points to locate.
+
+    Returns:
+        numpy.ndarray: The parameter values (:math:`s`) corresponding
+        to each row of ``points``, with NaN for any point that is not
+        on the ``curve``.
+
+    Raises:
+        ValueError: If the standard deviation of the remaining start / end
+            parameters for any one point exceeds a given threshold
+            (e.g. :math:`2^{-20}`).
+    """
+    point_ids, pair_starts, pair_ends = _locate_candidates_multi(
+        curve, points)
+    found, result = _mean_params_multi(
+        point_ids, pair_starts, pair_ends, points.shape[0])
+    # pylint: disable=protected-access
+    result[found] = _newton_refine_multi(
+        curve._nodes, curve._degree, points[found, :],
+        np.asfortranarray(result[found]))
+    # pylint: enable=protected-access
+    return result
+
+
 def reduce_pseudo_inverse(nodes, degree):
     """Performs degree-reduction for a B |eacute| zier curve.
 
@@ -845,15 +1277,145 @@ def full_reduce(nodes):
     return nodes
 
 
+def full_reduce_degrees(nodes):
+    r"""Compute the degree of many curves after :func:`full_reduce`.
+
+    Vectorized version of the degree-elevation check in
+    :func:`_maybe_reduce`, applied repeatedly (as in :func:`full_reduce`)
+    until none of the curves can be reduced.
+
+    Args:
+        nodes (numpy.ndarray): Stack (``M x N x D``) of the nodes in the
+            curves. Each curve has degree at most four.
+
+    Returns:
+        numpy.ndarray: The ``M`` degrees of the fully degree-reduced
+        curves.
+
+    Raises:
+        NotImplementedError: If the curves are degree 5 or higher.
+    """
+    num_curves, num_nodes, _ = nodes.shape
+    if num_nodes > 5:
+        raise NotImplementedError(num_nodes)
+
+    degrees = np.zeros((num_curves,), dtype=int)
+    active = np.arange(num_curves)
+    while num_nodes > 1 and active.size > 0:
+        projection, denom = _PROJECTIONS[num_nodes]
+        reduction, reduction_denom = _REDUCTIONS[num_nodes - 1]
+        projected = np.matmul(projection, nodes) / denom
+        # NOTE: This is the relative error from ``_projection_error``.
+        error = np.sqrt(np.sum((nodes - projected)**2, axis=(1, 2)))
+        norms = np.sqrt(np.sum(nodes * nodes, axis=(1, 2)))
+        nonzero = error != 0.0
+        error[nonzero] /= norms[nonzero]
+
+        reducible = error < _REDUCE_THRESHOLD
+        degrees[active[~reducible]] = num_nodes - 1
+        active = active[reducible]
+        nodes = np.matmul(reduction, nodes[reducible]) / reduction_denom
+        num_nodes -= 1
+
+    return degrees
+
+
+def _flatten(nodes, tolerance):
+    r"""Approximate a curve by a polyline within a given tolerance.
+
+    Does so by recursively subdividing the curve (at :math:`s = 1/2`)
+    until the :func:`.linearization_error` of each sub-curve is at most
+    ``tolerance``. Since the linearization error bounds the distance
+    between a sub-curve and the line segment joining its endpoints, the
+    resulting polyline is within ``tolerance`` of the curve. Only the
+    sub-curves that are not yet flat enough are subdivided, so nearly
+    straight spans are represented by very few points.
+
+    The sub-curves are visited depth-first (left half first) so the
+    endpoints are emitted in order of increasing :math:`s`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes in the curve.
+        tolerance (float): The maximum allowed linearization error.
+
+    Returns:
+        numpy.ndarray: The ``N x D`` points of the polyline (the first and
+        last points are the endpoints of the curve).
+    """
+    # NOTE: This cyclic import need be resolved.
+    from bezier import _intersection_helpers
+
+    degree = nodes.shape[0] - 1
+    left_mat, right_mat = subdivision_matrices(degree)
+    points = [nodes[0, :]]
+    stack = [(nodes, 0)]
+    while stack:
+        current, depth = stack.pop()
+        error = _intersection_helpers.linearization_error(current, degree)
+        if error <= tolerance or depth == _MAX_FLATTEN_SUBDIVISIONS:
+            points.append(current[-1, :])
+        else:
+            # NOTE: The right half is pushed first so that the left half
+            #       is visited first.
+            stack.append(
+                (_helpers.matrix_product(right_mat, current), depth + 1))
+            stack.append(
+                (_helpers.matrix_product(left_mat, current), depth + 1))
+
+    return np.asfortranarray(np.vstack(points))
+
+
+def _flatten_speedup(nodes, tolerance):
+    r"""Approximate a curve by a polyline within a given tolerance.
+
+    .. note::
+
+       This uses a compiled version of :func:`_flatten`. The compiled
+       routine writes into a fixed size buffer (and counts any points that
+       don't fit), so it is called again with a large enough buffer if
+       the first guess is too small.
+
+    Args:
+        nodes (numpy.ndarray): The nodes in the curve.
+        tolerance (float): The maximum allowed linearization error.
+
+    Returns:
+        numpy.ndarray: The ``N x D`` points of the polyline (the first and
+        last points are the endpoints of the curve).
+    """
+    points, num_points = _speedup.speedup.flatten_curve(
+        nodes, tolerance, _FLATTEN_MAX_POINTS)
+    if num_points > _FLATTEN_MAX_POINTS:
+        points, num_points = _speedup.speedup.flatten_curve(
+            nodes, tolerance, num_points)
+
+    return np.asfortranarray(points[:num_points, :])
+
+
 # pylint: disable=invalid-name
 if _speedup is None:  # pragma: NO COVER
     evaluate_multi_barycentric = _evaluate_multi_barycentric
     evaluate_multi = _evaluate_multi
     specialize_curve = _specialize_curve
     evaluate_hodograph = _evaluate_hodograph
+    evaluate_hodograph_multi = _evaluate_hodograph_multi
+    locate_point = _locate_point
+    flatten = _flatten
 else:
     evaluate_multi_barycentric = _speedup.speedup.evaluate_curve_barycentric
     evaluate_multi = _speedup.speedup.evaluate_multi
     specialize_curve = _speedup.speedup.specialize_curve
     evaluate_hodograph = _speedup.speedup.evaluate_hodograph
+    evaluate_hodograph_multi = _hodograph_multi_speedup
+    locate_point = _locate_point_speedup
+    flatten = _flatten_speedup
 # pylint: enable=invalid-name
+backend_mod.register_defaults(__name__, {
+    'evaluate_multi_barycentric': _evaluate_multi_barycentric,
+    'evaluate_multi': _evaluate_multi,
+    'specialize_curve': _specialize_curve,
+    'evaluate_hodograph': _evaluate_hodograph,
+    'evaluate_hodograph_multi': _evaluate_hodograph_multi,
+    'locate_point': _locate_point,
+    'flatten': _flatten,
+})
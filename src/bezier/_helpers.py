@@ -15,6 +15,7 @@
 
 import numpy as np
 
+from bezier import backend as backend_mod
 try:
     from bezier import _speedup
 except ImportError:  # pragma: NO COVER
@@ -22,6 +23,7 @@ except ImportError:  # pragma: NO COVER
 
 
 _EPS = 0.5**40
+_TREE_LEAF_SIZE = 8
 
 
 def vector_close(vec1, vec2, eps=_EPS):
@@ -70,6 +72,33 @@ def vector_close(vec1, vec2, eps=_EPS):
         return np.linalg.norm(vec1[0, :] - vec2[0, :], ord=2) <= upper_bound
 
 
+def vector_close_multi(vecs1, vecs2, eps=_EPS):
+    """Checks that pairs of vectors are equal to some threshold.
+
+    This is a vectorized version of :func:`vector_close`, which compares
+    each row of ``vecs1`` to the matching row of ``vecs2``.
+
+    Args:
+        vecs1 (numpy.ndarray): ``N x D`` array of vectors.
+        vecs2 (numpy.ndarray): ``N x D`` array of vectors.
+        eps (float): Error threshold. Defaults to :math:`2^{-40}`.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating which rows are close
+        to precision.
+    """
+    sizes1 = np.linalg.norm(vecs1, ord=2, axis=1)
+    sizes2 = np.linalg.norm(vecs2, ord=2, axis=1)
+    upper_bounds = eps * np.minimum(sizes1, sizes2)
+    result = np.linalg.norm(vecs1 - vecs2, ord=2, axis=1) <= upper_bounds
+    # Handle the rows where one of the vectors is zero.
+    zero1 = sizes1 == 0
+    result[zero1] = sizes2[zero1] <= eps
+    zero2 = ~zero1 & (sizes2 == 0)
+    result[zero2] = sizes1[zero2] <= eps
+    return result
+
+
 def in_interval(value, start, end):
     """Checks if a ``value`` is an interval (inclusive).
 
@@ -106,6 +135,26 @@ def _bbox(nodes):
     return left, right, bottom, top
 
 
+def bboxes(nodes_stack):
+    """Get the bounding boxes for many sets of points at once.
+
+    Vectorized version of :func:`bbox`, e.g. for computing the boxes
+    used by :func:`bbox_tree` or :func:`sweep_and_prune`.
+
+    Args:
+       nodes_stack (numpy.ndarray): ``K x N x 2`` array of points, one
+           ``N x 2`` set of points for each box.
+
+    Returns:
+        numpy.ndarray: ``K x 4`` array of the ``left, right, bottom, top``
+        bounding boxes.
+    """
+    boxes = np.empty((nodes_stack.shape[0], 4))
+    boxes[:, 0::2] = np.min(nodes_stack, axis=1)
+    boxes[:, 1::2] = np.max(nodes_stack, axis=1)
+    return boxes
+
+
 def contains(nodes, x_val, y_val):
     r"""Predicate indicating if a point is within a bounding box.
 
@@ -117,7 +166,25 @@ def contains(nodes, x_val, y_val):
     Returns:
         bool: Indicating containment.
     """
-    left, right, bottom, top = bbox(nodes)
+    return box_contains(bbox(nodes), x_val, y_val)
+
+
+def box_contains(box, x_val, y_val):
+    r"""Predicate indicating if a point is within a given bounding box.
+
+    Like :func:`contains` but for a box that has already been computed
+    (e.g. a cached box from a shape).
+
+    Args:
+       box (Tuple[float, float, float, float]): The left, right, bottom
+           and top bounds for the box.
+       x_val (float): The :math:`x`-coordinate of the point.
+       y_val (float): The :math:`y`-coordinate of the point.
+
+    Returns:
+        bool: Indicating containment.
+    """
+    left, right, bottom, top = box
     if not in_interval(x_val, left, right):
         return False
     if not in_interval(y_val, bottom, top):
@@ -151,6 +218,32 @@ def contains_nd(nodes, point):
     return True
 
 
+def contains_nd_multi(nodes_stack, points, shape_ids, point_ids):
+    r"""Predicate indicating if many points are within bounding boxes.
+
+    Vectorized version of :func:`contains_nd` for many pairs of a shape
+    (i.e. a set of nodes) and a point.
+
+    Args:
+        nodes_stack (numpy.ndarray): ``K x N x D`` array of nodes, one
+            ``N x D`` set of nodes for each shape.
+        points (numpy.ndarray): ``P x D`` array of points.
+        shape_ids (numpy.ndarray): The shape (i.e. the index into
+            ``nodes_stack``) in each pair.
+        point_ids (numpy.ndarray): The point (i.e. the row of ``points``)
+            in each pair.
+
+    Returns:
+        numpy.ndarray: Boolean mask indicating containment for each pair.
+    """
+    min_vals = np.min(nodes_stack, axis=1)
+    max_vals = np.max(nodes_stack, axis=1)
+    pair_points = points[point_ids, :]
+    return np.all(
+        (min_vals[shape_ids, :] <= pair_points) &
+        (pair_points <= max_vals[shape_ids, :]), axis=1)
+
+
 def cross_product(vec0, vec1):
     r"""Compute the cross product of vectors in :math:`\mathbf{R}^2`.
 
@@ -238,6 +331,224 @@ def matrix_product(mat1, mat2):
     return np.dot(mat2.T, mat1.T).T
 
 
+def _bbox_tree_node(boxes, order, start, end, leaf_size, node_boxes, nodes):
+    """Add a node (and its descendants) to a bounding box tree.
+
+    Helper for :func:`bbox_tree`. The nodes are added in pre-order, so
+    the first child of an internal node immediately follows it.
+
+    Args:
+        boxes (numpy.ndarray): ``N x 4`` array of ``left, right, bottom,
+            top`` bounding boxes.
+        order (numpy.ndarray): The permutation of ``0, ..., N - 1`` that
+            is being built. The slice ``order[start:end]`` will be
+            re-ordered.
+        start (int): The start of the slice of ``order`` covered by
+            the node.
+        end (int): The end of the slice of ``order`` covered by
+            the node.
+        leaf_size (int): The maximum number of boxes in a leaf.
+        node_boxes (list): The bounding boxes of the nodes added so far.
+        nodes (list): The ``start, end, second child`` triples of the
+            nodes added so far.
+    """
+    indices = order[start:end]
+    sub_boxes = boxes[indices, :]
+    node_boxes.append((
+        np.min(sub_boxes[:, 0]), np.max(sub_boxes[:, 1]),
+        np.min(sub_boxes[:, 2]), np.max(sub_boxes[:, 3])))
+    node_index = len(nodes)
+    nodes.append([start, end, -1])
+    if end - start <= leaf_size:
+        return
+
+    # Split at the median center along the axis where the
+    # centers are most spread out.
+    centers = np.empty((end - start, 2))
+    centers[:, 0] = sub_boxes[:, 0] + sub_boxes[:, 1]
+    centers[:, 1] = sub_boxes[:, 2] + sub_boxes[:, 3]
+    spread = np.max(centers, axis=0) - np.min(centers, axis=0)
+    axis = np.argmax(spread)
+    order[start:end] = indices[np.argsort(centers[:, axis], kind='mergesort')]
+
+    middle = (start + end) // 2
+    _bbox_tree_node(
+        boxes, order, start, middle, leaf_size, node_boxes, nodes)
+    nodes[node_index][2] = len(nodes)
+    _bbox_tree_node(
+        boxes, order, middle, end, leaf_size, node_boxes, nodes)
+
+
+def bbox_tree(boxes, leaf_size=_TREE_LEAF_SIZE):
+    """Build a bounding volume hierarchy from a collection of boxes.
+
+    The tree is built top-down by splitting the boxes in half (based on
+    the centers of each box) until at most ``leaf_size`` boxes remain.
+
+    Args:
+        boxes (numpy.ndarray): ``N x 4`` array of ``left, right, bottom,
+            top`` bounding boxes.
+        leaf_size (Optional[int]): The maximum number of boxes in a leaf.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * ``K x 4`` array of the bounding boxes of each of the ``K``
+          tree nodes (the root is the first node)
+        * ``K x 3`` array of the ``start, end`` indices (into the
+          ordering) covered by each node along with the index of the
+          second child (or ``-1`` for a leaf). The first child of an
+          internal node is always the following node.
+        * A permutation of ``0, ..., N - 1`` that groups the boxes
+          in each node together.
+    """
+    num_boxes = boxes.shape[0]
+    order = np.arange(num_boxes)
+    node_boxes = []
+    nodes = []
+    if num_boxes > 0:
+        _bbox_tree_node(
+            boxes, order, 0, num_boxes, leaf_size, node_boxes, nodes)
+
+    node_boxes = np.asfortranarray(node_boxes, dtype=np.float64)
+    nodes = np.asarray(nodes, dtype=int)
+    return node_boxes.reshape((-1, 4)), nodes.reshape((-1, 3)), order
+
+
+def _overlap_mask(boxes, left, right, bottom, top):
+    """Check which of many boxes overlap a query box.
+
+    Helper for :func:`bbox_tree_query`. Boxes which only touch the query
+    box (e.g. share an edge) are considered overlapping.
+
+    Args:
+        boxes (numpy.ndarray): ``N x 4`` array of ``left, right, bottom,
+            top`` bounding boxes.
+        left (float): The left edge of the query box.
+        right (float): The right edge of the query box.
+        bottom (float): The bottom edge of the query box.
+        top (float): The top edge of the query box.
+
+    Returns:
+        numpy.ndarray: Boolean mask indicating which boxes overlap.
+    """
+    return ((boxes[:, 0] <= right) & (left <= boxes[:, 1]) &
+            (boxes[:, 2] <= top) & (bottom <= boxes[:, 3]))
+
+
+def _concat_ranges(starts, ends):
+    """Concatenate many ranges of integers.
+
+    Helper for :func:`bbox_tree_query`. Equivalent to concatenating
+    ``np.arange(start, end)`` for each pair, without a Python loop.
+
+    Args:
+        starts (numpy.ndarray): The start of each range.
+        ends (numpy.ndarray): The (exclusive) end of each range.
+
+    Returns:
+        numpy.ndarray: The concatenated ranges.
+    """
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(np.sum(lengths))
+
+
+def bbox_tree_query(tree, boxes, left, right, bottom, top):
+    """Find the boxes in a bounding box tree that overlap a query box.
+
+    Boxes which only touch the query box (e.g. share an edge) are
+    considered overlapping.
+
+    The tree is traversed one level at a time: the bounding boxes of
+    every node in a level are checked at once, and the boxes in every
+    leaf that was reached are checked at once at the end.
+
+    Args:
+        tree (Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]): A
+            tree created by :func:`bbox_tree`.
+        boxes (numpy.ndarray): ``N x 4`` array of ``left, right, bottom,
+            top`` bounding boxes used to create ``tree``.
+        left (float): The left edge of the query box.
+        right (float): The right edge of the query box.
+        bottom (float): The bottom edge of the query box.
+        top (float): The top edge of the query box.
+
+    Returns:
+        numpy.ndarray: The (sorted) indices of the overlapping boxes.
+    """
+    node_boxes, nodes, order = tree
+    if nodes.shape[0] == 0:
+        return np.empty((0,), dtype=int)
+
+    leaves = []
+    level = np.zeros((1,), dtype=int)
+    while level.size > 0:
+        level = level[_overlap_mask(
+            node_boxes[level, :], left, right, bottom, top)]
+        is_leaf = nodes[level, 2] == -1
+        leaves.append(level[is_leaf])
+        # NOTE: The first child of an internal node immediately follows
+        #       it (see :func:`bbox_tree`).
+        internal = level[~is_leaf]
+        level = np.concatenate([internal + 1, nodes[internal, 2]])
+
+    leaves = np.concatenate(leaves)
+    indices = order[_concat_ranges(nodes[leaves, 0], nodes[leaves, 1])]
+    overlap = _overlap_mask(boxes[indices, :], left, right, bottom, top)
+    return np.sort(indices[overlap])
+
+
+def sweep_and_prune(boxes):
+    """Find all pairs of overlapping boxes in a collection.
+
+    Sorts the boxes by their left edge and then sweeps from left to right.
+    Each box only needs to be compared with the boxes that start before
+    it ends, and since the left edges are sorted, those are found with
+    a binary search.
+
+    Boxes which only touch (e.g. share an edge) are considered
+    overlapping.
+
+    Args:
+        boxes (numpy.ndarray): ``N x 4`` array of ``left, right, bottom,
+            top`` bounding boxes.
+
+    Returns:
+        numpy.ndarray: ``M x 2`` array of the index pairs ``i < j`` of
+        overlapping boxes, sorted lexicographically.
+    """
+    order = np.argsort(boxes[:, 0], kind='mergesort')
+    sorted_boxes = boxes[order, :]
+    ends = np.searchsorted(
+        sorted_boxes[:, 0], sorted_boxes[:, 1], side='right')
+
+    firsts = []
+    seconds = []
+    for position, end in enumerate(ends):
+        # NOTE: Every box in ``position + 1:end`` starts between the left
+        #       and right edges of the current box, so only the vertical
+        #       overlap needs to be checked.
+        _, _, bottom, top = sorted_boxes[position, :]
+        others = sorted_boxes[position + 1:end, :]
+        overlap = (others[:, 2] <= top) & (bottom <= others[:, 3])
+        matches = order[position + 1:end][overlap]
+        firsts.append(np.full(matches.shape, order[position], dtype=int))
+        seconds.append(matches)
+
+    if firsts:
+        firsts = np.concatenate(firsts)
+        seconds = np.concatenate(seconds)
+    else:
+        firsts = seconds = np.empty((0,), dtype=int)
+
+    pairs = np.empty((firsts.size, 2), dtype=int)
+    pairs[:, 0] = np.minimum(firsts, seconds)
+    pairs[:, 1] = np.maximum(firsts, seconds)
+    sort_order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    return pairs[sort_order, :]
+
+
 def _wiggle_interval_py(value, wiggle=0.5**45):
     r"""Check if ``value`` is in :math:`\left[0, 1\right]`.
 
@@ -273,11 +584,71 @@ def _wiggle_interval_py(value, wiggle=0.5**45):
         raise ValueError('outside of unit interval', value)
 
 
+def _wiggle_interval_multi(values, wiggle=0.5**45):
+    r"""Check if many values are in :math:`\left[0, 1\right]`.
+
+    Vectorized version of :func:`_wiggle_interval_py`. Rather than
+    raising an exception, values outside of the unit interval (with
+    wiggle room) are flagged.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Args:
+        values (numpy.ndarray): The values to check.
+        wiggle (Optional[float]): The amount of wiggle room around the
+            the endpoints ``0.0`` and ``1.0``.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The ``values``, with values slightly outside of the interval
+          replaced by ``0`` or ``1``. Values that are outside of the
+          interval are unchanged.
+        * Boolean array indicating which values are in the interval
+          (with wiggle room).
+    """
+    results = np.array(values, dtype=float)
+    results[(-wiggle < values) & (values < wiggle)] = 0.0
+    results[(1.0 - wiggle < values) & (values < 1.0 + wiggle)] = 1.0
+    success = (-wiggle < values) & (values < 1.0 + wiggle)
+    return results, success
+
+
+def _wiggle_interval_multi_speedup(values):
+    r"""Check if many values are in :math:`\left[0, 1\right]`.
+
+    .. note::
+
+       This uses the compiled ``wiggle_interval_multi``, which returns
+       the flags as integers.
+
+    Args:
+        values (numpy.ndarray): The values to check.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of the (possibly
+        wiggled) ``values`` and boolean array indicating which values
+        are in the interval (with wiggle room).
+    """
+    results, success = _speedup.speedup.wiggle_interval_multi(values)
+    return results, success.astype(bool)
+
+
 # pylint: disable=invalid-name
 if _speedup is None:  # pragma: NO COVER
     bbox = _bbox
     wiggle_interval = _wiggle_interval_py
+    wiggle_interval_multi = _wiggle_interval_multi
 else:
     bbox = _speedup.speedup.bbox
     wiggle_interval = _speedup.speedup.wiggle_interval
+    wiggle_interval_multi = _wiggle_interval_multi_speedup
 # pylint: enable=invalid-name
+backend_mod.register_defaults(__name__, {
+    'bbox': _bbox,
+    'wiggle_interval': _wiggle_interval_py,
+    'wiggle_interval_multi': _wiggle_interval_multi,
+})
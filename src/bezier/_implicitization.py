@@ -69,6 +69,38 @@ _NON_SIMPLE_ERR = 'Polynomial has non-simple roots'
 _POWER_BASIS_ERR = (
     'Currently only supporting degree pairs '
     '1-1, 1-2, 1-3, 1-4, 2-2, 2-3, 2-4 and 3-3.')
+# Parameters ``t`` (along the second curve) used by ``_to_power_basis_multi``
+# and the matrix that converts values at those parameters to coefficients
+# (or :data:`None` if a least-squares fit is used). These are the same as
+# in the ``_to_power_basis**`` helpers, keyed by the number of nodes in
+# each curve.
+_POWER_BASIS_MULTI = {
+    (2, 2): (np.asfortranarray([0.0, 1.0]), np.asfortranarray([
+        [1.0, 0.0],
+        [-1.0, 1.0],
+    ])),
+    (2, 3): (np.asfortranarray([0.0, 0.5, 1.0]), np.asfortranarray([
+        [1.0, 0.0, 0.0],
+        [-3.0, 4.0, -1.0],
+        [2.0, -4.0, 2.0],
+    ])),
+    (2, 4): (np.asfortranarray([0.0, 0.25, 0.75, 1.0]), np.asfortranarray([
+        [3.0, 0.0, 0.0, 0.0],
+        [-19.0, 24.0, -8.0, 3.0],
+        [32.0, -56.0, 40.0, -16.0],
+        [-16.0, 32.0, -32.0, 16.0],
+    ])),
+    (3, 3): (
+        np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0]), np.asfortranarray([
+            [3.0, 0.0, 0.0, 0.0, 0.0],
+            [-25.0, 48.0, -36.0, 16.0, -3.0],
+            [70.0, -208.0, 228.0, -112.0, 22.0],
+            [-80.0, 288.0, -384.0, 224.0, -48.0],
+            [32.0, -128.0, 192.0, -128.0, 32.0],
+        ])),
+    (3, 4): (_CHEB7, None),
+    (4, 4): (_CHEB10, None),
+}
 
 
 def _evaluate3(nodes, x_val, y_val):
@@ -162,6 +194,105 @@ def evaluate(nodes, x_val, y_val):
         raise NotImplementedError('Only degrees 1 and 2 supported')
 
 
+def _evaluate_multi(nodes, x_vals, y_vals):
+    r"""Evaluate the implicitized polynomials of many curves.
+
+    Vectorized version of :func:`evaluate`. Each curve is evaluated at
+    its own set of points.
+
+    Args:
+        nodes (numpy.ndarray): Stack (``M x N x 2``) of the nodes in the
+            curves.
+        x_vals (numpy.ndarray): ``M x T`` array of ``x``-coordinates,
+            one row for each curve.
+        y_vals (numpy.ndarray): ``M x T`` array of ``y``-coordinates,
+            one row for each curve.
+
+    Returns:
+        numpy.ndarray: The ``M x T`` computed values of :math:`f(x, y)`.
+
+    Raises:
+        ValueError: If the curves are points.
+        NotImplementedError: If the curves are not degree 1, 2 or 3.
+    """
+    _, num_nodes, _ = nodes.shape
+    # NOTE: Each column of ``nodes`` is ``M x 1`` so that it broadcasts
+    #       against the ``M x T`` coordinates.
+    delta_x = nodes[:, :, [0]] - x_vals[:, np.newaxis, :]
+    delta_y = nodes[:, :, [1]] - y_vals[:, np.newaxis, :]
+    if num_nodes == 1:
+        raise ValueError('A point cannot be implicitized')
+    elif num_nodes == 2:
+        return (
+            delta_x[:, 0, :] * delta_y[:, 1, :] -
+            delta_x[:, 1, :] * delta_y[:, 0, :])
+    elif num_nodes == 3:
+        return _evaluate2_multi(delta_x, delta_y)
+    elif num_nodes == 4:
+        return _evaluate3_multi(delta_x, delta_y)
+    else:
+        raise NotImplementedError('Only degrees 1, 2 and 3 supported')
+
+
+def _evaluate2_multi(delta_x, delta_y):
+    r"""Evaluate the implicitized polynomials of many quadratic curves.
+
+    Helper for :func:`_evaluate_multi`. This uses the same expansion of
+    the modified Sylvester determinant as :func:`evaluate`.
+
+    Args:
+        delta_x (numpy.ndarray): ``M x 3 x T`` array of the differences
+            between the :math:`x`-coordinates of the nodes and of the
+            points.
+        delta_y (numpy.ndarray): ``M x 3 x T`` array of the differences
+            between the :math:`y`-coordinates of the nodes and of the
+            points.
+
+    Returns:
+        numpy.ndarray: The ``M x T`` computed values of :math:`f(x, y)`.
+    """
+    val_a = delta_x[:, 0, :]
+    val_b = 2.0 * delta_x[:, 1, :]
+    val_c = delta_x[:, 2, :]
+    val_d = delta_y[:, 0, :]
+    val_e = 2.0 * delta_y[:, 1, :]
+    val_f = delta_y[:, 2, :]
+    sub1 = val_b * val_f - val_c * val_e
+    sub2 = val_a * val_f - val_c * val_d
+    sub_det_a = -val_e * sub1 + val_f * sub2
+    sub_det_d = val_b * sub1 - val_c * sub2
+    return val_a * sub_det_a + val_d * sub_det_d
+
+
+def _evaluate3_multi(delta_x, delta_y):
+    r"""Evaluate the implicitized polynomials of many cubic curves.
+
+    Helper for :func:`_evaluate_multi`. This uses the same (row / column
+    swapped) Sylvester matrix as :func:`_evaluate3`, with one matrix per
+    point.
+
+    Args:
+        delta_x (numpy.ndarray): ``M x 4 x T`` array of the differences
+            between the :math:`x`-coordinates of the nodes and of the
+            points.
+        delta_y (numpy.ndarray): ``M x 4 x T`` array of the differences
+            between the :math:`y`-coordinates of the nodes and of the
+            points.
+
+    Returns:
+        numpy.ndarray: The ``M x T`` computed values of :math:`f(x, y)`.
+    """
+    delta = np.stack([delta_x, delta_y], axis=-1)
+    delta = np.moveaxis(delta, 1, 2)
+    delta[:, :, 1:3, :] *= 3.0
+    num_curves, num_points, _, _ = delta.shape
+    sylvester_mat = np.zeros((num_curves, num_points, 6, 6))
+    sylvester_mat[:, :, :4, :2] = delta
+    sylvester_mat[:, :, 1:5, 2:4] = delta
+    sylvester_mat[:, :, 2:, 4:] = delta
+    return np.linalg.det(sylvester_mat)
+
+
 def eval_intersection_polynomial(nodes1, nodes2, t):
     r"""Evaluates a parametric curve **on** an implicitized algebraic curve.
 
@@ -456,6 +587,67 @@ def to_power_basis(nodes1, nodes2):
     # pylint: enable=too-many-return-statements
 
 
+def _to_power_basis_multi(nodes1, nodes2):
+    """Compute the coefficients of many **intersection polynomials**.
+
+    Vectorized version of :func:`to_power_basis`. Every pair of curves
+    is evaluated at the same parameters (along the second curve) and
+    the values are converted to coefficients, so the result is a single
+    coefficient matrix. Each row only depends on its own pair (i.e. not
+    on the rest of the batch).
+
+    .. note::
+
+       This assumes that the degree of the curves in ``nodes1`` is
+       less than or equal to the degree of those in ``nodes2``.
+
+    Args:
+        nodes1 (numpy.ndarray): Stack (``M x N1 x 2``) of the nodes in
+            the first curve of each pair.
+        nodes2 (numpy.ndarray): Stack (``M x N2 x 2``) of the nodes in
+            the second curve of each pair.
+
+    Returns:
+        numpy.ndarray: ``M x (d1 d2 + 1)`` array of coefficients, one row
+        for each pair.
+
+    Raises:
+        NotImplementedError: If the degree pair is not ``1-1``, ``1-2``,
+            ``1-3``, ``2-2``, ``2-3`` or ``3-3``.
+    """
+    _, num_nodes1, _ = nodes1.shape
+    _, num_nodes2, _ = nodes2.shape
+    key = (num_nodes1, num_nodes2)
+    if key not in _POWER_BASIS_MULTI:
+        raise NotImplementedError(
+            'Degree 1', num_nodes1 - 1, 'Degree2', num_nodes2 - 1,
+            _POWER_BASIS_ERR)
+
+    t_vals, to_coeffs = _POWER_BASIS_MULTI[key]
+    # Evaluate every second curve at every parameter (``M x T x 2``).
+    points = _evaluate_curves_multi(nodes2, t_vals[np.newaxis, :])
+
+    values = _evaluate_multi(nodes1, points[:, :, 0], points[:, :, 1])
+    num_pairs, num_vals = values.shape
+    if to_coeffs is None:
+        # NOTE: Each pair is fit on its own, since a single least-squares
+        #       solve for every pair doesn't round in the same way (so the
+        #       coefficients would depend on the rest of the batch).
+        coeffs = np.empty((num_pairs, num_vals))
+        for row, row_values in enumerate(values):
+            coeffs[row, :] = polynomial.polyfit(
+                t_vals, row_values, num_vals - 1)
+        return coeffs
+    else:
+        # NOTE: The sums are accumulated in the same order as in the
+        #       ``_to_power_basis**`` helpers, since nearly tangent curves
+        #       have roots that are very sensitive to round-off.
+        coeffs = np.zeros((num_pairs, num_vals))
+        for index in six.moves.xrange(num_vals):
+            coeffs += to_coeffs[:, index] * values[:, [index]]
+        return coeffs
+
+
 def polynomial_norm(coeffs):
     r"""Computes :math:`L_2` norm of polynomial on :math:`\left[0, 1\right]`.
 
@@ -487,6 +679,31 @@ def polynomial_norm(coeffs):
     return np.sqrt(result)
 
 
+def _polynomial_norm_multi(coeffs):
+    r"""Computes the :math:`L_2` norms of many polynomials.
+
+    Vectorized version of :func:`polynomial_norm`. The terms are summed
+    in the same order, since the norm is prone to cancellation.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial.
+
+    Returns:
+        numpy.ndarray: The ``M`` :math:`L_2` norms.
+    """
+    num_polys, num_coeffs = coeffs.shape
+    result = np.zeros((num_polys,))
+    for i in six.moves.xrange(num_coeffs):
+        coeff_i = coeffs[:, i]
+        result += coeff_i * coeff_i / (2.0 * i + 1.0)
+        for j in six.moves.xrange(i + 1, num_coeffs):
+            coeff_j = coeffs[:, j]
+            result += 2.0 * coeff_i * coeff_j / (i + j + 1.0)
+
+    return np.sqrt(result)
+
+
 def normalize_polynomial(coeffs, threshold=_L2_THRESHOLD):
     r"""Normalizes a polynomial in the :math:`L_2` sense.
 
@@ -511,6 +728,70 @@ def normalize_polynomial(coeffs, threshold=_L2_THRESHOLD):
         return coeffs
 
 
+def _normalize_polynomial_multi(coeffs, threshold=_L2_THRESHOLD):
+    r"""Normalizes many polynomials in the :math:`L_2` sense.
+
+    Vectorized version of :func:`normalize_polynomial`.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial.
+        threshold (Optional[float]): The point :math:`\tau` below which a
+            polynomial will be considered to be numerically equal to zero.
+
+    Returns:
+        numpy.ndarray: The normalized polynomials (a new array).
+    """
+    l2_norms = _polynomial_norm_multi(coeffs)
+    result = np.zeros(coeffs.shape)
+    nonzero = l2_norms >= threshold
+    result[nonzero, :] = (
+        coeffs[nonzero, :] / l2_norms[nonzero, np.newaxis])
+    return result
+
+
+def _companion_multi(coeffs):
+    """Compute the companion matrices of many polynomials.
+
+    Vectorized version of :func:`numpy.polynomial.polynomial.polycompanion`.
+
+    .. note::
+
+       This assumes, but doesn't check, that the leading coefficient of
+       each polynomial is non-zero.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial.
+
+    Returns:
+        numpy.ndarray: Stack (``M x d x d``) of companion matrices.
+    """
+    num_polys, num_coeffs = coeffs.shape
+    size = num_coeffs - 1
+    companion = np.zeros((num_polys, size, size))
+    index = np.arange(1, size)
+    companion[:, index, index - 1] = 1.0
+    companion[:, :, -1] -= coeffs[:, :-1] / coeffs[:, -1:]
+    return companion
+
+
+def _group_by_length(lengths):
+    """Group the rows of a coefficient matrix by polynomial length.
+
+    Args:
+        lengths (numpy.ndarray): The number of coefficients in each row.
+
+    Returns:
+        List[Tuple[int, numpy.ndarray]]: Pairs of each distinct length
+        and the (sorted) rows with that length.
+    """
+    return [
+        (length, np.flatnonzero(lengths == length))
+        for length in np.unique(lengths)
+    ]
+
+
 def roots_in_unit_interval(coeffs):
     r"""Compute roots of a polynomial in the unit interval.
 
@@ -532,6 +813,59 @@ def roots_in_unit_interval(coeffs):
     return all_roots[real_inds].real
 
 
+def _roots_in_unit_interval_multi(coeffs):
+    r"""Compute roots of many polynomials in the unit interval.
+
+    Vectorized version of :func:`roots_in_unit_interval`. Polynomials
+    are grouped by degree (ignoring zero leading coefficients, as
+    :func:`~numpy.polynomial.polynomial.polyroots` does) and the roots
+    of each group are computed with a single (stacked) eigenvalue solve
+    of the companion matrices.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The row (i.e. polynomial) of each root.
+        * The real roots in :math:`\left[0, 1\right]`.
+
+        The roots are ordered by row and then (as in
+        :func:`roots_in_unit_interval`) in increasing order.
+    """
+    _, num_coeffs = coeffs.shape
+    nonzero = coeffs != 0.0
+    lengths = num_coeffs - np.argmax(nonzero[:, ::-1], axis=1)
+    lengths[~np.any(nonzero, axis=1)] = 0
+
+    all_rows = [np.empty((0,), dtype=int)]
+    all_roots = [np.empty((0,))]
+    for length, rows in _group_by_length(lengths):
+        if length < 2:
+            continue
+
+        group_coeffs = coeffs[rows, :length]
+        if length == 2:
+            roots = -group_coeffs[:, :1] / group_coeffs[:, 1:]
+        else:
+            roots = np.linalg.eigvals(_companion_multi(group_coeffs))
+            roots.sort(axis=1)
+
+        keep = (
+            (_UNIT_INTERVAL_WIGGLE_START < roots) &
+            (roots < _UNIT_INTERVAL_WIGGLE_END) &
+            (np.abs(roots.imag) < _IMAGINARY_WIGGLE))
+        row_index, _ = np.nonzero(keep)
+        all_rows.append(rows[row_index])
+        all_roots.append(roots[keep].real)
+
+    rows = np.concatenate(all_rows)
+    order = np.argsort(rows, kind='mergesort')
+    return rows[order], np.concatenate(all_roots)[order]
+
+
 def _strip_leading_zeros(coeffs, threshold=_COEFFICIENT_THRESHOLD):
     r"""Strip leading zero coefficients from a polynomial.
 
@@ -603,6 +937,80 @@ def _check_non_simple(coeffs):
         raise NotImplementedError(_NON_SIMPLE_ERR, coeffs)
 
 
+def _non_simple_multi(coeffs):
+    r"""Finds the polynomials (among many) with non-simple roots.
+
+    Vectorized version of :func:`_check_non_simple`. Polynomials are
+    grouped by degree (after stripping leading zeros, as in
+    :func:`_strip_leading_zeros`) and :math:`f(A)` is computed for each
+    group at once. Rather than raising, the polynomials with non-simple
+    roots are flagged.
+
+    .. note::
+
+       This assumes that each :math:`f \neq 0` and that each polynomial
+       has been normalized.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial.
+
+    Returns:
+        numpy.ndarray: Boolean mask indicating if each polynomial has
+        non-simple roots.
+    """
+    num_rows, num_coeffs = coeffs.shape
+    large = np.abs(coeffs) >= _COEFFICIENT_THRESHOLD
+    lengths = num_coeffs - np.argmax(large[:, ::-1], axis=1)
+    lengths[~np.any(large, axis=1)] = 0
+    non_simple = np.zeros((num_rows,), dtype=bool)
+    for length, rows in _group_by_length(lengths):
+        if length < 3:
+            continue
+
+        non_simple[rows] = ~_simple_roots_multi(coeffs[rows, :length])
+
+    return non_simple
+
+
+def _simple_roots_multi(coeffs):
+    r"""Checks if many polynomials of the same degree have simple roots.
+
+    Helper for :func:`_non_simple_multi`. Computes :math:`f(A)` for
+    the companion matrix :math:`A` of :math:`f'` (as in
+    :func:`_check_non_simple`) and checks if it has full rank.
+
+    Args:
+        coeffs (numpy.ndarray): ``M x (d + 1)`` array of coefficients in
+            monomial / power basis, one row for each polynomial. Each
+            leading coefficient must be non-zero and :math:`d \geq 2`.
+
+    Returns:
+        numpy.ndarray: Boolean mask indicating if each polynomial has
+        only simple roots.
+    """
+    _, length = coeffs.shape
+    deriv_coeffs = coeffs[:, 1:] * np.arange(1.0, length)
+    companion = _companion_multi(deriv_coeffs)
+    # Use Horner's method to evaluate f(companion)
+    num_companion = length - 2
+    id_mat = np.eye(num_companion)
+    evaluated = coeffs[:, -1, np.newaxis, np.newaxis] * id_mat
+    for index in six.moves.xrange(length - 2, -1, -1):
+        coeff = coeffs[:, index, np.newaxis, np.newaxis]
+        evaluated = np.matmul(evaluated, companion) + coeff * id_mat
+
+    if num_companion == 1:
+        # NOTE: This relies on the fact that coeffs is normalized.
+        return np.abs(evaluated[:, 0, 0]) > _NON_SIMPLE_THRESHOLD
+
+    # NOTE: This uses the same tolerance as ``matrix_rank``.
+    sing_vals = np.linalg.svd(evaluated, compute_uv=False)
+    tolerance = sing_vals[:, :1] * num_companion * np.finfo(float).eps
+    rank = np.sum(sing_vals > tolerance, axis=1)
+    return rank == num_companion
+
+
 def _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t):
     """Resolve a computed intersection and add to lists.
 
@@ -638,6 +1046,89 @@ def _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t):
     final_t.append(t_val)
 
 
+def _evaluate_curves_multi(nodes, s_vals):
+    """Evaluate many curves at many parameters.
+
+    Uses the same modified Horner's method as
+    :func:`._curve_helpers.evaluate_multi_barycentric`, for every curve
+    at once.
+
+    Args:
+        nodes (numpy.ndarray): Stack (``M x N x 2``) of the nodes in the
+            curves.
+        s_vals (numpy.ndarray): ``M x T`` array of parameters, one row
+            for each curve (or ``1 x T`` if the parameters are the same
+            for every curve).
+
+    Returns:
+        numpy.ndarray: The ``M x T x 2`` points on the curves.
+    """
+    _, num_nodes, _ = nodes.shape
+    degree = num_nodes - 1
+    lambda1 = 1.0 - s_vals[:, :, np.newaxis]
+    lambda2 = s_vals[:, :, np.newaxis]
+
+    result = lambda1 * nodes[:, [0], :]
+    binom_val = 1.0
+    lambda2_pow = np.ones(lambda2.shape)
+    for index in six.moves.xrange(1, degree):
+        lambda2_pow = lambda2_pow * lambda2
+        binom_val = (binom_val * (degree - index + 1)) / index
+        result += binom_val * lambda2_pow * nodes[:, [index], :]
+        result *= lambda1
+
+    result += lambda2 * lambda2_pow * nodes[:, [degree], :]
+    return result
+
+
+def _resolve_multi(nodes1, s_vals, nodes2, t_vals):
+    """Resolve many computed intersections.
+
+    Vectorized version of :func:`_resolve_and_add`. Performs one Newton
+    step for each intersection and then flags the intersections that are
+    outside of the unit square.
+
+    Args:
+        nodes1 (numpy.ndarray): Stack (``M x N1 x 2``) of the nodes in
+            the first curve of each intersection.
+        s_vals (numpy.ndarray): The ``M`` approximate intersection
+            parameters along the first curves.
+        nodes2 (numpy.ndarray): Stack (``M x N2 x 2``) of the nodes in
+            the second curve of each intersection.
+        t_vals (numpy.ndarray): The ``M`` approximate intersection
+            parameters along the second curves.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The refined
+        ``s`` and ``t`` parameters and a boolean array indicating which
+        intersections should be accepted.
+    """
+    # NOTE: We form -F(s, t) since we want to solve -DF^{-1} F(s, t).
+    func_vals = (
+        _evaluate_curves_multi(nodes2, t_vals[:, np.newaxis]) -
+        _evaluate_curves_multi(nodes1, s_vals[:, np.newaxis]))[:, 0, :]
+    # No refinement is needed for exact intersections.
+    refine = np.any(func_vals != 0.0, axis=1)
+
+    _, num_nodes1, _ = nodes1.shape
+    _, num_nodes2, _ = nodes2.shape
+    jac_mats = np.empty((np.count_nonzero(refine), 2, 2))
+    jac_mats[:, :, 0] = _curve_helpers.evaluate_hodograph_multi(
+        s_vals[refine], nodes1[refine], num_nodes1 - 1)
+    jac_mats[:, :, 1] = -_curve_helpers.evaluate_hodograph_multi(
+        t_vals[refine], nodes2[refine], num_nodes2 - 1)
+    deltas = np.linalg.solve(jac_mats, func_vals[refine, :, np.newaxis])
+
+    s_vals = np.array(s_vals, dtype=float)
+    t_vals = np.array(t_vals, dtype=float)
+    s_vals[refine] += deltas[:, 0, 0]
+    t_vals[refine] += deltas[:, 1, 0]
+
+    s_vals, s_success = _helpers.wiggle_interval_multi(s_vals)
+    t_vals, t_success = _helpers.wiggle_interval_multi(t_vals)
+    return s_vals, t_vals, s_success & t_success
+
+
 def intersect_curves(nodes1, nodes2):
     r"""Intersect two parametric B |eacute| zier curves.
 
@@ -692,6 +1183,154 @@ def intersect_curves(nodes1, nodes2):
     return result
 
 
+def _intersect_curves_batch(nodes1, nodes2):
+    r"""Intersect many pairs of curves with the same (true) degrees.
+
+    Helper for :func:`intersect_curves_many`. Follows the same steps as
+    :func:`intersect_curves`, but each step is done for every pair at
+    once.
+
+    .. note::
+
+       This assumes, but doesn't check, that none of the curves can be
+       degree-reduced.
+
+    Args:
+        nodes1 (numpy.ndarray): Stack (``M x N1 x 2``) of the nodes in
+            the first curve of each pair.
+        nodes2 (numpy.ndarray): Stack (``M x N2 x 2``) of the nodes in
+            the second curve of each pair.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The pair index
+        and the ``(s, t)`` parameters of each intersection and a boolean
+        mask of the pairs that failed, i.e. for which
+        :func:`intersect_curves` would raise because the "intersection
+        polynomial" is all zeros or has non-simple roots. No intersections
+        are returned for the failed pairs.
+    """
+    _, num_nodes1, _ = nodes1.shape
+    _, num_nodes2, _ = nodes2.shape
+    swapped = num_nodes1 > num_nodes2
+    if swapped:
+        nodes1, nodes2 = nodes2, nodes1
+
+    coeffs = _normalize_polynomial_multi(
+        _to_power_basis_multi(nodes1, nodes2))
+    failed = np.all(coeffs == 0.0, axis=1)
+    failed[~failed] = _non_simple_multi(coeffs[~failed])
+    rows, t_vals = _roots_in_unit_interval_multi(coeffs[~failed])
+    rows = np.flatnonzero(~failed)[rows]
+
+    points = _evaluate_curves_multi(
+        nodes2[rows], t_vals[:, np.newaxis])[:, 0, :]
+    s_vals = _locate_point_multi(nodes1[rows], points[:, 0], points[:, 1])
+    found = ~np.isnan(s_vals)
+    rows = rows[found]
+    s_vals, t_vals, accepted = _resolve_multi(
+        nodes1[rows], s_vals[found], nodes2[rows], t_vals[found])
+
+    st_vals = np.empty((np.count_nonzero(accepted), 2), order='F')
+    if swapped:
+        s_vals, t_vals = t_vals, s_vals
+    st_vals[:, 0] = s_vals[accepted]
+    st_vals[:, 1] = t_vals[accepted]
+
+    return rows[accepted], st_vals, failed
+
+
+def _batchable(nodes1, nodes2):
+    """Determine which pairs of curves can be intersected in a batch.
+
+    Args:
+        nodes1 (numpy.ndarray): Stack (``M x N1 x 2``) of the nodes in
+            the first curve of each pair.
+        nodes2 (numpy.ndarray): Stack (``M x N2 x 2``) of the nodes in
+            the second curve of each pair.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the pairs where neither curve can
+        be degree-reduced (always :data:`False` if either degree is
+        greater than three).
+    """
+    num_pairs, num_nodes1, _ = nodes1.shape
+    _, num_nodes2, _ = nodes2.shape
+    if 2 <= num_nodes1 <= 4 and 2 <= num_nodes2 <= 4:
+        return (
+            (_curve_helpers.full_reduce_degrees(nodes1) == num_nodes1 - 1) &
+            (_curve_helpers.full_reduce_degrees(nodes2) == num_nodes2 - 1))
+
+    return np.zeros((num_pairs,), dtype=bool)
+
+
+def intersect_curves_many(nodes1, nodes2):
+    r"""Intersect many pairs of parametric B |eacute| zier curves.
+
+    Vectorized version of :func:`intersect_curves` for pairs of curves
+    with the same degrees (at most three). Rather than solving one
+    "intersection polynomial" at a time, the polynomials for every pair
+    are computed as a single coefficient matrix and their roots are
+    found with one (stacked) eigenvalue solve for each degree.
+
+    Pairs containing a curve that can be degree-reduced are intersected
+    one at a time with :func:`intersect_curves`, as are all pairs when
+    either degree is greater than three and the pairs that fail in the
+    batch (e.g. tangent or coincident curves).
+
+    A pair that :func:`intersect_curves` can't intersect doesn't stop the
+    others. Instead, it is reported (and left out of the intersections).
+
+    Args:
+        nodes1 (numpy.ndarray): Stack (``M x N1 x 2``) of the nodes in
+            the first curve of each pair.
+        nodes2 (numpy.ndarray): Stack (``M x N2 x 2``) of the nodes in
+            the second curve of each pair.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The pair index (i.e. the index into ``nodes1`` and ``nodes2``)
+          of each intersection.
+        * ``K x 2`` array of intersection parameters. Each row contains
+          a pair of values :math:`s` and :math:`t` (each in
+          :math:`\left[0, 1\right]`) such that the curves in the
+          corresponding pair intersect: :math:`B_1(s) = B_2(t)`.
+        * The (sorted) pair indices for which :func:`intersect_curves`
+          raises :exc:`NotImplementedError`, e.g. because the
+          "intersection polynomial" is all zeros (coincident curves) or
+          has non-simple roots (tangent curves).
+
+        The intersections are ordered by pair index (and for each pair,
+        in the same order as :func:`intersect_curves`).
+    """
+    batched = _batchable(nodes1, nodes2)
+    batch_index = np.flatnonzero(batched)
+    rows, batch_st_vals, batch_failed = _intersect_curves_batch(
+        nodes1[batch_index], nodes2[batch_index])
+    all_pair_indices = [batch_index[rows]]
+    all_st_vals = [batch_st_vals]
+    # NOTE: The pairs that failed in the batch are retried one at a time,
+    #       so they fail (or succeed) just as they would on their own.
+    batched[batch_index[batch_failed]] = False
+    failed = []
+    for pair_index in np.flatnonzero(~batched):
+        try:
+            st_vals = intersect_curves(
+                np.asfortranarray(nodes1[pair_index]),
+                np.asfortranarray(nodes2[pair_index]))
+        except NotImplementedError:
+            failed.append(pair_index)
+            continue
+        all_pair_indices.append(
+            np.repeat(pair_index, st_vals.shape[0]))
+        all_st_vals.append(st_vals)
+
+    pair_indices = np.concatenate(all_pair_indices)
+    order = np.argsort(pair_indices, kind='mergesort')
+    st_vals = np.asfortranarray(np.vstack(all_st_vals)[order, :])
+    return pair_indices[order], st_vals, np.asarray(failed, dtype=int)
+
+
 def poly_to_power_basis(bezier_coeffs):
     """Convert a B |eacute| zier curve to polynomial in power basis.
 
@@ -741,6 +1380,49 @@ def poly_to_power_basis(bezier_coeffs):
             'Currently only supports degrees 0, 1, 2 and 3')
 
 
+def _poly_to_power_basis_multi(bezier_coeffs):
+    """Convert many B |eacute| zier curves to polynomials in power basis.
+
+    Vectorized version of :func:`poly_to_power_basis`.
+
+    Args:
+        bezier_coeffs (numpy.ndarray): ``M x N`` array of coefficients in
+            the Bernstein basis, one row for each curve.
+
+    Returns:
+        numpy.ndarray: ``M x N`` array of coefficients in monomial basis.
+
+    Raises:
+        NotImplementedError: If the degree of the curves is not among
+            0, 1, 2 or 3.
+    """
+    _, num_coeffs = bezier_coeffs.shape
+    if num_coeffs > 4:
+        raise NotImplementedError(
+            'Currently only supports degrees 0, 1, 2 and 3')
+
+    # NOTE: Each column is one of the power basis conversions in
+    #       ``poly_to_power_basis``.
+    power_coeffs = np.empty(bezier_coeffs.shape)
+    coeff0 = bezier_coeffs[:, 0]
+    power_coeffs[:, 0] = coeff0
+    if num_coeffs == 2:
+        power_coeffs[:, 1] = bezier_coeffs[:, 1] - coeff0
+    elif num_coeffs == 3:
+        coeff1 = bezier_coeffs[:, 1]
+        power_coeffs[:, 1] = 2.0 * (coeff1 - coeff0)
+        power_coeffs[:, 2] = bezier_coeffs[:, 2] - 2.0 * coeff1 + coeff0
+    elif num_coeffs == 4:
+        coeff1 = bezier_coeffs[:, 1]
+        coeff2 = bezier_coeffs[:, 2]
+        power_coeffs[:, 1] = 3.0 * (coeff1 - coeff0)
+        power_coeffs[:, 2] = 3.0 * (coeff2 - 2.0 * coeff1 + coeff0)
+        power_coeffs[:, 3] = (
+            bezier_coeffs[:, 3] - 3.0 * coeff2 + 3.0 * coeff1 - coeff0)
+
+    return power_coeffs
+
+
 def locate_point(nodes, x_val, y_val):
     r"""Find the parameter corresponding to a point on a curve.
 
@@ -786,3 +1468,90 @@ def locate_point(nodes, x_val, y_val):
 
     if near_zero[index] < _ZERO_THRESHOLD:
         return all_roots[index]
+
+
+def _locate_power_bases(nodes, x_vals, y_vals):
+    r"""Compute the polynomials solved to locate points on many curves.
+
+    Helper for :func:`_locate_point_multi`. As in :func:`locate_point`,
+    the coefficients above the true degree of :math:`x(s) - x` and
+    :math:`y(s) - y` are dropped and the polynomial with the lowest
+    degree (unless it is a constant) is put first.
+
+    Args:
+        nodes (numpy.ndarray): Stack (``M x N x 2``) of the nodes in the
+            curves.
+        x_vals (numpy.ndarray): The ``M`` :math:`x`-coordinates.
+        y_vals (numpy.ndarray): The ``M`` :math:`y`-coordinates.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The ``M x N`` coefficients
+        (in monomial basis) of the polynomials to find the roots of and
+        the ``M x N`` (normalized) coefficients of the polynomials to
+        check at those roots.
+    """
+    num_curves, num_nodes, _ = nodes.shape
+    # First, find the true degree of x(s) and y(s) and drop the
+    # coefficients above it.
+    too_high = np.arange(num_nodes) > np.stack([
+        _curve_helpers.full_reduce_degrees(nodes[:, :, [0]]),
+        _curve_helpers.full_reduce_degrees(nodes[:, :, [1]]),
+    ], axis=1)[:, :, np.newaxis]
+    power_bases = np.stack([
+        _poly_to_power_basis_multi(nodes[:, :, 0]),
+        _poly_to_power_basis_multi(nodes[:, :, 1]),
+    ], axis=1)
+    power_bases[:, 0, 0] -= x_vals
+    power_bases[:, 1, 0] -= y_vals
+    power_bases[too_high] = 0.0
+
+    # Make sure we have the lowest degree in front (unless it is a
+    # constant), as in ``locate_point``.
+    degrees = num_nodes - np.sum(too_high, axis=2)
+    swap = degrees[:, 0] > degrees[:, 1]
+    swap ^= np.where(swap, degrees[:, 1], degrees[:, 0]) == 1
+    curve_index = np.arange(num_curves)
+    power_basis1 = power_bases[curve_index, swap.astype(int), :]
+    power_basis2 = _normalize_polynomial_multi(
+        power_bases[curve_index, (~swap).astype(int), :])
+    return power_basis1, power_basis2
+
+
+def _locate_point_multi(nodes, x_vals, y_vals):
+    r"""Find the parameters corresponding to points on many curves.
+
+    Vectorized version of :func:`locate_point`, with one point for each
+    curve.
+
+    Args:
+        nodes (numpy.ndarray): Stack (``M x N x 2``) of the nodes in the
+            curves.
+        x_vals (numpy.ndarray): The ``M`` :math:`x`-coordinates.
+        y_vals (numpy.ndarray): The ``M`` :math:`y`-coordinates.
+
+    Returns:
+        numpy.ndarray: The ``M`` parameters on the curves (NaN if a
+        point is not on its curve).
+    """
+    num_curves, num_nodes, _ = nodes.shape
+    power_basis1, power_basis2 = _locate_power_bases(nodes, x_vals, y_vals)
+
+    rows, all_roots = _roots_in_unit_interval_multi(power_basis1)
+    # NOTE: We want to check for "zero" values, i.e. f2(s) == 0, at
+    #       every root.
+    near_zero = np.abs(np.sum(
+        power_basis2[rows, :] *
+        all_roots[:, np.newaxis]**np.arange(num_nodes), axis=1))
+
+    # Take the root with the smallest value for each curve (the first
+    # one in the case of a tie, as ``np.argmin`` does).
+    order = np.lexsort((near_zero, rows))
+    first = np.ones(order.shape, dtype=bool)
+    first[1:] = rows[order[1:]] != rows[order[:-1]]
+    best = order[first]
+    best = best[near_zero[best] < _ZERO_THRESHOLD]
+
+    result = np.empty((num_curves,))
+    result.fill(np.nan)
+    result[rows[best]] = all_roots[best]
+    return result
@@ -17,6 +17,7 @@
 """
 
 
+import collections
 import enum
 import itertools
 
@@ -25,6 +26,8 @@ import six
 
 from bezier import _curve_helpers
 from bezier import _helpers
+from bezier import backend as backend_mod
+from bezier import stats as stats_mod
 try:
     from bezier import _speedup
 except ImportError:  # pragma: NO COVER
@@ -105,8 +108,27 @@ def _bbox_intersect(nodes1, nodes2):
         int: Enum from ``BoxIntersectionType`` indicating the type of
         bounding box intersection.
     """
-    left1, right1, bottom1, top1 = _helpers.bbox(nodes1)
-    left2, right2, bottom2, top2 = _helpers.bbox(nodes2)
+    return box_intersect(_helpers.bbox(nodes1), _helpers.bbox(nodes2))
+
+
+def box_intersect(box1, box2):
+    r"""Bounding box intersection predicate for precomputed boxes.
+
+    Like :func:`_bbox_intersect`, but for boxes that have already been
+    computed (e.g. the cached boxes of two shapes).
+
+    Args:
+        box1 (Tuple[float, float, float, float]): The left, right,
+            bottom and top bounds for the first box.
+        box2 (Tuple[float, float, float, float]): The left, right,
+            bottom and top bounds for the second box.
+
+    Returns:
+        int: Enum from ``BoxIntersectionType`` indicating the type of
+        bounding box intersection.
+    """
+    left1, right1, bottom1, top1 = box1
+    left2, right2, bottom2, top2 = box2
 
     if (right2 < left1 or right1 < left2 or
             top2 < bottom1 or top1 < bottom2):
@@ -1089,6 +1111,9 @@ def from_linearized(first, second, intersections):
         second.end_node, orig_second._nodes)
     # pylint: enable=protected-access
     if success:
+        stats = stats_mod.active()
+        if stats is not None:
+            stats.increment('intersect.newton_steps')
         intersection = Intersection(
             orig_first, refined_s, orig_second, refined_t)
         _add_intersection(intersection, intersections)
@@ -1292,19 +1317,335 @@ def bbox_line_intersect(nodes, line_start, line_end):
     return BoxIntersectionType.DISJOINT
 
 
-def intersect_one_round(candidates, intersections):
+class IntersectionStrategy(enum.Enum):
+    """Enum determining if the type of intersection algorithm to use."""
+
+    geometric = 'geometric'
+    """Geometric approach to intersection (via subdivision)."""
+
+    algebraic = 'algebraic'
+    """Algebraic approach to intersection (via implicitization)."""
+
+
+def _all_intersections_geometric(candidates):
+    r"""Find the points of intersection among pairs of curves.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+       However, functions used here will fail if that assumption
+       fails, e.g. :func:`bbox_intersect` and :func:`newton_refine`.
+
+    Args:
+        candidates (iterable): Iterable of pairs of curves that may
+            intersect.
+
+    Returns:
+        list: List of all :class:`Intersection`s (possibly empty).
+
+    Raises:
+        ValueError: If the subdivision iteration does not terminate
+            before exhausting the maximum number of subdivisions.
+        NotImplementedError: If the subdivision process picks up too
+            many candidate pairs. This typically indicates tangent
+            curves or coincident curves.
+    """
+    # NOTE: This cyclic import need be resolved.
+    from bezier import _intersection_multi
+
+    candidates = list(candidates)
+    if len(candidates) == 1:
+        # NOTE: A single pair (e.g. from :meth:`.Curve.intersect`) is
+        #       checked by the object-based round first, so the candidate
+        #       blocks are never built if the bounding boxes are disjoint.
+        intersections = []
+        if not _intersect_one_round(candidates, intersections):
+            return intersections
+
+    # NOTE: All candidates share a single pair index, so the limit on
+    #       accepted pairs applies to all of them together.
+    # pylint: disable=protected-access
+    intersections, = _intersection_multi._all_intersections_pool(
+        candidates, [0] * len(candidates), 1)
+    # pylint: enable=protected-access
+    if isinstance(intersections, Exception):
+        raise intersections
+    return intersections
+
+
+def _intersect_geometric_many(candidates):
+    r"""Find the points of intersection for many independent pairs of curves.
+
+    This is a batched version of :func:`_all_intersections_geometric`.
+    Rather than running the subdivision rounds once per pair, all pairs
+    go through each round together, so the per-round overhead is shared
+    across the batch.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+
+    Args:
+        candidates (list): List of pairs of curves that may intersect.
+
+    Returns:
+        list: List (with the same length as ``candidates``) of lists of
+        :class:`Intersection`s (each possibly empty). A pair that can't
+        be intersected (e.g. if the subdivision process picks up too many
+        candidate pairs) gets the error instead of a list, and the other
+        pairs are unaffected.
+    """
+    # NOTE: This cyclic import need be resolved.
+    from bezier import _intersection_multi
+
+    # pylint: disable=protected-access
+    return _intersection_multi._all_intersections_pool(
+        candidates, six.moves.xrange(len(candidates)), len(candidates))
+    # pylint: enable=protected-access
+
+
+def _curve_intersections_py(nodes1, nodes2):
+    r"""Find the points of intersection between two curves.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    This runs the full geometric intersection process (via
+    :func:`_all_intersections_geometric`) on a single pair of curves
+    described by their nodes.
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes of the first curve (assumed
+            in :math:`\mathbf{R}^2`).
+        nodes2 (numpy.ndarray): The nodes of the second curve (assumed
+            in :math:`\mathbf{R}^2`).
+
+    Returns:
+        Tuple[numpy.ndarray, int]: Pair of
+
+        * An ``N x 2`` array of the parameters ``(s, t)`` of each
+          intersection (only the first ``num_intersections`` rows
+          are meaningful).
+        * The number of intersections ``num_intersections``.
+
+    Raises:
+        ValueError: If the subdivision iteration does not terminate
+            before exhausting the maximum number of subdivisions.
+        NotImplementedError: If the subdivision process picks up too
+            many candidate pairs. This typically indicates tangent
+            curves or coincident curves.
+    """
+    # NOTE: This cyclic import need be resolved.
+    from bezier import curve as curve_mod
+
+    curve1 = curve_mod.Curve(nodes1, nodes1.shape[0] - 1, _copy=False)
+    curve2 = curve_mod.Curve(nodes2, nodes2.shape[0] - 1, _copy=False)
+    intersections = _all_intersections_geometric([(curve1, curve2)])
+    st_vals = np.empty((len(intersections), 2), order='F')
+    for index, intersection in enumerate(intersections):
+        st_vals[index, :] = intersection.s, intersection.t
+
+    return st_vals, len(intersections)
+
+
+def _curve_intersections_speedup(nodes1, nodes2):
+    r"""Find the points of intersection between two curves.
+
+    .. note::
+
+       This uses the compiled version of :func:`_curve_intersections_py`.
+       The compiled routine writes into a fixed size buffer (and counts
+       any intersections that don't fit), so it is called again with a
+       large enough buffer if the first guess is too small.
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes of the first curve (assumed
+            in :math:`\mathbf{R}^2`).
+        nodes2 (numpy.ndarray): The nodes of the second curve (assumed
+            in :math:`\mathbf{R}^2`).
+
+    Returns:
+        Tuple[numpy.ndarray, int]: Pair of
+
+        * An ``N x 2`` array of the parameters ``(s, t)`` of each
+          intersection (only the first ``num_intersections`` rows
+          are meaningful).
+        * The number of intersections ``num_intersections``.
+    """
+    st_vals, num_intersections = _speedup.speedup.curve_intersections(
+        nodes1, nodes2)
+    if num_intersections > st_vals.shape[0]:
+        st_vals, num_intersections = _speedup.speedup.curve_intersections(
+            nodes1, nodes2, max_intersections=num_intersections)
+
+    return st_vals, num_intersections
+
+
+def _pair_intersections(curve1, curve2, intersections):
+    """Find the points of intersection between two curves.
+
+    Helper for :func:`_all_intersections_pairwise` and
+    :func:`_intersect_pairwise_many`. Uses :func:`curve_intersections`
+    on the nodes of each curve and then maps the parameters back to the
+    root curves.
+
+    Args:
+        curve1 (Union[~bezier.curve.Curve, Linearization]): First curve
+            being intersected.
+        curve2 (Union[~bezier.curve.Curve, Linearization]): Second curve
+            being intersected.
+        intersections (list): A list of existing intersections.
+    """
+    # NOTE: Linearizations are re-computed by ``curve_intersections``,
+    #       so only the underlying curves are needed.
+    if isinstance(curve1, Linearization):
+        curve1 = curve1.curve
+    if isinstance(curve2, Linearization):
+        curve2 = curve2.curve
+    # pylint: disable=protected-access
+    st_vals, num_intersections = curve_intersections(
+        curve1._nodes, curve2._nodes)
+    for s, t in st_vals[:num_intersections, :]:
+        orig_s = (1.0 - s) * curve1._start + s * curve1._end
+        orig_t = (1.0 - t) * curve2._start + t * curve2._end
+        intersection = Intersection(
+            curve1._root, orig_s, curve2._root, orig_t)
+        _add_intersection(intersection, intersections)
+    # pylint: enable=protected-access
+
+
+def _all_intersections_pairwise(candidates):
+    r"""Find the points of intersection among pairs of curves.
+
+    Equivalent to :func:`_all_intersections_geometric`, but a single
+    pair is intersected by :func:`curve_intersections`. This is used when
+    the Fortran implementation of that function is available, since it
+    runs the entire subdivision process natively.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+
+    Args:
+        candidates (iterable): Iterable of pairs of curves that may
+            intersect.
+
+    Returns:
+        list: List of all :class:`Intersection`s (possibly empty).
+
+    Raises:
+        ValueError: If the subdivision iteration does not terminate
+            before exhausting the maximum number of subdivisions.
+        NotImplementedError: If the subdivision process picks up too
+            many candidate pairs. This typically indicates tangent
+            curves or coincident curves.
+    """
+    candidates = list(candidates)
+    if len(candidates) != 1:
+        # NOTE: The limit on accepted pairs applies to all of the
+        #       candidates together (see :func:`_all_intersections_geometric`)
+        #       while :func:`curve_intersections` can only apply it to
+        #       each pair separately.
+        return _all_intersections_geometric(candidates)
+
+    intersections = []
+    (curve1, curve2), = candidates
+    _pair_intersections(curve1, curve2, intersections)
+    return intersections
+
+
+def _intersect_or_error(intersect, pair):
+    """Find the points of intersection between a pair of curves.
+
+    Helper for the functions that intersect many independent pairs of
+    curves one pair at a time. An error for one pair shouldn't stop the
+    rest, so it is returned rather than raised.
+
+    Args:
+        intersect (Callable[[list], list]): The function used to intersect
+            a list of candidate pairs, e.g. :func:`_all_intersections_cached`.
+        pair (Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]): The pair of
+            curves to intersect.
+
+    Returns:
+        Union[list, Exception]: List of the :class:`Intersection`s
+        (possibly empty) or the error raised by ``intersect``.
+    """
+    try:
+        return intersect([pair])
+    except (NotImplementedError, ValueError) as exc:
+        return exc
+
+
+def _intersect_pairwise_many(candidates):
+    r"""Find the points of intersection for many independent pairs of curves.
+
+    Equivalent to :func:`_intersect_geometric_many`, but each pair
+    is intersected separately by :func:`curve_intersections`, i.e. this
+    is a loop over the pairs rather than a batch. This is used when the
+    Fortran implementation of that function is available, since running
+    the subdivision process natively for each pair is faster than the
+    batched rounds.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+
+    Args:
+        candidates (list): List of pairs of curves that may intersect.
+
+    Returns:
+        list: List (with the same length as ``candidates``) of lists of
+        :class:`Intersection`s (each possibly empty) or of the error for
+        each pair that can't be intersected.
+    """
+    return [
+        _intersect_or_error(_all_intersections_pairwise, pair)
+        for pair in candidates]
+
+
+def _uses_subdivision_cache(candidates):
+    """Check if any curve among pairs of curves has a subdivision cache.
+
+    Linearized curves are never subdivided, so they are ignored.
+
+    Args:
+        candidates (list): List of pairs of curves (or linearized curves).
+
+    Returns:
+        bool: Indicating if a subdivision cache is enabled on any of the
+        curves.
+    """
+    # NOTE: In the below we replace ``isinstance(a, B)`` with
+    #       ``a.__class__ is B``, which is a 3-3.5x speedup.
+    # pylint: disable=protected-access
+    return any(
+        curve.__class__ is not Linearization and
+        curve._subdivision is not None
+        for pair in candidates for curve in pair)
+    # pylint: enable=protected-access
+
+
+def _intersect_one_round(candidates, intersections):
     """Perform one step of the intersection process.
 
-    Checks if the bounding boxes of each pair in ``candidates``
-    intersect. If the bounding boxes do not intersect, the pair
-    is discarded. Otherwise, the pair is "accepted". Then we
-    attempt to linearize each curve in an "accepted" pair and
-    track the overall linearization error for every curve
-    encountered.
+    Helper for :func:`_all_intersections_geometric` and
+    :func:`_all_intersections_cached`. Checks if the bounding boxes of
+    each pair in ``candidates`` intersect. If they do not, the pair is
+    discarded. Otherwise, the pair is "accepted" (unless both curves in
+    the pair are linearized, in which case they are intersected
+    immediately).
 
     Args:
-        candidates (Union[list, itertools.chain]): An iterable of
-            pairs of curves (or linearized curves).
+        candidates (Iterable[Tuple[Union[~bezier.curve.Curve, \
+            Linearization], Union[~bezier.curve.Curve, Linearization]]]):
+            Pairs of curves (or linearized curves).
         intersections (list): A list of already encountered
             intersections. If any intersections can be readily determined
             during this round of subdivision, then they will be added
@@ -1331,7 +1672,10 @@ def intersect_one_round(candidates, intersections):
             bbox_int = bbox_line_intersect(
                 first._nodes, second.start_node, second.end_node)
         else:
-            bbox_int = bbox_intersect(first._nodes, second._nodes)
+            # NOTE: The boxes are cached along with the (cached) curves.
+            # pylint: disable=protected-access
+            bbox_int = box_intersect(first._get_bbox(), second._get_bbox())
+            # pylint: enable=protected-access
 
         if bbox_int == BoxIntersectionType.DISJOINT:
             continue
@@ -1348,50 +1692,37 @@ def intersect_one_round(candidates, intersections):
 def _next_candidates(first, second):
     """Take a pair of "accepted" curves and subdivide them.
 
-    Attempts to replace the subdivided curves with linearizations
-    if they are close enough to lines.
+    Helper for :func:`_all_intersections_cached`. Attempts to replace the
+    subdivided curves with linearizations if they are close enough to
+    lines.
 
     Args:
-        first (Union[.Curve, Linearization]): First curve in pair.
-        second (Union[.Curve, Linearization]): Second curve in pair.
+        first (Union[~bezier.curve.Curve, Linearization]): First curve in
+            pair.
+        second (Union[~bezier.curve.Curve, Linearization]): Second curve in
+            pair.
 
     Returns:
         itertools.product: Iterator of pairs of first and second curves after
         subdivision, some of which may be linearized.
     """
-    # NOTE: This may be a wasted computation, e.g. if ``first``
-    #       or ``second`` occur in multiple accepted pairs (the caller
-    #       only passes one pair at a time). However, in practice
-    #       the number of such pairs will be small so this cost
-    #       will be low.
     lin1 = six.moves.map(Linearization.from_shape, first.subdivide())
     lin2 = six.moves.map(Linearization.from_shape, second.subdivide())
     return itertools.product(lin1, lin2)
 
 
-class IntersectionStrategy(enum.Enum):
-    """Enum determining if the type of intersection algorithm to use."""
-
-    geometric = 'geometric'
-    """Geometric approach to intersection (via subdivision)."""
-
-    algebraic = 'algebraic'
-    """Algebraic approach to intersection (via implicitization)."""
-
-
-def _all_intersections_geometric(candidates):
+def _all_intersections_cached(candidates):
     r"""Find the points of intersection among pairs of curves.
 
-    .. note::
-
-       This assumes all curves in a candidate pair are in
-       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
-       However, functions used here will fail if that assumption
-       fails, e.g. :func:`bbox_intersect` and :func:`newton_refine`.
+    Equivalent to :func:`_all_intersections_geometric`, but the curves
+    are subdivided one at a time via :meth:`~bezier.curve.Curve.subdivide`
+    rather than in struct-of-arrays blocks. This is used (instead of
+    the pure Python or compiled versions of the subdivision process)
+    when a curve has a subdivision cache, since it is the only version
+    that re-uses the cached sub-curves and bounding boxes.
 
     Args:
-        candidates (iterable): Iterable of pairs of curves that may
-            intersect.
+        candidates (list): List of pairs of curves that may intersect.
 
     Returns:
         list: List of all :class:`Intersection`s (possibly empty).
@@ -1403,8 +1734,6 @@ def _all_intersections_geometric(candidates):
             many candidate pairs. This typically indicates tangent
             curves or coincident curves.
     """
-    # First make sure any curves that are linear / near-linear are
-    # linearized (to avoid unnecessary checks, e.g. bbox intersect check).
     candidates = [
         (Linearization.from_shape(first), Linearization.from_shape(second))
         for first, second in candidates
@@ -1412,7 +1741,7 @@ def _all_intersections_geometric(candidates):
 
     intersections = []
     for _ in six.moves.xrange(_MAX_INTERSECT_SUBDIVISIONS):
-        accepted = intersect_one_round(candidates, intersections)
+        accepted = _intersect_one_round(candidates, intersections)
         if len(accepted) > _MAX_CANDIDATES:
             msg = _TOO_MANY_TEMPLATE.format(
                 len(accepted), 4 * len(accepted))
@@ -1464,7 +1793,10 @@ def _all_intersections_algebraic(candidates):
         curve2 = second.curve if second.__class__ is Linearization else second
         nodes2 = curve2._nodes
         # Only attempt this if the bounding boxes intersect.
-        if bbox_intersect(nodes1, nodes2) == BoxIntersectionType.DISJOINT:
+        # pylint: disable=protected-access
+        bbox_int = box_intersect(curve1._get_bbox(), curve2._get_bbox())
+        # pylint: enable=protected-access
+        if bbox_int == BoxIntersectionType.DISJOINT:
             continue
 
         st_vals = _implicitization.intersect_curves(nodes1, nodes2)
@@ -1475,6 +1807,85 @@ def _all_intersections_algebraic(candidates):
     return result
 
 
+def _group_by_degrees(candidates):
+    """Group pairs of curves by their degrees.
+
+    Helper for :func:`_intersect_algebraic_many`. Pairs with disjoint
+    bounding boxes are left out, since they can't intersect.
+
+    Args:
+        candidates (list): List of pairs of curves that may intersect.
+
+    Returns:
+        collections.OrderedDict: Mapping from the degrees of the two
+        curves to a pair of lists: the indices (in ``candidates``) of
+        the pairs with those degrees and the pairs of curves.
+    """
+    groups = collections.OrderedDict()
+    for pair_index, (first, second) in enumerate(candidates):
+        # NOTE: In the below we replace ``isinstance(a, B)`` with
+        #       ``a.__class__ is B``, which is a 3-3.5x speedup.
+        curve1 = first.curve if first.__class__ is Linearization else first
+        curve2 = second.curve if second.__class__ is Linearization else second
+        # Only attempt this if the bounding boxes intersect.
+        # pylint: disable=protected-access
+        bbox_int = box_intersect(curve1._get_bbox(), curve2._get_bbox())
+        # pylint: enable=protected-access
+        if bbox_int == BoxIntersectionType.DISJOINT:
+            continue
+
+        key = (curve1._degree, curve2._degree)
+        pair_indices, pairs = groups.setdefault(key, ([], []))
+        pair_indices.append(pair_index)
+        pairs.append((curve1, curve2))
+
+    return groups
+
+
+def _intersect_algebraic_many(candidates):
+    r"""Find the points of intersection for many independent pairs of curves.
+
+    Equivalent to calling :func:`_all_intersections_algebraic` on each
+    pair, but the pairs are grouped by the degrees of the two curves and
+    each group is intersected at once by
+    :func:`._implicitization.intersect_curves_many`.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+
+    Args:
+        candidates (list): List of pairs of curves that may intersect.
+
+    Returns:
+        list: List (with the same length as ``candidates``) of lists of
+        :class:`Intersection`s (each possibly empty) or of the error for
+        each pair that can't be intersected.
+    """
+    # NOTE: This cyclic import need be resolved.
+    from bezier import _implicitization
+
+    result = [[] for _ in candidates]
+    groups = _group_by_degrees(candidates)
+    for pair_indices, pairs in six.itervalues(groups):
+        rows, st_vals, failed = _implicitization.intersect_curves_many(
+            np.asarray([curve1._nodes for curve1, _ in pairs]),
+            np.asarray([curve2._nodes for _, curve2 in pairs]))
+        for row, (s, t) in six.moves.zip(rows, st_vals):
+            curve1, curve2 = pairs[row]
+            result[pair_indices[row]].append(
+                Intersection(curve1, s, curve2, t))
+        # NOTE: The failed pairs are intersected again on their own, to
+        #       report the error for each of them.
+        for row in failed:
+            result[pair_indices[row]] = _intersect_or_error(
+                _all_intersections_algebraic, pairs[row])
+
+    return result
+
+
+@stats_mod.timed('intersect')
 def all_intersections(candidates, strategy=IntersectionStrategy.geometric):
     r"""Find the points of intersection among pairs of curves.
 
@@ -1498,13 +1909,53 @@ def all_intersections(candidates, strategy=IntersectionStrategy.geometric):
         ValueError: If the strategy is not known.
     """
     if strategy is IntersectionStrategy.geometric:
-        return _all_intersections_geometric(candidates)
+        candidates = list(candidates)
+        if _uses_subdivision_cache(candidates):
+            return _all_intersections_cached(candidates)
+        return _geometric_intersections(candidates)
     elif strategy is IntersectionStrategy.algebraic:
         return _all_intersections_algebraic(candidates)
     else:
         raise ValueError('Unexpected strategy.')
 
 
+@stats_mod.timed('intersect')
+def all_intersections_many(
+        candidates, strategy=IntersectionStrategy.geometric):
+    r"""Find the points of intersection for many independent pairs of curves.
+
+    .. note::
+
+       This assumes all curves in a candidate pair are in
+       :math:`\mathbf{R}^2`, but does not **explicitly** check this.
+
+    Args:
+        candidates (list): List of pairs of curves that may intersect.
+        strategy (Optional[~bezier.curve.IntersectionStrategy]): The
+            intersection algorithm to use. Defaults to geometric.
+
+    Returns:
+        list: List (with the same length as ``candidates``) of lists of
+        :class:`Intersection`s (each possibly empty). A pair that can't
+        be intersected (e.g. tangent curves with the algebraic strategy
+        or coincident curves) gets the error instead of a list, and the
+        other pairs are unaffected.
+
+    Raises:
+        ValueError: If the strategy is not known.
+    """
+    if strategy is IntersectionStrategy.geometric:
+        if _uses_subdivision_cache(candidates):
+            return [
+                _intersect_or_error(_all_intersections_cached, pair)
+                for pair in candidates]
+        return _geometric_intersections_many(candidates)
+    elif strategy is IntersectionStrategy.algebraic:
+        return _intersect_algebraic_many(candidates)
+    else:
+        raise ValueError('Unexpected strategy.')
+
+
 class BoxIntersectionType(object):  # pylint: disable=too-few-public-methods
     """Enum representing all possible bounding box intersections.
 
@@ -1645,6 +2096,9 @@ if _speedup is None:  # pragma: NO COVER
     bbox_intersect = _bbox_intersect
     parallel_different = _parallel_different
     _from_linearized_low_level = _from_linearized_low_level_py
+    curve_intersections = _curve_intersections_py
+    _geometric_intersections = _all_intersections_geometric
+    _geometric_intersections_many = _intersect_geometric_many
 else:
     linearization_error = _speedup.speedup.linearization_error
     segment_intersection = _speedup.speedup.segment_intersection
@@ -1652,4 +2106,18 @@ else:
     bbox_intersect = _speedup.speedup.bbox_intersect
     parallel_different = _speedup.speedup.parallel_different
     _from_linearized_low_level = _speedup.speedup.from_linearized
+    curve_intersections = _curve_intersections_speedup
+    _geometric_intersections = _all_intersections_pairwise
+    _geometric_intersections_many = _intersect_pairwise_many
 # pylint: enable=invalid-name
+backend_mod.register_defaults(__name__, {
+    'linearization_error': _linearization_error,
+    'segment_intersection': _segment_intersection,
+    'newton_refine': _newton_refine,
+    'bbox_intersect': _bbox_intersect,
+    'parallel_different': _parallel_different,
+    '_from_linearized_low_level': _from_linearized_low_level_py,
+    'curve_intersections': _curve_intersections_py,
+    '_geometric_intersections': _all_intersections_geometric,
+    '_geometric_intersections_many': _intersect_geometric_many,
+})
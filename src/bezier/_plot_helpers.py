@@ -16,6 +16,7 @@
 import numpy as np
 
 from bezier import _helpers
+from bezier import _tessellation_helpers
 
 
 def new_axis():
@@ -75,26 +76,13 @@ def add_patch(ax, color, pts_per_edge, *edges):
     from matplotlib import patches
     from matplotlib import path as _path_mod
 
-    s_vals = np.linspace(0.0, 1.0, pts_per_edge)
-
-    # Evaluate points on each edge.
-    all_points = []
-    for edge in edges:
-        points = edge.evaluate_multi(s_vals)
-        # We assume the edges overlap and leave out the first point
-        # in each.
-        all_points.append(points[1:, :])
-
-    # Add first point as last point (polygon is closed).
-    first_edge = all_points[0]
-    # NOTE: ``first_edge[[0], :]`` makes a copy while the access
-    #       below **does not** copy. See
-    #       (https://docs.scipy.org/doc/numpy-1.6.0/reference/
-    #        arrays.indexing.html#advanced-indexing)
-    all_points.append(first_edge[0, :].reshape((1, 2), order='F'))
+    # Evaluate points on each edge (the last row closes the polygon).
+    num_vertices = len(edges) * (pts_per_edge - 1)
+    polygon = np.empty((num_vertices + 1, 2), order='F')
+    _tessellation_helpers.fill_boundary(edges, pts_per_edge, polygon)
+    polygon[num_vertices, :] = polygon[0, :]
 
     # Add boundary first.
-    polygon = np.asfortranarray(np.vstack(all_points))
     line, = ax.plot(polygon[:, 0], polygon[:, 1], color=color)
     # Reset ``color`` in case it was ``None`` and set from color wheel.
     color = line.get_color()
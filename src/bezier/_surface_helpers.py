@@ -29,6 +29,7 @@ import six
 from bezier import _curve_helpers
 from bezier import _helpers
 from bezier import _intersection_helpers
+from bezier import backend as backend_mod
 from bezier import curved_polygon
 try:
     from bezier import _speedup
@@ -37,8 +38,10 @@ except ImportError:  # pragma: NO COVER
 
 
 _MAX_POLY_SUBDIVISIONS = 5
-_MAX_LOCATE_SUBDIVISIONS = 20
-_LOCATE_EPS = 2.0**(-47)
+_MAX_CACHED_TRANSFORMS = 32
+# Process-wide LRU cache of de Casteljau transforms (keyed by degree and
+# barycentric weights).
+_TRANSFORMS = collections.OrderedDict()
 _SIGN = np.sign  # pylint: disable=no-member
 _FLOAT64 = np.float64  # pylint: disable=no-member
 _SAME_CURVATURE = 'Tangent curves have same curvature.'
@@ -590,6 +593,42 @@ def _make_transform(degree, weights_a, weights_b, weights_c):
     return transform
 
 
+def _get_transform(degree, weights_a, weights_b, weights_c):
+    """Get the (cached) matrices corresponding to the de Casteljau algorithm.
+
+    The matrices are computed via :func:`_make_transform` the first time
+    a given degree and set of weights are requested and are then re-used
+    by subsequent calls. Only the most recently used transforms are kept.
+
+    Args:
+        degree (int): The degree of a candidate surface.
+        weights_a (Tuple[float, float, float]): Barycentric weights for a
+            point in the reference triangle
+        weights_b (Tuple[float, float, float]): Barycentric weights for a
+            point in the reference triangle
+        weights_c (Tuple[float, float, float]): Barycentric weights for a
+            point in the reference triangle
+
+    Returns:
+        Mapping[int, numpy.ndarray]: Mapping from keys to the de Casteljau
+        transformation mappings. The keys are ``0`` corresponding to
+        ``weights_a``, ``1`` to ``weights_b`` and ``2`` to ``weights_c``.
+    """
+    key = (degree, tuple(weights_a), tuple(weights_b), tuple(weights_c))
+    transform = _TRANSFORMS.pop(key, None)
+    if transform is None:
+        transform = _make_transform(degree, weights_a, weights_b, weights_c)
+        for matrix in six.itervalues(transform):
+            matrix.flags.writeable = False
+
+    # NOTE: Re-inserting the entry marks it as most recently used.
+    _TRANSFORMS[key] = transform
+    if len(_TRANSFORMS) > _MAX_CACHED_TRANSFORMS:
+        _TRANSFORMS.popitem(last=False)
+
+    return transform
+
+
 def _reduced_to_matrix(shape, degree, vals_by_weight):
     r"""Converts a reduced values dictionary into a matrix.
 
@@ -664,7 +703,7 @@ def specialize_surface(nodes, degree, weights_a, weights_b, weights_c):
 
     for reduced_deg in six.moves.xrange(degree - 1, 0, -1):
         new_partial = {}
-        transform = _make_transform(
+        transform = _get_transform(
             reduced_deg, weights_a, weights_b, weights_c)
         for key, sub_nodes in six.iteritems(partial_vals):
             # Our keys are ascending so we increment from the last value.
@@ -678,35 +717,6 @@ def specialize_surface(nodes, degree, weights_a, weights_b, weights_c):
     return _reduced_to_matrix(nodes.shape, degree, partial_vals)
 
 
-def _mean_centroid(candidates):
-    """Take the mean of all centroids in set of reference triangles.
-
-    Args:
-        candidates (List[.Surface]): List of surfaces. We'll only use
-            the base ``x`` and ``y`` and the width of the reference
-            triangle that each surface represents.
-
-    Returns:
-        Tuple[float, float]: The mean of all centroids.
-    """
-    sum_x = 0.0
-    sum_y = 0.0
-    sum_width = 0.0
-    for candidate in candidates:
-        # pylint: disable=protected-access
-        sum_x += candidate._base_x
-        sum_y += candidate._base_y
-        sum_width += candidate._width
-        # pylint: enable=protected-access
-
-    denom = float(len(candidates))
-    mean_x = sum_x / denom
-    mean_y = sum_y / denom
-    width_delta = sum_width / (3.0 * denom)
-
-    return mean_x + width_delta, mean_y + width_delta
-
-
 def jacobian_s(nodes, degree, dimension):
     r"""Compute :math:`\frac{\partial B}{\partial s}`.
 
@@ -1040,54 +1050,6 @@ def newton_refine(nodes, degree, x_val, y_val, s, t):
     return s + delta_s, t + delta_t
 
 
-def locate_point(surface, x_val, y_val):
-    r"""Locate a point on a surface.
-
-    Does so by recursively subdividing the surface and rejecting
-    sub-surfaces with bounding boxes that don't contain the point.
-    After the sub-surfaces are sufficiently small, uses Newton's
-    method to zoom in on the intersection.
-
-    Args:
-        surface (.Surface): A B |eacute| zier surface (assumed to
-            be two-dimensional).
-        x_val (float): The :math:`x`-coordinate of a point
-            on the surface.
-        y_val (float): The :math:`y`-coordinate of a point
-            on the surface.
-
-    Returns:
-        Optional[Tuple[float, float]]: The :math:`s` and :math:`t`
-        values corresponding to ``x_val`` and ``y_val`` or
-        :data:`None` if the point is not on the ``surface``.
-    """
-    candidates = [surface]
-    for _ in six.moves.xrange(_MAX_LOCATE_SUBDIVISIONS + 1):
-        next_candidates = []
-        for candidate in candidates:
-            nodes = candidate._nodes
-            if _helpers.contains(nodes, x_val, y_val):
-                next_candidates.extend(candidate.subdivide())
-
-        candidates = next_candidates
-
-    if not candidates:
-        return None
-
-    # We take the average of all centroids from the candidates
-    # that may contain the point.
-    s_approx, t_approx = _mean_centroid(candidates)
-    s, t = newton_refine(
-        surface._nodes, surface._degree, x_val, y_val, s_approx, t_approx)
-
-    actual = surface.evaluate_cartesian(s, t, _verify=False)
-    expected = np.asfortranarray([[x_val, y_val]])
-    if not _helpers.vector_close(actual, expected, eps=_LOCATE_EPS):
-        s, t = newton_refine(
-            surface._nodes, surface._degree, x_val, y_val, s, t)
-    return s, t
-
-
 def classify_intersection(intersection):
     r"""Determine which curve is on the "inside of the intersection".
 
@@ -2461,3 +2423,11 @@ else:
     jacobian_both = _speedup.speedup.jacobian_both
     jacobian_det = _speedup.speedup.jacobian_det
 # pylint: enable=invalid-name
+backend_mod.register_defaults(__name__, {
+    'de_casteljau_one_round': _de_casteljau_one_round,
+    'evaluate_barycentric': _evaluate_barycentric,
+    'evaluate_barycentric_multi': _evaluate_barycentric_multi,
+    'evaluate_cartesian_multi': _evaluate_cartesian_multi,
+    'jacobian_both': _jacobian_both,
+    'jacobian_det': _jacobian_det,
+})
@@ -0,0 +1,642 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Private helper methods for locating and evaluating many points at once.
+
+These are used by :mod:`bezier.surface` to locate points on a
+surface, subdivide many surfaces at once and evaluate many surfaces at
+the same parameters.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+"""
+
+
+import numpy as np
+import six
+
+from bezier import _helpers
+from bezier import _surface_helpers
+from bezier import backend as backend_mod
+from bezier import stats as stats_mod
+try:
+    from bezier import _speedup
+except ImportError:  # pragma: NO COVER
+    _speedup = None
+
+
+_MAX_LOCATE_SUBDIVISIONS = 20
+_LOCATE_EPS = 2.0**(-47)
+# NOTE: This is the sentinel used by the compiled ``locate_point_surface``.
+_LOCATE_MISS = -1.0
+# Process-wide cache of subdivision matrices (keyed by degree).
+_SUBDIVISION_MATRICES = {}
+
+
+def _mean_centroid(candidates):
+    """Take the mean of all centroids in set of reference triangles.
+
+    Args:
+        candidates (List[.Surface]): List of surfaces. We'll only use
+            the base ``x`` and ``y`` and the width of the reference
+            triangle that each surface represents.
+
+    Returns:
+        Tuple[float, float]: The mean of all centroids.
+    """
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_width = 0.0
+    for candidate in candidates:
+        # pylint: disable=protected-access
+        sum_x += candidate._base_x
+        sum_y += candidate._base_y
+        sum_width += candidate._width
+        # pylint: enable=protected-access
+
+    denom = float(len(candidates))
+    mean_x = sum_x / denom
+    mean_y = sum_y / denom
+    width_delta = sum_width / (3.0 * denom)
+
+    return mean_x + width_delta, mean_y + width_delta
+
+
+@stats_mod.timed('surface.locate')
+def _locate_point(surface, x_val, y_val):
+    r"""Locate a point on a surface.
+
+    Does so by recursively subdividing the surface and rejecting
+    sub-surfaces with bounding boxes that don't contain the point.
+    After the sub-surfaces are sufficiently small, uses Newton's
+    method to zoom in on the intersection.
+
+    Args:
+        surface (.Surface): A B |eacute| zier surface (assumed to
+            be two-dimensional).
+        x_val (float): The :math:`x`-coordinate of a point
+            on the surface.
+        y_val (float): The :math:`y`-coordinate of a point
+            on the surface.
+
+    Returns:
+        Optional[Tuple[float, float]]: The :math:`s` and :math:`t`
+        values corresponding to ``x_val`` and ``y_val`` or
+        :data:`None` if the point is not on the ``surface``.
+    """
+    candidates = [surface]
+    for _ in six.moves.xrange(_MAX_LOCATE_SUBDIVISIONS + 1):
+        next_candidates = []
+        for candidate in candidates:
+            # pylint: disable=protected-access
+            bbox = candidate._get_bbox()
+            # pylint: enable=protected-access
+            if _helpers.box_contains(bbox, x_val, y_val):
+                next_candidates.extend(candidate.subdivide())
+
+        candidates = next_candidates
+
+    stats = stats_mod.active()
+    if stats is not None:
+        stats.increment('locate.candidates', len(candidates))
+    if not candidates:
+        return None
+
+    # We take the average of all centroids from the candidates
+    # that may contain the point.
+    s_approx, t_approx = _mean_centroid(candidates)
+    s, t = _surface_helpers.newton_refine(
+        surface._nodes, surface._degree, x_val, y_val, s_approx, t_approx)
+    num_steps = 1
+
+    actual = surface.evaluate_cartesian(s, t, _verify=False)
+    expected = np.asfortranarray([[x_val, y_val]])
+    if not _helpers.vector_close(actual, expected, eps=_LOCATE_EPS):
+        s, t = _surface_helpers.newton_refine(
+            surface._nodes, surface._degree, x_val, y_val, s, t)
+        num_steps += 1
+
+    if stats is not None:
+        stats.increment('locate.newton_steps', num_steps)
+    return s, t
+
+
+@stats_mod.timed('surface.locate')
+def _locate_point_speedup(surface, x_val, y_val):
+    r"""Locate a point on a surface.
+
+    .. note::
+
+       This uses a compiled version of :func:`_locate_point`, which does
+       the subdivision, bounding box checks and Newton refinement without
+       creating any intermediate :class:`.Surface` objects. As in
+       :func:`_locate_point`, the initial guess for Newton's method uses
+       the reference triangle that ``surface`` represents, so the two
+       agree on sub-surfaces.
+
+    Args:
+        surface (.Surface): A B |eacute| zier surface (assumed to
+            be two-dimensional).
+        x_val (float): The :math:`x`-coordinate of a point
+            on the surface.
+        y_val (float): The :math:`y`-coordinate of a point
+            on the surface.
+
+    Returns:
+        Optional[Tuple[float, float]]: The :math:`s` and :math:`t`
+        values corresponding to ``x_val`` and ``y_val`` or
+        :data:`None` if the point is not on the ``surface``.
+    """
+    # pylint: disable=protected-access
+    s, t = _speedup.speedup.locate_point_surface(
+        surface._nodes, surface._degree, surface._base_x, surface._base_y,
+        surface._width, x_val, y_val)
+    # pylint: enable=protected-access
+    if s == _LOCATE_MISS:
+        return None
+
+    return s, t
+
+
+# NOTE: Only the pure Python version subdivides via
+#       :meth:`.Surface.subdivide`, so it is used (with or without the
+#       speedup) for surfaces that have a subdivision cache.
+locate_point_cached = _locate_point  # pylint: disable=invalid-name
+
+
+def locate_point_cached_multi(surface, points):
+    r"""Locate many points on a surface that has a subdivision cache.
+
+    Unlike :func:`locate_point_multi`, each point is located on its own
+    via :func:`locate_point_cached`, so that every point re-uses (and
+    adds to) the cached sub-surfaces.
+
+    Args:
+        surface (.Surface): A B |eacute| zier surface (assumed to
+            be two-dimensional).
+        points (numpy.ndarray): ``N x 2`` array of points to locate.
+
+    Returns:
+        numpy.ndarray: ``N x 2`` array of the :math:`s` and :math:`t`
+        values corresponding to each row of ``points``, with NaN for
+        each point that is not on the ``surface``.
+    """
+    result = np.full((points.shape[0], 2), np.nan, order='F')
+    for index, (x_val, y_val) in enumerate(points):
+        st_vals = locate_point_cached(surface, x_val, y_val)
+        if st_vals is not None:
+            result[index, :] = st_vals
+
+    return result
+
+
+def subdivision_matrices(degree):
+    """Get the (cached) matrices used to subdivide a surface.
+
+    For degrees one through four, these are the stored constants (e.g.
+    :data:`.QUADRATIC_SUBDIVIDE_A`). For higher degrees, the matrices are
+    computed the first time a given degree is requested and are then
+    re-used by every subsequent call. Since they are shared, they are
+    marked read-only.
+
+    Args:
+        degree (int): The degree of the surface.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        The matrices that produce the nodes of the sub-surfaces ``A``,
+        ``B``, ``C`` and ``D`` (as in :meth:`.Surface.subdivide`).
+    """
+    if degree == 1:
+        return (
+            _surface_helpers.LINEAR_SUBDIVIDE_A,
+            _surface_helpers.LINEAR_SUBDIVIDE_B,
+            _surface_helpers.LINEAR_SUBDIVIDE_C,
+            _surface_helpers.LINEAR_SUBDIVIDE_D)
+    elif degree == 2:
+        return (
+            _surface_helpers.QUADRATIC_SUBDIVIDE_A,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_B,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_C,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_D)
+    elif degree == 3:
+        return (
+            _surface_helpers.CUBIC_SUBDIVIDE_A,
+            _surface_helpers.CUBIC_SUBDIVIDE_B,
+            _surface_helpers.CUBIC_SUBDIVIDE_C,
+            _surface_helpers.CUBIC_SUBDIVIDE_D)
+    elif degree == 4:
+        return (
+            _surface_helpers.QUARTIC_SUBDIVIDE_A,
+            _surface_helpers.QUARTIC_SUBDIVIDE_B,
+            _surface_helpers.QUARTIC_SUBDIVIDE_C,
+            _surface_helpers.QUARTIC_SUBDIVIDE_D)
+
+    matrices = _SUBDIVISION_MATRICES.get(degree)
+    if matrices is None:
+        # NOTE: Specialization is linear in the nodes, so specializing
+        #       the identity gives the matrix.
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        identity = _helpers.eye(num_nodes)
+        matrices = (
+            _surface_helpers.specialize_surface(
+                identity, degree,
+                (1.0, 0.0, 0.0), (0.5, 0.5, 0.0), (0.5, 0.0, 0.5)),
+            _surface_helpers.specialize_surface(
+                identity, degree,
+                (0.0, 0.5, 0.5), (0.5, 0.0, 0.5), (0.5, 0.5, 0.0)),
+            _surface_helpers.specialize_surface(
+                identity, degree,
+                (0.5, 0.5, 0.0), (0.0, 1.0, 0.0), (0.0, 0.5, 0.5)),
+            _surface_helpers.specialize_surface(
+                identity, degree,
+                (0.5, 0.0, 0.5), (0.0, 0.5, 0.5), (0.0, 0.0, 1.0)),
+        )
+        for matrix in matrices:
+            matrix.flags.writeable = False
+        _SUBDIVISION_MATRICES[degree] = matrices
+
+    return matrices
+
+
+def _subdivision_matrices(degree):
+    """Get the stacked matrices used to subdivide a surface.
+
+    Helper for :func:`locate_point_multi`.
+
+    Args:
+        degree (int): The degree of the surface.
+
+    Returns:
+        numpy.ndarray: The four matrices that produce the nodes of the
+        sub-surfaces ``A``, ``B``, ``C`` and ``D`` (as in
+        :meth:`.Surface.subdivide`) stacked on top of one another.
+    """
+    return np.vstack(subdivision_matrices(degree))
+
+
+def _sub_reference_triangles(base_x, base_y, widths):
+    """Get the reference triangles of the sub-surfaces of many surfaces.
+
+    Helper for :func:`subdivide_multi`.
+
+    Args:
+        base_x (numpy.ndarray): The ``N`` base :math:`x`-values of the
+            reference triangles that each surface represents.
+        base_y (numpy.ndarray): The ``N`` base :math:`y`-values of the
+            reference triangles that each surface represents.
+        widths (numpy.ndarray): The ``N`` widths of the reference
+            triangles that each surface represents.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The ``4N``
+        base :math:`x`-values, base :math:`y`-values and widths of the
+        sub-surfaces.
+    """
+    half_widths = 0.5 * widths
+    shifted_x = base_x + half_widths
+    shifted_y = base_y + half_widths
+    # NOTE: These match the reference triangles used by
+    #       :meth:`.Surface.subdivide`.
+    new_base_x = np.column_stack([
+        base_x, shifted_x, shifted_x, base_x]).ravel()
+    new_base_y = np.column_stack([
+        base_y, shifted_y, base_y, shifted_y]).ravel()
+    new_widths = np.column_stack([
+        half_widths, -half_widths, half_widths, half_widths]).ravel()
+    return new_base_x, new_base_y, new_widths
+
+
+def subdivide_multi(nodes, degree, base_x, base_y, widths):
+    """Subdivide many surfaces (of the same degree) at once.
+
+    This is a vectorized version of :meth:`.Surface.subdivide`. The
+    nodes of all ``4N`` sub-surfaces are computed with a single stacked
+    matrix product rather than four matrix products (and four
+    :class:`.Surface` objects) per surface.
+
+    Args:
+        nodes (numpy.ndarray): ``N x M x D`` array of nodes, one ``M x D``
+            set of nodes for each surface.
+        degree (int): The degree of each of the surfaces.
+        base_x (numpy.ndarray): The ``N`` base :math:`x`-values of the
+            reference triangles that each surface represents.
+        base_y (numpy.ndarray): The ``N`` base :math:`y`-values of the
+            reference triangles that each surface represents.
+        widths (numpy.ndarray): The ``N`` widths of the reference
+            triangles that each surface represents.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        The ``4N x M x D`` nodes and the ``4N`` base :math:`x`-values,
+        base :math:`y`-values and widths of the sub-surfaces. The
+        children of surface ``j`` are ``4j, ..., 4j + 3`` (in the same
+        order as :meth:`.Surface.subdivide`).
+    """
+    num_surfaces, num_nodes, dimension = nodes.shape
+    new_nodes = np.matmul(_subdivision_matrices(degree), nodes).reshape(
+        (4 * num_surfaces, num_nodes, dimension))
+    new_base_x, new_base_y, new_widths = _sub_reference_triangles(
+        base_x, base_y, widths)
+    return new_nodes, new_base_x, new_base_y, new_widths
+
+
+def _newton_solve_multi(jac_both, points, surf_vals):
+    """Solve the Newton systems for many points on a surface.
+
+    This is a vectorized version of :func:`._newton_refine_solve`.
+
+    Args:
+        jac_both (numpy.ndarray): ``N x 4`` array of the Jacobian
+            (:math:`B_s` followed by :math:`B_t`) at each point.
+        points (numpy.ndarray): ``N x 2`` array of points on the surface.
+        surf_vals (numpy.ndarray): ``N x 2`` array of the surface
+            evaluated at the current parameters.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The Newton updates for the
+        :math:`s` and :math:`t` values.
+    """
+    a_vals, b_vals, c_vals, d_vals = jac_both.T
+    e_vals, f_vals = (points - surf_vals).T
+    denoms = a_vals * d_vals - b_vals * c_vals
+    delta_s = (d_vals * e_vals - c_vals * f_vals) / denoms
+    delta_t = (a_vals * f_vals - b_vals * e_vals) / denoms
+    return delta_s, delta_t
+
+
+def _newton_refine_multi(nodes, degree, points, s_vals, t_vals):
+    """Perform one round of Newton's method for many points on a surface.
+
+    This is a vectorized version of :func:`.newton_refine`.
+
+    Args:
+        nodes (numpy.ndarray): Array of nodes in a surface.
+        degree (int): The degree of the surface.
+        points (numpy.ndarray): ``N x 2`` array of points on the surface.
+        s_vals (numpy.ndarray): Approximate :math:`s`-values to be refined.
+        t_vals (numpy.ndarray): Approximate :math:`t`-values to be refined.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The refined :math:`s` and
+        :math:`t` values.
+    """
+    param_vals = np.empty((s_vals.size, 3), order='F')
+    param_vals[:, 0] = 1.0 - s_vals - t_vals
+    param_vals[:, 1] = s_vals
+    param_vals[:, 2] = t_vals
+    surf_vals = _surface_helpers.evaluate_barycentric_multi(
+        nodes, degree, param_vals, 2)
+    # No refinement is needed for points that are already hit exactly.
+    needed = np.any(surf_vals != points, axis=1)
+
+    # NOTE: This function assumes ``dimension==2`` (i.e. since ``x, y``).
+    jac_nodes = _surface_helpers.jacobian_both(nodes, degree, 2)
+    # The degree of the jacobian is one less.
+    jac_both = _surface_helpers.evaluate_barycentric_multi(
+        jac_nodes, degree - 1, param_vals[needed, :], 4)
+
+    new_s = np.array(s_vals, dtype=np.float64)
+    new_t = np.array(t_vals, dtype=np.float64)
+    delta_s, delta_t = _newton_solve_multi(
+        jac_both, points[needed, :], surf_vals[needed, :])
+    new_s[needed] += delta_s
+    new_t[needed] += delta_t
+    return new_s, new_t
+
+
+def _locate_candidates_multi(surface, points):
+    """Find the sub-surfaces that may contain each of many points.
+
+    Helper for :func:`locate_point_multi`. The sub-surfaces are shared
+    among all of the points and each sub-surface is subdivided (at most)
+    once per round.
+
+    Args:
+        surface (.Surface): A B |eacute| zier surface (assumed to
+            be two-dimensional).
+        points (numpy.ndarray): ``N x 2`` array of points to locate.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, \
+        numpy.ndarray]: The point (i.e. the row of ``points``) and the
+        base :math:`x`-value, base :math:`y`-value and width of the
+        sub-surface in every remaining (sub-surface, point) pair. The
+        pairs for each point are in the same order that
+        :func:`locate_point` visits the sub-surfaces.
+    """
+    # pylint: disable=protected-access
+    degree = surface._degree
+    # Each sub-surface is a "row" in the stacked arrays below.
+    sub_nodes = surface._nodes[np.newaxis, :, :]
+    base_x = np.asarray([surface._base_x])
+    base_y = np.asarray([surface._base_y])
+    widths = np.asarray([surface._width])
+    # pylint: enable=protected-access
+
+    # Track every (sub-surface, point) pair that hasn't been ruled out.
+    num_points = points.shape[0]
+    surface_ids = np.zeros((num_points,), dtype=int)
+    point_ids = np.arange(num_points)
+    for _ in six.moves.xrange(_MAX_LOCATE_SUBDIVISIONS + 1):
+        contained = _helpers.contains_nd_multi(
+            sub_nodes, points, surface_ids, point_ids)
+        point_ids = point_ids[contained]
+
+        # Only subdivide the sub-surfaces that still contain a point.
+        kept, surface_ids = np.unique(
+            surface_ids[contained], return_inverse=True)
+        sub_nodes, base_x, base_y, widths = subdivide_multi(
+            sub_nodes[kept, :, :], degree,
+            base_x[kept], base_y[kept], widths[kept])
+        # The children of sub-surface ``j`` are ``4j, ..., 4j + 3``.
+        surface_ids = np.concatenate([
+            4 * surface_ids + child for child in six.moves.xrange(4)])
+        point_ids = np.tile(point_ids, 4)
+
+    # NOTE: Sorting puts the pairs for each point in the same order
+    #       that :func:`locate_point` visits the sub-surfaces.
+    order = np.argsort(surface_ids, kind='mergesort')
+    surface_ids = surface_ids[order]
+    return (
+        point_ids[order], base_x[surface_ids],
+        base_y[surface_ids], widths[surface_ids])
+
+
+def _mean_centroid_multi(point_ids, pair_base_x, pair_base_y, pair_widths,
+                         num_points):
+    """Take the mean of the candidate centroids for each of many points.
+
+    This is a vectorized version of :func:`_mean_centroid`.
+
+    Args:
+        point_ids (numpy.ndarray): The point in each (sub-surface, point)
+            pair.
+        pair_base_x (numpy.ndarray): The base :math:`x`-value of the
+            sub-surface in each pair.
+        pair_base_y (numpy.ndarray): The base :math:`y`-value of the
+            sub-surface in each pair.
+        pair_widths (numpy.ndarray): The width of the sub-surface in
+            each pair.
+        num_points (int): The number of points.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Boolean mask
+        indicating which points are in at least one pair and the mean
+        centroid (:math:`s` and :math:`t`) of each of those points.
+    """
+    counts = np.bincount(point_ids, minlength=num_points)
+    found = counts > 0
+    denoms = counts[found].astype(np.float64)
+    sum_x = np.bincount(point_ids, weights=pair_base_x, minlength=num_points)
+    sum_y = np.bincount(point_ids, weights=pair_base_y, minlength=num_points)
+    sum_width = np.bincount(
+        point_ids, weights=pair_widths, minlength=num_points)
+    width_delta = sum_width[found] / (3.0 * denoms)
+    s_approx = sum_x[found] / denoms + width_delta
+    t_approx = sum_y[found] / denoms + width_delta
+    return found, s_approx, t_approx
+
+
+def locate_point_multi(surface, points):
+    r"""Locate many points on a surface.
+
+    This is a vectorized version of :func:`locate_point`. Rather than
+    subdividing the surface once for each point, the sub-surfaces are
+    shared among all of the points (see :func:`_locate_candidates_multi`).
+    After the sub-surfaces are sufficiently small, Newton's method is
+    applied to all of the points at once.
+
+    Args:
+        surface (.Surface): A B |eacute| zier surface (assumed to
+            be two-dimensional).
+        points (numpy.ndarray): ``N x 2`` array of points to locate.
+
+    Returns:
+        numpy.ndarray: ``N x 2`` array of the :math:`s` and :math:`t`
+        values corresponding to each row of ``points``, with NaN for
+        each point that is not on the ``surface``.
+    """
+    num_points = points.shape[0]
+    found, s_approx, t_approx = _mean_centroid_multi(
+        *_locate_candidates_multi(surface, points), num_points=num_points)
+
+    # pylint: disable=protected-access
+    nodes = surface._nodes
+    degree = surface._degree
+    # pylint: enable=protected-access
+    found_points = points[found, :]
+    s_vals, t_vals = _newton_refine_multi(
+        nodes, degree, found_points, s_approx, t_approx)
+
+    param_vals = np.empty((s_vals.size, 2), order='F')
+    param_vals[:, 0] = s_vals
+    param_vals[:, 1] = t_vals
+    actual = _surface_helpers.evaluate_cartesian_multi(
+        nodes, degree, param_vals, 2)
+    not_close = ~_helpers.vector_close_multi(
+        actual, found_points, eps=_LOCATE_EPS)
+    s_vals[not_close], t_vals[not_close] = _newton_refine_multi(
+        nodes, degree, found_points[not_close, :],
+        s_vals[not_close], t_vals[not_close])
+
+    result = np.full((num_points, 2), np.nan, order='F')
+    result[found, 0] = s_vals
+    result[found, 1] = t_vals
+    return result
+
+
+def cartesian_basis(degree, param_vals):
+    r"""Compute the Bernstein basis of a surface at many parameter values.
+
+    For each row :math:`(s, t)` of ``param_vals`` and each node index
+    :math:`(i, j, k)` (in the same order as the nodes of a surface), this
+    computes
+
+    .. math::
+
+       \frac{d!}{i! j! k!} \lambda_1^i \lambda_2^j \lambda_3^k
+
+    where :math:`\lambda_1 = 1 - s - t, \lambda_2 = s, \lambda_3 = t`.
+    Multiplying the basis by the nodes of a surface evaluates the surface
+    at each of the parameter values.
+
+    Args:
+        degree (int): The degree of the surface.
+        param_vals (numpy.ndarray): Array of parameter values (as a
+            ``Nx2`` array).
+
+    Returns:
+        numpy.ndarray: The ``N x M`` basis matrix, where ``M`` is the number
+        of nodes in a surface of the given degree.
+    """
+    i_vals = []
+    j_vals = []
+    k_vals = []
+    for k in six.moves.xrange(degree + 1):
+        for j in six.moves.xrange(degree + 1 - k):
+            i_vals.append(degree - j - k)
+            j_vals.append(j)
+            k_vals.append(k)
+
+    # NOTE: The coefficients are the multinomials ``d! / (i! j! k!)``.
+    factorials = np.cumprod(
+        np.hstack([[1.0], np.arange(1.0, degree + 1.0)]))
+    coeffs = factorials[degree] / (
+        factorials[i_vals] * factorials[j_vals] * factorials[k_vals])
+
+    exponents = np.arange(degree + 1)
+    lambda2 = param_vals[:, [0]]**exponents
+    lambda3 = param_vals[:, [1]]**exponents
+    lambda1 = (1.0 - param_vals[:, [0]] - param_vals[:, [1]])**exponents
+    return (
+        coeffs * lambda1[:, i_vals] * lambda2[:, j_vals] * lambda3[:, k_vals])
+
+
+def evaluate_cartesian_stack(nodes_stack, degree, param_vals):
+    r"""Evaluate many surfaces (of the same degree) at the same points.
+
+    The Bernstein basis is computed once (via :func:`cartesian_basis`) for
+    the shared parameter values and then every surface is evaluated with
+    a single matrix product.
+
+    Args:
+        nodes_stack (numpy.ndarray): ``K x M x D`` array of nodes, one
+            ``M x D`` set of nodes for each surface.
+        degree (int): The degree of each of the surfaces.
+        param_vals (numpy.ndarray): Array of parameter values (as a
+            ``Nx2`` array).
+
+    Returns:
+        numpy.ndarray: The ``K x N x D`` evaluated points, i.e. the
+        ``N x D`` points on each of the ``K`` surfaces.
+    """
+    num_surfaces, num_nodes, dimension = nodes_stack.shape
+    basis = cartesian_basis(degree, param_vals)
+    # NOTE: Putting the nodes side by side (as an ``M x KD`` matrix) allows
+    #       a single matrix product for all of the surfaces.
+    side_by_side = np.transpose(nodes_stack, (1, 0, 2)).reshape(
+        (num_nodes, num_surfaces * dimension))
+    evaluated = np.dot(basis, side_by_side).reshape(
+        (param_vals.shape[0], num_surfaces, dimension))
+    return np.transpose(evaluated, (1, 0, 2))
+
+
+# pylint: disable=invalid-name
+if _speedup is None:  # pragma: NO COVER
+    locate_point = _locate_point
+else:
+    locate_point = _locate_point_speedup
+# pylint: enable=invalid-name
+backend_mod.register_defaults(__name__, {
+    'locate_point': _locate_point,
+})
@@ -0,0 +1,548 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tessellation utilities.
+
+Converts surfaces into triangle meshes and curved polygons into closed
+polylines, as flat vertex and index buffers. None of these utilities
+depend on ``matplotlib``.
+"""
+
+
+import numpy as np
+import six
+
+from bezier import basis as basis_mod
+
+
+# NOTE: With at most ``65536`` vertices in a chunk, every index in the
+#       chunk fits in an unsigned 16-bit integer (e.g. for a GPU index
+#       buffer). The index buffers themselves use the default integer
+#       type, so callers that want 16-bit indices must cast them.
+DEFAULT_MAX_VERTICES = 65536
+# NOTE: ``257`` points per edge (i.e. ``256`` intervals) gives ``33153``
+#       vertices, so a single adaptive mesh always fits in a chunk with
+#       the default maximum number of vertices.
+_MAX_PTS_PER_EDGE = 257
+# Caches keyed by ``pts_per_edge`` / ``(degree, pts_per_edge)`` / ``degree``.
+_GRIDS = {}
+_GRID_BASES = {}
+_SECOND_DIFFERENCES = {}
+
+
+def verify_resolution(pts_per_edge, tolerance):
+    """Verify the resolution requested for a tessellation.
+
+    Exactly one of ``pts_per_edge`` (for a uniform tessellation) and
+    ``tolerance`` (for an adaptive tessellation) must be specified.
+
+    Args:
+        pts_per_edge (Optional[int]): The number of points along each edge.
+        tolerance (Optional[float]): The maximum linearization error.
+
+    Raises:
+        ValueError: If both or neither of ``pts_per_edge`` and
+            ``tolerance`` are specified.
+        ValueError: If ``pts_per_edge`` is less than ``2``.
+        ValueError: If ``tolerance`` is not positive.
+    """
+    if (pts_per_edge is None) == (tolerance is None):
+        raise ValueError(
+            'Exactly one of pts_per_edge and tolerance must be specified')
+    if pts_per_edge is not None and pts_per_edge < 2:
+        raise ValueError(
+            'At least two points per edge are required', pts_per_edge)
+    if tolerance is not None and tolerance <= 0.0:
+        raise ValueError('Tolerance must be positive', tolerance)
+
+
+def triangle_grid(pts_per_edge):
+    r"""Get a uniform triangulation of the reference triangle.
+
+    The vertices are :math:`\left(\frac{i}{n}, \frac{j}{n}\right)`
+    for :math:`i + j \leq n` where :math:`n + 1` is ``pts_per_edge``,
+    ordered with :math:`j` (i.e. :math:`t`) varying slowest. The
+    triangles are oriented counter-clockwise.
+
+    The grid is computed once for each value of ``pts_per_edge`` and the
+    (read-only) result is cached.
+
+    Args:
+        pts_per_edge (int): The number of points along each edge.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The ``V x 2`` array of parameter values, where ``V`` is
+          :math:`\frac{(n + 1)(n + 2)}{2}`
+        * The :math:`n^2 \times 3` integer array of triangles (as
+          indices of rows in the parameter values)
+    """
+    grid = _GRIDS.get(pts_per_edge)
+    if grid is not None:
+        return grid
+
+    num_intervals = pts_per_edge - 1
+    # ``row_starts[j]`` is the index of the vertex ``(0, j)``.
+    row_starts = np.zeros((pts_per_edge + 1,), dtype=int)
+    row_starts[1:] = np.cumsum(np.arange(pts_per_edge, 0, -1))
+
+    param_vals = np.empty((row_starts[-1], 2), order='F')
+    triangles = np.empty((num_intervals * num_intervals, 3), dtype=int)
+    tri_index = 0
+    for j in six.moves.xrange(pts_per_edge):
+        row = np.arange(pts_per_edge - j)
+        param_vals[row_starts[j] + row, 0] = row / float(num_intervals)
+        param_vals[row_starts[j] + row, 1] = j / float(num_intervals)
+        if j == num_intervals:
+            continue
+
+        # "Upward" triangles have an edge on row ``j``.
+        lower = row_starts[j] + row[:-1]
+        upper = row_starts[j + 1] + row[:-1]
+        num_up = lower.size
+        triangles[tri_index:tri_index + num_up, 0] = lower
+        triangles[tri_index:tri_index + num_up, 1] = lower + 1
+        triangles[tri_index:tri_index + num_up, 2] = upper
+        tri_index += num_up
+        # "Downward" triangles have an edge on row ``j + 1``.
+        num_down = num_up - 1
+        triangles[tri_index:tri_index + num_down, 0] = lower[1:]
+        triangles[tri_index:tri_index + num_down, 1] = upper[1:]
+        triangles[tri_index:tri_index + num_down, 2] = upper[:-1]
+        tri_index += num_down
+
+    param_vals.flags.writeable = False
+    triangles.flags.writeable = False
+    grid = param_vals, triangles
+    _GRIDS[pts_per_edge] = grid
+    return grid
+
+
+def grid_basis(degree, pts_per_edge):
+    """Get the basis of a surface at the vertices of a uniform grid.
+
+    The vertices are those from :func:`triangle_grid`. The basis is
+    computed once for each degree and value of ``pts_per_edge`` and
+    the (read-only) result is cached.
+
+    Args:
+        degree (int): The degree of the surface.
+        pts_per_edge (int): The number of points along each edge.
+
+    Returns:
+        numpy.ndarray: The ``V x M`` basis matrix, where ``M`` is the number
+        of nodes in a surface of the given degree.
+    """
+    key = (degree, pts_per_edge)
+    basis = _GRID_BASES.get(key)
+    if basis is None:
+        # NOTE: This cyclic import need be resolved.
+        from bezier import _surface_multi
+
+        param_vals, _ = triangle_grid(pts_per_edge)
+        basis = np.asfortranarray(
+            _surface_multi.cartesian_basis(degree, param_vals))
+        basis.flags.writeable = False
+        _GRID_BASES[key] = basis
+
+    return basis
+
+
+def _second_differences(degree):
+    """Get the node indices used for second differences in a surface.
+
+    The second differences are computed along each of the three edge
+    directions of the control net of the surface. The result is cached
+    for each degree.
+
+    Args:
+        degree (int): The degree of the surface (at least ``2``).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The indices
+        of the first, middle and last nodes in each second difference.
+    """
+    indices = _SECOND_DIFFERENCES.get(degree)
+    if indices is not None:
+        return indices
+
+    # ``row_starts[k]`` is the index of the node with ``s`` power ``0``
+    # and ``t`` power ``k``.
+    row_starts = np.zeros((degree + 1,), dtype=int)
+    row_starts[1:] = np.cumsum(np.arange(degree + 1, 1, -1))
+    first = []
+    middle = []
+    last = []
+    for k in six.moves.xrange(degree - 1):
+        for j in six.moves.xrange(degree - 1 - k):
+            node = row_starts[k] + j
+            # Along ``s``, along ``t`` and along the third edge.
+            first.extend([node, node, node + 2])
+            middle.extend([
+                node + 1,
+                row_starts[k + 1] + j,
+                row_starts[k + 1] + j + 1,
+            ])
+            last.extend([
+                node + 2,
+                row_starts[k + 2] + j,
+                row_starts[k + 2] + j,
+            ])
+
+    indices = (
+        np.asarray(first, dtype=int),
+        np.asarray(middle, dtype=int),
+        np.asarray(last, dtype=int),
+    )
+    _SECOND_DIFFERENCES[degree] = indices
+    return indices
+
+
+def linearization_error(nodes, degree):
+    r"""Estimate the maximum error of a linear approximation of a surface.
+
+    This is the same estimate as :func:`.linearization_error` for curves,
+    using the largest second difference of the control net along each of
+    the three edge directions of the surface:
+
+    .. math::
+
+       \frac{d(d - 1)}{8} \left\|\max \left|\Delta^2 v\right|\right\|_2.
+
+    Args:
+        nodes (numpy.ndarray): Nodes of a surface.
+        degree (int): The degree of the surface.
+
+    Returns:
+        float: The estimated error.
+    """
+    if degree == 1:
+        return 0.0
+
+    first, middle, last = _second_differences(degree)
+    second_deriv = nodes[first, :] - 2.0 * nodes[middle, :] + nodes[last, :]
+    worst_case = np.max(np.abs(second_deriv), axis=0)
+    multiplier = 0.125 * degree * (degree - 1)
+    return multiplier * np.linalg.norm(worst_case, ord=2)
+
+
+def adaptive_pts_per_edge(nodes, degree, tolerance):
+    r"""Choose the number of points per edge for a surface tessellation.
+
+    Splitting each edge into :math:`n` pieces scales the linearization
+    error by :math:`\frac{1}{n^2}`, so :math:`n` is chosen as the smallest
+    value that brings the :func:`linearization_error` below
+    ``tolerance``.
+
+    .. note::
+
+       The number of points per edge is capped at ``257``, so for a very
+       small ``tolerance`` the estimated error of the resulting mesh may
+       exceed ``tolerance``. The error of the capped mesh is at most
+       :math:`\frac{1}{65536}` of the :func:`linearization_error`.
+
+    Args:
+        nodes (numpy.ndarray): Nodes of a surface.
+        degree (int): The degree of the surface.
+        tolerance (float): The maximum allowed linearization error.
+
+    Returns:
+        int: The number of points per edge (at least ``2`` and at most
+        ``257``).
+    """
+    error = linearization_error(nodes, degree)
+    num_intervals = int(np.ceil(np.sqrt(error / tolerance)))
+    return min(max(num_intervals, 1) + 1, _MAX_PTS_PER_EDGE)
+
+
+def surface_buffers(nodes, degree, pts_per_edge):
+    """Tessellate a single surface with a uniform triangle grid.
+
+    Args:
+        nodes (numpy.ndarray): Nodes of a surface.
+        degree (int): The degree of the surface.
+        pts_per_edge (int): The number of points along each edge.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The ``V x D`` array of vertices
+        * The ``T x 3`` integer array of triangles (as indices of rows in
+          the vertices)
+    """
+    _, triangles = triangle_grid(pts_per_edge)
+    vertices = np.asfortranarray(
+        np.dot(grid_basis(degree, pts_per_edge), nodes))
+    return vertices, triangles.copy()
+
+
+def fill_boundary(edges, pts_per_edge, vertices):
+    """Evaluate the boundary of a curved polygon into a buffer.
+
+    The edges are assumed to share endpoints, so the first point of each
+    edge is left out.
+
+    Args:
+        edges (Sequence[~bezier.curve.Curve]): Curved edges defining a
+            boundary.
+        pts_per_edge (int): The number of points along each edge.
+        vertices (numpy.ndarray): The buffer to be populated. Must have
+            (at least) ``len(edges) * (pts_per_edge - 1)`` rows.
+    """
+    s_vals = np.linspace(0.0, 1.0, pts_per_edge)
+    start = 0
+    for edge in edges:
+        basis = basis_mod.BernsteinBasis.cached(edge.degree, s_vals)
+        # pylint: disable=protected-access
+        vertices[start:start + pts_per_edge - 1, :] = basis.evaluate(
+            edge._nodes)[1:, :]
+        # pylint: enable=protected-access
+        start += pts_per_edge - 1
+
+
+def fill_loop(start, end, segments):
+    """Populate a buffer with the segments of a closed loop.
+
+    Args:
+        start (int): The index of the first vertex in the loop.
+        end (int): The index just after the last vertex in the loop.
+        segments (numpy.ndarray): The ``(end - start) x 2`` integer buffer
+            to be populated.
+    """
+    segments[:, 0] = np.arange(start, end)
+    segments[:-1, 1] = segments[1:, 0]
+    segments[-1, 1] = start
+
+
+def boundary_buffers(edges, pts_per_edge):
+    """Tessellate the boundary of a single curved polygon.
+
+    Args:
+        edges (Sequence[~bezier.curve.Curve]): Curved edges defining a
+            boundary.
+        pts_per_edge (int): The number of points along each edge.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The ``V x 2`` array of vertices
+        * The ``V x 2`` integer array of segments (as indices of rows in
+          the vertices), forming a closed loop
+    """
+    num_vertices = len(edges) * (pts_per_edge - 1)
+    vertices = np.empty((num_vertices, 2), order='F')
+    segments = np.empty((num_vertices, 2), dtype=int)
+    fill_boundary(edges, pts_per_edge, vertices)
+    fill_loop(0, num_vertices, segments)
+    return vertices, segments
+
+
+def _group(sized_items, max_vertices):
+    """Group items into consecutive chunks with a bounded size.
+
+    An item that is too large on its own is put in a chunk by itself.
+
+    Args:
+        sized_items (Iterable[Tuple[object, int, int]]): Triples of an
+            item, its number of vertices and its number of elements.
+        max_vertices (int): The (soft) maximum number of vertices in
+            a chunk.
+
+    Yields:
+        Tuple[list, int, int]: Triples of the items in a chunk (each a
+        triple of the same form as the input) and the total number of
+        vertices and elements in the chunk.
+    """
+    chunk = []
+    num_vertices = 0
+    num_elements = 0
+    for item, item_vertices, item_elements in sized_items:
+        if chunk and num_vertices + item_vertices > max_vertices:
+            yield chunk, num_vertices, num_elements
+            chunk = []
+            num_vertices = 0
+            num_elements = 0
+
+        chunk.append((item, item_vertices, item_elements))
+        num_vertices += item_vertices
+        num_elements += item_elements
+
+    if chunk:
+        yield chunk, num_vertices, num_elements
+
+
+def _sized_surfaces(surfaces, pts_per_edge, tolerance):
+    """Determine the size of the tessellation of each surface.
+
+    Args:
+        surfaces (Iterable[~bezier.surface.Surface]): The surfaces.
+        pts_per_edge (Optional[int]): The number of points along each edge.
+        tolerance (Optional[float]): The maximum linearization error. Only
+            used if ``pts_per_edge`` is :data:`None`.
+
+    Yields:
+        Tuple[Tuple[int, ~bezier.surface.Surface, int], int, int]: Triples
+        of the surface (along with its index and points per edge) and the
+        number of vertices and triangles in its tessellation.
+    """
+    for index, surface in enumerate(surfaces):
+        surface_pts = pts_per_edge
+        if surface_pts is None:
+            # pylint: disable=protected-access
+            surface_pts = adaptive_pts_per_edge(
+                surface._nodes, surface._degree, tolerance)
+            # pylint: enable=protected-access
+        num_vertices = (surface_pts * (surface_pts + 1)) // 2
+        num_triangles = (surface_pts - 1) * (surface_pts - 1)
+        yield (index, surface, surface_pts), num_vertices, num_triangles
+
+
+def _fill_mesh(surface, pts_per_edge, vertices, triangles, vertex_start):
+    """Populate buffers with the tessellation of a single surface.
+
+    Args:
+        surface (~bezier.surface.Surface): The surface to tessellate.
+        pts_per_edge (int): The number of points along each edge.
+        vertices (numpy.ndarray): The ``V x D`` buffer to be populated
+            with the vertices of the mesh.
+        triangles (numpy.ndarray): The ``T x 3`` integer buffer to be
+            populated with the triangles of the mesh.
+        vertex_start (int): The offset of the first vertex of the mesh
+            (i.e. to be added to every index in ``triangles``).
+    """
+    # pylint: disable=protected-access
+    basis = grid_basis(surface._degree, pts_per_edge)
+    vertices[:, :] = np.dot(basis, surface._nodes)
+    # pylint: enable=protected-access
+    _, grid_triangles = triangle_grid(pts_per_edge)
+    triangles[:, :] = grid_triangles + vertex_start
+
+
+def _surface_chunk(chunk, num_vertices, num_triangles):
+    """Tessellate a chunk of surfaces into preallocated buffers.
+
+    Args:
+        chunk (List[Tuple[Tuple[int, ~bezier.surface.Surface, int], int, \
+            int]]): The sized surfaces in the chunk (as produced by
+            :func:`_sized_surfaces`).
+        num_vertices (int): The total number of vertices in the chunk.
+        num_triangles (int): The total number of triangles in the chunk.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The vertices,
+        triangles and surface indices of the chunk (as in
+        :func:`stream_surfaces`).
+
+    Raises:
+        ValueError: If the surfaces in the chunk don't all have the same
+            dimension.
+    """
+    # pylint: disable=protected-access
+    dimension = chunk[0][0][1]._dimension
+    # pylint: enable=protected-access
+    vertices = np.empty((num_vertices, dimension), order='F')
+    triangles = np.empty((num_triangles, 3), dtype=int)
+    surface_ids = np.empty((num_triangles,), dtype=int)
+
+    vertex_start = 0
+    tri_start = 0
+    for (index, surface, surface_pts), sub_vertices, sub_tris in chunk:
+        # pylint: disable=protected-access
+        if surface._dimension != dimension:
+            raise ValueError(
+                'Surfaces must have the same dimension',
+                'Expected:', dimension, 'Received:', surface._dimension)
+        # pylint: enable=protected-access
+        tri_end = tri_start + sub_tris
+        _fill_mesh(
+            surface, surface_pts,
+            vertices[vertex_start:vertex_start + sub_vertices, :],
+            triangles[tri_start:tri_end, :], vertex_start)
+        surface_ids[tri_start:tri_end] = index
+        vertex_start += sub_vertices
+        tri_start = tri_end
+
+    return vertices, triangles, surface_ids
+
+
+def stream_surfaces(surfaces, pts_per_edge, tolerance, max_vertices):
+    """Tessellate many surfaces, in chunks of preallocated buffers.
+
+    Args:
+        surfaces (Iterable[~bezier.surface.Surface]): The surfaces to
+            tessellate. Can be a generator; surfaces are only consumed
+            as each chunk is needed.
+        pts_per_edge (Optional[int]): The number of points along each edge.
+        tolerance (Optional[float]): The maximum linearization error. Only
+            used if ``pts_per_edge`` is :data:`None`.
+        max_vertices (int): The (soft) maximum number of vertices in each
+            chunk.
+
+    Yields:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triples of
+
+        * The ``V x D`` array of vertices in the chunk
+        * The ``T x 3`` integer array of triangles (as indices of rows in
+          the vertices of the chunk)
+        * The ``T`` integer array of the index (in ``surfaces``) of the
+          surface each triangle came from
+
+    Raises:
+        ValueError: If the surfaces in a chunk don't all have the same
+            dimension.
+    """
+    sized = _sized_surfaces(surfaces, pts_per_edge, tolerance)
+    for chunk, num_vertices, num_triangles in _group(sized, max_vertices):
+        yield _surface_chunk(chunk, num_vertices, num_triangles)
+
+
+def stream_boundaries(polygons, pts_per_edge, max_vertices):
+    """Tessellate the boundaries of many curved polygons, in chunks.
+
+    Args:
+        polygons (Iterable[~bezier.curved_polygon.CurvedPolygon]): The
+            curved polygons to tessellate. Can be a generator; polygons are
+            only consumed as each chunk is needed.
+        pts_per_edge (int): The number of points along each edge.
+        max_vertices (int): The (soft) maximum number of vertices in each
+            chunk.
+
+    Yields:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triples of
+
+        * The ``V x 2`` array of vertices in the chunk
+        * The ``V x 2`` integer array of segments (as indices of rows in
+          the vertices of the chunk), each boundary is a closed loop
+        * The ``V`` integer array of the index (in ``polygons``) of the
+          curved polygon each segment came from
+    """
+    # NOTE: Each closed boundary has as many segments as vertices.
+    sized = (
+        ((index, polygon),) + (polygon.num_sides * (pts_per_edge - 1),) * 2
+        for index, polygon in enumerate(polygons))
+    for chunk, num_vertices, _ in _group(sized, max_vertices):
+        vertices = np.empty((num_vertices, 2), order='F')
+        segments = np.empty((num_vertices, 2), dtype=int)
+        polygon_ids = np.empty((num_vertices,), dtype=int)
+
+        start = 0
+        for (index, polygon), sub_vertices, _ in chunk:
+            end = start + sub_vertices
+            # pylint: disable=protected-access
+            fill_boundary(polygon._edges, pts_per_edge, vertices[start:end])
+            # pylint: enable=protected-access
+            fill_loop(start, end, segments[start:end])
+            polygon_ids[start:end] = index
+            start = end
+
+        yield vertices, segments, polygon_ids
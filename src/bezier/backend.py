@@ -0,0 +1,285 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of the kernels used by the helper modules.
+
+Many of the low-level routines (kernels) have both a pure Python
+implementation (the ``python`` backend) and a compiled implementation
+(the ``speedup`` backend). By default, the compiled implementation is
+used when it is available. Each kernel is named after the helper module
+and function it is bound to, e.g. ``_helpers.bbox``.
+
+The backend can be changed for the whole process with :func:`use` or
+within a block with :func:`using`:
+
+.. doctest:: backend-using
+
+   >>> with bezier.backend.using('python'):
+   ...     bezier.backend.active_backend('_helpers.bbox')
+   'python'
+
+Additional implementations can be added with :func:`register_kernel`;
+they must have the same signature as the pure Python implementation.
+
+.. doctest:: backend-register
+
+   >>> def bbox_numpy(nodes):
+   ...     left, bottom = np.min(nodes, axis=0)
+   ...     right, top = np.max(nodes, axis=0)
+   ...     return left, right, bottom, top
+   ...
+   >>> bezier.backend.register_kernel('_helpers.bbox', 'numpy', bbox_numpy)
+   >>> with bezier.backend.using('numpy', name='_helpers.bbox'):
+   ...     curve = bezier.Curve(np.asfortranarray([
+   ...         [0.0, 0.0],
+   ...         [1.0, 2.0],
+   ...         [2.0, 0.0],
+   ...     ]), degree=2)
+   ...     bezier.backend.active_backend('_helpers.bbox')
+   ...     curve.locate(np.asfortranarray([[1.0, 1.0]]))
+   'numpy'
+   0.5
+
+Switching backends changes the functions bound in the helper modules,
+so it applies to every thread.
+
+.. testsetup:: backend-using, backend-register
+
+   import numpy as np
+   import bezier
+
+.. testcleanup:: backend-register
+
+   bezier.backend.reset()
+"""
+
+
+import collections
+import contextlib
+import sys
+
+import six
+
+
+PYTHON = 'python'
+"""str: The name of the pure Python backend."""
+SPEEDUP = 'speedup'
+"""str: The name of the compiled (Fortran) backend."""
+_KERNELS = collections.OrderedDict()
+
+
+class _Kernel(object):  # pylint: disable=too-few-public-methods
+    """A kernel and each of its implementations.
+
+    Args:
+        module_name (str): The name of the module the kernel is bound in.
+        attr (str): The name the kernel is bound to in the module.
+        default (str): The default backend.
+        implementations (collections.OrderedDict): The implementation for
+            each backend.
+    """
+
+    __slots__ = ('module_name', 'attr', 'default', 'active', 'implementations')
+
+    def __init__(self, module_name, attr, default, implementations):
+        self.module_name = module_name
+        self.attr = attr
+        self.default = default
+        self.active = default
+        self.implementations = implementations
+
+    def activate(self, backend):
+        """Bind the implementation for a backend in the module.
+
+        Args:
+            backend (str): The backend to use.
+        """
+        func = self.implementations[backend]
+        setattr(sys.modules[self.module_name], self.attr, func)
+        self.active = backend
+
+
+def _get_kernel(name):
+    """Get a registered kernel.
+
+    Args:
+        name (str): The name of the kernel.
+
+    Returns:
+        _Kernel: The kernel.
+
+    Raises:
+        KeyError: If the kernel is not registered.
+    """
+    try:
+        return _KERNELS[name]
+    except KeyError:
+        raise KeyError('Unknown kernel', name)
+
+
+def register_defaults(module_name, bound_kernels):
+    """Register the kernels bound in a helper module.
+
+    This is intended to be called at the bottom of each helper module,
+    after the default implementation of each kernel has been bound.
+    If the bound implementation differs from the pure Python
+    implementation, it is registered as the ``speedup`` implementation.
+
+    Args:
+        module_name (str): The name of the helper module.
+        bound_kernels (Dict[str, Callable]): The pure Python
+            implementation of each kernel, keyed by the name it is bound
+            to in the module.
+    """
+    module = sys.modules[module_name]
+    _, _, short_name = module_name.rpartition('.')
+    for attr, python_func in sorted(six.iteritems(bound_kernels)):
+        implementations = collections.OrderedDict()
+        implementations[PYTHON] = python_func
+        default = PYTHON
+        bound = getattr(module, attr)
+        if bound is not python_func:
+            implementations[SPEEDUP] = bound
+            default = SPEEDUP
+
+        name = '{}.{}'.format(short_name, attr)
+        _KERNELS[name] = _Kernel(module_name, attr, default, implementations)
+
+
+def register_kernel(name, backend, func):
+    """Add an implementation of a kernel.
+
+    The new implementation is not used until its backend is selected
+    with :func:`use` or :func:`using`.
+
+    Args:
+        name (str): The name of the kernel, e.g. ``_helpers.bbox``.
+        backend (str): The name of the backend the implementation
+            belongs to.
+        func (Callable): The implementation. Must have the same signature
+            as the pure Python implementation.
+
+    Raises:
+        KeyError: If the kernel is not registered.
+        ValueError: If ``backend`` is the ``python`` backend.
+    """
+    kernel = _get_kernel(name)
+    if backend == PYTHON:
+        raise ValueError(
+            'The pure Python implementation can\'t be replaced', name)
+
+    kernel.implementations[backend] = func
+    if kernel.active == backend:
+        kernel.activate(backend)
+
+
+def kernels():
+    """Get the active backend for every kernel.
+
+    Returns:
+        collections.OrderedDict: Mapping from the name of each kernel to
+        the name of its active backend.
+    """
+    return collections.OrderedDict(
+        (name, kernel.active) for name, kernel in six.iteritems(_KERNELS))
+
+
+def active_backend(name):
+    """Get the active backend for a kernel.
+
+    Args:
+        name (str): The name of the kernel, e.g. ``_helpers.bbox``.
+
+    Returns:
+        str: The name of the active backend.
+
+    Raises:
+        KeyError: If the kernel is not registered.
+    """
+    return _get_kernel(name).active
+
+
+def available_backends(name):
+    """Get the backends that implement a kernel.
+
+    Args:
+        name (str): The name of the kernel, e.g. ``_helpers.bbox``.
+
+    Returns:
+        Tuple[str, ...]: The names of the backends (in the order they
+        were registered).
+
+    Raises:
+        KeyError: If the kernel is not registered.
+    """
+    return tuple(_get_kernel(name).implementations)
+
+
+def use(backend, name=None):
+    """Use a backend for the rest of the process.
+
+    Args:
+        backend (str): The name of the backend.
+        name (Optional[str]): The name of a single kernel to switch. If
+            not provided, every kernel implemented by ``backend`` is
+            switched (the other kernels are unchanged).
+
+    Raises:
+        KeyError: If ``name`` is not a registered kernel.
+        ValueError: If ``backend`` does not implement the kernel
+            ``name`` (or if ``name`` is not provided, any kernel).
+    """
+    if name is None:
+        selected = [
+            kernel for kernel in six.itervalues(_KERNELS)
+            if backend in kernel.implementations]
+    else:
+        selected = [_get_kernel(name)]
+        if backend not in selected[0].implementations:
+            selected = []
+
+    if not selected:
+        raise ValueError('Backend not available', backend, name)
+
+    for kernel in selected:
+        kernel.activate(backend)
+
+
+@contextlib.contextmanager
+def using(backend, name=None):
+    """Use a backend within a block.
+
+    The previously active backend of every kernel is restored when the
+    block exits.
+
+    Args:
+        backend (str): The name of the backend.
+        name (Optional[str]): The name of a single kernel to switch. If
+            not provided, every kernel implemented by ``backend`` is
+            switched.
+
+    Yields:
+        None: Nothing is yielded.
+    """
+    previous = kernels()
+    use(backend, name=name)
+    try:
+        yield
+    finally:
+        for kernel_name, kernel_backend in six.iteritems(previous):
+            _KERNELS[kernel_name].activate(kernel_backend)
+
+
+def reset():
+    """Use the default backend for every kernel."""
+    for kernel in six.itervalues(_KERNELS):
+        kernel.activate(kernel.default)
@@ -0,0 +1,262 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed Bernstein basis for evaluating B |eacute| zier curves.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+
+import collections
+
+import numpy as np
+
+from bezier import _helpers
+
+
+_REPR_TEMPLATE = '<{} (degree={:d}, num_vals={:d})>'
+_MAX_CACHED_BASES = 32
+# Process-wide LRU cache of bases, keyed by degree and parameter values.
+_CACHE = collections.OrderedDict()
+
+
+def _basis_matrix(degree, s_vals):
+    r"""Compute the Bernstein basis of a curve at many parameter values.
+
+    Row ``n`` and column ``j`` of the result is
+
+    .. math::
+
+       \binom{d}{j} (1 - s_n)^{d - j} s_n^j.
+
+    Args:
+        degree (int): The degree of the curve.
+        s_vals (numpy.ndarray): The ``N`` parameter values.
+
+    Returns:
+        numpy.ndarray: The ``N x (d + 1)`` basis matrix.
+    """
+    exponents = np.arange(degree + 1)
+    # NOTE: The binomial coefficients are accumulated as floats via
+    #       C(d, j + 1) = C(d, j) (d - j) / (j + 1).
+    binomials = np.ones((degree + 1,))
+    for j in exponents[:-1]:
+        binomials[j + 1] = binomials[j] * (degree - j) / (j + 1.0)
+
+    s_powers = s_vals[:, np.newaxis]**exponents
+    one_less_powers = (1.0 - s_vals[:, np.newaxis])**exponents[::-1]
+    return np.asfortranarray(binomials * one_less_powers * s_powers)
+
+
+class BernsteinBasis(object):
+    r"""Bernstein basis for curves of a given degree at fixed parameters.
+
+    Evaluating a curve of degree :math:`d` at :math:`N` parameter values
+    is the product of an :math:`N \times (d + 1)` basis matrix with the
+    nodes of the curve. When the same parameter values (e.g. a uniform
+    grid used for rendering) are used with many curves, computing the
+    basis once reduces each evaluation to a single matrix product.
+
+    .. doctest:: bernstein-basis-constructor
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+       >>> basis = bezier.BernsteinBasis(2, s_vals)
+       >>> basis
+       <BernsteinBasis (degree=2, num_vals=3)>
+       >>> basis.matrix
+       array([[ 1.  , 0.  , 0.  ],
+              [ 0.25, 0.5 , 0.25],
+              [ 0.  , 0.  , 1.  ]])
+
+    Args:
+        degree (int): The degree of the curves to be evaluated.
+        s_vals (numpy.ndarray): The (1D) parameter values to evaluate at.
+
+    Raises:
+        ValueError: If ``degree`` is negative.
+        ValueError: If ``s_vals`` is not one-dimensional.
+    """
+
+    __slots__ = ('_degree', '_s_vals', '_matrix')
+
+    def __init__(self, degree, s_vals):
+        if degree < 0:
+            raise ValueError('Degree must be non-negative', degree)
+        s_vals = np.array(s_vals, dtype=np.float64)
+        if s_vals.ndim != 1:
+            raise ValueError('Parameter values must be 1D array')
+
+        s_vals.flags.writeable = False
+        self._degree = degree
+        self._s_vals = s_vals
+        self._matrix = _basis_matrix(degree, s_vals)
+        self._matrix.flags.writeable = False
+
+    @classmethod
+    def cached(cls, degree, s_vals):
+        """Get a (possibly cached) basis for a degree and parameter values.
+
+        Bases are kept in a process-wide cache, keyed by ``degree`` and
+        the values in ``s_vals``, and the least recently used basis is
+        evicted once the cache is full.
+
+        .. doctest:: bernstein-basis-cached
+
+           >>> s_vals = np.linspace(0.0, 1.0, 256)
+           >>> basis = bezier.BernsteinBasis.cached(3, s_vals)
+           >>> basis is bezier.BernsteinBasis.cached(3, s_vals)
+           True
+
+        Args:
+            degree (int): The degree of the curves to be evaluated.
+            s_vals (numpy.ndarray): The (1D) parameter values to evaluate
+                at.
+
+        Returns:
+            BernsteinBasis: The basis for ``degree`` and ``s_vals``.
+
+        Raises:
+            ValueError: If ``degree`` is negative.
+            ValueError: If ``s_vals`` is not one-dimensional.
+        """
+        s_vals = np.asarray(s_vals, dtype=np.float64)
+        key = (degree, s_vals.shape, s_vals.tobytes())
+        basis = _CACHE.pop(key, None)
+        if basis is None:
+            basis = cls(degree, s_vals)
+
+        # NOTE: Re-inserting the entry marks it as most recently used.
+        _CACHE[key] = basis
+        if len(_CACHE) > _MAX_CACHED_BASES:
+            _CACHE.popitem(last=False)
+
+        return basis
+
+    @property
+    def degree(self):
+        """int: The degree of the curves to be evaluated."""
+        return self._degree
+
+    @property
+    def s_vals(self):
+        """numpy.ndarray: The (read-only) parameter values."""
+        return self._s_vals
+
+    @property
+    def matrix(self):
+        """numpy.ndarray: The (read-only) ``N x (d + 1)`` basis matrix."""
+        return self._matrix
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current basis's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {name: getattr(self, name)
+                for name in self.__slots__}
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return _REPR_TEMPLATE.format(
+            self.__class__.__name__, self._degree, self._s_vals.size)
+
+    def _verify_nodes(self, num_nodes):
+        """Verify that nodes match the degree of the basis.
+
+        Args:
+            num_nodes (int): The number of nodes in a curve.
+
+        Raises:
+            ValueError: If ``num_nodes`` is not ``degree + 1``.
+        """
+        if num_nodes != self._degree + 1:
+            raise ValueError(
+                'Nodes do not match the degree of the basis',
+                'Number of nodes expected:', self._degree + 1,
+                'Received:', num_nodes)
+
+    def evaluate(self, nodes):
+        """Evaluate a curve at each of the parameter values.
+
+        .. doctest:: bernstein-basis-evaluate
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> basis = bezier.BernsteinBasis(
+           ...     2, np.asfortranarray([0.0, 0.5, 1.0]))
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.0],
+           ...     [1.0, 2.0],
+           ...     [2.0, 0.0],
+           ... ])
+           >>> basis.evaluate(nodes)
+           array([[ 0., 0.],
+                  [ 1., 1.],
+                  [ 2., 0.]])
+
+        Args:
+            nodes (numpy.ndarray): The ``(d + 1) x D`` nodes of a curve.
+
+        Returns:
+            numpy.ndarray: The ``N x D`` points on the curve.
+
+        Raises:
+            ValueError: If the number of nodes doesn't match the degree.
+        """
+        self._verify_nodes(nodes.shape[0])
+        return _helpers.matrix_product(self._matrix, nodes)
+
+    def evaluate_many(self, nodes_stack):
+        """Evaluate many curves at each of the parameter values.
+
+        All of the curves are evaluated with a single matrix product.
+
+        Args:
+            nodes_stack (numpy.ndarray): ``K x (d + 1) x D`` array of
+                nodes, one ``(d + 1) x D`` set of nodes for each curve.
+
+        Returns:
+            numpy.ndarray: The ``K x N x D`` evaluated points, i.e. the
+            ``N x D`` points on each of the ``K`` curves.
+
+        Raises:
+            ValueError: If ``nodes_stack`` is not a 3D array.
+            ValueError: If the number of nodes doesn't match the degree.
+        """
+        if nodes_stack.ndim != 3:
+            raise ValueError('Nodes must be a 3D array')
+        num_curves, num_nodes, dimension = nodes_stack.shape
+        self._verify_nodes(num_nodes)
+
+        # NOTE: Putting the nodes side by side (as a ``(d + 1) x KD``
+        #       matrix) allows a single matrix product for all curves.
+        side_by_side = np.transpose(nodes_stack, (1, 0, 2)).reshape(
+            (num_nodes, num_curves * dimension))
+        evaluated = np.dot(self._matrix, side_by_side).reshape(
+            (self._s_vals.size, num_curves, dimension))
+        return np.transpose(evaluated, (1, 0, 2))
@@ -0,0 +1,666 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact collections of B |eacute| zier curves and surfaces.
+
+A collection stores the nodes of many shapes (of the same degree) as a
+single ``K x N x D`` array along with parallel arrays of metadata, rather
+than as ``K`` separate :class:`.Curve` or :class:`.Surface` objects.
+Operations on the collection are vectorized over every shape and a shape
+is only materialized when the collection is indexed.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+
+import numpy as np
+import six
+
+from bezier import _curve_helpers
+from bezier import _helpers
+from bezier import _surface_multi
+from bezier import basis as basis_mod
+from bezier import curve as curve_mod
+from bezier import surface as surface_mod
+
+
+_REPR_TEMPLATE = '<{} (num_shapes={:d}, degree={:d}, dimension={:d})>'
+# Process-wide cache of surface degree-elevation matrices, keyed by degree.
+_SURFACE_ELEVATION_MATRICES = {}
+
+
+def _read_only(values, copy):
+    """Convert values to a (read-only) array of floats.
+
+    Args:
+        values (numpy.ndarray): The values to convert.
+        copy (bool): Flag indicating if the values should be copied.
+
+    Returns:
+        numpy.ndarray: The read-only values.
+    """
+    if copy:
+        values = np.array(values, dtype=np.float64)
+    else:
+        # NOTE: This is a new view, so ``values`` itself is not changed.
+        values = np.asarray(values, dtype=np.float64).view()
+    values.flags.writeable = False
+    return values
+
+
+def _metadata(values, num_shapes, default, copy):
+    """Convert per-shape metadata to a (read-only) array.
+
+    Args:
+        values (Optional[numpy.ndarray]): The values for each shape. If
+            :data:`None`, ``default`` is used for every shape.
+        num_shapes (int): The number of shapes in the collection.
+        default (float): The default value.
+        copy (bool): Flag indicating if the values should be copied.
+
+    Returns:
+        numpy.ndarray: The ``num_shapes`` read-only values.
+
+    Raises:
+        ValueError: If ``values`` doesn't have a value for each shape.
+    """
+    if values is None:
+        return _read_only(np.full((num_shapes,), default), False)
+
+    values = _read_only(values, copy)
+    if values.shape != (num_shapes,):
+        raise ValueError(
+            'Expected one value per shape', 'Shape expected:',
+            (num_shapes,), 'Received:', values.shape)
+    return values
+
+
+def _surface_elevation_matrix(degree):
+    """Get the (cached) matrix used to degree-elevate a surface.
+
+    Since degree-elevation is linear in the nodes, the matrix is computed
+    by elevating the identity (via :meth:`.Surface.elevate`). As the
+    matrix is shared, it is marked read-only.
+
+    Args:
+        degree (int): The degree of the surface.
+
+    Returns:
+        numpy.ndarray: The matrix that converts the nodes into the nodes
+        of the degree-elevated surface.
+    """
+    matrix = _SURFACE_ELEVATION_MATRICES.get(degree)
+    if matrix is None:
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        identity = surface_mod.Surface(
+            _helpers.eye(num_nodes), degree, _copy=False)
+        matrix = identity.elevate()._nodes  # pylint: disable=protected-access
+        matrix.flags.writeable = False
+        _SURFACE_ELEVATION_MATRICES[degree] = matrix
+
+    return matrix
+
+
+class _Collection(object):
+    """Base collection object.
+
+    Args:
+        nodes (numpy.ndarray): ``K x N x D`` array of nodes, one ``N x D``
+            set of nodes for each of the ``K`` shapes.
+        degree (int): The degree of each of the shapes.
+        _copy (bool): Flag indicating if the nodes (and metadata) should
+            be copied before being stored. Defaults to :data:`True` since
+            callers may freely mutate ``nodes`` after passing in.
+
+    Raises:
+        ValueError: If ``nodes`` is not a 3D array with the number of
+            nodes expected for ``degree``.
+    """
+
+    __slots__ = ('_nodes', '_degree')
+
+    def __init__(self, nodes, degree, _copy=True):
+        num_nodes = self._num_nodes(degree)
+        if nodes.ndim != 3 or nodes.shape[1] != num_nodes:
+            raise ValueError(
+                'Nodes must be a stack of shapes with degree', degree,
+                'Shape expected:', ('K', num_nodes, 'D'),
+                'Received:', nodes.shape)
+
+        self._nodes = _read_only(nodes, _copy)
+        self._degree = degree
+
+    @staticmethod
+    def _num_nodes(degree):
+        """Get the number of nodes in a shape of a given degree.
+
+        Args:
+            degree (int): The degree of the shape.
+
+        Returns:
+            int: The number of nodes.
+
+        Raises:
+            NotImplementedError: This is an abstract method.
+        """
+        raise NotImplementedError(degree)
+
+    @property
+    def degree(self):
+        """int: The degree of every shape in the collection."""
+        return self._degree
+
+    @property
+    def dimension(self):
+        """int: The dimension that the shapes live in."""
+        return self._nodes.shape[2]
+
+    @property
+    def nodes(self):
+        """numpy.ndarray: The ``K x N x D`` nodes of every shape."""
+        return self._nodes.copy()
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current collection's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {name: getattr(self, name)
+                for name in self.__slots__}
+
+    def __len__(self):
+        """Get the number of shapes in the collection.
+
+        Returns:
+            int: The number of shapes.
+        """
+        return self._nodes.shape[0]
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return _REPR_TEMPLATE.format(
+            self.__class__.__name__, len(self), self._degree,
+            self.dimension)
+
+    def __getitem__(self, index):
+        """Materialize a shape in the collection.
+
+        Args:
+            index (int): The index of the shape. Negative indices count
+                from the end.
+
+        Returns:
+            Union[~bezier.curve.Curve, ~bezier.surface.Surface]: The
+            shape (with a copy of its nodes).
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+        """
+        num_shapes = len(self)
+        if index < 0:
+            index += num_shapes
+        if not 0 <= index < num_shapes:
+            raise IndexError('Shape index out of range', index)
+
+        return self._get_shape(index)
+
+    def __iter__(self):
+        """Iterate over (materialized) shapes in the collection.
+
+        Yields:
+            Union[~bezier.curve.Curve, ~bezier.surface.Surface]: The
+            shapes.
+        """
+        for index in six.moves.xrange(len(self)):
+            yield self._get_shape(index)
+
+    def _get_shape(self, index):
+        """Materialize a shape in the collection.
+
+        Args:
+            index (int): The (non-negative) index of the shape.
+
+        Raises:
+            NotImplementedError: This is an abstract method.
+        """
+        raise NotImplementedError(index)
+
+    def bbox(self):
+        """Compute the bounding box of every shape in the collection.
+
+        Returns:
+            numpy.ndarray: ``K x 4`` array of the ``left, right, bottom,
+            top`` bounding boxes of each shape (as used by
+            :class:`.CurveIndex`).
+
+        Raises:
+            NotImplementedError: If the shapes are not two-dimensional.
+        """
+        if self.dimension != 2:
+            raise NotImplementedError(
+                '2D is the only supported dimension',
+                'Current dimension', self.dimension)
+
+        return _helpers.bboxes(self._nodes)
+
+
+class CurveCollection(_Collection):
+    """A collection of B |eacute| zier curves with the same degree.
+
+    .. doctest:: curve-collection
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 0.0], [1.0, 2.0], [2.0, 0.0]],
+       ...     [[0.0, 1.0], [2.0, 1.0], [4.0, 1.0]],
+       ... ])
+       >>> curves = bezier.CurveCollection(nodes, 2)
+       >>> curves
+       <CurveCollection (num_shapes=2, degree=2, dimension=2)>
+       >>> curves.evaluate_multi(np.asfortranarray([0.5, 1.0]))
+       array([[[ 1., 1.],
+               [ 2., 0.]],
+              [[ 2., 1.],
+               [ 4., 1.]]])
+       >>> left, right = curves.subdivide()
+       >>> right[1]
+       <Curve (degree=2, dimension=2, start=0.5, end=1)>
+       >>> curves.length()
+       array([ 2.95788572, 4. ])
+
+    Args:
+        nodes (numpy.ndarray): ``K x N x D`` array of nodes, one ``N x D``
+            set of nodes for each of the ``K`` curves.
+        degree (int): The degree of each of the curves.
+        starts (Optional[numpy.ndarray]): The beginning of the
+            sub-interval that each curve represents. Defaults to ``0``.
+        ends (Optional[numpy.ndarray]): The end of the sub-interval that
+            each curve represents. Defaults to ``1``.
+        _copy (bool): Flag indicating if the nodes (and metadata) should
+            be copied before being stored. Defaults to :data:`True` since
+            callers may freely mutate ``nodes`` after passing in.
+
+    Raises:
+        ValueError: If ``nodes`` is not a 3D array with the number of
+            nodes expected for ``degree``.
+        ValueError: If ``starts`` or ``ends`` doesn't have a value for
+            each curve.
+    """
+
+    __slots__ = (
+        '_nodes', '_degree',  # From base class
+        '_starts', '_ends',  # From constructor
+    )
+
+    def __init__(self, nodes, degree, starts=None, ends=None, _copy=True):
+        super(CurveCollection, self).__init__(nodes, degree, _copy=_copy)
+        num_curves = len(self)
+        self._starts = _metadata(starts, num_curves, 0.0, _copy)
+        self._ends = _metadata(ends, num_curves, 1.0, _copy)
+
+    @classmethod
+    def from_curves(cls, curves):
+        """Create a collection from existing curves.
+
+        Args:
+            curves (Sequence[~bezier.curve.Curve]): The curves. They must
+                all have the same degree and dimension.
+
+        Returns:
+            CurveCollection: The collection of curves.
+
+        Raises:
+            ValueError: If there are no curves.
+            ValueError: If the curves don't all have the same degree and
+                dimension.
+        """
+        # pylint: disable=protected-access
+        if not curves:
+            raise ValueError('At least one curve is required')
+
+        degree = curves[0]._degree
+        dimension = curves[0]._dimension
+        for curve in curves:
+            if curve._degree != degree or curve._dimension != dimension:
+                raise ValueError(
+                    'Curves must all have the same degree and dimension',
+                    (degree, dimension), (curve._degree, curve._dimension))
+
+        nodes = np.stack([curve._nodes for curve in curves])
+        starts = np.array([curve._start for curve in curves])
+        ends = np.array([curve._end for curve in curves])
+        # pylint: enable=protected-access
+        return cls(nodes, degree, starts=starts, ends=ends, _copy=False)
+
+    @staticmethod
+    def _num_nodes(degree):
+        """Get the number of nodes in a curve of a given degree.
+
+        Args:
+            degree (int): The degree of the curve.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return degree + 1
+
+    @property
+    def starts(self):
+        """numpy.ndarray: The start parameter of every curve."""
+        return self._starts.copy()
+
+    @property
+    def ends(self):
+        """numpy.ndarray: The end parameter of every curve."""
+        return self._ends.copy()
+
+    def _get_shape(self, index):
+        """Materialize a curve in the collection.
+
+        Args:
+            index (int): The (non-negative) index of the curve.
+
+        Returns:
+            ~bezier.curve.Curve: The curve (with a copy of its nodes).
+        """
+        return curve_mod.Curve(
+            self._nodes[index], self._degree,
+            start=float(self._starts[index]), end=float(self._ends[index]))
+
+    def evaluate_multi(self, s_vals):
+        r"""Evaluate every curve at the same parameter values.
+
+        This is equivalent to calling :meth:`.Curve.evaluate_multi` on
+        each curve, but the Bernstein basis is computed once (see
+        :class:`.BernsteinBasis`) and every curve is evaluated with a
+        single matrix product.
+
+        Args:
+            s_vals (numpy.ndarray): Parameters along each curve (as a
+                1D array).
+
+        Returns:
+            numpy.ndarray: The ``K x N x D`` points, i.e. the ``N x D``
+            points on each of the ``K`` curves.
+        """
+        basis = basis_mod.BernsteinBasis.cached(self._degree, s_vals)
+        return basis.evaluate_many(self._nodes)
+
+    def subdivide(self):
+        """Split every curve into a left and right half.
+
+        This is a vectorized version of :meth:`.Curve.subdivide`.
+
+        Returns:
+            Tuple[CurveCollection, CurveCollection]: The left and right
+            halves of every curve.
+        """
+        left_nodes, right_nodes, starts, midpoints, ends = (
+            _curve_helpers.subdivide_multi(
+                self._nodes, self._degree, self._starts, self._ends))
+        left = CurveCollection(
+            left_nodes, self._degree, starts=starts, ends=midpoints,
+            _copy=False)
+        right = CurveCollection(
+            right_nodes, self._degree, starts=midpoints, ends=ends,
+            _copy=False)
+        return left, right
+
+    def length(self):
+        """Compute the length of every curve.
+
+        This is a vectorized version of :attr:`.Curve.length` (see
+        :func:`._curve_helpers.compute_length_multi`). It uses a fixed
+        Gauss-Legendre rule rather than adaptive quadrature, so it is
+        less accurate for curves with a cusp.
+
+        Returns:
+            numpy.ndarray: The ``K`` (approximate) lengths.
+        """
+        return _curve_helpers.compute_length_multi(self._nodes, self._degree)
+
+    def elevate(self):
+        """Degree-elevate every curve.
+
+        This is a vectorized version of :meth:`.Curve.elevate`.
+
+        Returns:
+            CurveCollection: The degree-elevated curves.
+        """
+        elevation = _curve_helpers.elevation_matrix(self._degree)
+        return CurveCollection(
+            np.matmul(elevation, self._nodes), self._degree + 1,
+            starts=self._starts, ends=self._ends, _copy=False)
+
+
+class SurfaceCollection(_Collection):
+    """A collection of B |eacute| zier surfaces with the same degree.
+
+    .. doctest:: surface-collection
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+       ...     [[1.0, 1.0], [3.0, 1.0], [1.0, 3.0]],
+       ... ])
+       >>> surfaces = bezier.SurfaceCollection(nodes, 1)
+       >>> surfaces
+       <SurfaceCollection (num_shapes=2, degree=1, dimension=2)>
+       >>> surfaces.bbox()
+       array([[ 0., 1., 0., 1.],
+              [ 1., 3., 1., 3.]])
+       >>> sub_a, sub_b, sub_c, sub_d = surfaces.subdivide()
+       >>> sub_b[1]
+       <Surface (degree=1, dimension=2, base=(0.5, 0.5), width=-0.5)>
+
+    Args:
+        nodes (numpy.ndarray): ``K x N x D`` array of nodes, one ``N x D``
+            set of nodes for each of the ``K`` surfaces.
+        degree (int): The degree of each of the surfaces.
+        base_x (Optional[numpy.ndarray]): The :math:`x`-coordinate of the
+            base vertex of the sub-triangle that each surface represents.
+            Defaults to ``0``.
+        base_y (Optional[numpy.ndarray]): The :math:`y`-coordinate of the
+            base vertex of the sub-triangle that each surface represents.
+            Defaults to ``0``.
+        widths (Optional[numpy.ndarray]): The width of the sub-triangle
+            that each surface represents. Defaults to ``1``.
+        _copy (bool): Flag indicating if the nodes (and metadata) should
+            be copied before being stored. Defaults to :data:`True` since
+            callers may freely mutate ``nodes`` after passing in.
+
+    Raises:
+        ValueError: If ``nodes`` is not a 3D array with the number of
+            nodes expected for ``degree``.
+        ValueError: If ``base_x``, ``base_y`` or ``widths`` doesn't have a
+            value for each surface.
+    """
+
+    __slots__ = (
+        '_nodes', '_degree',  # From base class
+        '_base_x', '_base_y', '_widths',  # From constructor
+    )
+
+    def __init__(self, nodes, degree, base_x=None, base_y=None,
+                 widths=None, _copy=True):
+        super(SurfaceCollection, self).__init__(nodes, degree, _copy=_copy)
+        num_surfaces = len(self)
+        self._base_x = _metadata(base_x, num_surfaces, 0.0, _copy)
+        self._base_y = _metadata(base_y, num_surfaces, 0.0, _copy)
+        self._widths = _metadata(widths, num_surfaces, 1.0, _copy)
+
+    @classmethod
+    def from_surfaces(cls, surfaces):
+        """Create a collection from existing surfaces.
+
+        Args:
+            surfaces (Sequence[~bezier.surface.Surface]): The surfaces.
+                They must all have the same degree and dimension.
+
+        Returns:
+            SurfaceCollection: The collection of surfaces.
+
+        Raises:
+            ValueError: If there are no surfaces.
+            ValueError: If the surfaces don't all have the same degree and
+                dimension.
+        """
+        # pylint: disable=protected-access
+        if not surfaces:
+            raise ValueError('At least one surface is required')
+
+        degree = surfaces[0]._degree
+        dimension = surfaces[0]._dimension
+        for surface in surfaces:
+            if (surface._degree != degree or
+                    surface._dimension != dimension):
+                raise ValueError(
+                    'Surfaces must all have the same degree and dimension',
+                    (degree, dimension),
+                    (surface._degree, surface._dimension))
+
+        nodes = np.stack([surface._nodes for surface in surfaces])
+        base_x = np.array([surface._base_x for surface in surfaces])
+        base_y = np.array([surface._base_y for surface in surfaces])
+        widths = np.array([surface._width for surface in surfaces])
+        # pylint: enable=protected-access
+        return cls(nodes, degree, base_x=base_x, base_y=base_y,
+                   widths=widths, _copy=False)
+
+    @staticmethod
+    def _num_nodes(degree):
+        """Get the number of nodes in a surface of a given degree.
+
+        Args:
+            degree (int): The degree of the surface.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return ((degree + 1) * (degree + 2)) // 2
+
+    @property
+    def base_x(self):
+        """numpy.ndarray: The :math:`x`-coordinate of every base vertex."""
+        return self._base_x.copy()
+
+    @property
+    def base_y(self):
+        """numpy.ndarray: The :math:`y`-coordinate of every base vertex."""
+        return self._base_y.copy()
+
+    @property
+    def widths(self):
+        """numpy.ndarray: The width of every sub-triangle."""
+        return self._widths.copy()
+
+    def _get_shape(self, index):
+        """Materialize a surface in the collection.
+
+        Args:
+            index (int): The (non-negative) index of the surface.
+
+        Returns:
+            ~bezier.surface.Surface: The surface (with a copy of its
+            nodes).
+        """
+        return surface_mod.Surface(
+            self._nodes[index], self._degree,
+            base_x=float(self._base_x[index]),
+            base_y=float(self._base_y[index]),
+            width=float(self._widths[index]))
+
+    def evaluate_cartesian_multi(self, param_vals, _verify=True):
+        r"""Evaluate every surface at the same parameter values.
+
+        This is equivalent to calling
+        :meth:`.Surface.evaluate_cartesian_multi` on each surface (see
+        :func:`.evaluate_surfaces`).
+
+        Args:
+            param_vals (numpy.ndarray): Array of parameter values (as a
+                ``N x 2`` array).
+            _verify (Optional[bool]): Indicates if the parameter values
+                should be verified. Can be disabled to speed up execution
+                time. Defaults to :data:`True`.
+
+        Returns:
+            numpy.ndarray: The ``K x N x D`` points, i.e. the ``N x D``
+            points on each of the ``K`` surfaces.
+
+        Raises:
+            ValueError: If ``param_vals`` is not ``N x 2`` or if any of
+                them lies outside the reference triangle (and
+                ``_verify=True``).
+        """
+        return surface_mod.evaluate_surfaces(
+            self._nodes, self._degree, param_vals, _verify=_verify)
+
+    def subdivide(self):
+        """Split every surface into four sub-surfaces.
+
+        This is a vectorized version of :meth:`.Surface.subdivide`.
+
+        Returns:
+            Tuple[SurfaceCollection, SurfaceCollection, \
+                SurfaceCollection, SurfaceCollection]: The lower left,
+            central, lower right and upper left sub-surfaces of every
+            surface (in the same order as :meth:`.Surface.subdivide`).
+        """
+        num_surfaces, num_nodes, dimension = self._nodes.shape
+        new_nodes, new_base_x, new_base_y, new_widths = (
+            _surface_multi.subdivide_multi(
+                self._nodes, self._degree, self._base_x, self._base_y,
+                self._widths))
+        # NOTE: The children of surface ``j`` are ``4j, ..., 4j + 3``.
+        new_nodes = new_nodes.reshape(
+            (num_surfaces, 4, num_nodes, dimension))
+        new_base_x = new_base_x.reshape((num_surfaces, 4))
+        new_base_y = new_base_y.reshape((num_surfaces, 4))
+        new_widths = new_widths.reshape((num_surfaces, 4))
+        return tuple(
+            SurfaceCollection(
+                new_nodes[:, child, :, :], self._degree,
+                base_x=new_base_x[:, child], base_y=new_base_y[:, child],
+                widths=new_widths[:, child], _copy=False)
+            for child in six.moves.xrange(4)
+        )
+
+    def elevate(self):
+        """Degree-elevate every surface.
+
+        This is a vectorized version of :meth:`.Surface.elevate`.
+
+        Returns:
+            SurfaceCollection: The degree-elevated surfaces.
+        """
+        elevation = _surface_elevation_matrix(self._degree)
+        return SurfaceCollection(
+            np.matmul(elevation, self._nodes), self._degree + 1,
+            base_x=self._base_x, base_y=self._base_y, widths=self._widths,
+            _copy=False)
@@ -28,13 +28,17 @@ See :doc:`../curve-curve-intersection` for examples using the
 """
 
 
+import itertools
+
 import numpy as np
+import six
 
 from bezier import _base
 from bezier import _curve_helpers
 from bezier import _helpers
 from bezier import _intersection_helpers
 from bezier import _plot_helpers
+from bezier import basis as basis_mod
 
 
 _REPR_TEMPLATE = (
@@ -126,7 +130,7 @@ class Curve(_base.Base):
     """
 
     __slots__ = (
-        '_dimension', '_nodes',  # From base class
+        '_dimension', '_nodes', '_subdivision', '_bbox',  # From base class
         '_degree', '_start', '_end', '_root',  # From constructor
         '_length', '_edge_index', '_next_edge',  # Empty defaults
         '_previous_edge',  # Empty defaults
@@ -464,7 +468,8 @@ class Curve(_base.Base):
                                       'Current dimension', self._dimension)
 
         s_vals = np.linspace(0.0, 1.0, num_pts)
-        points = self.evaluate_multi(s_vals)
+        basis = basis_mod.BernsteinBasis.cached(self.degree, s_vals)
+        points = basis.evaluate(self._nodes)
 
         if ax is None:
             ax = _plot_helpers.new_axis()
@@ -473,6 +478,47 @@ class Curve(_base.Base):
 
         return ax
 
+    def flatten(self, tolerance):
+        r"""Approximate the current curve by a polyline.
+
+        The curve is subdivided (recursively) until each piece is within
+        ``tolerance`` of the line segment joining its endpoints, using the
+        bound from :func:`.linearization_error`. Only the pieces that are
+        not yet flat enough are subdivided, so (unlike evaluating on a
+        uniform grid) nearly straight spans use very few points.
+
+        .. doctest:: curve-flatten
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.0],
+           ...     [1.0, 2.0],
+           ...     [2.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> curve.flatten(0.25)
+           array([[ 0., 0.],
+                  [ 1., 1.],
+                  [ 2., 0.]])
+           >>> curve.flatten(0.0625).shape
+           (5, 2)
+
+        Args:
+            tolerance (float): The maximum distance allowed between the
+                curve and the polyline.
+
+        Returns:
+            numpy.ndarray: The ``N x D`` points of the polyline, starting
+            and ending at the endpoints of the curve.
+
+        Raises:
+            ValueError: If ``tolerance`` is not positive.
+        """
+        if not tolerance > 0.0:
+            raise ValueError('Tolerance must be positive', tolerance)
+
+        return _curve_helpers.flatten(self._nodes, tolerance)
+
     def subdivide(self):
         r"""Split the curve :math:`B(s)` into a left and right half.
 
@@ -513,6 +559,22 @@ class Curve(_base.Base):
            import make_images
            make_images.curve_subdivide(curve, left, right)
 
+        If a subdivision cache has been enabled (see
+        :meth:`enable_subdivision_cache`), the same
+        sub-curves are returned each time the curve is subdivided.
+
+        Returns:
+            Tuple[Curve, Curve]: The left and right sub-curves.
+        """
+        if self._subdivision is None:
+            return self._subdivide()
+
+        cache, level, index = self._subdivision
+        return cache.subdivide(level, index, self._subdivide)
+
+    def _subdivide(self):
+        """Split the curve into a left and right half (without caching).
+
         Returns:
             Tuple[Curve, Curve]: The left and right sub-curves.
         """
@@ -532,7 +594,7 @@ class Curve(_base.Base):
             right_nodes = _helpers.matrix_product(
                 _CUBIC_SUBDIVIDE_RIGHT, self._nodes)
         else:
-            left_mat, right_mat = _curve_helpers.make_subdivision_matrices(
+            left_mat, right_mat = _curve_helpers.subdivision_matrices(
                 self._degree)
             left_nodes = _helpers.matrix_product(left_mat, self._nodes)
             right_nodes = _helpers.matrix_product(right_mat, self._nodes)
@@ -897,4 +959,337 @@ class Curve(_base.Base):
             raise ValueError('Point is not in same dimension as curve',
                              point, 'Shape expected:', (1, self._dimension))
 
+        if self._subdivision is not None:
+            # NOTE: Only the pure Python version subdivides via
+            #       :meth:`subdivide`, so it is the only one that uses
+            #       the subdivision cache.
+            return _curve_helpers.locate_point_cached(self, point)
         return _curve_helpers.locate_point(self, point)
+
+    def locate_multi(self, points):
+        r"""Find many points on the current curve.
+
+        Solves for :math:`s` in :math:`B(s) = p` for each row :math:`p`
+        of ``points``. This is equivalent to calling :meth:`locate` on
+        each point, but the subdivision and Newton refinement are shared
+        among all of the points.
+
+        .. note::
+
+           A unique solution is only guaranteed if the current curve has no
+           self-intersections. This code assumes, but doesn't check, that
+           this is true.
+
+        .. doctest:: curve-locate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.0],
+           ...     [1.0, 2.0],
+           ...     [3.0, 1.0],
+           ...     [4.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=3)
+           >>> points = np.asfortranarray([
+           ...     [3.09375, 0.703125],
+           ...     [2.0    , 0.5     ],
+           ...     [2.0    , 1.125   ],
+           ... ])
+           >>> s_vals = curve.locate_multi(points)
+           >>> s_vals
+           array([ 0.75,  nan,  0.5 ])
+
+        Args:
+            points (numpy.ndarray): A (``NxD``) array of points, where
+                :math:`D` is the dimension of the curve.
+
+        Returns:
+            numpy.ndarray: The (``N``) parameter values (:math:`s`)
+            corresponding to each point, with NaN for each point
+            that is not on the curve.
+
+        Raises:
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current curve.
+        """
+        if points.ndim != 2 or points.shape[1] != self._dimension:
+            raise ValueError('Points are not in same dimension as curve',
+                             points, 'Shape expected:',
+                             ('N', self._dimension))
+
+        if self._subdivision is not None:
+            return _curve_helpers.locate_point_cached_multi(self, points)
+        return _curve_helpers.locate_point_multi(self, points)
+
+
+def intersect_many(curves_a, curves_b,
+                   strategy=IntersectionStrategy.geometric, _verify=True):
+    """Find the points of intersection for many pairs of curves.
+
+    Pairs are formed index-wise, i.e. ``curves_a[i]`` is intersected with
+    ``curves_b[i]``. All pairs are pushed through the subdivision rounds
+    together, so this is much cheaper than calling :meth:`Curve.intersect`
+    once for each pair.
+
+    .. note::
+
+       When the compiled speedups are available, the geometric strategy
+       does **not** batch the pairs. Instead it loops over the pairs in
+       Python and runs the full subdivision process natively for each
+       one, which is faster than the batched (NumPy) rounds.
+
+    .. doctest:: intersect-many
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> curve1 = bezier.Curve(np.asfortranarray([
+       ...     [0.0  , 0.0  ],
+       ...     [0.375, 0.75 ],
+       ...     [0.75 , 0.375],
+       ... ]), degree=2)
+       >>> curve2 = bezier.Curve(np.asfortranarray([
+       ...     [0.5, 0.0 ],
+       ...     [0.5, 0.75],
+       ... ]), degree=1)
+       >>> curve3 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.46875],
+       ...     [1.0, 0.46875],
+       ... ]), degree=1)
+       >>> pair_indices, points, failed = bezier.intersect_many(
+       ...     [curve1, curve1, curve2], [curve2, curve3, curve3])
+       >>> pair_indices
+       array([0, 1, 1, 2])
+       >>> points
+       array([[ 0.5  , 0.5    ],
+              [ 0.375, 0.46875],
+              [ 0.625, 0.46875],
+              [ 0.5  , 0.46875]])
+       >>> failed.size
+       0
+
+    A pair that can't be intersected (e.g. tangent curves with the
+    algebraic strategy or coincident curves) doesn't stop the other
+    pairs. Instead, it is reported:
+
+    .. doctest:: intersect-many
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> curve4 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [0.5, 1.0],
+       ...     [1.0, 0.0],
+       ... ]), degree=2)
+       >>> curve5 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.5],
+       ...     [1.0, 0.5],
+       ... ]), degree=1)
+       >>> strategy = bezier.curve.IntersectionStrategy.algebraic
+       >>> pair_indices, points, failed = bezier.intersect_many(
+       ...     [curve4, curve2], [curve5, curve3], strategy=strategy)
+       >>> pair_indices
+       array([1])
+       >>> points
+       array([[ 0.5 , 0.46875]])
+       >>> failed
+       array([0])
+
+    Args:
+        curves_a (Sequence[Curve]): The first curve in each pair.
+        curves_b (Sequence[Curve]): The second curve in each pair.
+        strategy (Optional[~bezier.curve.IntersectionStrategy]): The
+            intersection algorithm to use. Defaults to geometric.
+        _verify (Optional[bool]): Indicates if extra caution should be
+            used to verify assumptions about the inputs. Can be disabled
+            to speed up execution time. Defaults to :data:`True`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The (``M``) integer array of pair indices, one for each
+          intersection found (sorted, since pairs are processed in order)
+        * The (``Mx2``) array of intersection points
+        * The (``F``) integer array of pair indices that could not be
+          intersected (sorted), i.e. the pairs for which
+          :meth:`Curve.intersect` would raise :exc:`NotImplementedError`
+          or :exc:`ValueError`
+
+    Raises:
+        ValueError: If ``curves_a`` and ``curves_b`` have different
+            lengths.
+        TypeError: If any of the inputs is not a curve (and
+            ``_verify=True``).
+        NotImplementedError: If any of the curves isn't two-dimensional
+            (and ``_verify=True``).
+    """
+    if len(curves_a) != len(curves_b):
+        raise ValueError(
+            'Expected the same number of curves in each sequence',
+            len(curves_a), len(curves_b))
+    if _verify:
+        for curve in itertools.chain(curves_a, curves_b):
+            if not isinstance(curve, Curve):
+                raise TypeError('Can only intersect curves',
+                                'Received', curve)
+            if curve._dimension != 2:
+                raise NotImplementedError(
+                    'Intersection only implemented in 2D')
+
+    candidates = list(six.moves.zip(curves_a, curves_b))
+    intersections = _intersection_helpers.all_intersections_many(
+        candidates, strategy=strategy)
+    failed = np.asarray([
+        index for index, pair_intersections in enumerate(intersections)
+        if isinstance(pair_intersections, Exception)], dtype=int)
+    num_intersections = sum(
+        len(pair_intersections) for pair_intersections in intersections
+        if not isinstance(pair_intersections, Exception))
+    pair_indices = np.empty((num_intersections,), dtype=int)
+    points = np.empty((num_intersections, 2), order='F')
+    row = 0
+    for index, pair_intersections in enumerate(intersections):
+        if isinstance(pair_intersections, Exception):
+            continue
+        for intersection in pair_intersections:
+            pair_indices[row] = index
+            points[row, :] = intersection.get_point()
+            row += 1
+
+    return pair_indices, points, failed
+
+
+def intersect_network(curves, strategy=IntersectionStrategy.geometric,
+                      _verify=True):
+    """Find all points of intersection among a collection of curves.
+
+    Every pair of (distinct) curves is considered, but a sweep-and-prune
+    over the bounding boxes of the curves is used to skip pairs that
+    can't possibly intersect. The remaining pairs are intersected
+    together as in :func:`intersect_many`.
+
+    .. doctest:: intersect-network
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> curve0 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [0.5, 1.0],
+       ...     [1.0, 0.0],
+       ... ]), degree=2)
+       >>> curve1 = bezier.Curve(np.asfortranarray([
+       ...     [0.5, 0.0],
+       ...     [0.5, 1.0],
+       ... ]), degree=1)
+       >>> curve2 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.375],
+       ...     [1.0, 0.375],
+       ... ]), degree=1)
+       >>> curve3 = bezier.Curve(np.asfortranarray([
+       ...     [3.0, 0.0],
+       ...     [4.0, 1.0],
+       ... ]), degree=1)
+       >>> pairs, points, failed = bezier.intersect_network(
+       ...     [curve0, curve1, curve2, curve3])
+       >>> pairs
+       array([[0, 1],
+              [0, 2],
+              [0, 2],
+              [1, 2]])
+       >>> points
+       array([[ 0.5 , 0.5  ],
+              [ 0.25, 0.375],
+              [ 0.75, 0.375],
+              [ 0.5 , 0.375]])
+       >>> failed.shape
+       (0, 2)
+
+    Args:
+        curves (Sequence[Curve]): The curves in the network.
+        strategy (Optional[~bezier.curve.IntersectionStrategy]): The
+            intersection algorithm to use. Defaults to geometric.
+        _verify (Optional[bool]): Indicates if extra caution should be
+            used to verify assumptions about the inputs. Can be disabled
+            to speed up execution time. Defaults to :data:`True`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The (``Mx2``) integer array of curve indices ``i < j``, one row
+          for each intersection found (sorted)
+        * The (``Mx2``) array of intersection points
+        * The (``Fx2``) integer array of curve indices ``i < j`` for the
+          pairs that could not be intersected (sorted), as in
+          :func:`intersect_many`
+
+    Raises:
+        TypeError: If any of the inputs is not a curve (and
+            ``_verify=True``).
+        NotImplementedError: If any of the curves isn't two-dimensional
+            (and ``_verify=True``).
+    """
+    if _verify:
+        for curve in curves:
+            if not isinstance(curve, Curve):
+                raise TypeError('Can only intersect curves',
+                                'Received', curve)
+            if curve._dimension != 2:
+                raise NotImplementedError(
+                    'Intersection only implemented in 2D')
+
+    boxes = np.empty((len(curves), 4))
+    for index, curve in enumerate(curves):
+        # pylint: disable=protected-access
+        boxes[index, :] = curve._get_bbox()
+        # pylint: enable=protected-access
+    candidate_pairs = _helpers.sweep_and_prune(boxes)
+
+    curves_a = [curves[index] for index in candidate_pairs[:, 0]]
+    curves_b = [curves[index] for index in candidate_pairs[:, 1]]
+    pair_indices, points, failed = intersect_many(
+        curves_a, curves_b, strategy=strategy, _verify=False)
+    return (
+        candidate_pairs[pair_indices, :], points, candidate_pairs[failed, :])
+
+
+def curves_from_buffer(nodes, degree):
+    """Create many curves (of the same degree) that share a node buffer.
+
+    Each curve is a **view** into ``nodes`` rather than a copy, so no
+    memory is allocated per curve and the nodes of the collection remain
+    contiguous. This makes it possible to load a large model (e.g. from
+    a :class:`numpy.memmap`) without copying.
+
+    .. doctest:: curves-from-buffer
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 2.0],
+       ...     [2.0, 0.0],
+       ...     [3.0, 1.0],
+       ... ])
+       >>> curves = bezier.curves_from_buffer(nodes, 1)
+       >>> curves
+       [<Curve (degree=1, dimension=2)>, <Curve (degree=1, dimension=2)>]
+       >>> curves[1].evaluate(0.5)
+       array([[ 2.5, 0.5]])
+
+    Since the nodes of a curve are assumed not to change (e.g. its
+    bounding box is cached), the buffer must not be modified while the
+    curves are in use.
+
+    Args:
+        nodes (numpy.ndarray): The ``(K * (degree + 1)) x D`` buffer of
+            nodes, i.e. the nodes of ``K`` curves stacked on top of each
+            other.
+        degree (int): The degree of each of the curves.
+
+    Returns:
+        List[Curve]: The ``K`` curves.
+
+    Raises:
+        ValueError: If ``nodes`` is not 2D.
+        ValueError: If the number of rows in ``nodes`` is not a multiple
+            of ``degree + 1``.
+    """
+    return [
+        Curve(curve_nodes, degree, _copy=False)
+        for curve_nodes in _base.node_views(nodes, degree + 1)
+    ]
@@ -0,0 +1,319 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spatial index for a collection of B |eacute| zier curves.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+
+import numpy as np
+
+from bezier import _helpers
+from bezier import curve as curve_mod
+
+
+_REPR_TEMPLATE = '<{} (num_curves={:d})>'
+
+
+class CurveIndex(object):
+    """Index for intersecting against a (large) collection of curves.
+
+    The bounding box of the nodes of each curve is stored in a bounding
+    volume hierarchy. When a curve (or point) is queried against the
+    index, only the curves with a bounding box that overlaps the query
+    are passed along to the (much more expensive) intersection code.
+
+    .. doctest:: curve-index-constructor
+
+       >>> curves = [
+       ...     bezier.Curve(np.asfortranarray([
+       ...         [0.25, 0.0],
+       ...         [0.25, 1.0],
+       ...     ]), degree=1),
+       ...     bezier.Curve(np.asfortranarray([
+       ...         [0.5, 0.0],
+       ...         [0.5, 1.0],
+       ...     ]), degree=1),
+       ...     bezier.Curve(np.asfortranarray([
+       ...         [2.0, 0.0],
+       ...         [2.0, 1.0],
+       ...     ]), degree=1),
+       ... ]
+       >>> index = bezier.CurveIndex(curves)
+       >>> index
+       <CurveIndex (num_curves=3)>
+
+    Args:
+        curves (Sequence[~bezier.curve.Curve]): The curves to be indexed.
+        _verify (Optional[bool]): Indicates if the curves should be
+            verified as two-dimensional curves. Can be disabled to speed
+            up execution time. Defaults to :data:`True`.
+
+    Raises:
+        TypeError: If any of the inputs is not a curve (and
+            ``_verify=True``).
+        NotImplementedError: If any of the curves isn't two-dimensional
+            (and ``_verify=True``).
+    """
+
+    __slots__ = ('_curves', '_boxes', '_tree')
+
+    def __init__(self, curves, _verify=True):
+        curves = tuple(curves)
+        if _verify:
+            for curve in curves:
+                self._verify_curve(curve)
+
+        self._curves = curves
+        self._boxes = np.empty((len(curves), 4))
+        for index, curve in enumerate(curves):
+            # pylint: disable=protected-access
+            self._boxes[index, :] = curve._get_bbox()
+            # pylint: enable=protected-access
+        self._tree = _helpers.bbox_tree(self._boxes)
+
+    @staticmethod
+    def _verify_curve(curve):
+        """Verify that an object can be used with the index.
+
+        Args:
+            curve (object): The object to check.
+
+        Raises:
+            TypeError: If ``curve`` is not a curve.
+            NotImplementedError: If ``curve`` isn't two-dimensional.
+        """
+        if not isinstance(curve, curve_mod.Curve):
+            raise TypeError('Can only index curves', 'Received', curve)
+        # pylint: disable=protected-access
+        if curve._dimension != 2:
+            raise NotImplementedError('Index only implemented in 2D')
+        # pylint: enable=protected-access
+
+    @property
+    def curves(self):
+        """Tuple[~bezier.curve.Curve, ...]: The indexed curves."""
+        return self._curves
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current index's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {name: getattr(self, name)
+                for name in self.__slots__}
+
+    def __len__(self):
+        """Get the number of indexed curves.
+
+        Returns:
+            int: The number of curves.
+        """
+        return len(self._curves)
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return _REPR_TEMPLATE.format(
+            self.__class__.__name__, len(self._curves))
+
+    def query_box(self, left, right, bottom, top):
+        """Find the curves with a bounding box that overlaps a box.
+
+        Boxes which only touch (e.g. share an edge) are considered
+        overlapping.
+
+        .. doctest:: curve-index-query-box
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> index = bezier.CurveIndex([
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.0, 0.0],
+           ...         [1.0, 1.0],
+           ...     ]), degree=1),
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [2.0, 0.0],
+           ...         [3.0, 1.0],
+           ...     ]), degree=1),
+           ... ])
+           >>> index.query_box(0.5, 2.0, 0.0, 0.25)
+           array([0, 1])
+           >>> index.query_box(1.25, 1.75, 0.0, 1.0).size
+           0
+
+        Args:
+            left (float): The left edge of the query box.
+            right (float): The right edge of the query box.
+            bottom (float): The bottom edge of the query box.
+            top (float): The top edge of the query box.
+
+        Returns:
+            numpy.ndarray: The (sorted) indices of the matching curves.
+        """
+        return _helpers.bbox_tree_query(
+            self._tree, self._boxes, left, right, bottom, top)
+
+    def query_intersections(
+            self, curve,
+            strategy=curve_mod.IntersectionStrategy.geometric,
+            _verify=True):
+        """Intersect a curve with every indexed curve.
+
+        Only the indexed curves with a bounding box that overlaps the
+        bounding box of ``curve`` are actually intersected.
+
+        .. doctest:: curve-index-query-intersections
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> index = bezier.CurveIndex([
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.25, 0.0],
+           ...         [0.25, 1.0],
+           ...     ]), degree=1),
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.5, 0.0],
+           ...         [0.5, 1.0],
+           ...     ]), degree=1),
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [2.0, 0.0],
+           ...         [2.0, 1.0],
+           ...     ]), degree=1),
+           ... ])
+           >>> curve = bezier.Curve(np.asfortranarray([
+           ...     [0.0, 0.0],
+           ...     [0.5, 1.0],
+           ...     [1.0, 0.0],
+           ... ]), degree=2)
+           >>> curve_indices, points, failed = index.query_intersections(
+           ...     curve)
+           >>> curve_indices
+           array([0, 1])
+           >>> points
+           array([[ 0.25, 0.375],
+                  [ 0.5 , 0.5  ]])
+           >>> failed.size
+           0
+
+        Args:
+            curve (~bezier.curve.Curve): The curve to intersect with the
+                indexed curves.
+            strategy (Optional[~bezier.curve.IntersectionStrategy]): The
+                intersection algorithm to use. Defaults to geometric.
+            _verify (Optional[bool]): Indicates if extra caution should be
+                used to verify assumptions about ``curve``. Can be disabled
+                to speed up execution time. Defaults to :data:`True`.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+            * The (``M``) integer array of indexed curves, one for each
+              intersection found (sorted)
+            * The (``Mx2``) array of intersection points
+            * The (``F``) integer array of indexed curves that could not
+              be intersected with ``curve`` (sorted), as in
+              :func:`~bezier.curve.intersect_many`
+
+        Raises:
+            TypeError: If ``curve`` is not a curve (and ``_verify=True``).
+            NotImplementedError: If ``curve`` isn't two-dimensional
+                (and ``_verify=True``).
+        """
+        if _verify:
+            self._verify_curve(curve)
+
+        # pylint: disable=protected-access
+        left, right, bottom, top = curve._get_bbox()
+        # pylint: enable=protected-access
+        matches = self.query_box(left, right, bottom, top)
+        curves_a = [self._curves[index] for index in matches]
+        curves_b = [curve] * len(curves_a)
+        pair_indices, points, failed = curve_mod.intersect_many(
+            curves_a, curves_b, strategy=strategy, _verify=False)
+        return matches[pair_indices], points, matches[failed]
+
+    def query_point(self, point):
+        """Find the indexed curves that contain a point.
+
+        Only the indexed curves with a bounding box that contains
+        ``point`` are checked (via :meth:`.Curve.locate`).
+
+        .. doctest:: curve-index-query-point
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> index = bezier.CurveIndex([
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.0, 0.0],
+           ...         [1.0, 1.0],
+           ...     ]), degree=1),
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.0, 1.0],
+           ...         [1.0, 0.0],
+           ...     ]), degree=1),
+           ...     bezier.Curve(np.asfortranarray([
+           ...         [0.0, 0.0],
+           ...         [0.5, 1.0],
+           ...         [1.0, 0.0],
+           ...     ]), degree=2),
+           ... ])
+           >>> point = np.asfortranarray([[0.25, 0.25]])
+           >>> curve_indices, s_vals = index.query_point(point)
+           >>> curve_indices
+           array([0])
+           >>> s_vals
+           array([ 0.25])
+
+        Args:
+            point (numpy.ndarray): A (``1x2``) point.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * The (sorted) integer array of indexed curves that
+              contain ``point``
+            * The parameter values (:math:`s`) along each of those
+              curves that correspond to ``point``
+
+        Raises:
+            ValueError: If ``point`` is not ``1x2``.
+        """
+        if point.shape != (1, 2):
+            raise ValueError('Point is not in R^2', point,
+                             'Shape expected:', (1, 2))
+
+        x_val, y_val = point[0, :]
+        matches = self.query_box(x_val, x_val, y_val, y_val)
+        curve_indices = []
+        s_vals = []
+        for index in matches:
+            s_val = self._curves[index].locate(point)
+            if s_val is not None:
+                curve_indices.append(index)
+                s_vals.append(s_val)
+
+        return (np.asarray(curve_indices, dtype=int),
+                np.asarray(s_vals, dtype=np.float64))
@@ -30,6 +30,7 @@ import six
 
 from bezier import _helpers
 from bezier import _plot_helpers
+from bezier import _tessellation_helpers
 
 
 class CurvedPolygon(object):
@@ -246,3 +247,112 @@ class CurvedPolygon(object):
         _plot_helpers.add_patch(ax, color, pts_per_edge, *self._edges)
 
         return ax
+
+    def tessellate(self, pts_per_edge):
+        """Tessellate the boundary of the current curved polygon.
+
+        Each edge is evaluated at ``pts_per_edge`` evenly spaced parameter
+        values. Since consecutive edges share an endpoint, the first point
+        of each edge is left out.
+
+        .. doctest:: curved-polygon-tessellate
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> edge0 = bezier.Curve(np.asfortranarray([
+           ...     [0.0, 0.0],
+           ...     [1.0, -1.0],
+           ...     [2.0, 0.0],
+           ... ]), degree=2)
+           >>> edge1 = bezier.Curve(np.asfortranarray([
+           ...     [2.0, 0.0],
+           ...     [0.0, 0.0],
+           ... ]), degree=1)
+           >>> curved_poly = bezier.CurvedPolygon(edge0, edge1)
+           >>> vertices, segments = curved_poly.tessellate(3)
+           >>> vertices
+           array([[ 1. , -0.5],
+                  [ 2. ,  0. ],
+                  [ 1. ,  0. ],
+                  [ 0. ,  0. ]])
+           >>> segments
+           array([[0, 1],
+                  [1, 2],
+                  [2, 3],
+                  [3, 0]])
+
+        Args:
+            pts_per_edge (int): The number of points along each edge.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * The ``V x 2`` array of vertices
+            * The ``V x 2`` integer array of segments (as indices of rows
+              in the vertices), forming a closed loop
+
+        Raises:
+            ValueError: If ``pts_per_edge`` is less than ``2``.
+        """
+        _tessellation_helpers.verify_resolution(pts_per_edge, None)
+        return _tessellation_helpers.boundary_buffers(
+            self._edges, pts_per_edge)
+
+
+def tessellate_polygons(
+        polygons, pts_per_edge,
+        max_vertices=_tessellation_helpers.DEFAULT_MAX_VERTICES):
+    """Tessellate the boundaries of many curved polygons, in chunks.
+
+    The chunks are produced lazily: each one contains the boundaries (as
+    computed by :meth:`CurvedPolygon.tessellate`) of consecutive curved
+    polygons, merged into preallocated buffers with at most
+    ``max_vertices`` vertices (unless a single boundary is larger on its
+    own).
+
+    .. doctest:: tessellate-polygons
+
+       >>> edge0 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 0.0],
+       ... ]), degree=1)
+       >>> edge1 = bezier.Curve(np.asfortranarray([
+       ...     [1.0, 0.0],
+       ...     [0.0, 1.0],
+       ... ]), degree=1)
+       >>> edge2 = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 1.0],
+       ...     [0.0, 0.0],
+       ... ]), degree=1)
+       >>> polygons = [bezier.CurvedPolygon(edge0, edge1, edge2)] * 3
+       >>> chunks = bezier.tessellate_polygons(
+       ...     polygons, 2, max_vertices=6)
+       >>> for vertices, segments, polygon_ids in chunks:
+       ...     segments.tolist(), polygon_ids.tolist()
+       ([[0, 1], [1, 2], [2, 0], [3, 4], [4, 5], [5, 3]], [0, 0, 0, 1, 1, 1])
+       ([[0, 1], [1, 2], [2, 0]], [2, 2, 2])
+
+    Args:
+        polygons (Iterable[CurvedPolygon]): The curved polygons to
+            tessellate. Can be a generator; curved polygons are only
+            consumed as each chunk is needed.
+        pts_per_edge (int): The number of points along each edge.
+        max_vertices (Optional[int]): The maximum number of vertices in
+            a chunk. Defaults to ``65536``, so that every index in a
+            chunk fits in an unsigned 16-bit integer (the segments are
+            still returned with the default integer type).
+
+    Yields:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triples of
+
+        * The ``V x 2`` array of vertices in the chunk
+        * The ``V x 2`` integer array of segments (as indices of rows in
+          the vertices of the chunk), each boundary is a closed loop
+        * The ``V`` integer array of the index (in ``polygons``) of the
+          curved polygon each segment came from
+
+    Raises:
+        ValueError: If ``pts_per_edge`` is less than ``2``.
+    """
+    _tessellation_helpers.verify_resolution(pts_per_edge, None)
+    return _tessellation_helpers.stream_boundaries(
+        polygons, pts_per_edge, max_vertices)
@@ -9,11 +9,25 @@ module speedup
        specialize_curve_generic, specialize_curve_quadratic, &
        specialize_curve, jacobian_both, evaluate_hodograph, &
        newton_refine_intersect, jacobian_det, bbox_intersect, &
-       wiggle_interval, parallel_different, from_linearized
+       wiggle_interval, parallel_different, from_linearized, &
+       curve_intersections, locate_point_surface, locate_point_curve, &
+       flatten_curve, linearization_error_multi, evaluate_hodograph_multi, &
+       bbox_intersect_multi, wiggle_interval_multi
 
   ! NOTE: This still relies on .f2py_f2cmap being present
   !       in the directory that build is called from.
   integer, parameter :: dp=kind(0.d0)
+  ! NOTE: These values are also defined in ``_intersection_helpers.py``.
+  real(dp), parameter :: LINEARIZATION_THRESHOLD = 0.5_dp**26
+  integer, parameter :: MAX_INTERSECT_SUBDIVISIONS = 20
+  integer, parameter :: MAX_CANDIDATES = 16
+  ! NOTE: These values are also defined in ``_surface_helpers.py``.
+  integer, parameter :: MAX_LOCATE_SUBDIVISIONS = 20
+  real(dp), parameter :: LOCATE_EPS = 0.5_dp**47
+  real(dp), parameter :: LOCATE_MISS = -1.0_dp
+  ! NOTE: These values are also defined in ``_curve_helpers.py``.
+  real(dp), parameter :: LOCATE_STD_CAP = 0.5_dp**20
+  integer, parameter :: MAX_FLATTEN_SUBDIVISIONS = 20
 
 contains
 
@@ -159,6 +173,26 @@ contains
     error = 0.125_dp * degree * (degree - 1) * norm2(worst_case)
   end subroutine linearization_error
 
+  subroutine linearization_error_multi( &
+       num_curves, nodes, degree, dimension_, errors)
+
+    !f2py integer intent(hide), depend(nodes) :: num_curves = size(nodes, 1)
+    !f2py integer intent(hide), depend(nodes) :: dimension_ = size(nodes, 3)
+    integer :: num_curves
+    real(dp), intent(in) :: nodes(num_curves, degree + 1, dimension_)
+    integer, intent(in) :: degree
+    integer :: dimension_
+    real(dp), intent(out) :: errors(num_curves)
+    ! Variables outside of signature.
+    integer :: index_
+
+    do index_ = 1, num_curves
+       call linearization_error( &
+            nodes(index_, :, :), degree, dimension_, errors(index_))
+    end do
+
+  end subroutine linearization_error_multi
+
   subroutine evaluate_barycentric( &
        num_nodes, dimension_, nodes, degree, &
        lambda1, lambda2, lambda3, point)
@@ -532,6 +566,28 @@ contains
 
   end subroutine evaluate_hodograph
 
+  subroutine evaluate_hodograph_multi( &
+       num_curves, s_vals, nodes, dimension_, degree, hodographs)
+
+    !f2py integer intent(hide), depend(nodes) :: num_curves = size(nodes, 1)
+    !f2py integer intent(hide), depend(nodes) :: dimension_ = size(nodes, 3)
+    integer :: num_curves
+    real(dp), intent(in) :: s_vals(num_curves)
+    real(dp), intent(in) :: nodes(num_curves, degree + 1, dimension_)
+    integer :: dimension_
+    integer, intent(in) :: degree
+    real(dp), intent(out) :: hodographs(num_curves, dimension_)
+    ! Variables outside of signature.
+    integer :: index_
+
+    do index_ = 1, num_curves
+       call evaluate_hodograph( &
+            s_vals(index_), nodes(index_, :, :), dimension_, degree, &
+            hodographs(index_:index_, :))
+    end do
+
+  end subroutine evaluate_hodograph_multi
+
   subroutine newton_refine_intersect( &
        s, nodes1, degree1, t, nodes2, degree2, new_s, new_t)
 
@@ -651,6 +707,27 @@ contains
 
   end subroutine bbox_intersect
 
+  subroutine bbox_intersect_multi( &
+       num_pairs, num_nodes1, nodes1, num_nodes2, nodes2, enums)
+
+    !f2py integer intent(hide), depend(nodes1) :: num_pairs = size(nodes1, 1)
+    !f2py integer intent(hide), depend(nodes1) :: num_nodes1 = size(nodes1, 2)
+    !f2py integer intent(hide), depend(nodes2) :: num_nodes2 = size(nodes2, 2)
+    integer :: num_pairs, num_nodes1, num_nodes2
+    real(dp), intent(in) :: nodes1(num_pairs, num_nodes1, 2)
+    real(dp), intent(in) :: nodes2(num_pairs, num_nodes2, 2)
+    integer, intent(out) :: enums(num_pairs)
+    ! Variables outside of signature.
+    integer :: index_
+
+    do index_ = 1, num_pairs
+       call bbox_intersect( &
+            num_nodes1, nodes1(index_, :, :), &
+            num_nodes2, nodes2(index_, :, :), enums(index_))
+    end do
+
+  end subroutine bbox_intersect_multi
+
   subroutine wiggle_interval(value_, result_, success)
 
     real(dp), intent(in) :: value_
@@ -671,6 +748,26 @@ contains
 
   end subroutine wiggle_interval
 
+  subroutine wiggle_interval_multi(num_values, values, results, success)
+
+    !f2py integer intent(hide), depend(values) :: num_values = size(values)
+    integer :: num_values
+    real(dp), intent(in) :: values(num_values)
+    real(dp), intent(out) :: results(num_values)
+    logical(1), intent(out) :: success(num_values)
+    ! Variables outside of signature.
+    integer :: index_
+
+    do index_ = 1, num_values
+       call wiggle_interval( &
+            values(index_), results(index_), success(index_))
+       if (.NOT. success(index_)) then
+          results(index_) = values(index_)
+       end if
+    end do
+
+  end subroutine wiggle_interval_multi
+
   subroutine parallel_different(start0, end0, start1, end1, result_)
 
     real(dp), intent(in) :: start0(1, 2)
@@ -823,4 +920,873 @@ contains
 
   end subroutine from_linearized
 
+  pure function in_interval(value_, start, end_) result(predicate)
+
+    real(dp), intent(in) :: value_, start, end_
+    logical(1) :: predicate
+
+    predicate = (start <= value_) .AND. (value_ <= end_)
+
+  end function in_interval
+
+  pure function vector_close(num_values, vec1, vec2, eps) result(is_close)
+
+    integer, intent(in) :: num_values
+    real(dp), intent(in) :: vec1(1, num_values)
+    real(dp), intent(in) :: vec2(1, num_values)
+    real(dp), intent(in) :: eps
+    logical(1) :: is_close
+    ! Variables outside of signature.
+    real(dp) :: size1, size2
+
+    size1 = norm2(vec1)
+    size2 = norm2(vec2)
+    if (size1 == 0.0_dp) then
+       is_close = size2 <= eps
+    else if (size2 == 0.0_dp) then
+       is_close = size1 <= eps
+    else
+       is_close = norm2(vec1 - vec2) <= eps * min(size1, size2)
+    end if
+
+  end function vector_close
+
+  pure function ulps_away(value1, value2, num_bits) result(predicate)
+
+    real(dp), intent(in) :: value1, value2
+    integer, intent(in) :: num_bits
+    logical(1) :: predicate
+
+    if (value1 == 0.0_dp) then
+       predicate = abs(value2) < 0.5_dp**40
+    else if (value2 == 0.0_dp) then
+       predicate = abs(value1) < 0.5_dp**40
+    else
+       predicate = abs(value1 - value2) <= num_bits * spacing(value1)
+    end if
+
+  end function ulps_away
+
+  subroutine bbox_line_intersect( &
+       num_nodes, nodes, line_start, line_end, enum_)
+
+    !f2py integer intent(hide), depend(nodes) :: num_nodes = size(nodes, 1)
+    integer :: num_nodes
+    real(dp), intent(in) :: nodes(num_nodes, 2)
+    real(dp), intent(in) :: line_start(1, 2)
+    real(dp), intent(in) :: line_end(1, 2)
+    integer, intent(out) :: enum_
+    ! Variables outside of signature.
+    real(dp) :: left, right, bottom, top
+    real(dp) :: segment_start(1, 2)
+    real(dp) :: segment_end(1, 2)
+    real(dp) :: s_curr, t_curr
+    logical(1) :: success
+
+    call bbox(num_nodes, nodes, left, right, bottom, top)
+
+    if ( &
+         in_interval(line_start(1, 1), left, right) .AND. &
+         in_interval(line_start(1, 2), bottom, top)) then
+       enum_ = 0  ! Intersection
+       return
+    end if
+    if ( &
+         in_interval(line_end(1, 1), left, right) .AND. &
+         in_interval(line_end(1, 2), bottom, top)) then
+       enum_ = 0  ! Intersection
+       return
+    end if
+
+    ! NOTE: We allow ``segment_intersection`` to fail below (i.e.
+    !       ``success=False``). See ``bbox_line_intersect`` in
+    !       ``_intersection_helpers.py`` for an explanation.
+    enum_ = 0  ! Intersection
+
+    ! Bottom Edge
+    segment_start(1, :) = [left, bottom]
+    segment_end(1, :) = [right, bottom]
+    call segment_intersection( &
+         segment_start, segment_end, line_start, line_end, &
+         s_curr, t_curr, success)
+    if ( &
+         success .AND. &
+         in_interval(s_curr, 0.0_dp, 1.0_dp) .AND. &
+         in_interval(t_curr, 0.0_dp, 1.0_dp)) then
+       return
+    end if
+
+    ! Right Edge
+    segment_start(1, :) = [right, bottom]
+    segment_end(1, :) = [right, top]
+    call segment_intersection( &
+         segment_start, segment_end, line_start, line_end, &
+         s_curr, t_curr, success)
+    if ( &
+         success .AND. &
+         in_interval(s_curr, 0.0_dp, 1.0_dp) .AND. &
+         in_interval(t_curr, 0.0_dp, 1.0_dp)) then
+       return
+    end if
+
+    ! Top Edge
+    segment_start(1, :) = [right, top]
+    segment_end(1, :) = [left, top]
+    call segment_intersection( &
+         segment_start, segment_end, line_start, line_end, &
+         s_curr, t_curr, success)
+    if ( &
+         success .AND. &
+         in_interval(s_curr, 0.0_dp, 1.0_dp) .AND. &
+         in_interval(t_curr, 0.0_dp, 1.0_dp)) then
+       return
+    end if
+
+    ! NOTE: We skip the "last" edge. This is because any curve
+    !       that doesn't have an endpoint on a curve must cross
+    !       at least two, so we will already covered such curves
+    !       in one of the branches above.
+
+    enum_ = 2  ! Disjoint
+
+  end subroutine bbox_line_intersect
+
+  subroutine subdivide_nodes( &
+       nodes, degree, dimension_, left_nodes, right_nodes)
+
+    ! NOTE: This is a helper for ``curve_intersections``,
+    !       ``locate_point_curve`` and ``flatten_curve`` that uses de
+    !       Casteljau's algorithm to split a curve at s = 1/2.
+
+    real(dp), intent(in) :: nodes(degree + 1, dimension_)
+    integer, intent(in) :: degree
+    integer, intent(in) :: dimension_
+    real(dp), intent(out) :: left_nodes(degree + 1, dimension_)
+    real(dp), intent(out) :: right_nodes(degree + 1, dimension_)
+    ! Variables outside of signature.
+    real(dp) :: workspace(degree + 1, dimension_)
+    integer :: index_
+
+    workspace = nodes
+    left_nodes(1, :) = workspace(1, :)
+    right_nodes(degree + 1, :) = workspace(degree + 1, :)
+    do index_ = 1, degree
+       workspace(:degree + 1 - index_, :) = 0.5_dp * ( &
+            workspace(:degree + 1 - index_, :) + &
+            workspace(2:degree + 2 - index_, :))
+       left_nodes(index_ + 1, :) = workspace(1, :)
+       right_nodes(degree + 1 - index_, :) = workspace(degree + 1 - index_, :)
+    end do
+
+  end subroutine subdivide_nodes
+
+  subroutine add_intersection( &
+       s, t, max_intersections, intersections, num_intersections, success)
+
+    ! NOTE: This is a helper for ``curve_intersections``. Intersections
+    !       that are within a single ULP of an existing intersection
+    !       are treated as duplicates and are not added.
+
+    real(dp), intent(in) :: s, t
+    integer, intent(in) :: max_intersections
+    real(dp), intent(inout) :: intersections(max_intersections, 2)
+    integer, intent(inout) :: num_intersections
+    logical(1), intent(out) :: success
+    ! Variables outside of signature.
+    integer :: index_
+
+    success = .TRUE.
+    do index_ = 1, num_intersections
+       if ( &
+            ulps_away(intersections(index_, 1), s, 1) .AND. &
+            ulps_away(intersections(index_, 2), t, 1)) then
+          return
+       end if
+    end do
+
+    if (num_intersections == max_intersections) then
+       success = .FALSE.
+       return
+    end if
+
+    num_intersections = num_intersections + 1
+    intersections(num_intersections, 1) = s
+    intersections(num_intersections, 2) = t
+
+  end subroutine add_intersection
+
+  subroutine tangent_bbox_intersection( &
+       nodes1, degree1, start1, end1, nodes2, degree2, start2, end2, &
+       max_intersections, intersections, num_intersections, num_missed)
+
+    ! NOTE: This is a helper for ``curve_intersections``. If the bounding
+    !       boxes are tangent, intersection can only occur at the
+    !       endpoints, so we check the four pairs of endpoints.
+    ! NOTE: Intersections that don't fit in ``intersections`` are counted
+    !       in ``num_missed``.
+
+    real(dp), intent(in) :: nodes1(degree1 + 1, 2)
+    integer, intent(in) :: degree1
+    real(dp), intent(in) :: start1, end1
+    real(dp), intent(in) :: nodes2(degree2 + 1, 2)
+    integer, intent(in) :: degree2
+    real(dp), intent(in) :: start2, end2
+    integer, intent(in) :: max_intersections
+    real(dp), intent(inout) :: intersections(max_intersections, 2)
+    integer, intent(inout) :: num_intersections
+    integer, intent(inout) :: num_missed
+    ! Variables outside of signature.
+    integer :: i, j
+    integer :: endpoints1(2), endpoints2(2)
+    real(dp) :: params1(2), params2(2)
+    logical(1) :: success
+
+    endpoints1 = [1, degree1 + 1]
+    endpoints2 = [1, degree2 + 1]
+    params1 = [start1, end1]
+    params2 = [start2, end2]
+    do i = 1, 2
+       do j = 1, 2
+          if (vector_close( &
+               2, nodes1(endpoints1(i):endpoints1(i), :), &
+               nodes2(endpoints2(j):endpoints2(j), :), 0.5_dp**40)) then
+             call add_intersection( &
+                  params1(i), params2(j), max_intersections, &
+                  intersections, num_intersections, success)
+             if (.NOT. success) then
+                num_missed = num_missed + 1
+             end if
+          end if
+       end do
+    end do
+
+  end subroutine tangent_bbox_intersection
+
+  subroutine subdivide_candidate( &
+       nodes, degree, params, children, child_params, num_children)
+
+    real(dp), intent(in) :: nodes(degree + 1, 2)
+    integer, intent(in) :: degree
+    real(dp), intent(in) :: params(3)
+    real(dp), intent(out) :: children(degree + 1, 2, 2)
+    real(dp), intent(out) :: child_params(3, 2)
+    integer, intent(out) :: num_children
+    ! Variables outside of signature.
+    real(dp) :: midpoint
+
+    ! A linearized curve is not subdivided.
+    if (params(3) < LINEARIZATION_THRESHOLD) then
+       num_children = 1
+       children(:, :, 1) = nodes
+       child_params(:, 1) = params
+       return
+    end if
+
+    num_children = 2
+    call subdivide_nodes( &
+         nodes, degree, 2, children(:, :, 1), children(:, :, 2))
+    midpoint = 0.5_dp * (params(1) + params(2))
+    child_params(:2, 1) = [params(1), midpoint]
+    child_params(:2, 2) = [midpoint, params(2)]
+    call linearization_error( &
+         children(:, :, 1), degree, 2, child_params(3, 1))
+    call linearization_error( &
+         children(:, :, 2), degree, 2, child_params(3, 2))
+
+  end subroutine subdivide_candidate
+
+  subroutine curve_intersections( &
+       nodes1, degree1, nodes2, degree2, max_intersections, &
+       intersections, num_intersections, py_exc)
+
+    ! NOTE: This runs the full geometric intersection process (see
+    !       ``_all_intersections_geometric`` in ``_intersection_helpers.py``)
+    !       for a single pair of curves. Since at most ``MAX_CANDIDATES``
+    !       pairs can be accepted in each round, the candidates can be
+    !       stored in fixed size arrays.
+    ! NOTE: Intersections beyond ``max_intersections`` are counted (in
+    !       ``num_intersections``) but not stored, so the caller can retry
+    !       with a larger buffer. Since duplicates can't be detected among
+    !       the intersections that aren't stored, the count is an upper
+    !       bound.
+
+    !f2py integer intent(hide), depend(nodes1) :: degree1 = size(nodes1, 1) - 1
+    !f2py integer intent(hide), depend(nodes2) :: degree2 = size(nodes2, 1) - 1
+    real(dp), intent(in) :: nodes1(degree1 + 1, 2)
+    integer :: degree1
+    real(dp), intent(in) :: nodes2(degree2 + 1, 2)
+    integer :: degree2
+    integer, intent(in) :: max_intersections
+    real(dp), intent(out) :: intersections(max_intersections, 2)
+    integer, intent(out) :: num_intersections
+    integer, intent(out) :: py_exc
+    ! Variables outside of signature.
+    real(dp) :: first_nodes(degree1 + 1, 2, 4 * MAX_CANDIDATES)
+    real(dp) :: first_params(3, 4 * MAX_CANDIDATES)
+    real(dp) :: second_nodes(degree2 + 1, 2, 4 * MAX_CANDIDATES)
+    real(dp) :: second_params(3, 4 * MAX_CANDIDATES)
+    real(dp) :: next_first_nodes(degree1 + 1, 2, 4 * MAX_CANDIDATES)
+    real(dp) :: next_first_params(3, 4 * MAX_CANDIDATES)
+    real(dp) :: next_second_nodes(degree2 + 1, 2, 4 * MAX_CANDIDATES)
+    real(dp) :: next_second_params(3, 4 * MAX_CANDIDATES)
+    real(dp) :: children1(degree1 + 1, 2, 2)
+    real(dp) :: child_params1(3, 2)
+    real(dp) :: children2(degree2 + 1, 2, 2)
+    real(dp) :: child_params2(3, 2)
+    integer :: accepted(MAX_CANDIDATES)
+    integer :: num_candidates, num_accepted, num_children1, num_children2
+    integer :: round_, index_, i, j, k, enum_
+    logical(1) :: linearized1, linearized2, does_intersect, success
+    integer :: num_missed
+    real(dp) :: refined_s, refined_t
+
+    ! NOTE: The "params" for each candidate are the start and end
+    !       parameters (along the root curve) and the linearization error.
+    py_exc = 0
+    num_intersections = 0
+    num_missed = 0
+    num_candidates = 1
+    first_nodes(:, :, 1) = nodes1
+    first_params(:2, 1) = [0.0_dp, 1.0_dp]
+    call linearization_error(nodes1, degree1, 2, first_params(3, 1))
+    second_nodes(:, :, 1) = nodes2
+    second_params(:2, 1) = [0.0_dp, 1.0_dp]
+    call linearization_error(nodes2, degree2, 2, second_params(3, 1))
+
+    do round_ = 1, MAX_INTERSECT_SUBDIVISIONS
+       num_accepted = 0
+       do index_ = 1, num_candidates
+          linearized1 = first_params(3, index_) < LINEARIZATION_THRESHOLD
+          linearized2 = second_params(3, index_) < LINEARIZATION_THRESHOLD
+          if (linearized1 .AND. linearized2) then
+             ! If both ``first`` and ``second`` are linearizations, then
+             ! we can intersect them immediately.
+             call from_linearized( &
+                  first_params(3, index_), first_params(1, index_), &
+                  first_params(2, index_), first_nodes(1:1, :, index_), &
+                  first_nodes(degree1 + 1:degree1 + 1, :, index_), &
+                  nodes1, degree1, &
+                  second_params(3, index_), second_params(1, index_), &
+                  second_params(2, index_), second_nodes(1:1, :, index_), &
+                  second_nodes(degree2 + 1:degree2 + 1, :, index_), &
+                  nodes2, degree2, &
+                  refined_s, refined_t, does_intersect, py_exc)
+             if (py_exc /= 0) then
+                return
+             end if
+             if (does_intersect) then
+                call add_intersection( &
+                     refined_s, refined_t, max_intersections, &
+                     intersections, num_intersections, success)
+                if (.NOT. success) then
+                   num_missed = num_missed + 1
+                end if
+             end if
+             cycle
+          else if (linearized1) then
+             call bbox_line_intersect( &
+                  degree2 + 1, second_nodes(:, :, index_), &
+                  first_nodes(1:1, :, index_), &
+                  first_nodes(degree1 + 1:degree1 + 1, :, index_), enum_)
+          else if (linearized2) then
+             call bbox_line_intersect( &
+                  degree1 + 1, first_nodes(:, :, index_), &
+                  second_nodes(1:1, :, index_), &
+                  second_nodes(degree2 + 1:degree2 + 1, :, index_), enum_)
+          else
+             call bbox_intersect( &
+                  degree1 + 1, first_nodes(:, :, index_), &
+                  degree2 + 1, second_nodes(:, :, index_), enum_)
+          end if
+
+          if (enum_ == 2) then  ! Disjoint
+             cycle
+          else if (enum_ == 1) then  ! Tangent
+             call tangent_bbox_intersection( &
+                  first_nodes(:, :, index_), degree1, &
+                  first_params(1, index_), first_params(2, index_), &
+                  second_nodes(:, :, index_), degree2, &
+                  second_params(1, index_), second_params(2, index_), &
+                  max_intersections, intersections, num_intersections, &
+                  num_missed)
+             cycle
+          end if
+
+          num_accepted = num_accepted + 1
+          if (num_accepted <= MAX_CANDIDATES) then
+             accepted(num_accepted) = index_
+          end if
+       end do
+
+       if (num_accepted > MAX_CANDIDATES) then
+          ! py_exc==3 indicates too many candidates. We (ab)use
+          ! ``num_intersections`` to report the number accepted.
+          py_exc = 3
+          num_intersections = num_accepted
+          return
+       end if
+
+       ! If none of the pairs have been accepted, then there is
+       ! no intersection.
+       if (num_accepted == 0) then
+          num_intersections = num_intersections + num_missed
+          return
+       end if
+
+       ! If we **do** require more subdivisions, we need to update
+       ! the list of candidates.
+       num_candidates = 0
+       do i = 1, num_accepted
+          index_ = accepted(i)
+          call subdivide_candidate( &
+               first_nodes(:, :, index_), degree1, first_params(:, index_), &
+               children1, child_params1, num_children1)
+          call subdivide_candidate( &
+               second_nodes(:, :, index_), degree2, &
+               second_params(:, index_), &
+               children2, child_params2, num_children2)
+          do j = 1, num_children1
+             do k = 1, num_children2
+                num_candidates = num_candidates + 1
+                next_first_nodes(:, :, num_candidates) = children1(:, :, j)
+                next_first_params(:, num_candidates) = child_params1(:, j)
+                next_second_nodes(:, :, num_candidates) = &
+                     children2(:, :, k)
+                next_second_params(:, num_candidates) = &
+                     child_params2(:, k)
+             end do
+          end do
+       end do
+
+       first_nodes(:, :, :num_candidates) = &
+            next_first_nodes(:, :, :num_candidates)
+       first_params(:, :num_candidates) = next_first_params(:, :num_candidates)
+       second_nodes(:, :, :num_candidates) = &
+            next_second_nodes(:, :, :num_candidates)
+       second_params(:, :num_candidates) = &
+            next_second_params(:, :num_candidates)
+    end do
+
+    ! py_exc==5 indicates the subdivision did not converge.
+    py_exc = 5
+
+  end subroutine curve_intersections
+
+  subroutine surface_subdivision_matrix( &
+       num_nodes, degree, weights_a, weights_b, weights_c, matrix)
+
+    ! NOTE: This is a helper for ``locate_point_surface``. It computes the
+    !       matrix that maps the nodes of a surface onto the nodes of the
+    !       sub-surface with corners at the barycentric ``weights_a``,
+    !       ``weights_b`` and ``weights_c``. Row ``index_`` <--> (i, j, k)
+    !       is the blossom of the identity evaluated at ``weights_a`` (i
+    !       times), ``weights_b`` (j times) and ``weights_c`` (k times).
+
+    integer, intent(in) :: num_nodes
+    integer, intent(in) :: degree
+    real(dp), intent(in) :: weights_a(3)
+    real(dp), intent(in) :: weights_b(3)
+    real(dp), intent(in) :: weights_c(3)
+    real(dp), intent(out) :: matrix(num_nodes, num_nodes)
+    ! Variables outside of signature.
+    real(dp), allocatable :: workspace(:, :)
+    real(dp), allocatable :: new_workspace(:, :)
+    real(dp) :: weights(3)
+    integer :: index_, i, j, k, step
+
+    index_ = 1
+    do k = 0, degree
+       do j = 0, degree - k
+          i = degree - j - k
+          allocate(workspace(num_nodes, num_nodes))
+          workspace = 0.0_dp
+          forall (step = 1:num_nodes)  ! Borrow step for this loop.
+             workspace(step, step) = 1.0_dp
+          end forall
+
+          do step = 1, degree
+             if (step <= i) then
+                weights = weights_a
+             else if (step <= i + j) then
+                weights = weights_b
+             else
+                weights = weights_c
+             end if
+             ! NOTE: Each round reduces the degree by one, so the current
+             !       degree is ``degree - step + 1``.
+             allocate(new_workspace( &
+                  size(workspace, 1) - degree + step - 2, num_nodes))
+             call de_casteljau_one_round( &
+                  size(workspace, 1), num_nodes, workspace, &
+                  degree - step + 1, weights(1), weights(2), weights(3), &
+                  new_workspace)
+             call move_alloc(new_workspace, workspace)
+          end do
+
+          matrix(index_, :) = workspace(1, :)
+          deallocate(workspace)
+          index_ = index_ + 1
+       end do
+    end do
+
+  end subroutine surface_subdivision_matrix
+
+  subroutine newton_refine_surface( &
+       num_nodes, nodes, degree, x_val, y_val, s, t, updated_s, updated_t)
+
+    ! NOTE: This is the same as ``newton_refine`` in ``_surface_helpers.py``.
+    ! NOTE: This assumes the nodes are two-dimensional.
+
+    integer, intent(in) :: num_nodes
+    real(dp), intent(in) :: nodes(num_nodes, 2)
+    integer, intent(in) :: degree
+    real(dp), intent(in) :: x_val, y_val
+    real(dp), intent(in) :: s, t
+    real(dp), intent(out) :: updated_s, updated_t
+    ! Variables outside of signature.
+    real(dp) :: point(1, 2)
+    real(dp) :: jac_nodes(num_nodes - degree - 1, 4)
+    real(dp) :: jac_both(1, 4)
+    real(dp) :: e_val, f_val, denom
+
+    call evaluate_barycentric( &
+         num_nodes, 2, nodes, degree, 1.0_dp - s - t, s, t, point)
+    if (point(1, 1) == x_val .AND. point(1, 2) == y_val) then
+       ! No refinement is needed.
+       updated_s = s
+       updated_t = t
+       return
+    end if
+
+    call jacobian_both(num_nodes, 2, nodes, degree, jac_nodes)
+    ! The degree of the jacobian is one less.
+    call evaluate_barycentric( &
+         num_nodes - degree - 1, 4, jac_nodes, degree - 1, &
+         1.0_dp - s - t, s, t, jac_both)
+
+    ! The first column of the jacobian matrix is B_s (i.e. the
+    ! left-most values in ``jac_both``).
+    e_val = x_val - point(1, 1)
+    f_val = y_val - point(1, 2)
+    denom = jac_both(1, 1) * jac_both(1, 4) - jac_both(1, 2) * jac_both(1, 3)
+    updated_s = s + ( &
+         jac_both(1, 4) * e_val - jac_both(1, 3) * f_val) / denom
+    updated_t = t + ( &
+         jac_both(1, 1) * f_val - jac_both(1, 2) * e_val) / denom
+
+  end subroutine newton_refine_surface
+
+  subroutine locate_point_surface( &
+       num_nodes, nodes, degree, base_x, base_y, width, &
+       x_val, y_val, s_val, t_val)
+
+    ! NOTE: This solves the inverse problem B(s, t) = (x, y) (if it can be
+    !       solved). Does so by subdividing the surface until the
+    !       sub-surfaces are sufficiently small, then using Newton's method
+    !       to narrow in on the pre-image of the point.
+    ! NOTE: This returns ``LOCATE_MISS`` (i.e. -1) as a signal for "point
+    !       is not on the surface".
+    ! NOTE: This assumes the nodes are two-dimensional.
+    ! NOTE: ``base_x``, ``base_y`` and ``width`` describe the reference
+    !       triangle that the surface represents (as in ``_locate_point``
+    !       in ``_surface_helpers.py``, the initial guess for Newton's
+    !       method is the mean centroid in these coordinates).
+
+    !f2py integer intent(hide), depend(nodes) :: num_nodes = size(nodes, 1)
+    integer :: num_nodes
+    real(dp), intent(in) :: nodes(num_nodes, 2)
+    integer :: degree
+    real(dp), intent(in) :: base_x, base_y, width
+    real(dp), intent(in) :: x_val, y_val
+    real(dp), intent(out) :: s_val, t_val
+    ! Variables outside of signature.
+    real(dp) :: matrices(num_nodes, num_nodes, 4)
+    real(dp), allocatable :: candidates(:, :, :)
+    real(dp), allocatable :: next_candidates(:, :, :)
+    ! NOTE: The "params" for each candidate are the base ``x``, base ``y``
+    !       and width of the reference triangle that the candidate covers.
+    real(dp), allocatable :: params(:, :)
+    real(dp), allocatable :: next_params(:, :)
+    logical(1), allocatable :: is_contained(:)
+    integer :: num_candidates, num_contained, sub_index, index_, child
+    real(dp) :: left, right, bottom, top
+    real(dp) :: half_width, denom, actual(1, 2), expected(1, 2)
+
+    call surface_subdivision_matrix( &
+         num_nodes, degree, [1.0_dp, 0.0_dp, 0.0_dp], &
+         [0.5_dp, 0.5_dp, 0.0_dp], [0.5_dp, 0.0_dp, 0.5_dp], &
+         matrices(:, :, 1))
+    call surface_subdivision_matrix( &
+         num_nodes, degree, [0.0_dp, 0.5_dp, 0.5_dp], &
+         [0.5_dp, 0.0_dp, 0.5_dp], [0.5_dp, 0.5_dp, 0.0_dp], &
+         matrices(:, :, 2))
+    call surface_subdivision_matrix( &
+         num_nodes, degree, [0.5_dp, 0.5_dp, 0.0_dp], &
+         [0.0_dp, 1.0_dp, 0.0_dp], [0.0_dp, 0.5_dp, 0.5_dp], &
+         matrices(:, :, 3))
+    call surface_subdivision_matrix( &
+         num_nodes, degree, [0.5_dp, 0.0_dp, 0.5_dp], &
+         [0.0_dp, 0.5_dp, 0.5_dp], [0.0_dp, 0.0_dp, 1.0_dp], &
+         matrices(:, :, 4))
+
+    num_candidates = 1
+    allocate(candidates(num_nodes, 2, 1))
+    allocate(params(3, 1))
+    candidates(:, :, 1) = nodes
+    params(:, 1) = [base_x, base_y, width]
+
+    do sub_index = 0, MAX_LOCATE_SUBDIVISIONS
+       allocate(is_contained(num_candidates))
+       do index_ = 1, num_candidates
+          call bbox( &
+               num_nodes, candidates(:, :, index_), left, right, bottom, top)
+          is_contained(index_) = ( &
+               in_interval(x_val, left, right) .AND. &
+               in_interval(y_val, bottom, top))
+       end do
+       num_contained = count(is_contained)
+
+       allocate(next_candidates(num_nodes, 2, 4 * num_contained))
+       allocate(next_params(3, 4 * num_contained))
+       child = 1
+       do index_ = 1, num_candidates
+          if (.NOT. is_contained(index_)) then
+             cycle
+          end if
+
+          next_candidates(:, :, child) = matmul( &
+               matrices(:, :, 1), candidates(:, :, index_))
+          next_candidates(:, :, child + 1) = matmul( &
+               matrices(:, :, 2), candidates(:, :, index_))
+          next_candidates(:, :, child + 2) = matmul( &
+               matrices(:, :, 3), candidates(:, :, index_))
+          next_candidates(:, :, child + 3) = matmul( &
+               matrices(:, :, 4), candidates(:, :, index_))
+
+          half_width = 0.5_dp * params(3, index_)
+          next_params(:, child) = [ &
+               params(1, index_), params(2, index_), half_width]
+          next_params(:, child + 1) = [ &
+               params(1, index_) + half_width, &
+               params(2, index_) + half_width, -half_width]
+          next_params(:, child + 2) = [ &
+               params(1, index_) + half_width, params(2, index_), half_width]
+          next_params(:, child + 3) = [ &
+               params(1, index_), params(2, index_) + half_width, half_width]
+          child = child + 4
+       end do
+
+       deallocate(is_contained)
+       call move_alloc(next_candidates, candidates)
+       call move_alloc(next_params, params)
+       num_candidates = 4 * num_contained
+
+       if (num_candidates == 0) then
+          s_val = LOCATE_MISS
+          t_val = LOCATE_MISS
+          return
+       end if
+    end do
+
+    ! We take the average of all centroids from the candidates
+    ! that may contain the point.
+    denom = real(num_candidates, dp)
+    s_val = sum(params(1, :)) / denom
+    t_val = sum(params(2, :)) / denom
+    half_width = sum(params(3, :)) / (3.0_dp * denom)
+    s_val = s_val + half_width
+    t_val = t_val + half_width
+
+    call newton_refine_surface( &
+         num_nodes, nodes, degree, x_val, y_val, s_val, t_val, left, right)
+    s_val = left
+    t_val = right
+
+    call evaluate_barycentric( &
+         num_nodes, 2, nodes, degree, 1.0_dp - s_val - t_val, &
+         s_val, t_val, actual)
+    expected(1, :) = [x_val, y_val]
+    if (.NOT. vector_close(2, actual, expected, LOCATE_EPS)) then
+       call newton_refine_surface( &
+            num_nodes, nodes, degree, x_val, y_val, s_val, t_val, left, right)
+       s_val = left
+       t_val = right
+    end if
+
+  end subroutine locate_point_surface
+
+  subroutine newton_refine_curve( &
+       nodes, degree, dimension_, point, s, updated_s)
+
+    ! NOTE: This is the same as ``newton_refine`` in ``_curve_helpers.py``.
+
+    real(dp), intent(in) :: nodes(degree + 1, dimension_)
+    integer, intent(in) :: degree
+    integer, intent(in) :: dimension_
+    real(dp), intent(in) :: point(1, dimension_)
+    real(dp), intent(in) :: s
+    real(dp), intent(out) :: updated_s
+    ! Variables outside of signature.
+    real(dp) :: param(1)
+    real(dp) :: pt_delta(1, dimension_)
+    real(dp) :: derivative(1, dimension_)
+
+    param = s
+    call evaluate_multi(nodes, degree, dimension_, param, 1, pt_delta)
+    pt_delta = point - pt_delta
+    call evaluate_hodograph(s, nodes, dimension_, degree, derivative)
+
+    updated_s = s + ( &
+         dot_product(pt_delta(1, :), derivative(1, :)) / &
+         dot_product(derivative(1, :), derivative(1, :)))
+
+  end subroutine newton_refine_curve
+
+  subroutine locate_point_curve( &
+       nodes, degree, dimension_, point, start, end_, s_approx, py_exc)
+
+    ! NOTE: This solves the inverse problem B(s) = p (if it can be
+    !       solved). Does so by subdividing the curve until the sub-curves
+    !       are sufficiently small, then using Newton's method to narrow
+    !       in on the pre-image of the point.
+    ! NOTE: This returns ``LOCATE_MISS`` (i.e. -1) as a signal for "point
+    !       is not on the curve" and sets ``py_exc`` to 1 if the remaining
+    !       candidates are too spread out.
+    ! NOTE: The ``start`` and ``end_`` parameters of the curve are
+    !       subdivided along with the nodes (as in ``Curve.subdivide``),
+    !       but the Newton update is computed on ``nodes`` directly.
+
+    !f2py integer intent(hide), depend(nodes) :: degree = size(nodes, 1) - 1
+    !f2py integer intent(hide), depend(nodes) :: dimension_ = size(nodes, 2)
+    real(dp), intent(in) :: nodes(degree + 1, dimension_)
+    integer :: degree
+    integer :: dimension_
+    real(dp), intent(in) :: point(1, dimension_)
+    real(dp), intent(in) :: start, end_
+    real(dp), intent(out) :: s_approx
+    integer, intent(out) :: py_exc
+    ! Variables outside of signature.
+    real(dp), allocatable :: candidates(:, :, :)
+    real(dp), allocatable :: next_candidates(:, :, :)
+    ! NOTE: The "params" for each candidate are the start and end
+    !       parameters of the sub-curve.
+    real(dp), allocatable :: params(:, :)
+    real(dp), allocatable :: next_params(:, :)
+    logical(1), allocatable :: is_contained(:)
+    integer :: num_candidates, num_contained, sub_index, index_, child
+    real(dp) :: midpoint, std_dev
+
+    py_exc = 0
+    num_candidates = 1
+    allocate(candidates(degree + 1, dimension_, 1))
+    allocate(params(2, 1))
+    candidates(:, :, 1) = nodes
+    params(:, 1) = [start, end_]
+
+    do sub_index = 0, MAX_LOCATE_SUBDIVISIONS
+       allocate(is_contained(num_candidates))
+       do index_ = 1, num_candidates
+          ! NOTE: This is the same check as ``contains_nd``.
+          is_contained(index_) = ( &
+               all(minval(candidates(:, :, index_), 1) <= point(1, :)) .AND. &
+               all(point(1, :) <= maxval(candidates(:, :, index_), 1)))
+       end do
+       num_contained = count(is_contained)
+
+       allocate(next_candidates(degree + 1, dimension_, 2 * num_contained))
+       allocate(next_params(2, 2 * num_contained))
+       child = 1
+       do index_ = 1, num_candidates
+          if (.NOT. is_contained(index_)) then
+             cycle
+          end if
+
+          call subdivide_nodes( &
+               candidates(:, :, index_), degree, dimension_, &
+               next_candidates(:, :, child), next_candidates(:, :, child + 1))
+          midpoint = 0.5_dp * (params(1, index_) + params(2, index_))
+          next_params(:, child) = [params(1, index_), midpoint]
+          next_params(:, child + 1) = [midpoint, params(2, index_)]
+          child = child + 2
+       end do
+
+       deallocate(is_contained)
+       call move_alloc(next_candidates, candidates)
+       call move_alloc(next_params, params)
+       num_candidates = 2 * num_contained
+
+       if (num_candidates == 0) then
+          s_approx = LOCATE_MISS
+          return
+       end if
+    end do
+
+    s_approx = sum(params) / (2 * num_candidates)
+    std_dev = sqrt(sum((params - s_approx)**2) / (2 * num_candidates))
+    if (std_dev > LOCATE_STD_CAP) then
+       py_exc = 1
+       return
+    end if
+
+    call newton_refine_curve( &
+         nodes, degree, dimension_, point, s_approx, midpoint)
+    s_approx = midpoint
+
+  end subroutine locate_point_curve
+
+  subroutine flatten_curve( &
+       nodes, degree, dimension_, tolerance, max_points, points, num_points)
+
+    ! NOTE: This is the same as ``_flatten`` in ``_curve_helpers.py``. The
+    !       curve is subdivided until each sub-curve has a linearization
+    !       error below ``tolerance``, using an explicit stack (depth-first,
+    !       left half first) so the endpoints are emitted in order.
+    ! NOTE: Points beyond ``max_points`` are counted (in ``num_points``)
+    !       but not stored, so the caller can retry with a larger buffer.
+
+    !f2py integer intent(hide), depend(nodes) :: degree = size(nodes, 1) - 1
+    !f2py integer intent(hide), depend(nodes) :: dimension_ = size(nodes, 2)
+    real(dp), intent(in) :: nodes(degree + 1, dimension_)
+    integer :: degree
+    integer :: dimension_
+    real(dp), intent(in) :: tolerance
+    integer, intent(in) :: max_points
+    real(dp), intent(out) :: points(max_points, dimension_)
+    integer, intent(out) :: num_points
+    ! Variables outside of signature.
+    real(dp) :: stack(degree + 1, dimension_, MAX_FLATTEN_SUBDIVISIONS + 1)
+    integer :: depths(MAX_FLATTEN_SUBDIVISIONS + 1)
+    real(dp) :: current(degree + 1, dimension_)
+    integer :: top
+    real(dp) :: error
+
+    num_points = 1
+    points(1, :) = nodes(1, :)
+    top = 1
+    stack(:, :, 1) = nodes
+    depths(1) = 0
+    do while (top > 0)
+       call linearization_error(stack(:, :, top), degree, dimension_, error)
+       if (error <= tolerance .OR. &
+            depths(top) == MAX_FLATTEN_SUBDIVISIONS) then
+          num_points = num_points + 1
+          if (num_points <= max_points) then
+             points(num_points, :) = stack(degree + 1, :, top)
+          end if
+          top = top - 1
+       else
+          ! NOTE: The right half replaces the current sub-curve and the
+          !       left half is pushed on top of it (to be visited first).
+          current = stack(:, :, top)
+          call subdivide_nodes( &
+               current, degree, dimension_, &
+               stack(:, :, top + 1), stack(:, :, top))
+          depths(top) = depths(top) + 1
+          depths(top + 1) = depths(top)
+          top = top + 1
+       end if
+    end do
+
+  end subroutine flatten_curve
+
 end module speedup
@@ -0,0 +1,242 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in counters and timings for intersection and point location.
+
+Collection is disabled by default. Within a :func:`collect` block, each
+call to curve-curve intersection (``intersect``) and to point location
+(``curve.locate`` and ``surface.locate``) is timed and the following
+counters are recorded:
+
+* ``intersect.rounds``: The number of subdivision rounds.
+* ``intersect.candidates``: The number of candidate pairs checked.
+* ``intersect.accepted``: The number of candidate pairs with
+  intersecting bounding boxes.
+* ``intersect.max_accepted``: The largest number of pairs accepted in
+  a single round (intersection fails once this exceeds ``16``).
+* ``intersect.newton_steps``: The number of Newton steps used to
+  refine intersections of linearized segments.
+* ``locate.candidates``: The number of sub-curves / sub-surfaces that
+  remain after subdivision.
+* ``locate.newton_steps``: The number of Newton steps used to refine
+  the located parameters.
+
+Counters for work done in the compiled speedups (e.g. curve-curve
+intersection with the geometric strategy) are not recorded, but the
+calls are still timed.
+
+.. doctest:: stats-collect
+
+   >>> curve1 = bezier.Curve(np.asfortranarray([
+   ...     [0.0, 0.0],
+   ...     [0.5, 1.0],
+   ...     [1.0, 0.0],
+   ... ]), degree=2)
+   >>> curve2 = bezier.Curve(np.asfortranarray([
+   ...     [0.0, 0.25],
+   ...     [1.0, 0.25],
+   ... ]), degree=1)
+   >>> with bezier.stats.collect() as stats:
+   ...     intersections = curve1.intersect(curve2)
+   >>> stats.calls
+   [<Record (name='intersect')>]
+   >>> sorted(stats.timings)
+   ['intersect']
+
+When collection is disabled, each instrumented function only checks if
+there is an active :class:`Stats` object. Collection is process-wide,
+i.e. it is not specific to a thread.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: stats-collect
+
+   import numpy as np
+   import bezier
+"""
+
+
+import contextlib
+import functools
+import timeit
+
+
+_REPR_TEMPLATE = '<Record (name={!r})>'
+_ACTIVE = None
+
+
+class Record(object):  # pylint: disable=too-few-public-methods
+    """Counters and timing for a single instrumented call.
+
+    Args:
+        name (str): The name of the instrumented call.
+    """
+
+    __slots__ = ('name', 'seconds', 'counters')
+
+    def __init__(self, name):
+        self.name = name
+        """str: The name of the instrumented call."""
+        self.seconds = None
+        """float: The time spent in the call (in seconds)."""
+        self.counters = {}
+        """dict: The counters incremented during the call."""
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return _REPR_TEMPLATE.format(self.name)
+
+
+class Stats(object):
+    """Counters and timings collected by :func:`collect`.
+
+    Args:
+        callback (Optional[Callable[[Record], None]]): A function to be
+            called with the :class:`Record` of each instrumented call.
+            If provided, the records are passed to ``callback`` rather
+            than stored in :attr:`calls`.
+    """
+
+    __slots__ = ('counters', 'timings', 'calls', '_callback', '_stack')
+
+    def __init__(self, callback=None):
+        self.counters = {}
+        """dict: The total of each counter (over all calls)."""
+        self.timings = {}
+        """dict: The total time (in seconds) spent in each type of call."""
+        self.calls = []
+        """list: The :class:`Record` of each instrumented call."""
+        self._callback = callback
+        self._stack = []
+
+    def increment(self, name, value=1):
+        """Increment a counter.
+
+        The counter is incremented both in the totals and in the record
+        of every instrumented call in progress.
+
+        Args:
+            name (str): The name of the counter.
+            value (Optional[int]): The amount to increment by.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+        for record in self._stack:
+            record.counters[name] = record.counters.get(name, 0) + value
+
+    def maximum(self, name, value):
+        """Update a counter that tracks a maximum value.
+
+        Args:
+            name (str): The name of the counter.
+            value (int): The value to (potentially) replace the counter.
+        """
+        self.counters[name] = max(self.counters.get(name, value), value)
+        for record in self._stack:
+            record.counters[name] = max(
+                record.counters.get(name, value), value)
+
+    @contextlib.contextmanager
+    def record(self, name):
+        """Record the counters and timing for an instrumented call.
+
+        Args:
+            name (str): The name of the instrumented call.
+
+        Yields:
+            Record: The record for the call.
+        """
+        record = Record(name)
+        self._stack.append(record)
+        start = timeit.default_timer()
+        try:
+            yield record
+        finally:
+            record.seconds = timeit.default_timer() - start
+            self._stack.pop()
+            self.timings[name] = (
+                self.timings.get(name, 0.0) + record.seconds)
+            if self._callback is None:
+                self.calls.append(record)
+            else:
+                self._callback(record)
+
+
+def active():
+    """Get the statistics currently being collected.
+
+    Returns:
+        Optional[Stats]: The active statistics or :data:`None` if
+        collection is disabled.
+    """
+    return _ACTIVE
+
+
+@contextlib.contextmanager
+def collect(callback=None):
+    """Collect statistics within a block.
+
+    Blocks can be nested; the statistics from the outer block are
+    restored when an inner block exits.
+
+    Args:
+        callback (Optional[Callable[[Record], None]]): A function to be
+            called with the :class:`Record` of each instrumented call.
+
+    Yields:
+        Stats: The statistics collected within the block.
+    """
+    global _ACTIVE  # pylint: disable=global-statement
+    previous = _ACTIVE
+    stats = Stats(callback=callback)
+    _ACTIVE = stats
+    try:
+        yield stats
+    finally:
+        _ACTIVE = previous
+
+
+def timed(name):
+    """Create a decorator that times a function if collection is enabled.
+
+    Args:
+        name (str): The name used for each call to the function.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+    """
+    def decorator(func):
+        """Time calls to a function.
+
+        Args:
+            func (Callable): The function to time.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            """Call the function and record the timing (if enabled)."""
+            stats = _ACTIVE
+            if stats is None:
+                return func(*args, **kwargs)
+
+            with stats.record(name):
+                return func(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
@@ -0,0 +1,612 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Binary container format for collections of shapes.
+
+Rather than pickling each shape, the nodes of every curve and surface are
+stored contiguously, grouped by kind, degree and dimension, so that a
+(potentially very large) collection of shapes can be memory-mapped and
+individual shapes can be materialized on demand.
+
+The file layout is
+
+* An 8 byte magic string
+* The length of the header, as an 8 byte little-endian unsigned integer
+* A JSON header (padded with spaces) describing the location of each
+  block of data
+* The data blocks, each aligned to 64 bytes
+
+Each group of shapes with the same kind, degree and dimension has a
+block of nodes (``count x dimension x num_nodes``, so that the nodes of
+each shape can be transposed into a Fortran-ordered ``num_nodes x
+dimension`` array) and a block of parameters (``start`` and ``end`` for
+curves, ``base_x``, ``base_y`` and ``width`` for surfaces).
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import os
+   import shutil
+   import tempfile
+
+   import numpy as np
+   import bezier
+
+   temp_dir = tempfile.mkdtemp()
+
+.. testcleanup:: *
+
+   shutil.rmtree(temp_dir)
+"""
+
+
+import json
+
+import numpy as np
+import six
+
+from bezier import curve as curve_mod
+from bezier import curved_polygon as curved_polygon_mod
+from bezier import surface as surface_mod
+
+
+_MAGIC = b'\x93BEZIER\x01'
+_HEADER_SIZE_BYTES = 8
+_ALIGNMENT = 64
+_FORMAT_VERSION = 1
+_FLOAT_DTYPE = np.dtype('<f8')
+_INT_DTYPE = np.dtype('<i8')
+_CURVE = 'curve'
+_SURFACE = 'surface'
+# NOTE: Curved polygons are not stored in a group. Their records use
+#       this group index (and the index of the curved polygon).
+_POLYGON_GROUP = -1
+_REPR_TEMPLATE = '<{} (num_shapes={:d}, num_groups={:d})>'
+
+
+def _align(offset):
+    """Round an offset up to the next multiple of the alignment.
+
+    Args:
+        offset (int): A byte offset.
+
+    Returns:
+        int: The aligned offset.
+    """
+    remainder = offset % _ALIGNMENT
+    if remainder == 0:
+        return offset
+    return offset + _ALIGNMENT - remainder
+
+
+class _GroupBuilder(object):  # pylint: disable=too-few-public-methods
+    """Accumulates the shapes in a group as they are added.
+
+    Args:
+        kind (str): The kind of shape (curve or surface).
+        degree (int): The degree of the shapes in the group.
+        dimension (int): The dimension of the shapes in the group.
+    """
+
+    __slots__ = ('kind', 'degree', 'dimension', 'nodes', 'params')
+
+    def __init__(self, kind, degree, dimension):
+        self.kind = kind
+        self.degree = degree
+        self.dimension = dimension
+        self.nodes = []
+        self.params = []
+
+    def add(self, nodes, params):
+        """Add a shape to the group.
+
+        Args:
+            nodes (numpy.ndarray): The nodes of the shape.
+            params (Tuple[float, ...]): The parameters of the shape.
+
+        Returns:
+            int: The row of the shape within the group.
+        """
+        self.nodes.append(nodes.T)
+        self.params.append(params)
+        return len(self.nodes) - 1
+
+
+class _Writer(object):  # pylint: disable=too-few-public-methods
+    """Lays out the shapes to be saved into groups and blocks.
+
+    Args:
+        shapes (Iterable[Union[~bezier.curve.Curve, \
+            ~bezier.surface.Surface, \
+            ~bezier.curved_polygon.CurvedPolygon]]): The shapes to save.
+
+    Raises:
+        TypeError: If any of the shapes is not a curve, surface or curved
+            polygon.
+    """
+
+    def __init__(self, shapes):
+        self._groups = []
+        self._group_ids = {}
+        self._records = []
+        self._polygon_offsets = [0]
+        self._polygon_edges = []
+        for shape in shapes:
+            self._records.append(self._add_shape(shape))
+
+    def _add_node_shape(self, kind, shape, params):
+        """Add a curve or surface to the group it belongs in.
+
+        Args:
+            kind (str): The kind of shape (curve or surface).
+            shape (Union[~bezier.curve.Curve, ~bezier.surface.Surface]): The
+                shape being added.
+            params (Tuple[float, ...]): The parameters of the shape.
+
+        Returns:
+            Tuple[int, int]: The group index and row of the shape.
+        """
+        # pylint: disable=protected-access
+        key = (kind, shape._degree, shape._dimension)
+        group_id = self._group_ids.get(key)
+        if group_id is None:
+            group_id = len(self._groups)
+            self._group_ids[key] = group_id
+            self._groups.append(_GroupBuilder(*key))
+
+        row = self._groups[group_id].add(shape._nodes, params)
+        # pylint: enable=protected-access
+        return group_id, row
+
+    def _add_shape(self, shape):
+        """Add a shape.
+
+        Args:
+            shape (Union[~bezier.curve.Curve, ~bezier.surface.Surface, \
+                ~bezier.curved_polygon.CurvedPolygon]): The shape being
+                added.
+
+        Returns:
+            Tuple[int, int]: The record of the shape, i.e. the group index
+            and row (or the polygon group and the index of the curved
+            polygon).
+
+        Raises:
+            TypeError: If the shape is not a curve, surface or curved
+                polygon.
+        """
+        # pylint: disable=protected-access
+        if isinstance(shape, curve_mod.Curve):
+            return self._add_node_shape(
+                _CURVE, shape, (shape._start, shape._end))
+        elif isinstance(shape, surface_mod.Surface):
+            return self._add_node_shape(
+                _SURFACE, shape,
+                (shape._base_x, shape._base_y, shape._width))
+        elif isinstance(shape, curved_polygon_mod.CurvedPolygon):
+            for edge in shape._edges:
+                self._polygon_edges.append(self._add_node_shape(
+                    _CURVE, edge, (edge._start, edge._end)))
+            # pylint: enable=protected-access
+            self._polygon_offsets.append(len(self._polygon_edges))
+            return _POLYGON_GROUP, len(self._polygon_offsets) - 2
+        else:
+            raise TypeError(
+                'Can only save curves, surfaces and curved polygons',
+                'Received', shape)
+
+    def _blocks(self):
+        """Get the data blocks to be written.
+
+        Returns:
+            Tuple[dict, List[Tuple[int, numpy.ndarray]]]: Pair of the
+            (JSON) header and the blocks to be written (in order). Each
+            block is an array along with its offset relative to the start
+            of the data.
+        """
+        blocks = []
+        offset = [0]
+
+        def add_block(array):
+            """Add a block and get its offset.
+
+            Args:
+                array (numpy.ndarray): The block to add.
+
+            Returns:
+                int: The offset of the block.
+            """
+            block_offset = _align(offset[0])
+            offset[0] = block_offset + array.nbytes
+            blocks.append((block_offset, array))
+            return block_offset
+
+        groups = []
+        for group in self._groups:
+            nodes = np.asarray(group.nodes, dtype=_FLOAT_DTYPE)
+            params = np.asarray(group.params, dtype=_FLOAT_DTYPE)
+            groups.append({
+                'kind': group.kind,
+                'degree': group.degree,
+                'dimension': group.dimension,
+                'count': nodes.shape[0],
+                'num_nodes': nodes.shape[2],
+                'nodes_offset': add_block(nodes),
+                'params_offset': add_block(params),
+            })
+
+        records = np.asarray(self._records, dtype=_INT_DTYPE).reshape(
+            (len(self._records), 2))
+        polygon_offsets = np.asarray(self._polygon_offsets, dtype=_INT_DTYPE)
+        polygon_edges = np.asarray(
+            self._polygon_edges, dtype=_INT_DTYPE).reshape(
+                (len(self._polygon_edges), 2))
+        header = {
+            'version': _FORMAT_VERSION,
+            'groups': groups,
+            'num_shapes': records.shape[0],
+            'records_offset': add_block(records),
+            'num_polygons': polygon_offsets.size - 1,
+            'polygon_offsets_offset': add_block(polygon_offsets),
+            'num_polygon_edges': polygon_edges.shape[0],
+            'polygon_edges_offset': add_block(polygon_edges),
+        }
+        return header, blocks
+
+    def write(self, file_obj):
+        """Write the shapes to a (binary) file object.
+
+        Args:
+            file_obj (file): The file object to write to.
+        """
+        header, blocks = self._blocks()
+        header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+        data_start = _align(
+            len(_MAGIC) + _HEADER_SIZE_BYTES + len(header_bytes))
+        header_bytes = header_bytes.ljust(
+            data_start - len(_MAGIC) - _HEADER_SIZE_BYTES, b' ')
+
+        file_obj.write(_MAGIC)
+        file_obj.write(
+            np.asarray(len(header_bytes), dtype='<u8').tobytes())
+        file_obj.write(header_bytes)
+        position = 0
+        for block_offset, array in blocks:
+            file_obj.write(b'\x00' * (block_offset - position))
+            file_obj.write(np.ascontiguousarray(array).tobytes())
+            position = block_offset + array.nbytes
+
+
+def save_shapes(filename, shapes):
+    """Save a collection of shapes in a single binary file.
+
+    The shapes can be loaded (lazily) via :class:`ShapeLibrary`.
+
+    .. note::
+
+       Curves are saved with their ``start`` and ``end`` but not their
+       ``root``, i.e. each loaded curve is its own root.
+
+    .. doctest:: save-shapes
+
+       >>> curve = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 2.0],
+       ...     [2.0, 0.0],
+       ... ]), degree=2)
+       >>> surface = bezier.Surface(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 0.0],
+       ...     [0.0, 1.0],
+       ... ]), degree=1)
+       >>> filename = os.path.join(temp_dir, 'shapes.bin')
+       >>> bezier.save_shapes(filename, [curve, surface, curve])
+
+    Args:
+        filename (str): The file to write to.
+        shapes (Iterable[Union[~bezier.curve.Curve, \
+            ~bezier.surface.Surface, \
+            ~bezier.curved_polygon.CurvedPolygon]]): The shapes to save.
+
+    Raises:
+        TypeError: If any of the shapes is not a curve, surface or curved
+            polygon.
+    """
+    writer = _Writer(shapes)
+    with open(filename, 'wb') as file_obj:
+        writer.write(file_obj)
+
+
+def _read_header(filename):
+    """Read the header of a file written by :func:`save_shapes`.
+
+    Args:
+        filename (str): The file to read.
+
+    Returns:
+        Tuple[dict, int]: Pair of the header and the offset of the data
+        (i.e. the size of the header, including the magic string).
+
+    Raises:
+        ValueError: If the file doesn't start with the expected magic
+            string or has an unsupported version.
+    """
+    with open(filename, 'rb') as file_obj:
+        magic = file_obj.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError('Not a shape library', filename)
+        header_size, = np.frombuffer(
+            file_obj.read(_HEADER_SIZE_BYTES), dtype='<u8')
+        header = json.loads(file_obj.read(header_size).decode('utf-8'))
+
+    if header['version'] != _FORMAT_VERSION:
+        raise ValueError(
+            'Unsupported version', header['version'],
+            'Expected', _FORMAT_VERSION)
+
+    return header, len(_MAGIC) + _HEADER_SIZE_BYTES + int(header_size)
+
+
+def _block(data, offset, dtype, shape):
+    """Get a view of a block of data.
+
+    Args:
+        data (numpy.ndarray): The (``uint8``) data.
+        offset (int): The offset of the block in ``data``.
+        dtype (numpy.dtype): The type of the values in the block.
+        shape (Tuple[int, ...]): The shape of the block.
+
+    Returns:
+        numpy.ndarray: The (read-only) view of the block.
+    """
+    num_bytes = dtype.itemsize * int(np.prod(shape))
+    # NOTE: ``np.asarray`` drops the ``np.memmap`` subclass (the view still
+    #       refers to the memory-mapped data).
+    block = np.asarray(data[offset:offset + num_bytes]).view(dtype)
+    block = block.reshape(shape)
+    block.flags.writeable = False
+    return block
+
+
+class ShapeLibrary(object):
+    """A (read-only) collection of shapes saved by :func:`save_shapes`.
+
+    The file is memory-mapped, so opening a library is cheap (regardless
+    of the number of shapes) and each shape is only read (and a new
+    :class:`.Curve`, :class:`.Surface` or :class:`.CurvedPolygon` created)
+    when it is accessed.
+
+    .. doctest:: shape-library
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> curve = bezier.Curve(np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 2.0],
+       ...     [2.0, 0.0],
+       ... ]), degree=2)
+       >>> filename = os.path.join(temp_dir, 'curves.bin')
+       >>> bezier.save_shapes(filename, [curve, curve.specialize(0.5, 1.0)])
+       >>> library = bezier.ShapeLibrary(filename)
+       >>> library
+       <ShapeLibrary (num_shapes=2, num_groups=1)>
+       >>> sub_curve = library[1]
+       >>> sub_curve
+       <Curve (degree=2, dimension=2, start=0.5, end=1)>
+       >>> sub_curve.nodes
+       array([[ 1. , 1. ],
+              [ 1.5, 1. ],
+              [ 2. , 0. ]])
+
+    By default, the nodes of each shape are copied out of the file. With
+    ``copy=False``, the shapes are (read-only) views into the
+    memory-mapped file instead, so that loading even a very large
+    collection allocates no memory for nodes:
+
+    .. doctest:: shape-library
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> library = bezier.ShapeLibrary(filename, copy=False)
+       >>> curve = library[0]
+       >>> curve.evaluate(0.25)
+       array([[ 0.5 , 0.75]])
+
+    Args:
+        filename (str): The file to read.
+        copy (Optional[bool]): Flag indicating if the nodes of each shape
+            should be copied out of the file. Defaults to :data:`True`.
+            If :data:`False`, the shapes are only valid while the file is
+            unchanged.
+
+    Raises:
+        ValueError: If the file was not written by :func:`save_shapes`.
+    """
+
+    __slots__ = (
+        '_filename', '_copy', '_groups', '_nodes', '_params', '_records',
+        '_polygon_offsets', '_polygon_edges')
+
+    def __init__(self, filename, copy=True):
+        header, data_start = _read_header(filename)
+        self._filename = filename
+        self._copy = copy
+        # NOTE: The data is never empty, since ``polygon_offsets`` always
+        #       has at least one entry.
+        data = np.memmap(
+            filename, dtype=np.uint8, mode='r', offset=data_start,
+            shape=(_data_size(header),))
+
+        self._groups = tuple(
+            (group['kind'], group['degree'], group['dimension'])
+            for group in header['groups'])
+        self._nodes = tuple(
+            _block(data, group['nodes_offset'], _FLOAT_DTYPE,
+                   (group['count'], group['dimension'], group['num_nodes']))
+            for group in header['groups'])
+        self._params = tuple(
+            _block(data, group['params_offset'], _FLOAT_DTYPE,
+                   (group['count'], _num_params(group['kind'])))
+            for group in header['groups'])
+        self._records = _block(
+            data, header['records_offset'], _INT_DTYPE,
+            (header['num_shapes'], 2))
+        self._polygon_offsets = _block(
+            data, header['polygon_offsets_offset'], _INT_DTYPE,
+            (header['num_polygons'] + 1,))
+        self._polygon_edges = _block(
+            data, header['polygon_edges_offset'], _INT_DTYPE,
+            (header['num_polygon_edges'], 2))
+
+    @property
+    def filename(self):
+        """str: The file the library was read from."""
+        return self._filename
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current library's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {name: getattr(self, name)
+                for name in self.__slots__}
+
+    def __len__(self):
+        """Get the number of shapes in the library.
+
+        Returns:
+            int: The number of shapes.
+        """
+        return self._records.shape[0]
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return _REPR_TEMPLATE.format(
+            self.__class__.__name__, len(self), len(self._groups))
+
+    def __getitem__(self, index):
+        """Materialize a shape in the library.
+
+        Args:
+            index (int): The index of the shape (in the order the shapes
+                were saved). Negative indices count from the end.
+
+        Returns:
+            Union[~bezier.curve.Curve, ~bezier.surface.Surface, \
+                ~bezier.curved_polygon.CurvedPolygon]: The shape.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+        """
+        num_shapes = len(self)
+        if index < 0:
+            index += num_shapes
+        if not 0 <= index < num_shapes:
+            raise IndexError('Shape index out of range', index)
+
+        group_id, row = self._records[index, :]
+        if group_id == _POLYGON_GROUP:
+            start, end = self._polygon_offsets[row:row + 2]
+            edges = [
+                self._get_shape(*self._polygon_edges[edge_index, :])
+                for edge_index in six.moves.xrange(start, end)
+            ]
+            # NOTE: The edges were verified when the polygon was created.
+            return curved_polygon_mod.CurvedPolygon(*edges, _verify=False)
+
+        return self._get_shape(group_id, row)
+
+    def __iter__(self):
+        """Iterate over (materialized) shapes in the library.
+
+        Yields:
+            Union[~bezier.curve.Curve, ~bezier.surface.Surface, \
+                ~bezier.curved_polygon.CurvedPolygon]: The shapes.
+        """
+        for index in six.moves.xrange(len(self)):
+            yield self[index]
+
+    def _get_shape(self, group_id, row):
+        """Materialize a curve or surface from a group.
+
+        Args:
+            group_id (int): The index of the group.
+            row (int): The row of the shape within the group.
+
+        Returns:
+            Union[~bezier.curve.Curve, ~bezier.surface.Surface]: The shape.
+        """
+        kind, degree, _ = self._groups[group_id]
+        # NOTE: The transpose of the stored nodes is Fortran-ordered.
+        nodes = self._nodes[group_id][row].T
+        params = self._params[group_id][row, :]
+        if kind == _CURVE:
+            start, end = params
+            return curve_mod.Curve(
+                nodes, degree, start=float(start), end=float(end),
+                _copy=self._copy)
+        else:
+            base_x, base_y, width = params
+            return surface_mod.Surface(
+                nodes, degree, base_x=float(base_x), base_y=float(base_y),
+                width=float(width), _copy=self._copy)
+
+
+def _num_params(kind):
+    """Get the number of parameters stored for each shape of a kind.
+
+    Args:
+        kind (str): The kind of shape (curve or surface).
+
+    Returns:
+        int: The number of parameters.
+    """
+    if kind == _CURVE:
+        return 2
+    return 3
+
+
+def _data_size(header):
+    """Get the total size of the data blocks described by a header.
+
+    Args:
+        header (dict): The header of a file written by :func:`save_shapes`.
+
+    Returns:
+        int: The number of bytes of data (after the header).
+    """
+    ends = [
+        header['records_offset'] + _INT_DTYPE.itemsize * 2 * (
+            header['num_shapes']),
+        header['polygon_offsets_offset'] + _INT_DTYPE.itemsize * (
+            header['num_polygons'] + 1),
+        header['polygon_edges_offset'] + _INT_DTYPE.itemsize * 2 * (
+            header['num_polygon_edges']),
+    ]
+    for group in header['groups']:
+        ends.append(
+            group['nodes_offset'] + _FLOAT_DTYPE.itemsize * group['count'] *
+            group['dimension'] * group['num_nodes'])
+        ends.append(
+            group['params_offset'] + _FLOAT_DTYPE.itemsize * group['count'] *
+            _num_params(group['kind']))
+    return max(ends)
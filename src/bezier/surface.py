@@ -32,6 +32,8 @@ from bezier import _helpers
 from bezier import _intersection_helpers
 from bezier import _plot_helpers
 from bezier import _surface_helpers
+from bezier import _surface_multi
+from bezier import _tessellation_helpers
 from bezier import curve as _curve_mod
 
 
@@ -179,7 +181,7 @@ class Surface(_base.Base):
     """
 
     __slots__ = (
-        '_dimension', '_nodes',  # From base class
+        '_dimension', '_nodes', '_subdivision', '_bbox',  # From base class
         '_degree', '_base_x', '_base_y', '_width',  # From constructor
         '_area', '_edges', '_is_valid',  # Empty defaults
     )
@@ -221,7 +223,7 @@ class Surface(_base.Base):
         num_nodes, _ = nodes.shape
         degree = cls._get_degree(num_nodes)
         return cls(nodes, degree, base_x=base_x, base_y=base_y,
-                   width=width, _copy=True)
+                   width=width, _copy=_copy)
 
     def __repr__(self):
         """Representation of current object.
@@ -809,6 +811,74 @@ class Surface(_base.Base):
 
         return ax
 
+    def tessellate(self, pts_per_edge=None, tolerance=None):
+        """Tessellate the current surface into a triangle mesh.
+
+        The surface is evaluated on a uniform triangular grid in the
+        reference triangle. The resolution of the grid is either given
+        directly by ``pts_per_edge`` or is chosen (adaptively) so that
+        the estimated distance between the surface and the mesh is at most
+        ``tolerance``.
+
+        .. doctest:: surface-tessellate
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.0 ],
+           ...     [1.0, 0.25],
+           ...     [2.0, 0.0 ],
+           ...     [0.5, 1.0 ],
+           ...     [1.5, 1.0 ],
+           ...     [1.0, 2.0 ],
+           ... ])
+           >>> surface = bezier.Surface(nodes, degree=2)
+           >>> vertices, triangles = surface.tessellate(pts_per_edge=3)
+           >>> vertices
+           array([[ 0.  , 0.   ],
+                  [ 1.  , 0.125],
+                  [ 2.  , 0.   ],
+                  [ 0.5 , 1.   ],
+                  [ 1.5 , 1.   ],
+                  [ 1.  , 2.   ]])
+           >>> triangles
+           array([[0, 1, 3],
+                  [1, 2, 4],
+                  [1, 4, 3],
+                  [3, 4, 5]])
+           >>> vertices, triangles = surface.tessellate(tolerance=0.01)
+           >>> vertices.shape
+           (15, 2)
+
+        Args:
+            pts_per_edge (Optional[int]): The number of points along each
+                edge of the grid.
+            tolerance (Optional[float]): The maximum (estimated) distance
+                between the surface and the mesh. Only one of
+                ``pts_per_edge`` and ``tolerance`` can be specified. At
+                most ``257`` points per edge are used, so a very small
+                ``tolerance`` may not be met.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * The ``V x D`` array of vertices
+            * The ``T x 3`` integer array of (counter-clockwise) triangles,
+              as indices of rows in the vertices
+
+        Raises:
+            ValueError: If both or neither of ``pts_per_edge`` and
+                ``tolerance`` are specified.
+            ValueError: If ``pts_per_edge`` is less than ``2``.
+            ValueError: If ``tolerance`` is not positive.
+        """
+        _tessellation_helpers.verify_resolution(pts_per_edge, tolerance)
+        if pts_per_edge is None:
+            pts_per_edge = _tessellation_helpers.adaptive_pts_per_edge(
+                self._nodes, self._degree, tolerance)
+
+        return _tessellation_helpers.surface_buffers(
+            self._nodes, self._degree, pts_per_edge)
+
     def subdivide(self):
         r"""Split the surface into four sub-surfaces.
 
@@ -855,6 +925,23 @@ class Surface(_base.Base):
            make_images.surface_subdivide1()
            make_images.surface_subdivide2(surface, sub_surface_b)
 
+        If a subdivision cache has been enabled (see
+        :meth:`enable_subdivision_cache`), the same
+        sub-surfaces are returned each time the surface is subdivided.
+
+        Returns:
+            Tuple[Surface, Surface, Surface, Surface]: The lower left, central,
+            lower right and upper left sub-surfaces (in that order).
+        """
+        if self._subdivision is None:
+            return self._subdivide()
+
+        cache, level, index = self._subdivision
+        return cache.subdivide(level, index, self._subdivide)
+
+    def _subdivide(self):
+        """Split the surface into four sub-surfaces (without caching).
+
         Returns:
             Tuple[Surface, Surface, Surface, Surface]: The lower left, central,
             lower right and upper left sub-surfaces (in that order).
@@ -896,18 +983,12 @@ class Surface(_base.Base):
             nodes_d = _helpers.matrix_product(
                 _surface_helpers.QUARTIC_SUBDIVIDE_D, self._nodes)
         else:
-            nodes_a = _surface_helpers.specialize_surface(
-                self._nodes, self._degree,
-                (1.0, 0.0, 0.0), (0.5, 0.5, 0.0), (0.5, 0.0, 0.5))
-            nodes_b = _surface_helpers.specialize_surface(
-                self._nodes, self._degree,
-                (0.0, 0.5, 0.5), (0.5, 0.0, 0.5), (0.5, 0.5, 0.0))
-            nodes_c = _surface_helpers.specialize_surface(
-                self._nodes, self._degree,
-                (0.5, 0.5, 0.0), (0.0, 1.0, 0.0), (0.0, 0.5, 0.5))
-            nodes_d = _surface_helpers.specialize_surface(
-                self._nodes, self._degree,
-                (0.5, 0.0, 0.5), (0.0, 0.5, 0.5), (0.0, 0.0, 1.0))
+            mat_a, mat_b, mat_c, mat_d = (
+                _surface_multi.subdivision_matrices(self._degree))
+            nodes_a = _helpers.matrix_product(mat_a, self._nodes)
+            nodes_b = _helpers.matrix_product(mat_b, self._nodes)
+            nodes_c = _helpers.matrix_product(mat_c, self._nodes)
+            nodes_d = _helpers.matrix_product(mat_d, self._nodes)
 
         half_width = 0.5 * self._width
         shifted_x = self._base_x + half_width
@@ -1123,7 +1204,77 @@ class Surface(_base.Base):
                                  point, 'Shape expected:',
                                  (1, self._dimension))
 
-        return _surface_helpers.locate_point(self, point[0, 0], point[0, 1])
+        if self._subdivision is not None:
+            # NOTE: Only the pure Python version subdivides via
+            #       :meth:`subdivide`, so it is the only one that uses
+            #       the subdivision cache.
+            return _surface_multi.locate_point_cached(
+                self, point[0, 0], point[0, 1])
+        return _surface_multi.locate_point(self, point[0, 0], point[0, 1])
+
+    def locate_multi(self, points, _verify=True):
+        r"""Find many points on the current surface.
+
+        Solves for :math:`s` and :math:`t` in :math:`B(s, t) = p` for each
+        row :math:`p` of ``points``. This is equivalent to calling
+        :meth:`locate` on each point, but the subdivision and Newton
+        refinement are shared among all of the points.
+
+        .. note::
+
+           A unique solution is only guaranteed if the current surface is
+           valid. This code assumes a valid surface, but doesn't check.
+
+        .. doctest:: surface-locate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0 ,  0.0 ],
+           ...     [0.5 , -0.25],
+           ...     [1.0 ,  0.0 ],
+           ...     [0.25,  0.5 ],
+           ...     [0.75,  0.75],
+           ...     [0.0 ,  1.0 ],
+           ... ])
+           >>> surface = bezier.Surface(nodes, degree=2)
+           >>> points = np.asfortranarray([
+           ...     [0.59375, 0.25],
+           ...     [1.0    , 1.0 ],
+           ... ])
+           >>> st_vals = surface.locate_multi(points)
+           >>> st_vals
+           array([[ 0.5 , 0.25],
+                  [ nan,  nan]])
+
+        Args:
+            points (numpy.ndarray): A (``NxD``) array of points, where
+                :math:`D` is the dimension of the surface.
+            _verify (Optional[bool]): Indicates if extra caution should be
+                used to verify assumptions about the inputs. Can be
+                disabled to speed up execution time. Defaults to :data:`True`.
+
+        Returns:
+            numpy.ndarray: The (``Nx2``) :math:`s` and :math:`t` values
+            corresponding to each point, with NaN for each point that is
+            not on the surface.
+
+        Raises:
+            NotImplementedError: If the surface isn't in :math:`\mathbf{R}^2`.
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current surface.
+        """
+        if _verify:
+            if self._dimension != 2:
+                raise NotImplementedError('Only 2D surfaces supported.')
+
+            if points.ndim != 2 or points.shape[1] != self._dimension:
+                raise ValueError(
+                    'Points are not in same dimension as surface',
+                    points, 'Shape expected:', ('N', self._dimension))
+
+        if self._subdivision is not None:
+            return _surface_multi.locate_point_cached_multi(self, points)
+        return _surface_multi.locate_point_multi(self, points)
 
     def intersect(self, other, strategy=_STRATEGY.geometric, _verify=True):
         """Find the common intersection with another surface.
@@ -1154,8 +1305,10 @@ class Surface(_base.Base):
                 raise NotImplementedError(
                     'Intersection only implemented in 2D')
 
-        bbox_int = _intersection_helpers.bbox_intersect(
-            self._nodes, other._nodes)
+        # pylint: disable=protected-access
+        bbox_int = _intersection_helpers.box_intersect(
+            self._get_bbox(), other._get_bbox())
+        # pylint: enable=protected-access
         if bbox_int != _intersection_helpers.BoxIntersectionType.INTERSECTION:
             return []
 
@@ -1297,3 +1450,189 @@ class Surface(_base.Base):
         new_nodes /= denominator
 
         return Surface(new_nodes, self._degree + 1, _copy=False)
+
+
+def evaluate_surfaces(nodes_stack, degree, param_vals, _verify=True):
+    r"""Evaluate many surfaces (of the same degree) at the same points.
+
+    This is equivalent to calling :meth:`Surface.evaluate_cartesian_multi`
+    on each surface, but the Bernstein basis is computed once for the
+    shared ``param_vals`` and every surface is evaluated with a single
+    matrix product.
+
+    .. doctest:: evaluate-surfaces
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes_stack = np.asfortranarray([
+       ...     [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]],
+       ...     [[1.0, 1.0], [3.0, 1.0], [1.0, 2.0]],
+       ... ])
+       >>> param_vals = np.asfortranarray([
+       ...     [0.0 , 0.0 ],
+       ...     [0.25, 0.5 ],
+       ... ])
+       >>> points = bezier.evaluate_surfaces(nodes_stack, 1, param_vals)
+       >>> points.shape
+       (2, 2, 2)
+       >>> points[1, :, :]
+       array([[ 1. , 1. ],
+              [ 1.5, 1.5]])
+
+    Args:
+        nodes_stack (numpy.ndarray): ``K x M x D`` array of nodes, one
+            ``M x D`` set of nodes for each of the ``K`` surfaces.
+        degree (int): The degree of each of the surfaces.
+        param_vals (numpy.ndarray): Array of parameter values (as a
+            ``Nx2`` array).
+        _verify (Optional[bool]): Indicates if the inputs should be
+            verified. Checks the shapes of ``nodes_stack`` and
+            ``param_vals`` and that each row of ``param_vals`` lies in
+            the reference triangle. Can be disabled to speed up
+            execution time. Defaults to :data:`True`.
+
+    Returns:
+        numpy.ndarray: The ``K x N x D`` evaluated points, i.e. the
+        ``N x D`` points on each of the ``K`` surfaces.
+
+    Raises:
+        ValueError: If ``nodes_stack`` is not a 3D array with the number
+            of nodes expected for ``degree`` (and ``_verify=True``).
+        ValueError: If ``param_vals`` is not ``Nx2`` (and
+            ``_verify=True``).
+        ValueError: If any of ``param_vals`` lies outside the reference
+            triangle (and ``_verify=True``).
+    """
+    if _verify:
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        if nodes_stack.ndim != 3 or nodes_stack.shape[1] != num_nodes:
+            raise ValueError(
+                'Nodes must be a stack of surfaces with degree', degree,
+                'Shape expected:', ('K', num_nodes, 'D'),
+                'Received:', nodes_stack.shape)
+        if param_vals.ndim != 2 or param_vals.shape[1] != 2:
+            raise ValueError('Parameter values must be Nx2 array')
+        for s, t in param_vals:
+            # pylint: disable=protected-access
+            Surface._verify_cartesian(s, t)
+            # pylint: enable=protected-access
+
+    return _surface_multi.evaluate_cartesian_stack(
+        nodes_stack, degree, param_vals)
+
+
+def tessellate_surfaces(
+        surfaces, pts_per_edge=None, tolerance=None,
+        max_vertices=_tessellation_helpers.DEFAULT_MAX_VERTICES):
+    """Tessellate many surfaces into triangle meshes, in chunks.
+
+    The chunks are produced lazily: each one contains the meshes (as
+    computed by :meth:`Surface.tessellate`) of consecutive surfaces, merged
+    into preallocated buffers with at most ``max_vertices`` vertices (unless
+    the mesh of a single surface is larger on its own). This allows very
+    large collections of surfaces to be exported without materializing
+    every mesh at once.
+
+    .. doctest:: tessellate-surfaces
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 0.0],
+       ...     [0.0, 1.0],
+       ... ])
+       >>> surfaces = (
+       ...     bezier.Surface(nodes + shift, degree=1)
+       ...     for shift in range(5))
+       >>> chunks = bezier.tessellate_surfaces(
+       ...     surfaces, pts_per_edge=3, max_vertices=12)
+       >>> for vertices, triangles, surface_ids in chunks:
+       ...     vertices.shape, triangles.shape, surface_ids.tolist()
+       ((12, 2), (8, 3), [0, 0, 0, 0, 1, 1, 1, 1])
+       ((12, 2), (8, 3), [2, 2, 2, 2, 3, 3, 3, 3])
+       ((6, 2), (4, 3), [4, 4, 4, 4])
+
+    Args:
+        surfaces (Iterable[Surface]): The surfaces to tessellate. Can be
+            a generator; surfaces are only consumed as each chunk is
+            needed.
+        pts_per_edge (Optional[int]): The number of points along each
+            edge of the grid for every surface.
+        tolerance (Optional[float]): The maximum (estimated) distance
+            between each surface and its mesh. Only one of
+            ``pts_per_edge`` and ``tolerance`` can be specified. At most
+            ``257`` points per edge are used, so a very small
+            ``tolerance`` may not be met.
+        max_vertices (Optional[int]): The maximum number of vertices in
+            a chunk. Defaults to ``65536``, so that every index in a
+            chunk fits in an unsigned 16-bit integer (the triangles are
+            still returned with the default integer type).
+
+    Yields:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triples of
+
+        * The ``V x D`` array of vertices in the chunk
+        * The ``T x 3`` integer array of (counter-clockwise) triangles,
+          as indices of rows in the vertices of the chunk
+        * The ``T`` integer array of the index (in ``surfaces``) of the
+          surface each triangle came from
+
+    Raises:
+        ValueError: If both or neither of ``pts_per_edge`` and
+            ``tolerance`` are specified.
+        ValueError: If ``pts_per_edge`` is less than ``2``.
+        ValueError: If ``tolerance`` is not positive.
+        ValueError: If the surfaces in a chunk don't all have the same
+            dimension.
+    """
+    _tessellation_helpers.verify_resolution(pts_per_edge, tolerance)
+    return _tessellation_helpers.stream_surfaces(
+        surfaces, pts_per_edge, tolerance, max_vertices)
+
+
+def surfaces_from_buffer(nodes, degree):
+    """Create many surfaces (of the same degree) that share a node buffer.
+
+    Each surface is a **view** into ``nodes`` rather than a copy, so no
+    memory is allocated per surface and the nodes of the collection
+    remain contiguous. This makes it possible to load a large model (e.g.
+    from a :class:`numpy.memmap`) without copying.
+
+    .. doctest:: surfaces-from-buffer
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 0.0],
+       ...     [1.0, 0.0],
+       ...     [0.0, 1.0],
+       ...     [1.0, 1.0],
+       ...     [3.0, 1.0],
+       ...     [1.0, 2.0],
+       ... ])
+       >>> surfaces = bezier.surfaces_from_buffer(nodes, 1)
+       >>> len(surfaces)
+       2
+       >>> surfaces[1].evaluate_barycentric(0.0, 0.5, 0.5)
+       array([[ 2. , 1.5]])
+
+    Since the nodes of a surface are assumed not to change (e.g. its
+    bounding box is cached), the buffer must not be modified while the
+    surfaces are in use.
+
+    Args:
+        nodes (numpy.ndarray): The ``(K * M) x D`` buffer of nodes, i.e.
+            the ``M`` nodes of each of ``K`` surfaces stacked on top of
+            each other.
+        degree (int): The degree of each of the surfaces.
+
+    Returns:
+        List[Surface]: The ``K`` surfaces.
+
+    Raises:
+        ValueError: If ``nodes`` is not 2D.
+        ValueError: If the number of rows in ``nodes`` is not a multiple
+            of the number of nodes in a surface of degree ``degree``.
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    return [
+        Surface(surface_nodes, degree, _copy=False)
+        for surface_nodes in _base.node_views(nodes, num_nodes)
+    ]
@@ -10,11 +10,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import unittest
+
+import mock
 import numpy as np
 
 from tests import utils
 
 
+class TestSubdivisionCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import _base
+
+        return _base.SubdivisionCache
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    @staticmethod
+    def _make_children(num_children):
+        return tuple(
+            mock.Mock(spec=['_subdivision']) for _ in range(num_children))
+
+    def test_constructor(self):
+        cache = self._make_one(max_entries=3)
+        self.assertEqual(cache.max_entries, 3)
+        self.assertEqual(len(cache), 0)
+
+    def test_constructor_default(self):
+        from bezier import _base
+
+        cache = self._make_one()
+        self.assertEqual(cache.max_entries, _base._MAX_CACHE_ENTRIES)
+
+    def test_constructor_bad_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_entries=0)
+
+    def test_subdivide(self):
+        cache = self._make_one()
+        children = self._make_children(4)
+        subdivide = mock.Mock(return_value=children, spec=[])
+
+        result = cache.subdivide(2, 3, subdivide)
+        self.assertIs(result, children)
+        subdivide.assert_called_once_with()
+        self.assertIn((2, 3), cache)
+        for child_index, child in enumerate(children):
+            self.assertEqual(
+                child._subdivision, (cache, 3, 12 + child_index))
+
+        # Make sure the children are not re-computed.
+        self.assertIs(cache.subdivide(2, 3, subdivide), children)
+        self.assertEqual(subdivide.call_count, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_subdivide_evict(self):
+        cache = self._make_one(max_entries=2)
+        children1 = self._make_children(2)
+        children2 = self._make_children(2)
+        children3 = self._make_children(2)
+
+        cache.subdivide(0, 0, mock.Mock(return_value=children1, spec=[]))
+        cache.subdivide(1, 0, mock.Mock(return_value=children2, spec=[]))
+        # Use ``(0, 0)`` so that ``(1, 0)`` is the least recently used.
+        cache.subdivide(0, 0, mock.Mock(spec=[]))
+        cache.subdivide(1, 1, mock.Mock(return_value=children3, spec=[]))
+        self.assertEqual(len(cache), 2)
+        self.assertIn((0, 0), cache)
+        self.assertNotIn((1, 0), cache)
+        self.assertIn((1, 1), cache)
+
+    def test_clear(self):
+        cache = self._make_one()
+        children = self._make_children(2)
+        cache.subdivide(0, 0, mock.Mock(return_value=children, spec=[]))
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
 class TestBase(utils.NumPyTestCase):
 
     @staticmethod
@@ -38,6 +116,8 @@ class TestBase(utils.NumPyTestCase):
         self.assertEqual(shape._dimension, 2)
         self.assertIsNot(shape._nodes, nodes)
         self.assertEqual(shape._nodes, nodes)
+        self.assertIsNone(shape._subdivision)
+        self.assertIsNone(shape._bbox)
 
     def test_constructor_without_copy(self):
         nodes = np.asfortranarray([
@@ -50,6 +130,24 @@ class TestBase(utils.NumPyTestCase):
         self.assertEqual(shape._dimension, 2)
         self.assertIs(shape._nodes, nodes)
 
+    def test__get_bbox(self):
+        nodes = np.asfortranarray([
+            [0.0, 1.0],
+            [2.0, -1.0],
+            [1.0, 3.0],
+        ])
+        shape = self._make_one(nodes)
+        self.assertIsNone(shape._bbox)
+        box = shape._get_bbox()
+        self.assertEqual(box, (0.0, 2.0, -1.0, 3.0))
+        self.assertIs(shape._bbox, box)
+
+        # Make sure the box is re-used.
+        patch = mock.patch('bezier._helpers.bbox')
+        with patch as bbox:
+            self.assertIs(shape._get_bbox(), box)
+        bbox.assert_not_called()
+
     def test_constructor_wrong_dimension(self):
         nodes = np.asfortranarray([1.0, 2.0])
         with self.assertRaises(ValueError):
@@ -85,3 +183,59 @@ class TestBase(utils.NumPyTestCase):
         shape = self._make_one(nodes)
         expected = '<Base (degree=-1, dimension=3)>'
         self.assertEqual(repr(shape), expected)
+
+    def test_subdivision_cache_property(self):
+        shape = self._make_one(np.zeros((2, 2), order='F'))
+        self.assertIsNone(shape.subdivision_cache)
+        shape._subdivision = (mock.sentinel.cache, 1, 0)
+        self.assertIs(shape.subdivision_cache, mock.sentinel.cache)
+
+    def test_enable_subdivision_cache(self):
+        from bezier import _base
+
+        shape = self._make_one(np.zeros((2, 2), order='F'))
+        cache = shape.enable_subdivision_cache(max_entries=5)
+        self.assertIsInstance(cache, _base.SubdivisionCache)
+        self.assertEqual(cache.max_entries, 5)
+        self.assertEqual(shape._subdivision, (cache, 0, 0))
+        self.assertIs(shape.subdivision_cache, cache)
+
+    def test_disable_subdivision_cache(self):
+        shape = self._make_one(np.zeros((2, 2), order='F'))
+        shape.enable_subdivision_cache()
+        shape.disable_subdivision_cache()
+        self.assertIsNone(shape._subdivision)
+
+
+class Test_node_views(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, num_nodes):
+        from bezier import _base
+
+        return _base.node_views(nodes, num_nodes)
+
+    def test_it(self):
+        nodes = np.asfortranarray([
+            [0.0, 1.0],
+            [2.0, 3.0],
+            [4.0, 5.0],
+            [6.0, 7.0],
+        ])
+        views = self._call_function_under_test(nodes, 2)
+        self.assertEqual(len(views), 2)
+        self.assertEqual(views[1].tolist(), [[4.0, 5.0], [6.0, 7.0]])
+        for view in views:
+            self.assertIs(view.base, nodes)
+
+    def test_empty(self):
+        nodes = np.zeros((0, 3), order='F')
+        self.assertEqual(self._call_function_under_test(nodes, 3), [])
+
+    def test_bad_dimension(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((6,)), 3)
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((5, 2)), 3)
@@ -14,6 +14,7 @@ import unittest
 
 import mock
 import numpy as np
+import six
 try:
     import scipy.integrate as SCIPY_INT
 except ImportError:  # pragma: NO COVER
@@ -58,6 +59,94 @@ class Test_make_subdivision_matrices(utils.NumPyTestCase):
             3, curve._CUBIC_SUBDIVIDE_LEFT, curve._CUBIC_SUBDIVIDE_RIGHT)
 
 
+class Test_subdivision_matrices(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.subdivision_matrices(degree)
+
+    def test_cached(self):
+        from bezier import _curve_helpers
+
+        cache = {}
+        patch = mock.patch(
+            'bezier._curve_helpers._SUBDIVISION_MATRICES', new=cache)
+        with patch:
+            left, right = self._call_function_under_test(4)
+            self.assertEqual(list(cache.keys()), [4])
+            self.assertFalse(left.flags.writeable)
+            self.assertFalse(right.flags.writeable)
+
+            expected_l, expected_r = (
+                _curve_helpers.make_subdivision_matrices(4))
+            self.assertEqual(left, expected_l)
+            self.assertEqual(right, expected_r)
+
+            # Make sure the matrices are re-used.
+            new_left, new_right = self._call_function_under_test(4)
+            self.assertIs(new_left, left)
+            self.assertIs(new_right, right)
+
+
+class Test_subdivide_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack, degree, starts, ends):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.subdivide_multi(
+            nodes_stack, degree, starts, ends)
+
+    def test_it(self):
+        import bezier
+
+        nodes_stack = np.asfortranarray([
+            [[0.0, 0.0], [1.25, 3.0], [2.0, 1.0]],
+            [[1.0, 0.0], [2.0, 2.0], [0.0, 4.0]],
+        ])
+        starts = np.asfortranarray([0.0, 0.25])
+        ends = np.asfortranarray([1.0, 0.75])
+        left_nodes, right_nodes, new_starts, midpoints, new_ends = (
+            self._call_function_under_test(nodes_stack, 2, starts, ends))
+        self.assertEqual(new_starts, starts)
+        self.assertEqual(midpoints, np.asfortranarray([0.5, 0.5]))
+        self.assertEqual(new_ends, ends)
+        for index in range(2):
+            left, right = bezier.Curve(nodes_stack[index], 2).subdivide()
+            self.assertEqual(
+                np.asfortranarray(left_nodes[index]), left._nodes)
+            self.assertEqual(
+                np.asfortranarray(right_nodes[index]), right._nodes)
+
+
+class Test_elevation_matrix(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.elevation_matrix(degree)
+
+    def test_cached(self):
+        cache = {}
+        patch = mock.patch(
+            'bezier._curve_helpers._ELEVATION_MATRICES', new=cache)
+        with patch:
+            matrix = self._call_function_under_test(1)
+            self.assertEqual(list(cache.keys()), [1])
+            self.assertFalse(matrix.flags.writeable)
+            expected = np.asfortranarray([
+                [1.0, 0.0],
+                [0.5, 0.5],
+                [0.0, 1.0],
+            ])
+            self.assertEqual(matrix, expected)
+            # Make sure the matrix is re-used.
+            self.assertIs(self._call_function_under_test(1), matrix)
+
+
 class Test__evaluate_multi_barycentric(utils.NumPyTestCase):
 
     @staticmethod
@@ -215,6 +304,34 @@ class Test_compute_length(unittest.TestCase):
                 self._call_function_under_test(nodes, 4)
 
 
+class Test_compute_length_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack, degree):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.compute_length_multi(nodes_stack, degree)
+
+    def test_linear(self):
+        nodes_stack = np.asfortranarray([
+            [[0.0, 0.0], [3.0, 4.0]],
+            [[1.0, 1.0], [1.0, -1.0]],
+        ])
+        lengths = self._call_function_under_test(nodes_stack, 1)
+        self.assertEqual(lengths.tolist(), [5.0, 2.0])
+
+    def test_quadratic(self):
+        nodes_stack = np.asfortranarray([
+            [[0.0, 0.0], [1.0, 2.0], [2.0, 0.0]],
+            [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+        ])
+        lengths = self._call_function_under_test(nodes_stack, 2)
+        # NOTE: This is the closed form for the length of a parabola.
+        expected = np.sqrt(5.0) + 0.5 * np.arcsinh(2.0)
+        self.assertTrue(np.allclose(
+            lengths, [expected, np.sqrt(8.0)], atol=0.0, rtol=1e-14))
+
+
 class Test_elevate_nodes(utils.NumPyTestCase):
 
     @staticmethod
@@ -441,6 +558,61 @@ class Test_speedup_evaluate_hodograph(Test__evaluate_hodograph):
         return _speedup.speedup.evaluate_hodograph(s, nodes, degree)
 
 
+class Test__evaluate_hodograph_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(s_vals, nodes, degree):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._evaluate_hodograph_multi(s_vals, nodes, degree)
+
+    def test_line(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 1.0]],
+            [[2.0, 1.0], [-1.0, 3.0]],
+        ])
+        s_vals = np.asfortranarray([0.25, 0.75])
+        result = self._call_function_under_test(s_vals, nodes, 1)
+        expected = np.asfortranarray([
+            [1.0, 1.0],
+            [-3.0, 2.0],
+        ])
+        self.assertEqual(np.asfortranarray(result), expected)
+
+    def test_cubic(self):
+        from bezier import _curve_helpers
+
+        nodes = np.asarray([
+            [[0.0, 0.0], [0.25, 1.0], [0.75, 0.5], [1.25, 1.0]],
+            [[0.0, 0.0], [1.0, 2.0], [3.0, 1.0], [4.0, 4.0]],
+            [[1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [-1.0, 0.5]],
+        ])
+        s_vals = np.asfortranarray([0.125, 0.5, 1.0])
+        result = self._call_function_under_test(s_vals, nodes, 3)
+        self.assertEqual(result.shape, (3, 2))
+        # Make sure we agree with the non-vectorized version.
+        for index in six.moves.xrange(3):
+            expected = _curve_helpers._evaluate_hodograph(
+                s_vals[index], np.asfortranarray(nodes[index]), 3)
+            self.assertTrue(np.allclose(result[[index], :], expected))
+
+    def test_empty(self):
+        nodes = np.zeros((0, 3, 2))
+        result = self._call_function_under_test(np.empty((0,)), nodes, 2)
+        self.assertEqual(result.shape, (0, 2))
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test_speedup_evaluate_hodograph_multi(Test__evaluate_hodograph_multi):
+
+    @staticmethod
+    def _call_function_under_test(s_vals, nodes, degree):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._hodograph_multi_speedup(
+            s_vals, nodes, degree)
+
+
 class Test_get_curvature(unittest.TestCase):
 
     @staticmethod
@@ -511,13 +683,13 @@ class Test_newton_refine(unittest.TestCase):
         self.assertEqual(110.0 * new_s, 57.0)
 
 
-class Test_locate_point(unittest.TestCase):
+class Test__locate_point(unittest.TestCase):
 
     @staticmethod
     def _call_function_under_test(curve, point):
         from bezier import _curve_helpers
 
-        return _curve_helpers.locate_point(curve, point)
+        return _curve_helpers._locate_point(curve, point)
 
     def test_it(self):
         import bezier
@@ -556,6 +728,253 @@ class Test_locate_point(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._call_function_under_test(curve, point)
 
+    def _check_stats(self, counters):
+        self.assertEqual(
+            counters, {'locate.candidates': 4, 'locate.newton_steps': 1})
+
+    def test_stats(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ]), degree=2)
+        point = np.asfortranarray([[0.25, 0.4375]])
+        with bezier.stats.collect() as stats:
+            result = self._call_function_under_test(curve, point)
+
+        self.assertEqual(result, 0.125)
+        self._check_stats(stats.counters)
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test__locate_point_speedup(Test__locate_point):
+
+    @staticmethod
+    def _call_function_under_test(curve, point):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._locate_point_speedup(curve, point)
+
+    def _check_stats(self, counters):
+        # NOTE: The compiled version doesn't record any counters.
+        self.assertEqual(counters, {})
+
+    def test_matches_python(self):
+        import bezier
+        from bezier import _curve_helpers
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [3.0, 1.0],
+            [4.0, 0.0],
+        ]), degree=3)
+        # NOTE: Use a sub-curve so that the subdivided parameters are
+        #       relative to a root curve that differs from ``curve``.
+        sub_curve = curve.specialize(0.25, 0.75)
+        for s_val in (0.0, 0.125, 0.375, 0.5, 0.875, 1.0):
+            point = sub_curve.evaluate(s_val)
+            result = self._call_function_under_test(sub_curve, point)
+            expected = _curve_helpers._locate_point(sub_curve, point)
+            self.assertEqual(result, expected)
+
+
+class Test__newton_refine_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points, s_vals):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._newton_refine_multi(
+            nodes, degree, points, s_vals)
+
+    def test_it(self):
+        import bezier
+        from bezier import _curve_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [3.0, 1.0],
+            [4.0, 0.0],
+        ])
+        curve = bezier.Curve(nodes, degree=3)
+        points = np.asfortranarray([
+            [3.09375, 0.703125],
+            [2.0, 1.125],
+            [0.0, 0.0],
+        ])
+        s_vals = np.asfortranarray([0.625, 0.5, 0.25])
+        result = self._call_function_under_test(nodes, 3, points, s_vals)
+        for index in range(3):
+            expected = _curve_helpers.newton_refine(
+                curve, points[[index], :], s_vals[index])
+            self.assertAlmostEqual(result[index], expected, delta=0.5**50)
+        # NOTE: ``s = 0.5`` is already the solution for the second point.
+        self.assertEqual(result[1], 0.5)
+
+
+class Test__locate_candidates_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(curve, points):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._locate_candidates_multi(curve, points)
+
+    def test_it(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
+        points = np.asfortranarray([
+            [0.25, 0.25],
+            [2.0, 2.0],
+        ])
+        point_ids, pair_starts, pair_ends = self._call_function_under_test(
+            curve, points)
+        # Only the first point is on the curve, in tiny sub-curves
+        # near s = 1/4.
+        self.assertEqual(set(point_ids.tolist()), set([0]))
+        widths = pair_ends - pair_starts
+        self.assertTrue(np.all(widths == widths[0]))
+        self.assertLessEqual(widths[0], 0.5**20)
+        self.assertTrue(np.all(np.abs(pair_starts - 0.25) <= 2 * widths))
+
+
+class Test__mean_params_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(
+            point_ids, pair_starts, pair_ends, num_points):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._mean_params_multi(
+            point_ids, pair_starts, pair_ends, num_points)
+
+    def test_it(self):
+        point_ids = np.asarray([2, 0, 2])
+        pair_starts = np.asarray([0.5, 0.25, 0.5 + 0.5**22])
+        pair_ends = np.asarray([0.5 + 0.5**22, 0.25, 0.5 + 0.5**21])
+        found, means = self._call_function_under_test(
+            point_ids, pair_starts, pair_ends, 3)
+        self.assertEqual(found.tolist(), [True, False, True])
+        self.assertEqual(means[0], 0.25)
+        self.assertTrue(np.isnan(means[1]))
+        self.assertEqual(means[2], 0.5 + 0.5**22)
+
+    def test_too_spread_out(self):
+        point_ids = np.asarray([0, 1, 1])
+        pair_starts = np.asarray([0.25, 0.0, 0.75])
+        pair_ends = np.asarray([0.25, 0.25, 1.0])
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                point_ids, pair_starts, pair_ends, 2)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ('Parameters not close enough to one another', 1))
+
+
+class Test_locate_point_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(curve, points):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.locate_point_multi(curve, points)
+
+    def test_it(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0, 0.0],
+            [3.0, 0.0, -1.0],
+            [1.0, 1.0, 3.0],
+        ]))
+        s_vals = np.asfortranarray([0.125, 0.5, 0.875])
+        points = curve.evaluate_multi(s_vals)
+        result = self._call_function_under_test(curve, points)
+        self.assertEqual(result, s_vals)
+
+    def test_no_match(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]))
+        points = np.asfortranarray([
+            [0.5, 2.0],
+            [0.5, 0.5],
+            [0.5, 0.25],
+        ])
+        result = self._call_function_under_test(curve, points)
+        self.assertTrue(np.isnan(result[0]))
+        self.assertEqual(result[1], 0.5)
+        self.assertTrue(np.isnan(result[2]))
+
+    def test_empty(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
+        points = np.zeros((0, 2), order='F')
+        result = self._call_function_under_test(curve, points)
+        self.assertEqual(result.shape, (0,))
+
+    def test_matches_locate_point(self):
+        import bezier
+        from bezier import _curve_helpers
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [3.0, 1.0],
+            [4.0, 0.0],
+        ]), degree=3)
+        # NOTE: Use a sub-curve so that the parameters are relative
+        #       to a root curve that differs from ``curve``.
+        curve = curve.specialize(0.25, 0.75)
+        s_vals = np.asfortranarray(np.linspace(0.0, 1.0, 17))
+        points = curve.evaluate_multi(s_vals)
+        points[::4, 1] += 0.25
+        result = self._call_function_under_test(curve, points)
+        for index in range(17):
+            expected = _curve_helpers.locate_point(
+                curve, points[[index], :])
+            if expected is None:
+                self.assertTrue(np.isnan(result[index]))
+            else:
+                self.assertEqual(result[index], expected)
+
+    def test_failure_on_invalid(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 2.0],
+            [-1.0, 0.0],
+            [1.0, 1.0],
+            [-0.75, 1.625],
+        ])
+        curve = bezier.Curve(nodes, 3)
+        points = np.asfortranarray([
+            [0.0, 2.0],
+            [-0.25, 1.375],
+        ])
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(curve, points)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args[1], 1)
+
 
 class Test_reduce_pseudo_inverse(utils.NumPyTestCase):
 
@@ -861,3 +1280,168 @@ class Test_full_reduce(utils.NumPyTestCase):
         ])
         new_nodes = self._call_function_under_test(nodes)
         self.assertIs(new_nodes, nodes)
+
+
+class Test_full_reduce_degrees(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier import _curve_helpers
+
+        return _curve_helpers.full_reduce_degrees(nodes)
+
+    def test_it(self):
+        nodes = np.asarray([
+            # Linear, elevated twice.
+            [[0.0, 0.0], [1.0, 1.0 / 3.0], [2.0, 2.0 / 3.0], [3.0, 1.0]],
+            # Quadratic, elevated once.
+            [[0.0, 0.0], [1.0, 2.0 / 3.0], [2.0, 2.0 / 3.0], [3.0, 0.0]],
+            # Cubic.
+            [[0.0, 0.0], [1.0, 2.0], [2.0, -1.0], [3.0, 1.0]],
+            # Constant.
+            [[1.0, 2.0], [1.0, 2.0], [1.0, 2.0], [1.0, 2.0]],
+        ])
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.tolist(), [1, 2, 3, 0])
+
+    def test_unsupported_degree(self):
+        nodes = np.zeros((2, 6, 2))
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes)
+
+
+class Test__flatten(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._flatten(nodes, tolerance)
+
+    @staticmethod
+    def _polyline_distances(polyline, points):
+        starts = polyline[:-1, :]
+        deltas = polyline[1:, :] - starts
+        # Project each point onto each segment (clamped to the segment).
+        rel = points[:, np.newaxis, :] - starts[np.newaxis, :, :]
+        lengths_sq = np.sum(deltas * deltas, axis=1)
+        params = np.clip(
+            np.sum(rel * deltas, axis=2) / lengths_sq, 0.0, 1.0)
+        closest = starts + params[:, :, np.newaxis] * deltas
+        gaps = np.linalg.norm(points[:, np.newaxis, :] - closest, axis=2)
+        return np.min(gaps, axis=1)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([
+            [0.0, 1.0, 2.0],
+            [3.0, 1.0, 0.0],
+        ])
+        result = self._call_function_under_test(nodes, 0.5**20)
+        self.assertEqual(result, nodes)
+
+    def test_quadratic(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ])
+        # The linearization error of the curve is 1 and each subdivision
+        # reduces it by a factor of 4.
+        result = self._call_function_under_test(nodes, 1.0)
+        self.assertEqual(result, np.asfortranarray([
+            [0.0, 0.0],
+            [2.0, 0.0],
+        ]))
+        result = self._call_function_under_test(nodes, 0.25)
+        self.assertEqual(result, np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, 0.0],
+        ]))
+        result = self._call_function_under_test(nodes, 0.125)
+        self.assertEqual(result, np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.75],
+            [1.0, 1.0],
+            [1.5, 0.75],
+            [2.0, 0.0],
+        ]))
+
+    def test_elevated_line(self):
+        # A (degree-elevated) line doesn't need to be subdivided.
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.5],
+            [2.0, 1.0],
+            [3.0, 1.5],
+        ])
+        result = self._call_function_under_test(nodes, 0.5**40)
+        self.assertEqual(result, np.asfortranarray(nodes[[0, 3], :]))
+
+    def test_within_tolerance(self):
+        import bezier
+        from bezier import _curve_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [2.0, 0.0],
+            [3.0, 4.0],
+        ])
+        tolerance = 0.5**10
+        result = self._call_function_under_test(nodes, tolerance)
+        s_vals = _curve_helpers.locate_point_multi(
+            bezier.Curve(nodes, degree=3), result)
+        self.assertTrue(np.all(np.diff(s_vals) > 0.0))
+
+        # Every point on the curve is within ``tolerance`` of the polyline.
+        curve_pts = _curve_helpers.evaluate_multi(
+            nodes, np.linspace(0.0, 1.0, 1025))
+        distances = self._polyline_distances(result, curve_pts)
+        self.assertLessEqual(np.max(distances), tolerance)
+
+    def test_max_subdivisions(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ])
+        patch = mock.patch(
+            'bezier._curve_helpers._MAX_FLATTEN_SUBDIVISIONS', new=2)
+        with patch:
+            result = self._call_function_under_test(nodes, 0.5**40)
+        self.assertEqual(result.shape, (5, 2))
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test__flatten_speedup(Test__flatten):
+
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._flatten_speedup(nodes, tolerance)
+
+    def test_max_subdivisions(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ])
+        result = self._call_function_under_test(nodes, 0.0)
+        self.assertEqual(result.shape, (2**20 + 1, 2))
+
+    def test_grows_buffer(self):
+        from bezier import _curve_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ])
+        patch = mock.patch(
+            'bezier._curve_helpers._FLATTEN_MAX_POINTS', new=2)
+        with patch:
+            result = self._call_function_under_test(nodes, 0.125)
+        expected = _curve_helpers._flatten(nodes, 0.125)
+        self.assertEqual(result, expected)
@@ -13,6 +13,7 @@
 import unittest
 
 import numpy as np
+import six
 
 from tests import utils
 
@@ -56,6 +57,52 @@ class Test_vector_close(unittest.TestCase):
         self.assertFalse(self._call_function_under_test(vec1, vec2))
 
 
+class Test_vector_close_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(vecs1, vecs2, **kwargs):
+        from bezier import _helpers
+
+        return _helpers.vector_close_multi(vecs1, vecs2, **kwargs)
+
+    def test_it(self):
+        vecs1 = np.asfortranarray([
+            [0.5, 4.0],
+            [0.0, 0.0],
+            [0.0, 0.5**50],
+            [1.0, 1.0],
+            [0.5**50, 0.0],
+        ])
+        vecs2 = np.asfortranarray([
+            [0.5, 4.0],
+            [0.5**50, 0.0],
+            [0.0, 0.0],
+            [1.0, 1.0 + 0.5**20],
+            [0.5**20, 0.0],
+        ])
+        result = self._call_function_under_test(vecs1, vecs2)
+        self.assertEqual(result.tolist(), [True, True, True, False, False])
+
+    def test_matches_vector_close(self):
+        from bezier import _helpers
+
+        vecs1 = np.asfortranarray([
+            [1.0, 1.0],
+            [0.0, 0.0],
+            [2.0, 3.0],
+        ])
+        vecs2 = np.asfortranarray([
+            [1.0, 1.0 + 0.5**45],
+            [0.5**30, 0.0],
+            [2.0, 3.125],
+        ])
+        result = self._call_function_under_test(vecs1, vecs2, eps=0.5**20)
+        for index in range(3):
+            expected = _helpers.vector_close(
+                vecs1[[index], :], vecs2[[index], :], eps=0.5**20)
+            self.assertEqual(result[index], expected)
+
+
 class Test_in_interval(unittest.TestCase):
 
     @staticmethod
@@ -128,6 +175,35 @@ class Test_speedup_bbox(Test__bbox):
         return _speedup.speedup.bbox(nodes)
 
 
+class Test_bboxes(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack):
+        from bezier import _helpers
+
+        return _helpers.bboxes(nodes_stack)
+
+    def test_it(self):
+        nodes_stack = np.asfortranarray([
+            [[0.0, 5.0], [1.0, 3.0], [0.5, 4.0]],
+            [[1.0, 0.0], [-1.0, 2.0], [5.0, -3.0]],
+        ])
+        boxes = self._call_function_under_test(nodes_stack)
+        expected = np.asfortranarray([
+            [0.0, 1.0, 3.0, 5.0],
+            [-1.0, 5.0, -3.0, 2.0],
+        ])
+        self.assertEqual(np.asfortranarray(boxes), expected)
+        for index in range(2):
+            self.assertEqual(
+                tuple(boxes[index, :]),
+                Test__bbox._call_function_under_test(nodes_stack[index]))
+
+    def test_empty(self):
+        boxes = self._call_function_under_test(np.empty((0, 3, 2)))
+        self.assertEqual(boxes.shape, (0, 4))
+
+
 class Test_contains(unittest.TestCase):
 
     UNIT_SQUARE = np.asfortranarray([
@@ -154,6 +230,33 @@ class Test_contains(unittest.TestCase):
             self._call_function_under_test(self.UNIT_SQUARE, 0.25, 0.75))
 
 
+class Test_box_contains(unittest.TestCase):
+
+    UNIT_SQUARE = (0.0, 1.0, 0.0, 1.0)
+
+    @staticmethod
+    def _call_function_under_test(box, x_val, y_val):
+        from bezier import _helpers
+
+        return _helpers.box_contains(box, x_val, y_val)
+
+    def test_x_outside(self):
+        self.assertFalse(
+            self._call_function_under_test(self.UNIT_SQUARE, -1.0, 0.5))
+
+    def test_y_outside(self):
+        self.assertFalse(
+            self._call_function_under_test(self.UNIT_SQUARE, 0.625, 4.25))
+
+    def test_inside(self):
+        self.assertTrue(
+            self._call_function_under_test(self.UNIT_SQUARE, 0.25, 0.75))
+
+    def test_boundary(self):
+        self.assertTrue(
+            self._call_function_under_test(self.UNIT_SQUARE, 1.0, 0.0))
+
+
 class Test_contains_nd(unittest.TestCase):
 
     @staticmethod
@@ -188,6 +291,33 @@ class Test_contains_nd(unittest.TestCase):
         self.assertTrue(self._call_function_under_test(nodes, point))
 
 
+class Test_contains_nd_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack, points, shape_ids, point_ids):
+        from bezier import _helpers
+
+        return _helpers.contains_nd_multi(
+            nodes_stack, points, shape_ids, point_ids)
+
+    def test_it(self):
+        nodes_stack = np.asarray([
+            [[0.0, 0.0], [1.0, 1.0]],
+            [[2.0, 0.0], [3.0, 2.0]],
+        ])
+        points = np.asfortranarray([
+            [0.5, 0.5],
+            [2.5, 2.0],
+            [1.0, 1.5],
+        ])
+        shape_ids = np.asarray([0, 1, 0, 1, 0, 1])
+        point_ids = np.asarray([0, 0, 1, 1, 2, 2])
+        result = self._call_function_under_test(
+            nodes_stack, points, shape_ids, point_ids)
+        self.assertEqual(
+            result.tolist(), [True, False, False, True, False, False])
+
+
 class Test_cross_product(utils.NumPyTestCase):
 
     @staticmethod
@@ -325,6 +455,231 @@ class Test_matrix_product(utils.NumPyTestCase):
         self.assertFalse(result.flags.owndata)
 
 
+class Test_bbox_tree(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(boxes, **kwargs):
+        from bezier import _helpers
+
+        return _helpers.bbox_tree(boxes, **kwargs)
+
+    def test_empty(self):
+        boxes = np.zeros((0, 4))
+        node_boxes, nodes, order = self._call_function_under_test(boxes)
+        self.assertEqual(node_boxes.shape, (0, 4))
+        self.assertEqual(nodes.shape, (0, 3))
+        self.assertEqual(order.shape, (0,))
+
+    def test_single_leaf(self):
+        boxes = np.asfortranarray([
+            [0.0, 1.0, 0.0, 1.0],
+            [2.0, 3.0, -1.0, 0.5],
+        ])
+        node_boxes, nodes, order = self._call_function_under_test(boxes)
+        expected_boxes = np.asfortranarray([[0.0, 3.0, -1.0, 1.0]])
+        self.assertEqual(node_boxes, expected_boxes)
+        self.assertEqual(nodes.tolist(), [[0, 2, -1]])
+        self.assertEqual(order.tolist(), [0, 1])
+
+    def test_split(self):
+        boxes = np.asfortranarray([
+            [3.0, 4.0, 0.0, 1.0],
+            [0.0, 1.0, 0.0, 1.0],
+            [2.0, 3.0, 0.0, 1.0],
+            [1.0, 2.0, 0.0, 1.0],
+        ])
+        node_boxes, nodes, order = self._call_function_under_test(
+            boxes, leaf_size=1)
+        expected_boxes = np.asfortranarray([
+            [0.0, 4.0, 0.0, 1.0],
+            [0.0, 2.0, 0.0, 1.0],
+            [0.0, 1.0, 0.0, 1.0],
+            [1.0, 2.0, 0.0, 1.0],
+            [2.0, 4.0, 0.0, 1.0],
+            [2.0, 3.0, 0.0, 1.0],
+            [3.0, 4.0, 0.0, 1.0],
+        ])
+        self.assertEqual(node_boxes, expected_boxes)
+        expected_nodes = [
+            [0, 4, 4],
+            [0, 2, 3],
+            [0, 1, -1],
+            [1, 2, -1],
+            [2, 4, 6],
+            [2, 3, -1],
+            [3, 4, -1],
+        ]
+        self.assertEqual(nodes.tolist(), expected_nodes)
+        self.assertEqual(order.tolist(), [1, 3, 2, 0])
+
+
+class Test__overlap_mask(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(boxes, left, right, bottom, top):
+        from bezier import _helpers
+
+        return _helpers._overlap_mask(boxes, left, right, bottom, top)
+
+    def test_it(self):
+        boxes = np.asfortranarray([
+            [0.0, 1.0, 0.0, 1.0],
+            [1.0, 2.0, 1.0, 2.0],
+            [2.5, 3.0, 0.0, 1.0],
+            [0.0, 1.0, 3.0, 4.0],
+        ])
+        result = self._call_function_under_test(boxes, 0.5, 2.0, 0.5, 2.0)
+        self.assertEqual(result.tolist(), [True, True, False, False])
+
+
+class Test__concat_ranges(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(starts, ends):
+        from bezier import _helpers
+
+        return _helpers._concat_ranges(starts, ends)
+
+    def test_it(self):
+        starts = np.asarray([4, 0, 7, 2])
+        ends = np.asarray([6, 1, 7, 5])
+        result = self._call_function_under_test(starts, ends)
+        self.assertEqual(result.tolist(), [4, 5, 0, 2, 3, 4])
+
+    def test_empty(self):
+        empty = np.empty((0,), dtype=int)
+        result = self._call_function_under_test(empty, empty)
+        self.assertEqual(result.shape, (0,))
+
+
+class Test_bbox_tree_query(utils.NumPyTestCase):
+
+    BOXES = np.asfortranarray([
+        [3.0, 4.0, 0.0, 1.0],
+        [0.0, 1.0, 0.0, 1.0],
+        [2.0, 3.0, 0.0, 1.0],
+        [1.0, 2.0, 2.0, 3.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(tree, boxes, left, right, bottom, top):
+        from bezier import _helpers
+
+        return _helpers.bbox_tree_query(
+            tree, boxes, left, right, bottom, top)
+
+    def _query(self, left, right, bottom, top, leaf_size=1):
+        from bezier import _helpers
+
+        tree = _helpers.bbox_tree(self.BOXES, leaf_size=leaf_size)
+        result = self._call_function_under_test(
+            tree, self.BOXES, left, right, bottom, top)
+        return result.tolist()
+
+    def test_empty(self):
+        from bezier import _helpers
+
+        boxes = np.zeros((0, 4))
+        tree = _helpers.bbox_tree(boxes)
+        result = self._call_function_under_test(
+            tree, boxes, 0.0, 1.0, 0.0, 1.0)
+        self.assertEqual(result.shape, (0,))
+
+    def test_disjoint(self):
+        self.assertEqual(self._query(5.0, 6.0, 0.0, 1.0), [])
+        self.assertEqual(self._query(0.25, 0.75, 1.25, 1.75), [])
+
+    def test_overlap(self):
+        self.assertEqual(self._query(0.5, 2.5, 0.5, 2.5), [1, 2, 3])
+        self.assertEqual(
+            self._query(0.5, 2.5, 0.5, 2.5, leaf_size=8), [1, 2, 3])
+
+    def test_touching(self):
+        self.assertEqual(self._query(4.0, 5.0, 1.0, 2.0), [0])
+        self.assertEqual(self._query(2.0, 2.0, 1.0, 1.0), [2])
+
+    def test_point(self):
+        self.assertEqual(self._query(3.0, 3.0, 0.5, 0.5), [0, 2])
+
+    def test_many_levels(self):
+        from bezier import _helpers
+
+        # A 16 x 16 grid of unit boxes, each shrunk by 1/8.
+        corners = np.arange(16.0)
+        grid_x, grid_y = np.meshgrid(corners, corners)
+        boxes = np.empty((256, 4))
+        boxes[:, 0] = grid_x.ravel() + 0.125
+        boxes[:, 1] = grid_x.ravel() + 0.875
+        boxes[:, 2] = grid_y.ravel() + 0.125
+        boxes[:, 3] = grid_y.ravel() + 0.875
+        tree = _helpers.bbox_tree(boxes, leaf_size=4)
+        result = self._call_function_under_test(
+            tree, boxes, 2.5, 4.125, 7.0, 8.5)
+        expected = [
+            16 * row + column for row in (7, 8) for column in (2, 3, 4)]
+        self.assertEqual(result.tolist(), expected)
+
+
+class Test_sweep_and_prune(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(boxes):
+        from bezier import _helpers
+
+        return _helpers.sweep_and_prune(boxes)
+
+    def test_empty(self):
+        pairs = self._call_function_under_test(np.zeros((0, 4)))
+        self.assertEqual(pairs.shape, (0, 2))
+
+    def test_disjoint(self):
+        boxes = np.asfortranarray([
+            [0.0, 1.0, 0.0, 1.0],
+            [2.0, 3.0, 0.0, 1.0],
+            [0.5, 1.5, 2.0, 3.0],
+        ])
+        pairs = self._call_function_under_test(boxes)
+        self.assertEqual(pairs.shape, (0, 2))
+
+    def test_overlapping(self):
+        boxes = np.asfortranarray([
+            [2.0, 3.0, 0.0, 1.0],
+            [0.0, 4.0, 0.5, 0.75],
+            [0.0, 1.0, 0.0, 1.0],
+            [0.5, 0.75, 2.0, 3.0],
+            [1.0, 2.0, 1.0, 2.0],
+        ])
+        pairs = self._call_function_under_test(boxes)
+        # NOTE: Boxes 2 and 4 only share a corner and boxes
+        #       0 and 4 only share an edge.
+        expected = [[0, 1], [0, 4], [1, 2], [2, 4]]
+        self.assertEqual(pairs.tolist(), expected)
+
+    def test_brute_force(self):
+        # Compare against the O(N^2) check on many (small) random boxes.
+        random_state = np.random.RandomState(seed=3)
+        corners = random_state.random_sample((64, 2))
+        sizes = 0.125 * random_state.random_sample((64, 2))
+        boxes = np.empty((64, 4))
+        boxes[:, 0] = corners[:, 0]
+        boxes[:, 1] = corners[:, 0] + sizes[:, 0]
+        boxes[:, 2] = corners[:, 1]
+        boxes[:, 3] = corners[:, 1] + sizes[:, 1]
+
+        expected = []
+        for i in range(64):
+            for j in range(i + 1, 64):
+                if (boxes[i, 0] <= boxes[j, 1] and
+                        boxes[j, 0] <= boxes[i, 1] and
+                        boxes[i, 2] <= boxes[j, 3] and
+                        boxes[j, 2] <= boxes[i, 3]):
+                    expected.append([i, j])
+
+        pairs = self._call_function_under_test(boxes)
+        self.assertEqual(pairs.tolist(), expected)
+        self.assertGreater(len(expected), 0)
+
+
 class Test__wiggle_interval_py(unittest.TestCase):
 
     @staticmethod
@@ -458,3 +813,55 @@ class Test_speedup_wiggle_interval(Test__wiggle_interval_py):
         # to allow the compiler to pre-compute 1 + wiggle / 1 - wiggle
         # rather than having to deal with it at run-time.
         pass
+
+
+class Test__wiggle_interval_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(values, **kwargs):
+        from bezier import _helpers
+
+        return _helpers._wiggle_interval_multi(values, **kwargs)
+
+    def test_it(self):
+        from bezier import _helpers
+
+        values = np.asfortranarray([
+            0.0, -2.0**(-60), 0.25, 1.0 + 2.0**(-60), 1.0 + 2.0**(-20),
+            -0.25, 1.5])
+        results, success = self._call_function_under_test(values)
+        self.assertEqual(
+            success.tolist(), [True, True, True, True, False, False, False])
+        self.assertEqual(results[:4].tolist(), [0.0, 0.0, 0.25, 1.0])
+        # Make sure we agree with the non-vectorized version.
+        for index in six.moves.xrange(4):
+            self.assertEqual(
+                results[index], _helpers._wiggle_interval_py(values[index]))
+
+    def test_empty(self):
+        results, success = self._call_function_under_test(np.empty((0,)))
+        self.assertEqual(results.shape, (0,))
+        self.assertEqual(success.shape, (0,))
+
+    def test_custom_wiggle(self):
+        values = np.asfortranarray([1.25, 0.875])
+        _, success = self._call_function_under_test(values)
+        self.assertEqual(success.tolist(), [False, True])
+        results, success = self._call_function_under_test(
+            values, wiggle=0.5)
+        self.assertEqual(success.tolist(), [True, True])
+        self.assertEqual(results.tolist(), [1.0, 1.0])
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test_speedup_wiggle_interval_multi(Test__wiggle_interval_multi):
+
+    def _call_function_under_test(self, values, **kwargs):
+        from bezier import _helpers
+
+        self.assertEqual(kwargs, {})
+        return _helpers._wiggle_interval_multi_speedup(values, **kwargs)
+
+    def test_custom_wiggle(self):
+        # Fortran implementation doesn't support optional wiggle.
+        pass
@@ -14,6 +14,7 @@ import unittest
 
 import mock
 import numpy as np
+import six
 
 from tests import utils
 
@@ -172,6 +173,70 @@ class Test_evaluate(unittest.TestCase):
             self._call_function_under_test(nodes, 0.0, 0.0)
 
 
+class Test__evaluate_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, x_vals, y_vals):
+        from bezier import _implicitization
+
+        return _implicitization._evaluate_multi(nodes, x_vals, y_vals)
+
+    def _compare(self, nodes):
+        from bezier import _implicitization
+
+        x_vals = np.asfortranarray([
+            [0.0, 0.5, 1.25],
+            [-1.0, 2.0, 0.75],
+        ])
+        y_vals = np.asfortranarray([
+            [1.0, 0.25, -0.5],
+            [0.0, 3.0, 0.125],
+        ])
+        result = self._call_function_under_test(nodes, x_vals, y_vals)
+        self.assertEqual(result.shape, (2, 3))
+        for curve in (0, 1):
+            curve_nodes = np.asfortranarray(nodes[curve])
+            for index in (0, 1, 2):
+                expected = _implicitization.evaluate(
+                    curve_nodes, x_vals[curve, index], y_vals[curve, index])
+                self.assertAlmostEqual(
+                    result[curve, index], expected,
+                    delta=LOCAL_EPS * max(1.0, abs(expected)))
+
+    def test_linear(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 2.0]],
+            [[1.0, -1.0], [3.0, 0.5]],
+        ])
+        self._compare(nodes)
+
+    def test_quadratic(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 2.0], [3.0, 0.0]],
+            [[1.0, -1.0], [3.0, 0.5], [2.0, 2.0]],
+        ])
+        self._compare(nodes)
+
+    def test_cubic(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 2.0], [2.0, -1.0], [3.0, 1.0]],
+            [[1.0, -1.0], [3.0, 0.5], [2.0, 2.0], [0.0, 1.0]],
+        ])
+        self._compare(nodes)
+
+    def test_point(self):
+        nodes = np.zeros((2, 1, 2))
+        values = np.zeros((2, 1))
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes, values, values)
+
+    def test_degree_too_high(self):
+        nodes = np.zeros((2, 5, 2))
+        values = np.zeros((2, 1))
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes, values, values)
+
+
 class Test_eval_intersection_polynomial(unittest.TestCase):
 
     @staticmethod
@@ -640,6 +705,79 @@ class Test_to_power_basis(utils.NumPyTestCase):
             self._call_function_under_test(nodes_no, nodes_no)
 
 
+class Test__to_power_basis_multi(utils.NumPyTestCase):
+
+    NODES = {
+        2: np.asarray([
+            [[0.0, 0.0], [1.0, 2.0]],
+            [[1.0, -1.0], [3.0, 0.5]],
+        ]),
+        3: np.asarray([
+            [[0.0, 0.0], [1.0, 2.0], [3.0, 0.0]],
+            [[1.0, -1.0], [3.0, 0.5], [2.0, 2.0]],
+        ]),
+        4: np.asarray([
+            [[0.0, 0.0], [1.0, 2.0], [2.0, -1.0], [3.0, 1.0]],
+            [[1.0, -1.0], [3.0, 0.5], [2.0, 2.0], [0.0, 1.0]],
+        ]),
+    }
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _implicitization
+
+        return _implicitization._to_power_basis_multi(nodes1, nodes2)
+
+    def _compare(self, num_nodes1, num_nodes2):
+        from bezier import _implicitization
+
+        nodes1 = self.NODES[num_nodes1]
+        nodes2 = self.NODES[num_nodes2][::-1]
+        result = self._call_function_under_test(nodes1, nodes2)
+        num_coeffs = (num_nodes1 - 1) * (num_nodes2 - 1) + 1
+        self.assertEqual(result.shape, (2, num_coeffs))
+        for index in (0, 1):
+            expected = _implicitization.to_power_basis(
+                np.asfortranarray(nodes1[index]),
+                np.asfortranarray(nodes2[index]))
+            self.assertTrue(np.allclose(
+                result[index], expected, atol=LOCAL_EPS, rtol=LOCAL_EPS))
+
+    def test_degrees_1_1(self):
+        self._compare(2, 2)
+
+    def test_degrees_1_2(self):
+        self._compare(2, 3)
+
+    def test_degrees_1_3(self):
+        self._compare(2, 4)
+
+    def test_degrees_2_2(self):
+        self._compare(3, 3)
+
+    def test_degrees_2_3(self):
+        self._compare(3, 4)
+
+    def test_degrees_3_3(self):
+        self._compare(4, 4)
+
+    def test_batch_invariant(self):
+        random_state = utils.get_random(2)
+        nodes1 = random_state.random_sample((64, 4, 2))
+        nodes2 = random_state.random_sample((64, 4, 2))
+        result = self._call_function_under_test(nodes1, nodes2)
+        for index in six.moves.xrange(nodes1.shape[0]):
+            alone = self._call_function_under_test(
+                nodes1[index:index + 1], nodes2[index:index + 1])
+            self.assertEqual(alone, result[index:index + 1])
+
+    def test_unsupported(self):
+        nodes1 = self.NODES[4]
+        nodes2 = self.NODES[2]
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes1, nodes2)
+
+
 class Test_polynomial_norm(unittest.TestCase):
 
     @staticmethod
@@ -655,6 +793,31 @@ class Test_polynomial_norm(unittest.TestCase):
         self.assertAlmostEqual(result, expected, delta=LOCAL_EPS)
 
 
+class Test__polynomial_norm_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier import _implicitization
+
+        return _implicitization._polynomial_norm_multi(coeffs)
+
+    def test_it(self):
+        from bezier import _implicitization
+
+        coeffs = np.asfortranarray([
+            [2.0, 1.0, 3.0],
+            [1.0, -4.0, 0.5],
+            [0.0, 0.0, 0.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.shape, (3,))
+        for index in (0, 1, 2):
+            # NOTE: The terms are summed in the same order, so the
+            #       values are identical.
+            expected = _implicitization.polynomial_norm(coeffs[index])
+            self.assertEqual(result[index], expected)
+
+
 class Test_roots_in_unit_interval(utils.NumPyTestCase):
 
     @staticmethod
@@ -675,6 +838,41 @@ class Test_roots_in_unit_interval(utils.NumPyTestCase):
                 all_roots[index], expected, delta=LOCAL_EPS)
 
 
+class Test__roots_in_unit_interval_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier import _implicitization
+
+        return _implicitization._roots_in_unit_interval_multi(coeffs)
+
+    def test_it(self):
+        coeffs = np.asfortranarray([
+            # P(t) = (t^2 + 1) (2 t - 1) (3 t - 1) (3 t - 2)
+            [-2.0, 13.0, -29.0, 31.0, -27.0, 18.0],
+            # P(t) = 4 t - 1
+            [-1.0, 4.0, 0.0, 0.0, 0.0, 0.0],
+            # P(t) = t^2 + 1
+            [1.0, 0.0, 1.0, 0.0, 0.0, 0.0],
+            # P(t) = (2 t - 1) (4 t - 3)
+            [3.0, -10.0, 8.0, 0.0, 0.0, 0.0],
+        ])
+        rows, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(rows.tolist(), [0, 0, 0, 1, 3, 3])
+        expected = [
+            2.0 / 6.0, 3.0 / 6.0, 4.0 / 6.0, 0.25, 0.5, 0.75]
+        self.assertTrue(np.allclose(roots, expected, atol=LOCAL_EPS))
+
+    def test_no_roots(self):
+        coeffs = np.asfortranarray([
+            [2.0, 1.0],
+            [-3.0, 1.0],
+        ])
+        rows, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(rows.shape, (0,))
+        self.assertEqual(roots.shape, (0,))
+
+
 class Test__strip_leading_zeros(utils.NumPyTestCase):
 
     @staticmethod
@@ -737,6 +935,61 @@ class Test__check_non_simple(utils.NumPyTestCase):
             self.assertIsNone(self._call_function_under_test(new_coeffs))
 
 
+class Test__non_simple_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier import _implicitization
+
+        return _implicitization._non_simple_multi(coeffs)
+
+    def test_simple(self):
+        coeffs = np.asfortranarray([
+            [2.0, -3.0, 1.0, 0.0],
+            [4.0, 1.0, 0.0, 0.0],
+            [-6.0, 11.0, -6.0, 1.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.tolist(), [False, False, False])
+
+    def test_double_root(self):
+        coeffs = np.asfortranarray([
+            [2.0, -3.0, 1.0],
+            # f(t) = (t - 1)^2
+            [1.0, -2.0, 1.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.tolist(), [False, True])
+
+
+class Test__simple_roots_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier import _implicitization
+
+        return _implicitization._simple_roots_multi(coeffs)
+
+    def test_quadratic(self):
+        coeffs = np.asfortranarray([
+            [2.0, -3.0, 1.0],
+            # f(t) = (t - 1)^2
+            [1.0, -2.0, 1.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.tolist(), [True, False])
+
+    def test_quartic(self):
+        coeffs = np.asfortranarray([
+            # f(t) = (t - 1) (t - 2) (t - 3) (t - 4)
+            [24.0, -50.0, 35.0, -10.0, 1.0],
+            # f(t) = (t + 2)^2 (3 t + 2) (4 t + 19)
+            [152.0, 412.0, 346.0, 113.0, 12.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.tolist(), [True, False])
+
+
 class Test__resolve_and_add(utils.NumPyTestCase):
 
     @staticmethod
@@ -785,6 +1038,86 @@ class Test__resolve_and_add(utils.NumPyTestCase):
         self.assertEqual(final_t, [])
 
 
+class Test__evaluate_curves_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, s_vals):
+        from bezier import _implicitization
+
+        return _implicitization._evaluate_curves_multi(nodes, s_vals)
+
+    def test_it(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 2.0], [3.0, 0.0]],
+            [[1.0, -1.0], [3.0, 0.5], [2.0, 2.0]],
+        ])
+        s_vals = np.asfortranarray([
+            [0.0, 0.5, 1.0],
+            [0.25, 0.75, 1.0],
+        ])
+        result = self._call_function_under_test(nodes, s_vals)
+        expected = np.asarray([
+            [[0.0, 0.0], [1.25, 1.0], [3.0, 0.0]],
+            [[1.8125, -0.25], [2.3125, 1.25], [2.0, 2.0]],
+        ])
+        self.assertTrue(np.allclose(result, expected, atol=LOCAL_EPS))
+
+    def test_shared_params(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [2.0, 4.0]],
+            [[1.0, 1.0], [1.0, -1.0]],
+        ])
+        s_vals = np.asfortranarray([[0.25, 0.5]])
+        result = self._call_function_under_test(nodes, s_vals)
+        expected = np.asarray([
+            [[0.5, 1.0], [1.0, 2.0]],
+            [[1.0, 0.5], [1.0, 0.0]],
+        ])
+        self.assertTrue(np.allclose(result, expected, atol=LOCAL_EPS))
+
+
+class Test__resolve_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes1, s_vals, nodes2, t_vals):
+        from bezier import _implicitization
+
+        return _implicitization._resolve_multi(
+            nodes1, s_vals, nodes2, t_vals)
+
+    def test_it(self):
+        # The first pair of lines intersects at s = t = 1/2 and the
+        # second at s = 1/4, t = 0.
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [1.0, 1.0]],
+            [[0.0, 0.0], [4.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 1.0], [1.0, 0.0]],
+            [[1.0, 0.0], [1.0, 1.0]],
+        ])
+        s_vals = np.asarray([0.5 + 0.5**20, 0.25])
+        t_vals = np.asarray([0.5, -0.5**60])
+        s_vals, t_vals, accepted = self._call_function_under_test(
+            nodes1, s_vals, nodes2, t_vals)
+        self.assertEqual(s_vals.tolist(), [0.5, 0.25])
+        self.assertEqual(t_vals.tolist(), [0.5, 0.0])
+        self.assertEqual(accepted.tolist(), [True, True])
+
+    def test_outside(self):
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [1.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[2.0, -1.0], [2.0, 1.0]],
+        ])
+        s_vals, t_vals, accepted = self._call_function_under_test(
+            nodes1, np.asarray([2.0]), nodes2, np.asarray([0.5]))
+        self.assertEqual(s_vals.tolist(), [2.0])
+        self.assertEqual(t_vals.tolist(), [0.5])
+        self.assertEqual(accepted.tolist(), [False])
+
+
 class Test_intersect_curves(utils.NumPyTestCase):
 
     @staticmethod
@@ -893,6 +1226,134 @@ class Test_intersect_curves(utils.NumPyTestCase):
             self._call_function_under_test(nodes1, nodes2)
 
 
+class Test_intersect_curves_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _implicitization
+
+        return _implicitization.intersect_curves_many(nodes1, nodes2)
+
+    def _compare(self, nodes1, nodes2):
+        from bezier import _implicitization
+
+        pair_indices, st_vals, failed = self._call_function_under_test(
+            nodes1, nodes2)
+        self.assertEqual(st_vals.shape, (len(pair_indices), 2))
+        self.assertEqual(failed.shape, (0,))
+        for index in six.moves.xrange(nodes1.shape[0]):
+            expected = _implicitization.intersect_curves(
+                np.asfortranarray(nodes1[index]),
+                np.asfortranarray(nodes2[index]))
+            self.assertEqual(
+                st_vals[pair_indices == index].tolist(), expected.tolist())
+
+        return pair_indices
+
+    def test_same_as_scalar(self):
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]],
+            [[0.25, 0.4375], [0.625, 1.0], [1.0, 1.0]],
+            [[0.0, 0.0], [1.0, 2.0], [2.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 0.25], [0.5, 0.5], [1.0, 0.25]],
+            [[0.0, 1.0], [0.375, 1.0], [0.75, 0.4375]],
+            [[0.0, 3.0], [1.0, 2.0], [2.0, 3.0]],
+        ])
+        pair_indices = self._compare(nodes1, nodes2)
+        self.assertEqual(pair_indices.tolist(), [0, 0, 1])
+
+    def test_batch_invariant(self):
+        # NOTE: The roots of cubic-cubic "intersection polynomials" are
+        #       sensitive enough to round-off that a pair must not depend
+        #       on the rest of the batch.
+        random_state = utils.get_random(2)
+        nodes1 = random_state.random_sample((64, 4, 2))
+        nodes2 = random_state.random_sample((64, 4, 2))
+        pair_indices, st_vals, _ = self._call_function_under_test(
+            nodes1, nodes2)
+        for index in six.moves.xrange(nodes1.shape[0]):
+            _, alone, _ = self._call_function_under_test(
+                nodes1[index:index + 1], nodes2[index:index + 1])
+            self.assertEqual(
+                alone, np.asfortranarray(st_vals[pair_indices == index, :]))
+
+    def test_degrees_2_1(self):
+        # NOTE: This is the same as ``Test_intersect_curves`` with the
+        #       curves swapped, so s = 1/3, t = 1/2.
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [4.5, 9.0], [9.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 8.0], [6.0, 0.0]],
+        ])
+        pair_indices = self._compare(nodes1, nodes2)
+        self.assertEqual(pair_indices.tolist(), [0])
+
+    def test_reducible(self):
+        # NOTE: The second pair contains a degree-elevated line, so it
+        #       is intersected with ``intersect_curves``.
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]],
+            [[0.0, 0.0], [0.5, 0.5], [1.0, 1.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 0.25], [0.5, 0.5], [1.0, 0.25]],
+            [[0.0, 1.0], [0.5, 1.0], [1.0, 0.0]],
+        ])
+        pair_indices = self._compare(nodes1, nodes2)
+        self.assertEqual(pair_indices.tolist(), [0, 0, 1])
+
+    def test_coincident(self):
+        from bezier import _implicitization
+
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]],
+            [[0.0, 0.0], [1.0, 2.0], [4.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 0.25], [0.5, 0.5], [1.0, 0.25]],
+            [[2.625, 0.75], [4.5, 0.0], [7.5, -3.0]],
+        ])
+        pair_indices, st_vals, failed = self._call_function_under_test(
+            nodes1, nodes2)
+        self.assertEqual(pair_indices.tolist(), [0, 0])
+        expected = _implicitization.intersect_curves(
+            np.asfortranarray(nodes1[0]), np.asfortranarray(nodes2[0]))
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(failed.tolist(), [1])
+
+    def test_tangent(self):
+        from bezier import _implicitization
+
+        # NOTE: The first pair is tangent (at s = t = 1/2), so the
+        #       "intersection polynomial" has a double root.
+        nodes1 = np.asarray([
+            [[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]],
+            [[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]],
+        ])
+        nodes2 = np.asarray([
+            [[0.0, 1.0], [0.5, 0.0], [1.0, 1.0]],
+            [[0.0, 0.25], [0.5, 0.5], [1.0, 0.25]],
+        ])
+        pair_indices, st_vals, failed = self._call_function_under_test(
+            nodes1, nodes2)
+        self.assertEqual(pair_indices.tolist(), [1, 1])
+        expected = _implicitization.intersect_curves(
+            np.asfortranarray(nodes1[1]), np.asfortranarray(nodes2[1]))
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(failed.tolist(), [0])
+
+    def test_empty(self):
+        nodes = np.zeros((0, 3, 2))
+        pair_indices, st_vals, failed = self._call_function_under_test(
+            nodes, nodes)
+        self.assertEqual(pair_indices.shape, (0,))
+        self.assertEqual(st_vals.shape, (0, 2))
+        self.assertEqual(failed.shape, (0,))
+
+
 class Test_normalize_polynomial(utils.NumPyTestCase):
 
     @staticmethod
@@ -936,6 +1397,37 @@ class Test_normalize_polynomial(utils.NumPyTestCase):
         self.assertEqual(result, np.zeros(shape, order='F'))
 
 
+class Test__normalize_polynomial_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(coeffs, **kwargs):
+        from bezier import _implicitization
+
+        return _implicitization._normalize_polynomial_multi(
+            coeffs, **kwargs)
+
+    def test_it(self):
+        from bezier import _implicitization
+
+        coeffs = np.asfortranarray([
+            [2.0, 1.0, 3.0],
+            [1.0, -4.0, 0.5],
+            [1e-20, 0.0, 0.0],
+        ])
+        result = self._call_function_under_test(coeffs)
+        self.assertIsNot(result, coeffs)
+        for index in (0, 1, 2):
+            expected = _implicitization.normalize_polynomial(
+                np.array(coeffs[index]))
+            self.assertEqual(result[index].tolist(), expected.tolist())
+        self.assertEqual(result[2].tolist(), [0.0, 0.0, 0.0])
+
+    def test_threshold(self):
+        coeffs = np.asfortranarray([[1.0, 0.0]])
+        result = self._call_function_under_test(coeffs, threshold=2.0)
+        self.assertEqual(result.tolist(), [[0.0, 0.0]])
+
+
 class Test_poly_to_power_basis(utils.NumPyTestCase):
 
     @staticmethod
@@ -974,6 +1466,34 @@ class Test_poly_to_power_basis(utils.NumPyTestCase):
             self._call_function_under_test(bezier_coeffs)
 
 
+class Test__poly_to_power_basis_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(bezier_coeffs):
+        from bezier import _implicitization
+
+        return _implicitization._poly_to_power_basis_multi(bezier_coeffs)
+
+    def test_it(self):
+        from bezier import _implicitization
+
+        for num_nodes in (1, 2, 3, 4):
+            bezier_coeffs = np.asfortranarray(
+                [[1.0, -2.0, 4.5, 3.0][:num_nodes],
+                 [0.5, 2.0, -1.0, 7.0][:num_nodes]])
+            result = self._call_function_under_test(bezier_coeffs)
+            for index in (0, 1):
+                expected = _implicitization.poly_to_power_basis(
+                    np.array(bezier_coeffs[index]))
+                self.assertEqual(
+                    result[index].tolist(), expected.tolist())
+
+    def test_unsupported(self):
+        bezier_coeffs = np.zeros((2, 5))
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(bezier_coeffs)
+
+
 class Test_locate_point(unittest.TestCase):
 
     @staticmethod
@@ -1026,3 +1546,36 @@ class Test_locate_point(unittest.TestCase):
         ])
         result = self._call_function_under_test(nodes, 0.5, 1.0)
         self.assertIsNone(result)
+
+
+class Test__locate_point_multi(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, x_vals, y_vals):
+        from bezier import _implicitization
+
+        return _implicitization._locate_point_multi(nodes, x_vals, y_vals)
+
+    def test_it(self):
+        # NOTE: These are the curves from ``Test_locate_point``.
+        nodes = np.asarray([
+            [[0.0, 3.0], [1.0, 2.0], [3.0, 0.0]],
+            [[0.0, 0.0], [1.0, 1.0], [3.0, 0.0]],
+            [[0.0, 0.0], [1.0, 1.0], [3.0, 0.0]],
+            [[0.0, 1.0], [0.0, 3.0], [0.0, 5.0]],
+        ])
+        x_vals = np.asarray([1.25, 4.0, 0.5, 0.0])
+        y_vals = np.asarray([1.75, 0.25, 1.0, 1.5])
+        result = self._call_function_under_test(nodes, x_vals, y_vals)
+        self.assertEqual(result[0], 0.5)
+        self.assertTrue(np.isnan(result[1]))
+        self.assertTrue(np.isnan(result[2]))
+        self.assertEqual(result[3], 0.125)
+
+    def test_elevated_swap(self):
+        nodes = np.asarray([
+            [[0.0, 1.0], [1.0, 2.0], [1.0, 3.0], [2.0, 4.0]],
+        ])
+        result = self._call_function_under_test(
+            nodes, np.asarray([1.40625]), np.asarray([3.25]))
+        self.assertEqual(result.tolist(), [0.75])
@@ -140,6 +140,41 @@ class Test_speedup_bbox_intersect(Test__bbox_intersect):
         return _speedup.speedup.bbox_intersect(nodes1, nodes2)
 
 
+class Test_box_intersect(unittest.TestCase):
+
+    UNIT_SQUARE = (0.0, 1.0, 0.0, 1.0)
+
+    @staticmethod
+    def _call_function_under_test(box1, box2):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers.box_intersect(box1, box2)
+
+    def test_intersect(self):
+        from bezier import _intersection_helpers
+
+        result = self._call_function_under_test(
+            self.UNIT_SQUARE, (0.5, 1.5, 0.5, 1.5))
+        expected = _intersection_helpers.BoxIntersectionType.INTERSECTION
+        self.assertEqual(result, expected)
+
+    def test_tangent(self):
+        from bezier import _intersection_helpers
+
+        result = self._call_function_under_test(
+            self.UNIT_SQUARE, (1.0, 2.0, 0.0, 1.0))
+        expected = _intersection_helpers.BoxIntersectionType.TANGENT
+        self.assertEqual(result, expected)
+
+    def test_disjoint(self):
+        from bezier import _intersection_helpers
+
+        result = self._call_function_under_test(
+            self.UNIT_SQUARE, (1.0, 2.0, 1.5, 2.5))
+        expected = _intersection_helpers.BoxIntersectionType.DISJOINT
+        self.assertEqual(result, expected)
+
+
 class Test__linearization_error(unittest.TestCase):
 
     @staticmethod
@@ -1036,126 +1071,6 @@ class Test__tangent_bbox_intersection(utils.NumPyTestCase):
                            curve1, curve2, 1.0, 0.0)
 
 
-class Test_intersect_one_round(utils.NumPyTestCase):
-
-    # NOTE: NODES1 is a specialization of [0, 0], [1/2, 1], [1, 1]
-    #       onto the interval [1/4, 1].
-    NODES1 = np.asfortranarray([
-        [0.25, 0.4375],
-        [0.625, 1.0],
-        [1.0, 1.0],
-    ])
-    # NOTE: NODES2 is a specialization of [0, 1], [1/2, 1], [1, 0]
-    #       onto the interval [0, 3/4].
-    NODES2 = np.asfortranarray([
-        [0.0, 1.0],
-        [0.375, 1.0],
-        [0.75, 0.4375],
-    ])
-    LINE1 = np.asfortranarray([
-        [0.0, 0.0],
-        [1.0, 1.0],
-    ])
-    LINE2 = np.asfortranarray([
-        [0.0, 1.0],
-        [1.0, 0.0],
-    ])
-
-    @staticmethod
-    def _call_function_under_test(candidates, intersections):
-        from bezier import _intersection_helpers
-
-        return _intersection_helpers.intersect_one_round(
-            candidates, intersections)
-
-    def test_simple(self):
-        import bezier
-
-        curve1 = bezier.Curve(self.NODES1, degree=2)
-        curve2 = bezier.Curve(self.NODES2, degree=2)
-        candidates = [(curve1, curve2)]
-        accepted = self._call_function_under_test(
-            candidates, [])
-
-        self.assertEqual(accepted, [(curve1, curve2)])
-
-    def test_first_linearized(self):
-        import bezier
-        from bezier import _intersection_helpers
-
-        curve1 = bezier.Curve(self.LINE1, degree=1)
-        lin1 = _intersection_helpers.Linearization(curve1, 0.0)
-        curve2 = bezier.Curve(self.LINE2, degree=1)
-
-        intersections = []
-        accepted = self._call_function_under_test(
-            [(lin1, curve2)], intersections)
-
-        self.assertEqual(intersections, [])
-        self.assertEqual(accepted, [(lin1, curve2)])
-
-    def test_second_linearized(self):
-        import bezier
-        from bezier import _intersection_helpers
-
-        curve1 = bezier.Curve(self.LINE1, degree=1)
-        curve2 = bezier.Curve(self.LINE2, degree=1)
-        lin2 = _intersection_helpers.Linearization(curve2, 0.0)
-
-        intersections = []
-        accepted = self._call_function_under_test(
-            [(curve1, lin2)], intersections)
-
-        self.assertEqual(intersections, [])
-        self.assertEqual(accepted, [(curve1, lin2)])
-
-    def test_both_linearized(self):
-        import bezier
-        from bezier import _intersection_helpers
-
-        curve1 = bezier.Curve(self.LINE1, degree=1)
-        lin1 = _intersection_helpers.Linearization(curve1, 0.0)
-        curve2 = bezier.Curve(self.LINE2, degree=1)
-        lin2 = _intersection_helpers.Linearization(curve2, 0.0)
-
-        intersections = []
-        accepted = self._call_function_under_test(
-            [(lin1, lin2)], intersections)
-        self.assertEqual(accepted, [])
-        self.assertEqual(len(intersections), 1)
-        intersection = intersections[0]
-        expected = np.asfortranarray([[0.5, 0.5]])
-        check_intersection(self, intersection, expected,
-                           curve1, curve2, 0.5, 0.5)
-
-
-class Test__next_candidates(unittest.TestCase):
-
-    @staticmethod
-    def _call_function_under_test(first, second):
-        from bezier import _intersection_helpers
-
-        return _intersection_helpers._next_candidates(first, second)
-
-    def test_it(self):
-        import itertools
-        import bezier
-        from bezier import _intersection_helpers
-
-        nodes = np.asfortranarray([
-            [0.0, 0.0],
-            [1.0, 1.0],
-        ])
-        curve = bezier.Curve(nodes, degree=1)
-        lin = _intersection_helpers.Linearization(curve, 0.0)
-
-        result = self._call_function_under_test(lin, lin)
-
-        self.assertIsInstance(result, itertools.product)
-        pairs = list(result)
-        self.assertEqual(pairs, [(lin, lin)])
-
-
 class Test__all_intersections_geometric(utils.NumPyTestCase):
 
     @staticmethod
@@ -1165,17 +1080,43 @@ class Test__all_intersections_geometric(utils.NumPyTestCase):
         return _intersection_helpers._all_intersections_geometric(candidates)
 
     def test_failure(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
         patch = mock.patch(
             'bezier._intersection_helpers._MAX_INTERSECT_SUBDIVISIONS',
             new=-1)
         with patch:
             with self.assertRaises(ValueError):
-                self._call_function_under_test([])
+                self._call_function_under_test([(curve, curve)])
 
     def test_no_intersections(self):
         intersections = self._call_function_under_test([])
         self.assertEqual(intersections, [])
 
+    def test_single_disjoint(self):
+        import bezier
+
+        curve1 = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
+        curve2 = bezier.Curve.from_nodes(np.asfortranarray([
+            [2.0, 0.0],
+            [3.0, 1.0],
+        ]))
+        # Make sure the candidate blocks are never built.
+        patch = mock.patch(
+            'bezier._intersection_multi._all_intersections_pool',
+            side_effect=AssertionError)
+        with patch:
+            intersections = self._call_function_under_test(
+                [(curve1, curve2)])
+        self.assertEqual(intersections, [])
+
     def test_tangent(self):
         import itertools
         import bezier
@@ -1202,6 +1143,36 @@ class Test__all_intersections_geometric(utils.NumPyTestCase):
         with self.assertRaises(NotImplementedError):
             self._call_function_under_test(candidates)
 
+    def test_stats(self):
+        import bezier
+
+        nodes1 = np.asfortranarray([
+            [0.25, 0.4375],
+            [0.625, 1.0],
+            [1.0, 1.0],
+        ])
+        curve1 = bezier.Curve(nodes1, degree=2)
+        nodes2 = np.asfortranarray([
+            [0.0, 1.0],
+            [0.375, 1.0],
+            [0.75, 0.4375],
+        ])
+        curve2 = bezier.Curve(nodes2, degree=2)
+
+        with bezier.stats.collect() as stats:
+            intersections = self._call_function_under_test(
+                [(curve1, curve2)])
+
+        self.assertEqual(len(intersections), 1)
+        expected = {
+            'intersect.rounds': 13,
+            'intersect.candidates': 49,
+            'intersect.accepted': 12,
+            'intersect.max_accepted': 1,
+            'intersect.newton_steps': 1,
+        }
+        self.assertEqual(stats.counters, expected)
+
     def test_success(self):
         import bezier
 
@@ -1239,13 +1210,29 @@ class Test__all_intersections_geometric(utils.NumPyTestCase):
                            curve1, curve2, s_val, t_val)
 
 
-class Test__all_intersections_algebraic(utils.NumPyTestCase):
+class Test__intersect_geometric_many(utils.NumPyTestCase):
 
     @staticmethod
     def _call_function_under_test(candidates):
         from bezier import _intersection_helpers
 
-        return _intersection_helpers._all_intersections_algebraic(candidates)
+        return _intersection_helpers._intersect_geometric_many(candidates)
+
+    def test_failure(self):
+        import bezier
+
+        curve = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
+        patch = mock.patch(
+            'bezier._intersection_helpers._MAX_INTERSECT_SUBDIVISIONS',
+            new=-1)
+        with patch:
+            intersections = self._call_function_under_test([(curve, curve)])
+
+        self.assertEqual(len(intersections), 1)
+        self.assertIsInstance(intersections[0], ValueError)
 
     def test_no_intersections(self):
         intersections = self._call_function_under_test([])
@@ -1254,67 +1241,819 @@ class Test__all_intersections_algebraic(utils.NumPyTestCase):
     def test_success(self):
         import bezier
 
-        # NOTE: ``nodes1`` is a specialization of [0, 0], [1/2, 1], [1, 1]
-        #       onto the interval [1/4, 1] and ``nodes`` is a specialization
-        #       of [0, 1], [1/2, 1], [1, 0] onto the interval [0, 3/4].
-        #       We expect them to intersect at s = 1/3, t = 2/3, which is
-        #       the point [1/2, 3/4].
-        nodes1 = np.asfortranarray([
+        # NOTE: ``curve1`` and ``curve2`` are the same as in
+        #       ``Test__all_intersections_geometric.test_success``.
+        curve1 = bezier.Curve(np.asfortranarray([
             [0.25, 0.4375],
             [0.625, 1.0],
             [1.0, 1.0],
-        ])
-        curve1 = bezier.Curve(nodes1, degree=2, _copy=False)
-
-        nodes2 = np.asfortranarray([
+        ]), degree=2)
+        curve2 = bezier.Curve(np.asfortranarray([
             [0.0, 1.0],
             [0.375, 1.0],
             [0.75, 0.4375],
-        ])
-        curve2 = bezier.Curve(nodes2, degree=2, _copy=False)
+        ]), degree=2)
+        line1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1)
+        line2 = bezier.Curve(np.asfortranarray([
+            [2.0, 0.0],
+            [3.0, 1.0],
+        ]), degree=1)
 
-        candidates = [(curve1, curve2)]
+        candidates = [(curve1, curve2), (line1, line2), (curve2, curve1)]
         intersections = self._call_function_under_test(candidates)
+        self.assertEqual(len(intersections), 3)
 
-        self.assertEqual(len(intersections), 1)
-        intersection = intersections[0]
-        expected = np.asfortranarray([[0.5, 0.75]])
+        # Make sure the batched result agrees with the single pair version.
+        from bezier import _intersection_helpers
+        for pair, pair_intersections in zip(candidates, intersections):
+            expected = _intersection_helpers._all_intersections_geometric(
+                [pair])
+            self.assertEqual(len(pair_intersections), len(expected))
+            for intersection, expected_int in zip(
+                    pair_intersections, expected):
+                self.assertIs(intersection.first, expected_int.first)
+                self.assertEqual(intersection.s, expected_int.s)
+                self.assertIs(intersection.second, expected_int.second)
+                self.assertEqual(intersection.t, expected_int.t)
 
-        s_val = 1.0 / 3.0
-        t_val = 2.0 / 3.0
-        check_intersection(self, intersection, expected,
-                           curve1, curve2, s_val, t_val)
+        self.assertEqual(len(intersections[0]), 1)
+        self.assertEqual(intersections[1], [])
+        self.assertEqual(len(intersections[2]), 1)
 
 
-class Test_all_intersections(utils.NumPyTestCase):
+class Test__curve_intersections_py(utils.NumPyTestCase):
 
     @staticmethod
-    def _call_function_under_test(candidates, **kwargs):
+    def _call_function_under_test(nodes1, nodes2):
         from bezier import _intersection_helpers
 
-        return _intersection_helpers.all_intersections(candidates, **kwargs)
+        return _intersection_helpers._curve_intersections_py(nodes1, nodes2)
 
-    def test_geometric(self):
-        from bezier import _intersection_helpers
+    def _check(self, nodes1, nodes2, expected):
+        st_vals, num_intersections = self._call_function_under_test(
+            nodes1, nodes2)
+        self.assertEqual(num_intersections, expected.shape[0])
+        self.assertEqual(
+            np.asfortranarray(st_vals[:num_intersections, :]), expected)
 
-        strategy = _intersection_helpers.IntersectionStrategy.geometric
-        patch = mock.patch(
-            'bezier._intersection_helpers._all_intersections_geometric',
-            return_value=mock.sentinel.intersections)
-        with patch as mocked:
-            result = self._call_function_under_test(
-                mock.sentinel.candidates, strategy=strategy)
-            self.assertIs(result, mock.sentinel.intersections)
-            mocked.assert_called_once_with(mock.sentinel.candidates)
+    def test_curve_and_line(self):
+        nodes1 = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        nodes2 = np.asfortranarray([
+            [0.0, 0.5],
+            [1.0, 0.5],
+        ])
+        expected = np.asfortranarray([[0.5, 0.5]])
+        self._check(nodes1, nodes2, expected)
 
-    def test_algebraic(self):
-        from bezier import _intersection_helpers
+    def test_shared_endpoint(self):
+        nodes1 = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        nodes2 = np.asfortranarray([
+            [1.0, 1.0],
+            [2.0, 0.0],
+        ])
+        expected = np.asfortranarray([[1.0, 0.0]])
+        self._check(nodes1, nodes2, expected)
 
-        strategy = _intersection_helpers.IntersectionStrategy.algebraic
-        patch = mock.patch(
-            'bezier._intersection_helpers._all_intersections_algebraic',
-            return_value=mock.sentinel.intersections)
-        with patch as mocked:
+    def test_no_intersections(self):
+        nodes1 = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        nodes2 = np.asfortranarray([
+            [0.0, 2.0],
+            [1.0, 2.0],
+        ])
+        expected = np.zeros((0, 2), order='F')
+        self._check(nodes1, nodes2, expected)
+
+    def test_parallel(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes, nodes)
+
+    def test_too_many_candidates(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        # A curve matched with itself is "all" intersection.
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test(nodes, nodes)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(len(exc_args), 1)
+        self.assertTrue(exc_args[0].startswith(
+            'The number of candidate intersections is too high.'))
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test__curve_intersections_speedup(Test__curve_intersections_py):
+
+    NODES1 = np.asfortranarray([
+        [0.0, 0.0],
+        [0.5, 1.0],
+        [1.0, 0.0],
+    ])
+    NODES2 = np.asfortranarray([
+        [0.0, 0.25],
+        [1.0, 0.25],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._curve_intersections_speedup(
+            nodes1, nodes2)
+
+    def test_counts_missed(self):
+        from bezier import _speedup
+
+        st_vals, num_intersections = _speedup.speedup.curve_intersections(
+            self.NODES1, self.NODES2, max_intersections=1)
+        self.assertEqual(st_vals.shape, (1, 2))
+        self.assertEqual(num_intersections, 2)
+
+    def test_grows_buffer(self):
+        from bezier import _speedup
+
+        def curve_intersections(nodes1, nodes2, max_intersections=1):
+            return _speedup.speedup.curve_intersections(
+                nodes1, nodes2, max_intersections=max_intersections)
+
+        fake_speedup = mock.Mock(spec=['speedup'])
+        fake_speedup.speedup.curve_intersections = mock.Mock(
+            side_effect=curve_intersections)
+        patch = mock.patch(
+            'bezier._intersection_helpers._speedup', new=fake_speedup)
+        with patch:
+            st_vals, num_intersections = self._call_function_under_test(
+                self.NODES1, self.NODES2)
+
+        self.assertEqual(num_intersections, 2)
+        self.assertEqual(
+            fake_speedup.speedup.curve_intersections.call_count, 2)
+        expected, _ = _speedup.speedup.curve_intersections(
+            self.NODES1, self.NODES2)
+        self.assertEqual(st_vals, np.asfortranarray(expected[:2, :]))
+
+
+class Test__all_intersections_pairwise(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._all_intersections_pairwise(candidates)
+
+    def test_no_intersections(self):
+        intersections = self._call_function_under_test([])
+        self.assertEqual(intersections, [])
+
+    def test_subcurve(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        curve = bezier.Curve(nodes, degree=2)
+        # NOTE: ``right`` is the curve on the interval [1/2, 1].
+        _, right = curve.subdivide()
+        line = bezier.Curve(np.asfortranarray([
+            [0.75, 0.0],
+            [0.75, 1.0],
+        ]), degree=1)
+
+        intersections = self._call_function_under_test([(right, line)])
+        self.assertEqual(len(intersections), 1)
+        expected = np.asfortranarray([[0.75, 0.375]])
+        check_intersection(self, intersections[0], expected,
+                           curve, line, 0.75, 0.375)
+
+    def test_linearization(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1)
+        curve2 = bezier.Curve(np.asfortranarray([
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]), degree=1)
+        lin1 = _intersection_helpers.Linearization.from_shape(curve1)
+        lin2 = _intersection_helpers.Linearization.from_shape(curve2)
+
+        intersections = self._call_function_under_test(
+            [(lin1, lin2), (curve1, curve2)])
+        # NOTE: The duplicate from the second pair is not added.
+        self.assertEqual(len(intersections), 1)
+        expected = np.asfortranarray([[0.5, 0.5]])
+        check_intersection(self, intersections[0], expected,
+                           curve1, curve2, 0.5, 0.5)
+
+
+class Test__intersect_or_error(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(intersect, pair):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._intersect_or_error(intersect, pair)
+
+    def test_success(self):
+        pair = (mock.sentinel.curve1, mock.sentinel.curve2)
+        intersect = mock.Mock(return_value=mock.sentinel.intersections)
+        result = self._call_function_under_test(intersect, pair)
+        self.assertIs(result, mock.sentinel.intersections)
+        intersect.assert_called_once_with([pair])
+
+    def test_failure(self):
+        pair = (mock.sentinel.curve1, mock.sentinel.curve2)
+        for exc in (NotImplementedError('a'), ValueError('b')):
+            intersect = mock.Mock(side_effect=exc)
+            self.assertIs(self._call_function_under_test(intersect, pair), exc)
+
+        # Any other error is not caught.
+        intersect = mock.Mock(side_effect=TypeError)
+        with self.assertRaises(TypeError):
+            self._call_function_under_test(intersect, pair)
+
+
+class Test__intersect_pairwise_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._intersect_pairwise_many(candidates)
+
+    def test_it(self):
+        import bezier
+
+        curve1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1)
+        curve2 = bezier.Curve(np.asfortranarray([
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]), degree=1)
+        curve3 = bezier.Curve(np.asfortranarray([
+            [2.0, 0.0],
+            [3.0, 1.0],
+        ]), degree=1)
+
+        candidates = [(curve1, curve2), (curve1, curve3), (curve2, curve1)]
+        intersections = self._call_function_under_test(candidates)
+        self.assertEqual(len(intersections), 3)
+
+        expected = np.asfortranarray([[0.5, 0.5]])
+        self.assertEqual(len(intersections[0]), 1)
+        check_intersection(self, intersections[0][0], expected,
+                           curve1, curve2, 0.5, 0.5)
+        self.assertEqual(intersections[1], [])
+        self.assertEqual(len(intersections[2]), 1)
+        check_intersection(self, intersections[2][0], expected,
+                           curve2, curve1, 0.5, 0.5)
+
+    def test_failure(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2)
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [1.0, 0.25],
+        ]), degree=1)
+
+        # A curve matched with itself is "all" intersection.
+        candidates = [(curve, curve), (curve, line)]
+        intersections = self._call_function_under_test(candidates)
+        self.assertEqual(len(intersections), 2)
+        self.assertIsInstance(intersections[0], NotImplementedError)
+        self.assertEqual(len(intersections[1]), 2)
+
+
+class Test__uses_subdivision_cache(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._uses_subdivision_cache(candidates)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        curve1 = bezier.Curve(nodes, degree=1)
+        curve2 = bezier.Curve(nodes, degree=1)
+        self.assertFalse(self._call_function_under_test([]))
+        self.assertFalse(self._call_function_under_test([(curve1, curve2)]))
+        curve2.enable_subdivision_cache()
+        self.assertTrue(self._call_function_under_test([(curve1, curve2)]))
+
+    def test_linearized(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        curve = bezier.Curve(nodes, degree=1)
+        curve.enable_subdivision_cache()
+        lin = _intersection_helpers.Linearization(curve, 0.0)
+        self.assertFalse(self._call_function_under_test([(lin, lin)]))
+
+
+class Test__intersect_one_round(utils.NumPyTestCase):
+
+    # NOTE: NODES1 is a specialization of [0, 0], [1/2, 1], [1, 1]
+    #       onto the interval [1/4, 1].
+    NODES1 = np.asfortranarray([
+        [0.25, 0.4375],
+        [0.625, 1.0],
+        [1.0, 1.0],
+    ])
+    # NOTE: NODES2 is a specialization of [0, 1], [1/2, 1], [1, 0]
+    #       onto the interval [0, 3/4].
+    NODES2 = np.asfortranarray([
+        [0.0, 1.0],
+        [0.375, 1.0],
+        [0.75, 0.4375],
+    ])
+    LINE1 = np.asfortranarray([
+        [0.0, 0.0],
+        [1.0, 1.0],
+    ])
+    LINE2 = np.asfortranarray([
+        [0.0, 1.0],
+        [1.0, 0.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(candidates, intersections):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._intersect_one_round(
+            candidates, intersections)
+
+    def test_simple(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        curve2 = bezier.Curve(self.NODES2, degree=2)
+        candidates = [(curve1, curve2)]
+        accepted = self._call_function_under_test(candidates, [])
+
+        self.assertEqual(accepted, [(curve1, curve2)])
+        # The bounding boxes are cached on each curve.
+        self.assertIsNotNone(curve1._bbox)
+        self.assertIsNotNone(curve2._bbox)
+
+    def test_disjoint(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        curve2 = bezier.Curve(self.NODES2 - 2.0, degree=2)
+        accepted = self._call_function_under_test([(curve1, curve2)], [])
+        self.assertEqual(accepted, [])
+
+    def test_tangent(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        nodes2 = np.asfortranarray([
+            [1.0, 1.0],
+            [1.5, 2.0],
+            [2.0, 1.5],
+        ])
+        curve2 = bezier.Curve(nodes2, degree=2)
+        intersections = []
+        accepted = self._call_function_under_test(
+            [(curve1, curve2)], intersections)
+
+        self.assertEqual(accepted, [])
+        self.assertEqual(len(intersections), 1)
+        intersection = intersections[0]
+        self.assertEqual(intersection.s, 1.0)
+        self.assertEqual(intersection.t, 0.0)
+
+    def test_first_linearized(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(self.LINE1, degree=1)
+        lin1 = _intersection_helpers.Linearization(curve1, 0.0)
+        curve2 = bezier.Curve(self.LINE2, degree=1)
+
+        intersections = []
+        accepted = self._call_function_under_test(
+            [(lin1, curve2)], intersections)
+
+        self.assertEqual(intersections, [])
+        self.assertEqual(accepted, [(lin1, curve2)])
+
+    def test_second_linearized(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(self.LINE1, degree=1)
+        curve2 = bezier.Curve(self.LINE2, degree=1)
+        lin2 = _intersection_helpers.Linearization(curve2, 0.0)
+
+        intersections = []
+        accepted = self._call_function_under_test(
+            [(curve1, lin2)], intersections)
+
+        self.assertEqual(intersections, [])
+        self.assertEqual(accepted, [(curve1, lin2)])
+
+    def test_both_linearized(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(self.LINE1, degree=1)
+        lin1 = _intersection_helpers.Linearization(curve1, 0.0)
+        curve2 = bezier.Curve(self.LINE2, degree=1)
+        lin2 = _intersection_helpers.Linearization(curve2, 0.0)
+
+        intersections = []
+        accepted = self._call_function_under_test(
+            [(lin1, lin2)], intersections)
+        self.assertEqual(accepted, [])
+        self.assertEqual(len(intersections), 1)
+        intersection = intersections[0]
+        expected = np.asfortranarray([[0.5, 0.5]])
+        check_intersection(self, intersection, expected,
+                           curve1, curve2, 0.5, 0.5)
+
+
+class Test__next_candidates(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(first, second):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._next_candidates(first, second)
+
+    def test_it(self):
+        import itertools
+
+        import bezier
+        from bezier import _intersection_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        curve = bezier.Curve(nodes, degree=1)
+        lin = _intersection_helpers.Linearization(curve, 0.0)
+
+        result = self._call_function_under_test(lin, lin)
+
+        self.assertIsInstance(result, itertools.product)
+        pairs = list(result)
+        self.assertEqual(pairs, [(lin, lin)])
+
+
+class Test__all_intersections_cached(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._all_intersections_cached(candidates)
+
+    def test_failure(self):
+        patch = mock.patch(
+            'bezier._intersection_helpers._MAX_INTERSECT_SUBDIVISIONS',
+            new=-1)
+        with patch:
+            with self.assertRaises(ValueError):
+                self._call_function_under_test([])
+
+    def test_no_intersections(self):
+        intersections = self._call_function_under_test([])
+        self.assertEqual(intersections, [])
+
+    def test_tangent(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        curve = bezier.Curve(nodes, degree=2)
+        curve.enable_subdivision_cache()
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test([(curve, curve)])
+
+    def test_cache_hits(self):
+        import bezier
+
+        # NOTE: These are the same curves as in the ``test_success`` case
+        #       for ``_all_intersections_geometric``.
+        nodes1 = np.asfortranarray([
+            [0.25, 0.4375],
+            [0.625, 1.0],
+            [1.0, 1.0],
+        ])
+        curve1 = bezier.Curve(nodes1, degree=2)
+        nodes2 = np.asfortranarray([
+            [0.0, 1.0],
+            [0.375, 1.0],
+            [0.75, 0.4375],
+        ])
+        curve2 = bezier.Curve(nodes2, degree=2)
+        cache1 = curve1.enable_subdivision_cache()
+        cache2 = curve2.enable_subdivision_cache()
+
+        candidates = [(curve1, curve2)]
+        intersections = self._call_function_under_test(candidates)
+        self.assertEqual(len(intersections), 1)
+        intersection = intersections[0]
+        self.assertIs(intersection.first, curve1)
+        self.assertIs(intersection.second, curve2)
+        self.assertEqual(
+            (intersection.s, intersection.t),
+            (1.0 / 3.0 + SPACING(1.0 / 3.0), 2.0 / 3.0))
+        num_entries = (len(cache1), len(cache2))
+        self.assertGreater(min(num_entries), 0)
+
+        # A second call doesn't need to subdivide at all.
+        patch = mock.patch.object(
+            bezier.Curve, '_subdivide', side_effect=AssertionError)
+        with patch:
+            new_intersections = self._call_function_under_test(candidates)
+
+        self.assertEqual(len(new_intersections), 1)
+        self.assertEqual(
+            (new_intersections[0].s, new_intersections[0].t),
+            (intersection.s, intersection.t))
+        self.assertEqual((len(cache1), len(cache2)), num_entries)
+
+
+class Test__all_intersections_algebraic(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._all_intersections_algebraic(candidates)
+
+    def test_no_intersections(self):
+        intersections = self._call_function_under_test([])
+        self.assertEqual(intersections, [])
+
+    def test_success(self):
+        import bezier
+
+        # NOTE: ``nodes1`` is a specialization of [0, 0], [1/2, 1], [1, 1]
+        #       onto the interval [1/4, 1] and ``nodes`` is a specialization
+        #       of [0, 1], [1/2, 1], [1, 0] onto the interval [0, 3/4].
+        #       We expect them to intersect at s = 1/3, t = 2/3, which is
+        #       the point [1/2, 3/4].
+        nodes1 = np.asfortranarray([
+            [0.25, 0.4375],
+            [0.625, 1.0],
+            [1.0, 1.0],
+        ])
+        curve1 = bezier.Curve(nodes1, degree=2, _copy=False)
+
+        nodes2 = np.asfortranarray([
+            [0.0, 1.0],
+            [0.375, 1.0],
+            [0.75, 0.4375],
+        ])
+        curve2 = bezier.Curve(nodes2, degree=2, _copy=False)
+
+        candidates = [(curve1, curve2)]
+        intersections = self._call_function_under_test(candidates)
+
+        self.assertEqual(len(intersections), 1)
+        intersection = intersections[0]
+        expected = np.asfortranarray([[0.5, 0.75]])
+
+        s_val = 1.0 / 3.0
+        t_val = 2.0 / 3.0
+        check_intersection(self, intersection, expected,
+                           curve1, curve2, s_val, t_val)
+
+
+class Test__group_by_degrees(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._group_by_degrees(candidates)
+
+    def test_it(self):
+        import bezier
+
+        quadratic = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2, _copy=False)
+        line1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [1.0, 0.25],
+        ]), degree=1, _copy=False)
+        line2 = bezier.Curve(np.asfortranarray([
+            [5.0, 5.0],
+            [6.0, 6.0],
+        ]), degree=1, _copy=False)
+        candidates = [
+            (quadratic, line1),
+            (line1, quadratic),
+            # The bounding boxes are disjoint.
+            (quadratic, line2),
+            (quadratic, line1),
+        ]
+        groups = self._call_function_under_test(candidates)
+        self.assertEqual(list(groups.keys()), [(2, 1), (1, 2)])
+        self.assertEqual(groups[(2, 1)], (
+            [0, 3], [(quadratic, line1), (quadratic, line1)]))
+        self.assertEqual(groups[(1, 2)], ([1], [(line1, quadratic)]))
+
+
+class Test__intersect_algebraic_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers._intersect_algebraic_many(candidates)
+
+    def test_no_candidates(self):
+        self.assertEqual(self._call_function_under_test([]), [])
+
+    def test_same_as_single(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        quadratic1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2, _copy=False)
+        quadratic2 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [0.5, 0.5],
+            [1.0, 0.25],
+        ]), degree=2, _copy=False)
+        line1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [1.0, 0.25],
+        ]), degree=1, _copy=False)
+        line2 = bezier.Curve(np.asfortranarray([
+            [5.0, 5.0],
+            [6.0, 6.0],
+        ]), degree=1, _copy=False)
+        candidates = [
+            (quadratic1, quadratic2),
+            (quadratic1, line1),
+            # The bounding boxes are disjoint.
+            (quadratic1, line2),
+            (line1, quadratic2),
+        ]
+        result = self._call_function_under_test(candidates)
+
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[2], [])
+        for pair, intersections in zip(candidates, result):
+            expected = _intersection_helpers._all_intersections_algebraic(
+                [pair])
+            self.assertEqual(len(intersections), len(expected))
+            for intersection, expected_int in zip(intersections, expected):
+                self.assertIs(intersection.first, pair[0])
+                self.assertIs(intersection.second, pair[1])
+                self.assertEqual(intersection.s, expected_int.s)
+                self.assertEqual(intersection.t, expected_int.t)
+
+    def test_grouped(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1, _copy=False)
+        candidates = [(curve, curve), (curve, curve)]
+        patch = mock.patch(
+            'bezier._implicitization.intersect_curves_many',
+            return_value=(
+                np.asarray([1]), np.asfortranarray([[0.5, 0.25]]),
+                np.asarray([], dtype=int)))
+        with patch as mocked:
+            result = self._call_function_under_test(candidates)
+            self.assertEqual(mocked.call_count, 1)
+
+        self.assertEqual(result[0], [])
+        intersection, = result[1]
+        self.assertEqual(intersection.s, 0.5)
+        self.assertEqual(intersection.t, 0.25)
+
+    def test_failed(self):
+        import bezier
+
+        quadratic1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2, _copy=False)
+        quadratic2 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [0.5, 0.5],
+            [1.0, 0.25],
+        ]), degree=2, _copy=False)
+        # A curve matched with itself is "all" intersection.
+        candidates = [(quadratic1, quadratic1), (quadratic1, quadratic2)]
+        result = self._call_function_under_test(candidates)
+
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], NotImplementedError)
+        # NOTE: The failure of the first pair doesn't stop the second.
+        self.assertEqual(len(result[1]), 2)
+
+
+class Test_all_intersections(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates, **kwargs):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers.all_intersections(candidates, **kwargs)
+
+    def test_geometric(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve = bezier.Curve(np.asfortranarray([[0.0, 0.0], [1.0, 1.0]]), 1)
+        candidates = [(curve, curve)]
+        strategy = _intersection_helpers.IntersectionStrategy.geometric
+        patch = mock.patch(
+            'bezier._intersection_helpers._geometric_intersections',
+            return_value=mock.sentinel.intersections)
+        with patch as mocked:
+            result = self._call_function_under_test(
+                iter(candidates), strategy=strategy)
+            self.assertIs(result, mock.sentinel.intersections)
+            mocked.assert_called_once_with(candidates)
+
+    def test_geometric_cached(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve = bezier.Curve(np.asfortranarray([[0.0, 0.0], [1.0, 1.0]]), 1)
+        curve.enable_subdivision_cache()
+        candidates = [(curve, curve)]
+        strategy = _intersection_helpers.IntersectionStrategy.geometric
+        patch = mock.patch(
+            'bezier._intersection_helpers._all_intersections_cached',
+            return_value=mock.sentinel.intersections)
+        with patch as mocked:
+            result = self._call_function_under_test(
+                candidates, strategy=strategy)
+            self.assertIs(result, mock.sentinel.intersections)
+            mocked.assert_called_once_with(candidates)
+
+    def test_algebraic(self):
+        from bezier import _intersection_helpers
+
+        strategy = _intersection_helpers.IntersectionStrategy.algebraic
+        patch = mock.patch(
+            'bezier._intersection_helpers._all_intersections_algebraic',
+            return_value=mock.sentinel.intersections)
+        with patch as mocked:
             result = self._call_function_under_test(
                 mock.sentinel.candidates, strategy=strategy)
             self.assertIs(result, mock.sentinel.intersections)
@@ -1325,6 +2064,74 @@ class Test_all_intersections(utils.NumPyTestCase):
             self._call_function_under_test(None, strategy=None)
 
 
+class Test_all_intersections_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates, **kwargs):
+        from bezier import _intersection_helpers
+
+        return _intersection_helpers.all_intersections_many(
+            candidates, **kwargs)
+
+    def test_geometric(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve = bezier.Curve(np.asfortranarray([[0.0, 0.0], [1.0, 1.0]]), 1)
+        candidates = [(curve, curve)]
+        strategy = _intersection_helpers.IntersectionStrategy.geometric
+        patch = mock.patch(
+            'bezier._intersection_helpers._geometric_intersections_many',
+            return_value=mock.sentinel.intersections)
+        with patch as mocked:
+            result = self._call_function_under_test(
+                candidates, strategy=strategy)
+            self.assertIs(result, mock.sentinel.intersections)
+            mocked.assert_called_once_with(candidates)
+
+    def test_geometric_cached(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(np.asfortranarray([[0.0, 0.0], [1.0, 1.0]]), 1)
+        curve2 = bezier.Curve(np.asfortranarray([[0.0, 1.0], [1.0, 0.0]]), 1)
+        curve2.enable_subdivision_cache()
+        candidates = [(curve1, curve2), (curve2, curve1)]
+        strategy = _intersection_helpers.IntersectionStrategy.geometric
+        patch = mock.patch(
+            'bezier._intersection_helpers._all_intersections_cached',
+            side_effect=[mock.sentinel.result1, mock.sentinel.result2])
+        with patch as mocked:
+            result = self._call_function_under_test(
+                candidates, strategy=strategy)
+            self.assertEqual(
+                result, [mock.sentinel.result1, mock.sentinel.result2])
+            self.assertEqual(
+                mocked.mock_calls,
+                [mock.call([candidates[0]]), mock.call([candidates[1]])])
+
+    def test_algebraic(self):
+        from bezier import _intersection_helpers
+
+        strategy = _intersection_helpers.IntersectionStrategy.algebraic
+        patch = mock.patch(
+            'bezier._intersection_helpers._intersect_algebraic_many',
+            return_value=mock.sentinel.result)
+        candidates = [
+            (mock.sentinel.curve1, mock.sentinel.curve2),
+            (mock.sentinel.curve3, mock.sentinel.curve4),
+        ]
+        with patch as mocked:
+            result = self._call_function_under_test(
+                candidates, strategy=strategy)
+            self.assertIs(result, mock.sentinel.result)
+            mocked.assert_called_once_with(candidates)
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(None, strategy=None)
+
+
 class TestLinearization(utils.NumPyTestCase):
 
     NODES = np.asfortranarray([
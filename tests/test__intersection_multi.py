@@ -0,0 +1,631 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+import numpy as np
+import six
+
+from tests import utils
+
+
+SPACING = np.spacing  # pylint: disable=no-member
+
+
+def check_intersection(test_case, intersection, expected,
+                       curve1, curve2, s_val, t_val):
+    from bezier import _intersection_helpers
+
+    test_case.assertIsInstance(
+        intersection, _intersection_helpers.Intersection)
+    test_case.assertEqual(intersection.get_point(), expected)
+    test_case.assertIs(intersection.first, curve1)
+    test_case.assertEqual(intersection.s, s_val)
+    test_case.assertIs(intersection.second, curve2)
+    test_case.assertEqual(intersection.t, t_val)
+
+
+class Test__bbox_intersect_multi(utils.NumPyTestCase):
+
+    UNIT_SQUARE = np.asfortranarray([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [1.0, 1.0],
+        [0.0, 1.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._bbox_intersect_multi(nodes1, nodes2)
+
+    def test_it(self):
+        from bezier import _intersection_helpers
+
+        shifts = np.asfortranarray([
+            [0.5, 0.5],
+            [100.0, 100.0],
+            [1.0, 2.0],
+            [1.0, 0.0],
+            [1.0 + SPACING(1.0), 0.0],
+        ])
+        nodes1 = np.asarray([self.UNIT_SQUARE] * len(shifts))
+        nodes2 = nodes1 + shifts[:, np.newaxis, :]
+        result = self._call_function_under_test(nodes1, nodes2)
+
+        box_type = _intersection_helpers.BoxIntersectionType
+        expected = np.asfortranarray([
+            box_type.INTERSECTION,
+            box_type.DISJOINT,
+            box_type.DISJOINT,
+            box_type.TANGENT,
+            box_type.DISJOINT,
+        ])
+        self.assertEqual(result, expected)
+        # Make sure we agree with the non-vectorized version.
+        for index in six.moves.xrange(len(shifts)):
+            self.assertEqual(
+                result[index],
+                _intersection_helpers.bbox_intersect(
+                    np.asfortranarray(nodes1[index]),
+                    np.asfortranarray(nodes2[index])))
+
+    def test_empty(self):
+        nodes = np.zeros((0, 3, 2))
+        result = self._call_function_under_test(nodes, nodes)
+        self.assertEqual(result.shape, (0,))
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test_speedup_bbox_intersect_multi(Test__bbox_intersect_multi):
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._bbox_intersect_multi_speedup(
+            nodes1, nodes2)
+
+
+class Test__linearization_error_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._linearization_error_multi(
+            nodes, degree)
+
+    def test_linear(self):
+        nodes = np.asarray([
+            [[0.0, 0.0], [1.0, 2.0]],
+            [[1.0, 2.0], [3.0, 4.0]],
+        ])
+        errors = self._call_function_under_test(nodes, 1)
+        self.assertEqual(errors, np.zeros((2,)))
+
+    def test_quadratic(self):
+        from bezier import _intersection_helpers
+
+        nodes = np.asarray([
+            [[0.0, 0.0], [3.0, 1.0], [9.0, -2.0]],
+            [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+            [[0.0, 0.0], [1.0, 1.0], [5.0, 6.0]],
+        ])
+        errors = self._call_function_under_test(nodes, 2)
+        expected = np.asfortranarray([1.25, 0.0, 1.25])
+        self.assertEqual(errors, expected)
+        # Make sure we agree with the non-vectorized version.
+        for index in six.moves.xrange(len(nodes)):
+            self.assertEqual(
+                errors[index],
+                _intersection_helpers._linearization_error(
+                    np.asfortranarray(nodes[index]), 2))
+
+    def test_empty(self):
+        nodes = np.zeros((0, 3, 2))
+        errors = self._call_function_under_test(nodes, 2)
+        self.assertEqual(errors.shape, (0,))
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test_speedup_linearization_error_multi(Test__linearization_error_multi):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _speedup
+
+        return _speedup.speedup.linearization_error_multi(nodes, degree)
+
+
+class Test__SegmentColumns(utils.NumPyTestCase):
+
+    NODES1 = np.asfortranarray([
+        [0.0, 0.0],
+        [0.5, 1.0],
+        [1.0, 0.0],
+    ])
+    NODES2 = np.asfortranarray([
+        [0.0, 0.0],
+        [0.5, 0.5],
+        [1.0, 1.0],
+    ])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import _intersection_multi
+
+        return _intersection_multi._SegmentColumns
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_columns(self):
+        return self._make_one(
+            2, np.asarray([self.NODES1, self.NODES2]),
+            np.asfortranarray([0.0, 0.25]), np.asfortranarray([1.0, 0.5]),
+            np.asfortranarray([0.25, 0.0]), np.asarray([False, True]),
+            np.asarray([0, 1]))
+
+    def test_constructor(self):
+        columns = self._make_columns()
+        self.assertEqual(columns.degree, 2)
+        self.assertEqual(columns.nodes.shape, (2, 3, 2))
+        self.assertEqual(columns.start, np.asfortranarray([0.0, 0.25]))
+        self.assertEqual(columns.end, np.asfortranarray([1.0, 0.5]))
+        self.assertEqual(columns.error, np.asfortranarray([0.25, 0.0]))
+        self.assertEqual(
+            columns.linearized, np.asfortranarray([False, True]))
+        self.assertEqual(columns.root, np.asfortranarray([0, 1]))
+
+    def test_from_shapes(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        left, _ = curve1.subdivide()
+        curve2 = bezier.Curve(self.NODES2, degree=2)
+        lin2 = _intersection_helpers.Linearization(curve2, 0.0)
+
+        klass = self._get_target_class()
+        columns = klass.from_shapes([curve2, left, lin2], [3, 4, 5])
+
+        self.assertEqual(columns.degree, 2)
+        expected = np.asarray([self.NODES2, left._nodes, self.NODES2])
+        self.assertTrue(np.all(columns.nodes == expected))
+        self.assertEqual(columns.start, np.asfortranarray([0.0, 0.0, 0.0]))
+        self.assertEqual(columns.end, np.asfortranarray([1.0, 0.5, 1.0]))
+        self.assertEqual(columns.error[0], 0.0)
+        self.assertTrue(np.isnan(columns.error[1]))
+        self.assertEqual(columns.error[2], 0.0)
+        self.assertEqual(
+            columns.linearized, np.asfortranarray([True, False, True]))
+        self.assertEqual(columns.root, np.asfortranarray([3, 4, 5]))
+
+    def test_take(self):
+        columns = self._make_columns()
+        result = columns.take(np.asarray([1, 1, 0]))
+
+        self.assertEqual(result.degree, 2)
+        self.assertTrue(np.all(
+            result.nodes == np.asarray([self.NODES2, self.NODES2,
+                                        self.NODES1])))
+        self.assertEqual(result.start, np.asfortranarray([0.25, 0.25, 0.0]))
+        self.assertEqual(result.end, np.asfortranarray([0.5, 0.5, 1.0]))
+        self.assertEqual(result.error, np.asfortranarray([0.0, 0.0, 0.25]))
+        self.assertEqual(
+            result.linearized, np.asfortranarray([True, True, False]))
+        self.assertEqual(result.root, np.asfortranarray([1, 1, 0]))
+
+    def test_get_shape(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        root1 = bezier.Curve(self.NODES1, degree=2)
+        root2 = bezier.Curve(self.NODES2, degree=2)
+        columns = self._make_columns()
+
+        curve = columns.get_shape(0, [root1, root2])
+        self.assertIsInstance(curve, bezier.Curve)
+        self.assertEqual(curve._nodes, self.NODES1)
+        self.assertEqual(curve._start, 0.0)
+        self.assertEqual(curve._end, 1.0)
+        self.assertIs(curve._root, root1)
+
+        lin = columns.get_shape(1, [root1, root2])
+        self.assertIsInstance(lin, _intersection_helpers.Linearization)
+        self.assertEqual(lin.error, 0.0)
+        self.assertEqual(lin.curve._nodes, self.NODES2)
+        self.assertEqual(lin.curve._start, 0.25)
+        self.assertEqual(lin.curve._end, 0.5)
+        self.assertIs(lin.curve._root, root2)
+
+    def test_subdivide(self):
+        import bezier
+
+        columns = self._make_columns()
+        result = columns.subdivide()
+
+        left, right = bezier.Curve(self.NODES1, degree=2).subdivide()
+        expected = np.asarray([
+            left._nodes, right._nodes, self.NODES2, self.NODES2])
+        self.assertTrue(np.all(result.nodes == expected))
+        self.assertEqual(
+            result.start, np.asfortranarray([0.0, 0.5, 0.25, 0.25]))
+        self.assertEqual(
+            result.end, np.asfortranarray([0.5, 1.0, 0.5, 0.5]))
+        self.assertEqual(
+            result.error, np.asfortranarray([0.125, 0.125, 0.0, 0.0]))
+        self.assertEqual(
+            result.linearized,
+            np.asfortranarray([False, False, True, True]))
+        self.assertEqual(result.root, np.asfortranarray([0, 0, 1, 1]))
+
+    def test_subdivide_linearized(self):
+        columns = self._make_columns()
+        patch = mock.patch(
+            'bezier._intersection_helpers._ERROR_VAL', new=0.25)
+        with patch:
+            result = columns.subdivide()
+
+        self.assertEqual(result.linearized, np.ones((4,), dtype=bool))
+
+
+class Test__candidate_blocks(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates, pair_ids, roots):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._candidate_blocks(
+            candidates, pair_ids, roots)
+
+    def test_empty(self):
+        roots = []
+        blocks = self._call_function_under_test([], [], roots)
+        self.assertEqual(blocks, [])
+        self.assertEqual(roots, [])
+
+    def test_grouped_by_degree(self):
+        import bezier
+        from bezier import _intersection_helpers
+
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1)
+        lin = _intersection_helpers.Linearization(line, 0.0)
+        quadratic = bezier.Curve(np.asfortranarray([
+            [0.0, 1.0],
+            [0.5, -1.0],
+            [1.0, 1.0],
+        ]), degree=2)
+        left, right = quadratic.subdivide()
+
+        candidates = [(line, quadratic), (left, right), (lin, right)]
+        roots = []
+        blocks = self._call_function_under_test(candidates, [7, 8, 9], roots)
+
+        self.assertEqual(roots, [line, quadratic])
+        self.assertEqual(len(blocks), 2)
+
+        first, second, block_ids = blocks[0]
+        self.assertEqual(block_ids, np.asfortranarray([7, 9]))
+        self.assertEqual(first.degree, 1)
+        self.assertEqual(first.root, np.asfortranarray([0, 0]))
+        self.assertEqual(first.linearized, np.asfortranarray([True, True]))
+        self.assertEqual(second.degree, 2)
+        self.assertEqual(second.root, np.asfortranarray([1, 1]))
+        self.assertEqual(second.start, np.asfortranarray([0.0, 0.5]))
+
+        first, second, block_ids = blocks[1]
+        self.assertEqual(block_ids, np.asfortranarray([8]))
+        self.assertEqual(first.root, np.asfortranarray([1]))
+        self.assertEqual(first.end, np.asfortranarray([0.5]))
+        self.assertEqual(second.root, np.asfortranarray([1]))
+        self.assertEqual(second.start, np.asfortranarray([0.5]))
+
+
+class Test__intersect_block_round(utils.NumPyTestCase):
+
+    # NOTE: NODES1 is a specialization of [0, 0], [1/2, 1], [1, 1]
+    #       onto the interval [1/4, 1].
+    NODES1 = np.asfortranarray([
+        [0.25, 0.4375],
+        [0.625, 1.0],
+        [1.0, 1.0],
+    ])
+    # NOTE: NODES2 is a specialization of [0, 1], [1/2, 1], [1, 0]
+    #       onto the interval [0, 3/4].
+    NODES2 = np.asfortranarray([
+        [0.0, 1.0],
+        [0.375, 1.0],
+        [0.75, 0.4375],
+    ])
+    LINE1 = np.asfortranarray([
+        [0.0, 0.0],
+        [1.0, 1.0],
+    ])
+    LINE2 = np.asfortranarray([
+        [0.0, 1.0],
+        [1.0, 0.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(candidates, pair_ids, intersections):
+        from bezier import _intersection_multi
+
+        roots = []
+        (first, second, block_ids), = _intersection_multi._candidate_blocks(
+            candidates, pair_ids, roots)
+        return _intersection_multi._intersect_block_round(
+            first, second, block_ids, roots, intersections)
+
+    def test_simple(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        curve2 = bezier.Curve(self.NODES2, degree=2)
+        far_away = bezier.Curve(self.NODES2 + 10.0, degree=2)
+        intersections = [[]]
+        accepted = self._call_function_under_test(
+            [(curve1, curve2), (curve1, far_away)], [0, 0], intersections)
+
+        self.assertEqual(accepted, np.asfortranarray([True, False]))
+        self.assertEqual(intersections, [[]])
+
+    def test_linearized(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.LINE1, degree=1)
+        curve2 = bezier.Curve(self.LINE2, degree=1)
+        curve3 = bezier.Curve(self.LINE2 + 10.0, degree=1)
+        candidates = [(curve1, curve2), (curve1, curve3), (curve2, curve1)]
+        intersections = [[], [], []]
+        accepted = self._call_function_under_test(
+            candidates, [2, 1, 0], intersections)
+
+        self.assertEqual(accepted, np.zeros((3,), dtype=bool))
+        self.assertEqual(intersections[1], [])
+        expected = np.asfortranarray([[0.5, 0.5]])
+        intersection, = intersections[2]
+        check_intersection(self, intersection, expected,
+                           curve1, curve2, 0.5, 0.5)
+        intersection, = intersections[0]
+        check_intersection(self, intersection, expected,
+                           curve2, curve1, 0.5, 0.5)
+
+    def test_mixed_linearized(self):
+        import bezier
+
+        curve1 = bezier.Curve(self.NODES1, degree=2)
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [1.0, 0.5],
+        ]), degree=2)
+        far_away = bezier.Curve(self.NODES1 + 10.0, degree=2)
+        candidates = [(curve1, line), (line, curve1), (line, far_away)]
+        intersections = [[]]
+        accepted = self._call_function_under_test(
+            candidates, [0, 0, 0], intersections)
+
+        self.assertEqual(accepted, np.asfortranarray([True, True, False]))
+        self.assertEqual(intersections, [[]])
+
+    def test_tangent(self):
+        import bezier
+
+        # NOTE: The bounding boxes are tangent along y = 1 and the
+        #       curves touch at the shared endpoint.
+        curve1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.5],
+            [1.5, 0.0],
+            [1.0, 1.0],
+        ]), degree=3)
+        curve2 = bezier.Curve(np.asfortranarray([
+            [1.0, 1.0],
+            [1.5, 2.0],
+            [2.0, 1.5],
+            [3.0, 2.0],
+        ]), degree=3)
+        intersections = [[]]
+        accepted = self._call_function_under_test(
+            [(curve1, curve2)], [0], intersections)
+
+        self.assertEqual(accepted, np.asfortranarray([False]))
+        intersection, = intersections[0]
+        expected = np.asfortranarray([[1.0, 1.0]])
+        check_intersection(self, intersection, expected,
+                           curve1, curve2, 1.0, 0.0)
+
+
+class Test__next_block(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(first, second, pair_ids):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._next_block(first, second, pair_ids)
+
+    def test_it(self):
+        import bezier
+        from bezier import _intersection_multi
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2)
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [0.5, 0.25],
+            [1.0, 0.25],
+        ]), degree=2)
+        candidates = [(curve, curve), (curve, line), (line, curve)]
+        roots = []
+        (first, second, pair_ids), = _intersection_multi._candidate_blocks(
+            candidates, [4, 5, 6], roots)
+
+        new_first, new_second, new_ids = self._call_function_under_test(
+            first, second, pair_ids)
+
+        self.assertEqual(
+            new_ids, np.asfortranarray([4, 4, 4, 4, 5, 5, 6, 6]))
+        # The children of each pair should match ``itertools.product``.
+        self.assertEqual(
+            new_first.start,
+            np.asfortranarray([0.0, 0.0, 0.5, 0.5, 0.0, 0.5, 0.0, 0.0]))
+        self.assertEqual(
+            new_second.start,
+            np.asfortranarray([0.0, 0.5, 0.0, 0.5, 0.0, 0.0, 0.0, 0.5]))
+        self.assertEqual(
+            new_first.linearized,
+            np.asfortranarray([False] * 6 + [True] * 2))
+        self.assertEqual(
+            new_second.linearized,
+            np.asfortranarray([False] * 4 + [True] * 2 + [False] * 2))
+
+
+class Test__drop_pairs(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(blocks, dropped):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._drop_pairs(blocks, dropped)
+
+    def test_it(self):
+        import bezier
+        from bezier import _intersection_multi
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2)
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [1.0, 0.25],
+        ]), degree=1)
+        candidates = [(curve, curve), (curve, line), (line, line)]
+        blocks = _intersection_multi._candidate_blocks(
+            candidates, [0, 1, 2], [])
+        self.assertEqual(len(blocks), 3)
+
+        dropped = np.asarray([False, True, False])
+        result = self._call_function_under_test(blocks, dropped)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0][2], np.asfortranarray([0]))
+        self.assertEqual(result[1][2], np.asfortranarray([2]))
+
+
+class Test__drop_too_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(blocks, num_accepted, intersections):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._drop_too_many(
+            blocks, num_accepted, intersections)
+
+    def test_none(self):
+        intersections = [[], []]
+        result = self._call_function_under_test(
+            mock.sentinel.blocks, np.asarray([16, 0]), intersections)
+        self.assertIs(result, mock.sentinel.blocks)
+        self.assertEqual(intersections, [[], []])
+
+    def test_too_many(self):
+        blocks = [mock.sentinel.block]
+        intersections = [[], []]
+        patch = mock.patch(
+            'bezier._intersection_multi._drop_pairs',
+            return_value=mock.sentinel.result)
+        with patch as mocked:
+            result = self._call_function_under_test(
+                blocks, np.asarray([2, 17]), intersections)
+
+        self.assertIs(result, mock.sentinel.result)
+        self.assertEqual(intersections[0], [])
+        self.assertIsInstance(intersections[1], NotImplementedError)
+        self.assertEqual(intersections[1].args, (
+            'The number of candidate intersections is too high.\n'
+            '17 accepted pairs gives 68 candidate pairs.',))
+        call_blocks, dropped = mocked.call_args[0]
+        self.assertIs(call_blocks, blocks)
+        self.assertEqual(dropped, np.asfortranarray([False, True]))
+
+
+class Test__all_intersections_pool(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates, pair_ids, num_pairs):
+        from bezier import _intersection_multi
+
+        return _intersection_multi._all_intersections_pool(
+            candidates, pair_ids, num_pairs)
+
+    def test_failure(self):
+        import bezier
+
+        curve1 = bezier.Curve.from_nodes(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]))
+        curve2 = bezier.Curve.from_nodes(np.asfortranarray([
+            [2.0, 0.0],
+            [3.0, 1.0],
+        ]))
+        patch = mock.patch(
+            'bezier._intersection_helpers._MAX_INTERSECT_SUBDIVISIONS',
+            new=-1)
+        with patch:
+            intersections = self._call_function_under_test(
+                [(curve1, curve1), (curve1, curve2)], [0, 1], 3)
+
+        self.assertEqual(len(intersections), 3)
+        self.assertIsInstance(intersections[0], ValueError)
+        # NOTE: With no subdivision rounds, even the disjoint pair is
+        #       never resolved.
+        self.assertIsInstance(intersections[1], ValueError)
+        self.assertIsNot(intersections[1], intersections[0])
+        self.assertEqual(intersections[2], [])
+
+    def test_too_many_candidates(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2)
+        line = bezier.Curve(np.asfortranarray([
+            [0.0, 0.25],
+            [1.0, 0.25],
+        ]), degree=1)
+
+        # A curve matched with itself is "all" intersection.
+        candidates = [(curve, line), (curve, curve)]
+        intersections = self._call_function_under_test(
+            candidates, [0, 1], 2)
+        self.assertEqual(len(intersections), 2)
+        # NOTE: The failure of the second pair doesn't stop the first.
+        self.assertEqual(len(intersections[0]), 2)
+        self.assertIsInstance(intersections[1], NotImplementedError)
+        exc_args = intersections[1].args
+        self.assertTrue(exc_args[0].startswith(
+            'The number of candidate intersections is too high.'))
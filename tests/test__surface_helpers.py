@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import unittest
 
 import mock
@@ -353,6 +354,65 @@ class Test__make_transform(utils.NumPyTestCase):
         self._helper(2, weights, expected0, expected1, expected2)
 
 
+class Test__get_transform(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree, weights_a, weights_b, weights_c):
+        from bezier import _surface_helpers
+
+        return _surface_helpers._get_transform(
+            degree, weights_a, weights_b, weights_c)
+
+    def test_cached(self):
+        from bezier import _surface_helpers
+
+        weights_a = (1.0, 0.0, 0.0)
+        weights_b = (0.5, 0.5, 0.0)
+        weights_c = (0.5, 0.0, 0.5)
+        cache = collections.OrderedDict()
+        patch = mock.patch(
+            'bezier._surface_helpers._TRANSFORMS', new=cache)
+        with patch:
+            result = self._call_function_under_test(
+                2, weights_a, weights_b, weights_c)
+            self.assertEqual(
+                list(cache.keys()), [(2, weights_a, weights_b, weights_c)])
+            expected = _surface_helpers._make_transform(
+                2, weights_a, weights_b, weights_c)
+            for key in (0, 1, 2):
+                self.assertFalse(result[key].flags.writeable)
+                self.assertEqual(result[key], expected[key])
+
+            # Make sure the transform is re-used, even if the weights
+            # are not a ``tuple``.
+            new_result = self._call_function_under_test(
+                2, list(weights_a), weights_b, weights_c)
+            self.assertIs(new_result, result)
+
+    @mock.patch('bezier._surface_helpers._MAX_CACHED_TRANSFORMS', new=2)
+    @mock.patch('bezier._surface_helpers._TRANSFORMS',
+                new=collections.OrderedDict())
+    def test_cached_eviction(self):
+        from bezier import _surface_helpers
+
+        weights_a = (1.0, 0.0, 0.0)
+        weights_b = (0.5, 0.5, 0.0)
+        weights_c = (0.5, 0.0, 0.5)
+        result1 = self._call_function_under_test(
+            1, weights_a, weights_b, weights_c)
+        result2 = self._call_function_under_test(
+            2, weights_a, weights_b, weights_c)
+        # Use ``result1`` so that ``result2`` is least recently used.
+        self.assertIs(self._call_function_under_test(
+            1, weights_a, weights_b, weights_c), result1)
+        self._call_function_under_test(3, weights_a, weights_b, weights_c)
+        self.assertEqual(len(_surface_helpers._TRANSFORMS), 2)
+        self.assertIs(self._call_function_under_test(
+            1, weights_a, weights_b, weights_c), result1)
+        self.assertIsNot(self._call_function_under_test(
+            2, weights_a, weights_b, weights_c), result2)
+
+
 class Test__reduced_to_matrix(utils.NumPyTestCase):
 
     @staticmethod
@@ -465,34 +525,6 @@ class Test_specialize_surface(utils.NumPyTestCase):
             _surface_helpers.QUARTIC_SUBDIVIDE_D)
 
 
-class Test__mean_centroid(unittest.TestCase):
-
-    @staticmethod
-    def _call_function_under_test(candidates):
-        from bezier import _surface_helpers
-
-        return _surface_helpers._mean_centroid(candidates)
-
-    def test_it(self):
-        import bezier
-
-        nodes = np.asfortranarray([
-            [0.0, 0.0],
-            [1.0, 0.0],
-            [0.0, 1.0],
-        ])
-        surface1 = bezier.Surface(nodes, 1)
-        surface2 = bezier.Surface(
-            nodes, 1, base_x=0.5, base_y=0.25, width=0.75)
-        surface3 = bezier.Surface(
-            nodes, 1, base_x=0.25, base_y=1.25, width=0.5)
-
-        centroid_x, centroid_y = self._call_function_under_test(
-            [surface1, surface2, surface3])
-        self.assertEqual(centroid_x, 0.5)
-        self.assertEqual(centroid_y, 0.75)
-
-
 class Test_jacobian_s(utils.NumPyTestCase):
 
     @staticmethod
@@ -790,46 +822,6 @@ class Test_newton_refine(unittest.TestCase):
         self.assertEqual(new_t, 31.0 / 128.0)
 
 
-class Test_locate_point(unittest.TestCase):
-
-    @staticmethod
-    def _call_function_under_test(surface, x_val, y_val):
-        from bezier import _surface_helpers
-
-        return _surface_helpers.locate_point(surface, x_val, y_val)
-
-    def test_it(self):
-        import bezier
-
-        surface = bezier.Surface(UNIT_TRIANGLE, 1)
-        x_val = 0.25
-        y_val = 0.625
-        s, t = self._call_function_under_test(surface, x_val, y_val)
-        self.assertEqual(s, x_val)
-        self.assertEqual(t, y_val)
-
-    def test_extra_newton_step(self):
-        import bezier
-
-        surface = bezier.Surface(UNIT_TRIANGLE, 1)
-        x_val = 1.0 / 3.0
-        y_val = 1.0 / 3.0
-        with mock.patch('bezier._surface_helpers._LOCATE_EPS', new=-1.0):
-            s, t = self._call_function_under_test(surface, x_val, y_val)
-
-        self.assertEqual(s, x_val)
-        self.assertEqual(t, y_val)
-
-    def test_no_match(self):
-        import bezier
-
-        surface = bezier.Surface(UNIT_TRIANGLE, 1)
-        x_val = -0.125
-        y_val = 0.25
-        self.assertIsNone(
-            self._call_function_under_test(surface, x_val, y_val))
-
-
 class Test_classify_intersection(unittest.TestCase):
 
     @staticmethod
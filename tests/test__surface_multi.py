@@ -0,0 +1,629 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+UNIT_TRIANGLE = np.asfortranarray([
+    [0.0, 0.0],
+    [1.0, 0.0],
+    [0.0, 1.0],
+])
+
+
+class Test__mean_centroid(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier import _surface_multi
+
+        return _surface_multi._mean_centroid(candidates)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ])
+        surface1 = bezier.Surface(nodes, 1)
+        surface2 = bezier.Surface(
+            nodes, 1, base_x=0.5, base_y=0.25, width=0.75)
+        surface3 = bezier.Surface(
+            nodes, 1, base_x=0.25, base_y=1.25, width=0.5)
+
+        centroid_x, centroid_y = self._call_function_under_test(
+            [surface1, surface2, surface3])
+        self.assertEqual(centroid_x, 0.5)
+        self.assertEqual(centroid_y, 0.75)
+
+
+class Test__locate_point(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(surface, x_val, y_val):
+        from bezier import _surface_multi
+
+        return _surface_multi._locate_point(surface, x_val, y_val)
+
+    def test_it(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        x_val = 0.25
+        y_val = 0.625
+        s, t = self._call_function_under_test(surface, x_val, y_val)
+        self.assertEqual(s, x_val)
+        self.assertEqual(t, y_val)
+
+    def test_extra_newton_step(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        x_val = 1.0 / 3.0
+        y_val = 1.0 / 3.0
+        with mock.patch('bezier._surface_multi._LOCATE_EPS', new=-1.0):
+            s, t = self._call_function_under_test(surface, x_val, y_val)
+
+        self.assertEqual(s, x_val)
+        self.assertEqual(t, y_val)
+
+    def test_no_match(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        x_val = -0.125
+        y_val = 0.25
+        self.assertIsNone(
+            self._call_function_under_test(surface, x_val, y_val))
+
+    def test_quadratic(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, -0.125],
+            [1.0, 0.0],
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [0.0, 1.0],
+        ])
+        surface = bezier.Surface(nodes, 2)
+        (x_val, y_val), = surface.evaluate_cartesian(0.25, 0.5)
+        s, t = self._call_function_under_test(surface, x_val, y_val)
+        self.assertAlmostEqual(s, 0.25, delta=2.0**(-52))
+        self.assertAlmostEqual(t, 0.5, delta=2.0**(-52))
+
+    def test_on_the_fly(self):
+        # Test for a degree where the Python version doesn't use a stored
+        # subdivision matrix.
+        import six
+
+        import bezier
+
+        nodes = np.asfortranarray([
+            [j_val, k_val]
+            for k_val in six.moves.xrange(6)
+            for j_val in six.moves.xrange(6 - k_val)
+        ]) / 5.0
+        surface = bezier.Surface(nodes, 5)
+        (x_val, y_val), = surface.evaluate_cartesian(0.125, 0.75)
+        s, t = self._call_function_under_test(surface, x_val, y_val)
+        self.assertAlmostEqual(s, 0.125, delta=2.0**(-52))
+        self.assertAlmostEqual(t, 0.75, delta=2.0**(-52))
+
+    def test_sub_surface(self):
+        # NOTE: The initial guess comes from the reference triangle of
+        #       the sub-surface, so this checks that the compiled version
+        #       agrees with the pure Python version.
+        import bezier
+        from bezier import _surface_multi
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.25],
+            [2.0, 0.0],
+            [0.0, 1.0],
+            [1.25, 1.125],
+            [0.0, 2.0],
+        ])
+        surface = bezier.Surface(nodes, 2)
+        for sub_surface in surface.subdivide():
+            (x_val, y_val), = sub_surface.evaluate_cartesian(0.25, 0.25)
+            s, t = self._call_function_under_test(sub_surface, x_val, y_val)
+            expected = _surface_multi._locate_point(
+                sub_surface, x_val, y_val)
+            self.assertEqual((s, t), expected)
+            self.assertAlmostEqual(s, 0.25, delta=2.0**(-8))
+            self.assertAlmostEqual(t, 0.25, delta=2.0**(-8))
+
+    def _check_stats(self, counters):
+        self.assertEqual(
+            counters, {'locate.candidates': 32, 'locate.newton_steps': 1})
+
+    def test_stats(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        with bezier.stats.collect() as stats:
+            result = self._call_function_under_test(surface, 0.25, 0.625)
+
+        self.assertEqual(result, (0.25, 0.625))
+        self._check_stats(stats.counters)
+
+
+@unittest.skipIf(utils.WITHOUT_SPEEDUPS, 'No speedups available')
+class Test__locate_point_speedup(Test__locate_point):
+
+    @staticmethod
+    def _call_function_under_test(surface, x_val, y_val):
+        from bezier import _surface_multi
+
+        return _surface_multi._locate_point_speedup(surface, x_val, y_val)
+
+    def _check_stats(self, counters):
+        # NOTE: The compiled version doesn't record any counters.
+        self.assertEqual(counters, {})
+
+    def test_extra_newton_step(self):
+        # NOTE: The compiled version can't see a patched ``_LOCATE_EPS``,
+        #       so this just checks that an interior point is recovered.
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        x_val = 1.0 / 3.0
+        y_val = 1.0 / 3.0
+        s, t = self._call_function_under_test(surface, x_val, y_val)
+        self.assertEqual(s, x_val)
+        self.assertEqual(t, y_val)
+
+
+class Test_subdivision_matrices(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _surface_multi
+
+        return _surface_multi.subdivision_matrices(degree)
+
+    def test_stored(self):
+        from bezier import _surface_helpers
+
+        result = self._call_function_under_test(2)
+        expected = (
+            _surface_helpers.QUADRATIC_SUBDIVIDE_A,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_B,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_C,
+            _surface_helpers.QUADRATIC_SUBDIVIDE_D,
+        )
+        self.assertEqual(len(result), 4)
+        for matrix, expected_matrix in zip(result, expected):
+            self.assertIs(matrix, expected_matrix)
+
+    def test_cached(self):
+        cache = {}
+        patch = mock.patch(
+            'bezier._surface_multi._SUBDIVISION_MATRICES', new=cache)
+        with patch:
+            result = self._call_function_under_test(5)
+            self.assertEqual(list(cache.keys()), [5])
+            self.assertEqual(len(result), 4)
+            for matrix in result:
+                self.assertEqual(matrix.shape, (21, 21))
+                self.assertFalse(matrix.flags.writeable)
+
+            # Make sure the matrices are re-used.
+            self.assertIs(self._call_function_under_test(5), result)
+
+
+class Test__subdivision_matrices(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _surface_multi
+
+        return _surface_multi._subdivision_matrices(degree)
+
+    def _check(self, degree):
+        import bezier
+
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        nodes = np.asfortranarray(
+            np.arange(2 * num_nodes, dtype=float).reshape(num_nodes, 2)**2)
+        surface = bezier.Surface(nodes, degree)
+        sub_surfaces = surface.subdivide()
+
+        matrices = self._call_function_under_test(degree)
+        self.assertEqual(matrices.shape, (4 * num_nodes, num_nodes))
+        for index, sub_surface in enumerate(sub_surfaces):
+            matrix = matrices[index * num_nodes:(index + 1) * num_nodes, :]
+            self.assertTrue(np.allclose(
+                matrix.dot(nodes), sub_surface._nodes,
+                atol=0.0, rtol=0.5**50))
+
+    def test_linear(self):
+        self._check(1)
+
+    def test_quadratic(self):
+        self._check(2)
+
+    def test_cubic(self):
+        self._check(3)
+
+    def test_quartic(self):
+        self._check(4)
+
+    def test_degree5(self):
+        self._check(5)
+
+
+class Test__sub_reference_triangles(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(base_x, base_y, widths):
+        from bezier import _surface_multi
+
+        return _surface_multi._sub_reference_triangles(
+            base_x, base_y, widths)
+
+    def test_it(self):
+        base_x = np.asarray([0.0, 0.5])
+        base_y = np.asarray([0.0, 0.25])
+        widths = np.asarray([1.0, -0.5])
+        new_base_x, new_base_y, new_widths = self._call_function_under_test(
+            base_x, base_y, widths)
+        self.assertEqual(
+            new_base_x,
+            np.asarray([0.0, 0.5, 0.5, 0.0, 0.5, 0.25, 0.25, 0.5]))
+        self.assertEqual(
+            new_base_y,
+            np.asarray([0.0, 0.5, 0.0, 0.5, 0.25, 0.0, 0.25, 0.0]))
+        self.assertEqual(
+            new_widths,
+            np.asarray([0.5, -0.5, 0.5, 0.5, -0.25, 0.25, -0.25, -0.25]))
+
+
+class Test_subdivide_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree, base_x, base_y, widths):
+        from bezier import _surface_multi
+
+        return _surface_multi.subdivide_multi(
+            nodes, degree, base_x, base_y, widths)
+
+    def _subdivide_surfaces(self, surfaces):
+        nodes = np.stack([surface._nodes for surface in surfaces])
+        base_x = np.asarray([surface._base_x for surface in surfaces])
+        base_y = np.asarray([surface._base_y for surface in surfaces])
+        widths = np.asarray([surface._width for surface in surfaces])
+        return self._call_function_under_test(
+            nodes, surfaces[0].degree, base_x, base_y, widths)
+
+    def _check(self, surfaces):
+        new_nodes, new_base_x, new_base_y, new_widths = (
+            self._subdivide_surfaces(surfaces))
+
+        num_children = 4 * len(surfaces)
+        num_nodes, dimension = surfaces[0]._nodes.shape
+        self.assertEqual(
+            new_nodes.shape, (num_children, num_nodes, dimension))
+        self.assertEqual(new_base_x.shape, (num_children,))
+        self.assertEqual(new_base_y.shape, (num_children,))
+        self.assertEqual(new_widths.shape, (num_children,))
+
+        index = 0
+        for surface in surfaces:
+            for sub_surface in surface.subdivide():
+                self.assertTrue(np.allclose(
+                    new_nodes[index, :, :], sub_surface._nodes,
+                    atol=0.0, rtol=0.5**50))
+                self.assertEqual(new_base_x[index], sub_surface._base_x)
+                self.assertEqual(new_base_y[index], sub_surface._base_y)
+                self.assertEqual(new_widths[index], sub_surface._width)
+                index += 1
+
+    def test_quadratic(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, -0.25],
+            [1.0, 0.0],
+            [0.25, 0.5],
+            [0.75, 0.75],
+            [0.0, 1.0],
+        ])
+        surface = bezier.Surface(nodes, 2)
+        _, sub_surface_b, _, sub_surface_d = surface.subdivide()
+        self._check([surface, sub_surface_b, sub_surface_d])
+
+    def test_three_dimensional(self):
+        import bezier
+
+        nodes = utils.get_random_nodes(shape=(10, 3), seed=97, num_bits=8)
+        surface = bezier.Surface(nodes, 3)
+        self._check([surface])
+
+    def test_empty(self):
+        nodes = np.empty((0, 3, 2))
+        empty = np.empty((0,))
+        new_nodes, new_base_x, new_base_y, new_widths = (
+            self._call_function_under_test(nodes, 1, empty, empty, empty))
+        self.assertEqual(new_nodes.shape, (0, 3, 2))
+        self.assertEqual(new_base_x.shape, (0,))
+        self.assertEqual(new_base_y.shape, (0,))
+        self.assertEqual(new_widths.shape, (0,))
+
+
+class Test__newton_solve_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(jac_both, points, surf_vals):
+        from bezier import _surface_multi
+
+        return _surface_multi._newton_solve_multi(
+            jac_both, points, surf_vals)
+
+    def test_it(self):
+        jac_both = np.asfortranarray([
+            [2.0, 0.0, 0.0, 4.0],
+            [1.0, 1.0, -1.0, 1.0],
+        ])
+        points = np.asfortranarray([
+            [1.0, 1.0],
+            [3.0, 1.0],
+        ])
+        surf_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        delta_s, delta_t = self._call_function_under_test(
+            jac_both, points, surf_vals)
+        self.assertEqual(delta_s, np.asarray([0.5, 1.0]))
+        self.assertEqual(delta_t, np.asarray([0.25, -1.0]))
+
+
+class Test__newton_refine_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points, s_vals, t_vals):
+        from bezier import _surface_multi
+
+        return _surface_multi._newton_refine_multi(
+            nodes, degree, points, s_vals, t_vals)
+
+    def test_it(self):
+        # NOTE: These nodes are the same as in the doctest for
+        #       ``newton_refine``.
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [2.0, 0.0],
+            [2.0, 1.0],
+            [2.0, 2.0],
+            [0.0, 2.0],
+        ])
+        points = np.asfortranarray([
+            [1.25, 1.25],
+            [1.25, 1.25],
+        ])
+        s_vals = np.asfortranarray([0.5, 0.25])
+        t_vals = np.asfortranarray([0.25, 0.5])
+        new_s, new_t = self._call_function_under_test(
+            nodes, 2, points, s_vals, t_vals)
+        self.assertEqual(
+            32.0 * (new_s - s_vals), np.asfortranarray([-10.0, 0.0]))
+        self.assertEqual(
+            32.0 * (new_t - t_vals), np.asfortranarray([7.0, 0.0]))
+        # Make sure the inputs are not modified.
+        self.assertEqual(s_vals, np.asfortranarray([0.5, 0.25]))
+        self.assertEqual(t_vals, np.asfortranarray([0.25, 0.5]))
+
+
+class Test__locate_candidates_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(surface, points):
+        from bezier import _surface_multi
+
+        return _surface_multi._locate_candidates_multi(surface, points)
+
+    def test_it(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        points = np.asfortranarray([
+            [2.0, 2.0],
+            [0.25, 0.125],
+        ])
+        point_ids, pair_base_x, pair_base_y, pair_widths = (
+            self._call_function_under_test(surface, points))
+        # Only the second point is on the surface, in tiny sub-surfaces
+        # near (1/4, 1/8).
+        self.assertEqual(set(point_ids.tolist()), set([1]))
+        self.assertTrue(np.all(np.abs(pair_widths) == 0.5**21))
+        self.assertTrue(np.all(np.abs(pair_base_x - 0.25) <= 0.5**20))
+        self.assertTrue(np.all(np.abs(pair_base_y - 0.125) <= 0.5**20))
+
+
+class Test__mean_centroid_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(
+            point_ids, pair_base_x, pair_base_y, pair_widths, num_points):
+        from bezier import _surface_multi
+
+        return _surface_multi._mean_centroid_multi(
+            point_ids, pair_base_x, pair_base_y, pair_widths, num_points)
+
+    def test_it(self):
+        point_ids = np.asarray([2, 0, 2])
+        pair_base_x = np.asarray([0.0, 0.5, 0.5])
+        pair_base_y = np.asarray([0.0, 0.25, 0.5])
+        pair_widths = np.asarray([0.75, 1.5, 0.75])
+        found, s_approx, t_approx = self._call_function_under_test(
+            point_ids, pair_base_x, pair_base_y, pair_widths, 3)
+        self.assertEqual(found.tolist(), [True, False, True])
+        self.assertEqual(s_approx, np.asarray([1.0, 0.5]))
+        self.assertEqual(t_approx, np.asarray([0.75, 0.5]))
+
+
+class Test_locate_point_multi(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(surface, points):
+        from bezier import _surface_multi
+
+        return _surface_multi.locate_point_multi(surface, points)
+
+    def test_it(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        points = np.asfortranarray([
+            [0.25, 0.625],
+            [-0.125, 0.25],
+            [0.5, 0.0],
+        ])
+        result = self._call_function_under_test(surface, points)
+        expected = np.asfortranarray([
+            [0.25, 0.625],
+            [0.5, 0.0],
+        ])
+        self.assertEqual(np.asfortranarray(result[[0, 2], :]), expected)
+        self.assertTrue(np.all(np.isnan(result[1, :])))
+
+    def test_extra_newton_step(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        points = np.asfortranarray([[1.0 / 3.0, 1.0 / 3.0]])
+        with mock.patch('bezier._surface_multi._LOCATE_EPS', new=-1.0):
+            result = self._call_function_under_test(surface, points)
+
+        self.assertEqual(result, points)
+
+    def test_empty(self):
+        import bezier
+
+        surface = bezier.Surface(UNIT_TRIANGLE, 1)
+        points = np.zeros((0, 2), order='F')
+        result = self._call_function_under_test(surface, points)
+        self.assertEqual(result.shape, (0, 2))
+
+    def test_matches_locate_point(self):
+        import bezier
+        from bezier import _surface_multi
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.25],
+            [2.0, 0.0],
+            [-0.25, 1.0],
+            [1.0, 1.0],
+            [0.0, 2.0],
+        ])
+        surface = bezier.Surface(nodes, 2)
+        param_vals = np.asfortranarray([
+            [0.125, 0.25],
+            [0.5, 0.5],
+            [0.0, 0.75],
+            [0.3125, 0.0625],
+        ])
+        points = surface.evaluate_cartesian_multi(param_vals)
+        points[3, :] += 3.0
+        result = self._call_function_under_test(surface, points)
+        for index, (x_val, y_val) in enumerate(points):
+            expected = _surface_multi.locate_point(surface, x_val, y_val)
+            if expected is None:
+                self.assertTrue(np.all(np.isnan(result[index, :])))
+            else:
+                self.assertEqual(tuple(result[index, :]), expected)
+
+
+class Test_cartesian_basis(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree, param_vals):
+        from bezier import _surface_multi
+
+        return _surface_multi.cartesian_basis(degree, param_vals)
+
+    def test_linear(self):
+        param_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [0.25, 0.5],
+        ])
+        result = self._call_function_under_test(1, param_vals)
+        expected = np.asfortranarray([
+            [1.0, 0.0, 0.0],
+            [0.25, 0.25, 0.5],
+        ])
+        self.assertEqual(np.asfortranarray(result), expected)
+
+    def test_quadratic(self):
+        param_vals = np.asfortranarray([[0.25, 0.5]])
+        result = self._call_function_under_test(2, param_vals)
+        # (lambda1, lambda2, lambda3) = (1/4, 1/4, 1/2)
+        expected = np.asfortranarray([
+            [1.0, 2.0, 1.0, 4.0, 4.0, 4.0],
+        ]) / 16.0
+        self.assertEqual(np.asfortranarray(result), expected)
+
+    def test_partition_of_unity(self):
+        param_vals = np.asfortranarray([
+            [0.125, 0.25],
+            [0.5, 0.375],
+            [0.0, 1.0],
+        ])
+        result = self._call_function_under_test(5, param_vals)
+        self.assertEqual(result.shape, (3, 21))
+        self.assertTrue(np.allclose(np.sum(result, axis=1), 1.0))
+
+
+class Test_evaluate_cartesian_stack(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack, degree, param_vals):
+        from bezier import _surface_multi
+
+        return _surface_multi.evaluate_cartesian_stack(
+            nodes_stack, degree, param_vals)
+
+    def test_it(self):
+        from bezier import _surface_helpers
+
+        nodes_stack = np.stack([
+            utils.get_random_nodes(shape=(10, 3), seed=seed, num_bits=8)
+            for seed in (101, 102)
+        ])
+        param_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.25],
+            [0.0, 1.0],
+        ])
+        result = self._call_function_under_test(nodes_stack, 3, param_vals)
+        self.assertEqual(result.shape, (2, 3, 3))
+        for index in range(2):
+            expected = _surface_helpers._evaluate_cartesian_multi(
+                np.asfortranarray(nodes_stack[index, :, :]), 3,
+                param_vals, 3)
+            self.assertTrue(np.allclose(
+                result[index, :, :], expected, atol=0.0, rtol=0.5**50))
@@ -0,0 +1,534 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+class Test_verify_resolution(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(pts_per_edge, tolerance):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.verify_resolution(
+            pts_per_edge, tolerance)
+
+    def test_valid(self):
+        self.assertIsNone(self._call_function_under_test(2, None))
+        self.assertIsNone(self._call_function_under_test(None, 0.5))
+
+    def test_both(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(4, 0.5)
+
+    def test_neither(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(None, None)
+
+    def test_too_few_points(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(1, None)
+
+    def test_bad_tolerance(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(None, -1.0)
+
+
+class Test_triangle_grid(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(pts_per_edge):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.triangle_grid(pts_per_edge)
+
+    @mock.patch('bezier._tessellation_helpers._GRIDS', new={})
+    def test_single_triangle(self):
+        param_vals, triangles = self._call_function_under_test(2)
+        expected = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ])
+        self.assertEqual(param_vals, expected)
+        self.assertEqual(triangles.tolist(), [[0, 1, 2]])
+
+    @mock.patch('bezier._tessellation_helpers._GRIDS', new={})
+    def test_quartered(self):
+        param_vals, triangles = self._call_function_under_test(3)
+        expected = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.0],
+            [1.0, 0.0],
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [0.0, 1.0],
+        ])
+        self.assertEqual(param_vals, expected)
+        expected_triangles = [
+            [0, 1, 3],
+            [1, 2, 4],
+            [1, 4, 3],
+            [3, 4, 5],
+        ]
+        self.assertEqual(triangles.tolist(), expected_triangles)
+
+    @mock.patch('bezier._tessellation_helpers._GRIDS', new={})
+    def test_orientation_and_area(self):
+        param_vals, triangles = self._call_function_under_test(9)
+        self.assertEqual(param_vals.shape, (45, 2))
+        self.assertEqual(triangles.shape, (64, 3))
+
+        corners = param_vals[triangles, :]
+        edge1 = corners[:, 1, :] - corners[:, 0, :]
+        edge2 = corners[:, 2, :] - corners[:, 0, :]
+        areas = 0.5 * (
+            edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0])
+        self.assertTrue(np.allclose(areas, 0.5 / 64.0))
+
+    @mock.patch('bezier._tessellation_helpers._GRIDS', new={})
+    def test_cached(self):
+        from bezier import _tessellation_helpers
+
+        grid = self._call_function_under_test(4)
+        self.assertEqual(_tessellation_helpers._GRIDS, {4: grid})
+        self.assertIs(self._call_function_under_test(4), grid)
+        param_vals, triangles = grid
+        self.assertFalse(param_vals.flags.writeable)
+        self.assertFalse(triangles.flags.writeable)
+
+
+class Test_grid_basis(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree, pts_per_edge):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.grid_basis(degree, pts_per_edge)
+
+    @mock.patch('bezier._tessellation_helpers._GRID_BASES', new={})
+    def test_it(self):
+        from bezier import _surface_multi
+        from bezier import _tessellation_helpers
+
+        basis = self._call_function_under_test(2, 5)
+        param_vals, _ = _tessellation_helpers.triangle_grid(5)
+        expected = _surface_multi.cartesian_basis(2, param_vals)
+        self.assertEqual(basis, np.asfortranarray(expected))
+        self.assertFalse(basis.flags.writeable)
+        self.assertIs(self._call_function_under_test(2, 5), basis)
+        self.assertEqual(
+            _tessellation_helpers._GRID_BASES, {(2, 5): basis})
+
+
+class Test__second_differences(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers._second_differences(degree)
+
+    @mock.patch('bezier._tessellation_helpers._SECOND_DIFFERENCES', new={})
+    def test_quadratic(self):
+        first, middle, last = self._call_function_under_test(2)
+        self.assertEqual(first.tolist(), [0, 0, 2])
+        self.assertEqual(middle.tolist(), [1, 3, 4])
+        self.assertEqual(last.tolist(), [2, 5, 5])
+
+    @mock.patch('bezier._tessellation_helpers._SECOND_DIFFERENCES', new={})
+    def test_cubic(self):
+        first, middle, last = self._call_function_under_test(3)
+        self.assertEqual(first.tolist(), [0, 0, 2, 1, 1, 3, 4, 4, 6])
+        self.assertEqual(middle.tolist(), [1, 4, 5, 2, 5, 6, 5, 7, 8])
+        self.assertEqual(last.tolist(), [2, 7, 7, 3, 8, 8, 6, 9, 9])
+
+    @mock.patch('bezier._tessellation_helpers._SECOND_DIFFERENCES', new={})
+    def test_cached(self):
+        result = self._call_function_under_test(4)
+        self.assertIs(self._call_function_under_test(4), result)
+
+
+class Test_linearization_error(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.linearization_error(nodes, degree)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [3.0, 1.0],
+            [1.0, 2.0],
+        ])
+        self.assertEqual(self._call_function_under_test(nodes, 1), 0.0)
+
+    def test_degree_elevated_linear(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.0],
+            [1.0, 0.0],
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [0.0, 1.0],
+        ])
+        self.assertEqual(self._call_function_under_test(nodes, 2), 0.0)
+
+    def test_quadratic(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.5],
+            [1.0, 0.0],
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [0.0, 1.0],
+        ])
+        # The second differences are [0, -1], [0, 0] and [0, 0].
+        self.assertEqual(self._call_function_under_test(nodes, 2), 0.25)
+
+
+class Test_adaptive_pts_per_edge(unittest.TestCase):
+
+    NODES = np.asfortranarray([
+        [0.0, 0.0],
+        [0.5, 0.5],
+        [1.0, 0.0],
+        [0.0, 0.5],
+        [0.5, 0.5],
+        [0.0, 1.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree, tolerance):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.adaptive_pts_per_edge(
+            nodes, degree, tolerance)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ])
+        self.assertEqual(self._call_function_under_test(nodes, 1, 0.5), 2)
+
+    def test_quadratic(self):
+        # The estimated error is 0.25.
+        self.assertEqual(
+            self._call_function_under_test(self.NODES, 2, 0.25), 2)
+        self.assertEqual(
+            self._call_function_under_test(self.NODES, 2, 0.0625), 3)
+        self.assertEqual(
+            self._call_function_under_test(self.NODES, 2, 0.01), 6)
+
+    def test_capped(self):
+        result = self._call_function_under_test(self.NODES, 2, 1e-12)
+        self.assertEqual(result, 257)
+
+    def test_capped_fits_default_chunk(self):
+        from bezier import _tessellation_helpers
+
+        pts_per_edge = self._call_function_under_test(self.NODES, 2, 1e-12)
+        num_vertices = (pts_per_edge * (pts_per_edge + 1)) // 2
+        self.assertLessEqual(
+            num_vertices, _tessellation_helpers.DEFAULT_MAX_VERTICES)
+
+
+class Test_surface_buffers(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree, pts_per_edge):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.surface_buffers(
+            nodes, degree, pts_per_edge)
+
+    def test_it(self):
+        from bezier import _surface_helpers
+        from bezier import _tessellation_helpers
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0, 1.0],
+            [1.0, 0.25, 0.0],
+            [2.0, 0.0, 0.0],
+            [0.5, 1.0, 0.0],
+            [1.5, 1.0, 1.0],
+            [1.0, 2.0, 0.0],
+        ])
+        vertices, triangles = self._call_function_under_test(nodes, 2, 4)
+        param_vals, grid_triangles = _tessellation_helpers.triangle_grid(4)
+        expected = _surface_helpers.evaluate_cartesian_multi(
+            nodes, 2, param_vals, 3)
+        self.assertTrue(np.allclose(vertices, expected))
+        self.assertTrue(vertices.flags.f_contiguous)
+        self.assertEqual(triangles.tolist(), grid_triangles.tolist())
+        # The triangles are a (writable) copy.
+        self.assertTrue(triangles.flags.writeable)
+
+
+class Test_fill_boundary(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(edges, pts_per_edge, vertices):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.fill_boundary(
+            edges, pts_per_edge, vertices)
+
+    def test_it(self):
+        import bezier
+
+        edge0 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, -1.0],
+            [2.0, 0.0],
+        ]), 2)
+        edge1 = bezier.Curve(np.asfortranarray([
+            [2.0, 0.0],
+            [0.0, 0.0],
+        ]), 1)
+        vertices = np.full((5, 2), np.nan, order='F')
+        self._call_function_under_test([edge0, edge1], 3, vertices)
+        expected = np.asfortranarray([
+            [1.0, -0.5],
+            [2.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 0.0],
+            [np.nan, np.nan],
+        ])
+        self.assertTrue(np.allclose(vertices, expected, equal_nan=True))
+
+
+class Test_fill_loop(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(start, end, segments):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers.fill_loop(start, end, segments)
+
+    def test_it(self):
+        segments = np.zeros((3, 2), dtype=int)
+        self._call_function_under_test(4, 7, segments)
+        self.assertEqual(segments.tolist(), [[4, 5], [5, 6], [6, 4]])
+
+
+class Test__group(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(sized_items, max_vertices):
+        from bezier import _tessellation_helpers
+
+        return list(_tessellation_helpers._group(sized_items, max_vertices))
+
+    def test_it(self):
+        sized_items = [
+            ('a', 3, 1),
+            ('b', 4, 2),
+            ('c', 2, 1),
+            ('d', 9, 8),
+            ('e', 1, 1),
+        ]
+        result = self._call_function_under_test(sized_items, 7)
+        expected = [
+            ([('a', 3, 1), ('b', 4, 2)], 7, 3),
+            ([('c', 2, 1)], 2, 1),
+            # Too large for a chunk, so on its own.
+            ([('d', 9, 8)], 9, 8),
+            ([('e', 1, 1)], 1, 1),
+        ]
+        self.assertEqual(result, expected)
+
+    def test_empty(self):
+        self.assertEqual(self._call_function_under_test([], 7), [])
+
+    def test_lazy(self):
+        from bezier import _tessellation_helpers
+
+        consumed = []
+
+        def sized_items():
+            for item in ('a', 'b', 'c'):
+                consumed.append(item)
+                yield item, 1, 1
+
+        chunks = _tessellation_helpers._group(sized_items(), 1)
+        self.assertEqual(next(chunks), ([('a', 1, 1)], 1, 1))
+        self.assertEqual(consumed, ['a', 'b'])
+
+
+class Test__fill_mesh(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(
+            surface, pts_per_edge, vertices, triangles, vertex_start):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers._fill_mesh(
+            surface, pts_per_edge, vertices, triangles, vertex_start)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [2.0, 0.0],
+            [0.0, 2.0],
+        ])
+        surface = bezier.Surface(nodes, 1)
+        vertices = np.empty((3, 2), order='F')
+        triangles = np.empty((1, 3), dtype=int)
+        result = self._call_function_under_test(
+            surface, 2, vertices, triangles, 7)
+        self.assertIsNone(result)
+        self.assertEqual(vertices, nodes)
+        self.assertEqual(triangles.tolist(), [[7, 8, 9]])
+
+
+class Test__surface_chunk(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(chunk, num_vertices, num_triangles):
+        from bezier import _tessellation_helpers
+
+        return _tessellation_helpers._surface_chunk(
+            chunk, num_vertices, num_triangles)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ])
+        surface = bezier.Surface(nodes, 1)
+        chunk = [((4, surface, 2), 3, 1), ((6, surface, 3), 6, 4)]
+        vertices, triangles, surface_ids = self._call_function_under_test(
+            chunk, 9, 5)
+        self.assertEqual(vertices.shape, (9, 2))
+        self.assertEqual(np.asfortranarray(vertices[:3, :]), nodes)
+        self.assertEqual(triangles[0, :].tolist(), [0, 1, 2])
+        self.assertEqual(np.min(triangles[1:, :]), 3)
+        self.assertEqual(np.max(triangles[1:, :]), 8)
+        self.assertEqual(surface_ids.tolist(), [4, 6, 6, 6, 6])
+
+    def test_bad_dimension(self):
+        import bezier
+
+        surface1 = bezier.Surface(np.zeros((3, 2), order='F'), 1)
+        surface2 = bezier.Surface(np.zeros((3, 3), order='F'), 1)
+        chunk = [((0, surface1, 2), 3, 1), ((1, surface2, 2), 3, 1)]
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(chunk, 6, 2)
+
+
+class Test_stream_surfaces(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(
+            surfaces, pts_per_edge, tolerance, max_vertices):
+        from bezier import _tessellation_helpers
+
+        return list(_tessellation_helpers.stream_surfaces(
+            surfaces, pts_per_edge, tolerance, max_vertices))
+
+    def test_matches_single(self):
+        import bezier
+
+        surfaces = [
+            bezier.Surface(np.asfortranarray([
+                [0.0, 0.0],
+                [1.0, 0.0],
+                [0.0, 1.0],
+            ]), 1),
+            bezier.Surface(np.asfortranarray([
+                [0.0, 0.0],
+                [0.5, -0.25],
+                [1.0, 0.0],
+                [0.25, 0.5],
+                [0.75, 0.75],
+                [0.0, 1.0],
+            ]), 2),
+        ]
+        chunks = self._call_function_under_test(surfaces, 5, None, 100)
+        self.assertEqual(len(chunks), 1)
+        vertices, triangles, surface_ids = chunks[0]
+
+        offset = 0
+        tri_offset = 0
+        for index, surface in enumerate(surfaces):
+            sub_vertices, sub_triangles = surface.tessellate(pts_per_edge=5)
+            num_vertices = sub_vertices.shape[0]
+            num_triangles = sub_triangles.shape[0]
+            self.assertEqual(
+                np.asfortranarray(vertices[offset:offset + num_vertices]),
+                sub_vertices)
+            self.assertEqual(
+                triangles[tri_offset:tri_offset + num_triangles].tolist(),
+                (sub_triangles + offset).tolist())
+            self.assertEqual(
+                surface_ids[tri_offset:tri_offset + num_triangles].tolist(),
+                [index] * num_triangles)
+            offset += num_vertices
+            tri_offset += num_triangles
+
+    def test_bad_dimension(self):
+        import bezier
+
+        surfaces = [
+            bezier.Surface(np.zeros((3, 2), order='F'), 1),
+            bezier.Surface(np.zeros((3, 3), order='F'), 1),
+        ]
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(surfaces, 2, None, 100)
+
+
+class Test_stream_boundaries(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(polygons, pts_per_edge, max_vertices):
+        from bezier import _tessellation_helpers
+
+        return list(_tessellation_helpers.stream_boundaries(
+            polygons, pts_per_edge, max_vertices))
+
+    def test_it(self):
+        import bezier
+
+        edge0 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+        ]), 1)
+        edge1 = bezier.Curve(np.asfortranarray([
+            [1.0, 0.0],
+            [0.0, 0.0],
+        ]), 1)
+        polygon = bezier.CurvedPolygon(edge0, edge1)
+        chunks = self._call_function_under_test([polygon, polygon], 2, 3)
+        self.assertEqual(len(chunks), 2)
+        for index, (vertices, segments, polygon_ids) in enumerate(chunks):
+            expected = np.asfortranarray([
+                [1.0, 0.0],
+                [0.0, 0.0],
+            ])
+            self.assertEqual(vertices, expected)
+            self.assertEqual(segments.tolist(), [[0, 1], [1, 0]])
+            self.assertEqual(polygon_ids.tolist(), [index, index])
@@ -0,0 +1,373 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import sys
+import types
+import unittest
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+MODULE_NAME = 'bezier._fake_helpers'
+
+
+def _python_add(value1, value2):
+    return value1 + value2
+
+
+def _speedup_add(value1, value2):
+    return value2 + value1
+
+
+def _python_scale(value, factor):
+    return factor * value
+
+
+class _FakeModuleMixin(object):  # pylint: disable=too-few-public-methods
+
+    def setUp(self):
+        self.module = types.ModuleType(MODULE_NAME)
+        self.module.add = _speedup_add
+        self.module.scale = _python_scale
+        modules_patch = mock.patch.dict(
+            sys.modules, {MODULE_NAME: self.module})
+        kernels_patch = mock.patch(
+            'bezier.backend._KERNELS', new=collections.OrderedDict())
+        for patch in (modules_patch, kernels_patch):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        from bezier import backend
+
+        backend.register_defaults(MODULE_NAME, {
+            'add': _python_add,
+            'scale': _python_scale,
+        })
+
+
+class Test_Kernel(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import backend
+
+        return backend._Kernel
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        implementations = collections.OrderedDict([('python', _python_add)])
+        kernel = self._make_one(MODULE_NAME, 'add', 'python', implementations)
+        self.assertEqual(kernel.module_name, MODULE_NAME)
+        self.assertEqual(kernel.attr, 'add')
+        self.assertEqual(kernel.default, 'python')
+        self.assertEqual(kernel.active, 'python')
+        self.assertIs(kernel.implementations, implementations)
+
+    def test_activate(self):
+        module = types.ModuleType(MODULE_NAME)
+        module.add = _speedup_add
+        implementations = collections.OrderedDict([
+            ('python', _python_add),
+            ('speedup', _speedup_add),
+        ])
+        kernel = self._make_one(
+            MODULE_NAME, 'add', 'speedup', implementations)
+        with mock.patch.dict(sys.modules, {MODULE_NAME: module}):
+            kernel.activate('python')
+
+        self.assertIs(module.add, _python_add)
+        self.assertEqual(kernel.active, 'python')
+
+
+class Test__get_kernel(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(name):
+        from bezier import backend
+
+        return backend._get_kernel(name)
+
+    def test_it(self):
+        kernel = self._call_function_under_test('_fake_helpers.add')
+        self.assertEqual(kernel.attr, 'add')
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            self._call_function_under_test('_fake_helpers.subtract')
+
+
+class Test_register_defaults(_FakeModuleMixin, unittest.TestCase):
+
+    def test_it(self):
+        from bezier import backend
+
+        self.assertEqual(
+            list(backend._KERNELS),
+            ['_fake_helpers.add', '_fake_helpers.scale'])
+        add_kernel = backend._KERNELS['_fake_helpers.add']
+        self.assertEqual(add_kernel.default, 'speedup')
+        self.assertEqual(
+            list(add_kernel.implementations.items()),
+            [('python', _python_add), ('speedup', _speedup_add)])
+
+        # The bound implementation is the pure Python one.
+        scale_kernel = backend._KERNELS['_fake_helpers.scale']
+        self.assertEqual(scale_kernel.default, 'python')
+        self.assertEqual(
+            list(scale_kernel.implementations.items()),
+            [('python', _python_scale)])
+
+
+class Test_register_kernel(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(name, backend, func):
+        from bezier import backend as backend_mod
+
+        return backend_mod.register_kernel(name, backend, func)
+
+    def test_it(self):
+        from bezier import backend
+
+        self._call_function_under_test(
+            '_fake_helpers.scale', 'numpy', _speedup_add)
+        self.assertEqual(
+            backend.available_backends('_fake_helpers.scale'),
+            ('python', 'numpy'))
+        # The new implementation is not active.
+        self.assertIs(self.module.scale, _python_scale)
+
+    def test_replace_active(self):
+        from bezier import backend
+
+        self._call_function_under_test(
+            '_fake_helpers.scale', 'numpy', _python_add)
+        backend.use('numpy')
+        self.assertIs(self.module.scale, _python_add)
+        self._call_function_under_test(
+            '_fake_helpers.scale', 'numpy', _speedup_add)
+        self.assertIs(self.module.scale, _speedup_add)
+
+    def test_python(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                '_fake_helpers.scale', 'python', _speedup_add)
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            self._call_function_under_test(
+                '_fake_helpers.subtract', 'numpy', _speedup_add)
+
+
+class Test_kernels(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test():
+        from bezier import backend
+
+        return backend.kernels()
+
+    def test_it(self):
+        from bezier import backend
+
+        result = self._call_function_under_test()
+        self.assertEqual(list(result.items()), [
+            ('_fake_helpers.add', 'speedup'),
+            ('_fake_helpers.scale', 'python'),
+        ])
+        # The result is a copy.
+        result['_fake_helpers.add'] = 'python'
+        self.assertEqual(
+            backend.active_backend('_fake_helpers.add'), 'speedup')
+
+
+class Test_active_backend(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(name):
+        from bezier import backend
+
+        return backend.active_backend(name)
+
+    def test_it(self):
+        from bezier import backend
+
+        self.assertEqual(
+            self._call_function_under_test('_fake_helpers.add'), 'speedup')
+        backend.use('python')
+        self.assertEqual(
+            self._call_function_under_test('_fake_helpers.add'), 'python')
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            self._call_function_under_test('_fake_helpers.subtract')
+
+
+class Test_available_backends(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(name):
+        from bezier import backend
+
+        return backend.available_backends(name)
+
+    def test_it(self):
+        self.assertEqual(
+            self._call_function_under_test('_fake_helpers.add'),
+            ('python', 'speedup'))
+        self.assertEqual(
+            self._call_function_under_test('_fake_helpers.scale'),
+            ('python',))
+
+
+class Test_use(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(backend, **kwargs):
+        from bezier import backend as backend_mod
+
+        return backend_mod.use(backend, **kwargs)
+
+    def test_all(self):
+        from bezier import backend
+
+        self._call_function_under_test('python')
+        self.assertIs(self.module.add, _python_add)
+        self.assertIs(self.module.scale, _python_scale)
+
+        self._call_function_under_test('speedup')
+        self.assertIs(self.module.add, _speedup_add)
+        # Kernels without the backend are unchanged.
+        self.assertEqual(
+            backend.active_backend('_fake_helpers.scale'), 'python')
+
+    def test_single(self):
+        from bezier import backend
+
+        backend.register_kernel('_fake_helpers.scale', 'numpy', _python_add)
+        backend.register_kernel('_fake_helpers.add', 'numpy', _python_scale)
+        self._call_function_under_test('numpy', name='_fake_helpers.scale')
+        self.assertIs(self.module.scale, _python_add)
+        self.assertIs(self.module.add, _speedup_add)
+
+    def test_missing_backend(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test('numba')
+
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                'speedup', name='_fake_helpers.scale')
+
+    def test_unknown_kernel(self):
+        with self.assertRaises(KeyError):
+            self._call_function_under_test(
+                'python', name='_fake_helpers.subtract')
+
+
+class Test_using(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(backend, **kwargs):
+        from bezier import backend as backend_mod
+
+        return backend_mod.using(backend, **kwargs)
+
+    def test_it(self):
+        with self._call_function_under_test('python'):
+            self.assertIs(self.module.add, _python_add)
+
+        self.assertIs(self.module.add, _speedup_add)
+
+    def test_nested(self):
+        from bezier import backend
+
+        backend.register_kernel('_fake_helpers.scale', 'numpy', _python_add)
+        with self._call_function_under_test('python'):
+            with self._call_function_under_test(
+                    'numpy', name='_fake_helpers.scale'):
+                self.assertIs(self.module.add, _python_add)
+                self.assertIs(self.module.scale, _python_add)
+            self.assertIs(self.module.scale, _python_scale)
+
+        self.assertIs(self.module.add, _speedup_add)
+
+    def test_failure(self):
+        with self.assertRaises(RuntimeError):
+            with self._call_function_under_test('python'):
+                raise RuntimeError('broken')
+
+        self.assertIs(self.module.add, _speedup_add)
+
+
+class Test_reset(_FakeModuleMixin, unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test():
+        from bezier import backend
+
+        return backend.reset()
+
+    def test_it(self):
+        from bezier import backend
+
+        backend.use('python')
+        self.assertIs(self.module.add, _python_add)
+        self._call_function_under_test()
+        self.assertIs(self.module.add, _speedup_add)
+
+
+class TestHelperModules(unittest.TestCase):
+
+    def test_registered(self):
+        from bezier import backend
+
+        expected = ('python',)
+        if not utils.WITHOUT_SPEEDUPS:
+            expected += ('speedup',)
+        for name in ('_helpers.bbox', '_curve_helpers.evaluate_multi',
+                     '_intersection_helpers.newton_refine',
+                     '_surface_multi.locate_point'):
+            self.assertEqual(backend.available_backends(name), expected)
+            self.assertEqual(backend.active_backend(name), expected[-1])
+
+    def test_switch(self):
+        import bezier
+        from bezier import _curve_helpers
+        from bezier import backend
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ]), degree=2)
+        point = np.asfortranarray([[1.0, 1.0]])
+        with backend.using('python'):
+            self.assertIs(
+                _curve_helpers.locate_point, _curve_helpers._locate_point)
+            self.assertEqual(curve.locate(point), 0.5)
+            for name, active in backend.kernels().items():
+                self.assertEqual(active, 'python', msg=name)
+
+        if utils.WITHOUT_SPEEDUPS:
+            self.assertIs(
+                _curve_helpers.locate_point, _curve_helpers._locate_point)
+        else:
+            self.assertIs(
+                _curve_helpers.locate_point,
+                _curve_helpers._locate_point_speedup)
@@ -0,0 +1,181 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+class Test__basis_matrix(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree, s_vals):
+        from bezier import basis
+
+        return basis._basis_matrix(degree, s_vals)
+
+    def test_linear(self):
+        s_vals = np.asfortranarray([0.0, 0.25, 1.0])
+        result = self._call_function_under_test(1, s_vals)
+        expected = np.asfortranarray([
+            [1.0, 0.0],
+            [0.75, 0.25],
+            [0.0, 1.0],
+        ])
+        self.assertEqual(result, expected)
+
+    def test_cubic(self):
+        s_vals = np.asfortranarray([0.5])
+        result = self._call_function_under_test(3, s_vals)
+        expected = np.asfortranarray([[0.125, 0.375, 0.375, 0.125]])
+        self.assertEqual(result, expected)
+
+    def test_partition_of_unity(self):
+        s_vals = np.linspace(0.0, 1.0, 17)
+        result = self._call_function_under_test(7, s_vals)
+        self.assertTrue(np.allclose(result.sum(axis=1), 1.0))
+
+
+class TestBernsteinBasis(utils.NumPyTestCase):
+
+    NODES = np.asfortranarray([
+        [0.0, 0.0],
+        [1.0, 2.0],
+        [3.0, 1.0],
+    ])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import basis
+
+        return basis.BernsteinBasis
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        s_vals = [0.0, 0.5, 1.0]
+        basis = self._make_one(2, s_vals)
+        self.assertEqual(basis._degree, 2)
+        self.assertEqual(basis._s_vals, np.asfortranarray(s_vals))
+        self.assertEqual(basis._matrix.shape, (3, 3))
+        self.assertTrue(basis._matrix.flags.f_contiguous)
+        self.assertFalse(basis._matrix.flags.writeable)
+        self.assertFalse(basis._s_vals.flags.writeable)
+
+    def test_constructor_copies(self):
+        s_vals = np.asfortranarray([0.0, 1.0])
+        basis = self._make_one(1, s_vals)
+        self.assertIsNot(basis._s_vals, s_vals)
+        self.assertTrue(s_vals.flags.writeable)
+
+    def test_constructor_bad_degree(self):
+        with self.assertRaises(ValueError):
+            self._make_one(-1, [0.5])
+
+    def test_constructor_bad_shape(self):
+        with self.assertRaises(ValueError):
+            self._make_one(1, np.zeros((2, 2)))
+
+    def test_properties(self):
+        basis = self._make_one(2, [0.5])
+        self.assertEqual(basis.degree, 2)
+        self.assertIs(basis.s_vals, basis._s_vals)
+        self.assertIs(basis.matrix, basis._matrix)
+
+    def test___dict___property(self):
+        basis = self._make_one(1, [0.5])
+        props_dict = basis.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()), ['_degree', '_matrix', '_s_vals'])
+        self.assertIs(props_dict['_matrix'], basis._matrix)
+
+    def test___repr__(self):
+        basis = self._make_one(3, np.linspace(0.0, 1.0, 5))
+        self.assertEqual(
+            repr(basis), '<BernsteinBasis (degree=3, num_vals=5)>')
+
+    @mock.patch('bezier.basis._CACHE', new=collections.OrderedDict())
+    def test_cached(self):
+        from bezier import basis as basis_mod
+
+        klass = self._get_target_class()
+        s_vals = np.linspace(0.0, 1.0, 9)
+        basis = klass.cached(2, s_vals)
+        self.assertIsInstance(basis, klass)
+        self.assertEqual(len(basis_mod._CACHE), 1)
+        # Equal (but not identical) values re-use the basis.
+        self.assertIs(klass.cached(2, s_vals.copy()), basis)
+        self.assertEqual(len(basis_mod._CACHE), 1)
+        # A different degree or grid does not.
+        self.assertIsNot(klass.cached(3, s_vals), basis)
+        self.assertIsNot(klass.cached(2, s_vals[:-1]), basis)
+        self.assertEqual(len(basis_mod._CACHE), 3)
+
+    @mock.patch('bezier.basis._MAX_CACHED_BASES', new=2)
+    @mock.patch('bezier.basis._CACHE', new=collections.OrderedDict())
+    def test_cached_eviction(self):
+        from bezier import basis as basis_mod
+
+        klass = self._get_target_class()
+        s_vals = np.asfortranarray([0.5])
+        basis1 = klass.cached(1, s_vals)
+        basis2 = klass.cached(2, s_vals)
+        # Use ``basis1`` so that ``basis2`` is least recently used.
+        self.assertIs(klass.cached(1, s_vals), basis1)
+        klass.cached(3, s_vals)
+        self.assertEqual(len(basis_mod._CACHE), 2)
+        self.assertIs(klass.cached(1, s_vals), basis1)
+        self.assertIsNot(klass.cached(2, s_vals), basis2)
+
+    def test_evaluate(self):
+        from bezier import _curve_helpers
+
+        s_vals = np.linspace(0.0, 1.0, 7)
+        basis = self._make_one(2, s_vals)
+        result = basis.evaluate(self.NODES)
+        expected = _curve_helpers.evaluate_multi(self.NODES, s_vals)
+        self.assertTrue(np.allclose(result, expected))
+
+    def test_evaluate_wrong_degree(self):
+        basis = self._make_one(3, [0.5])
+        with self.assertRaises(ValueError):
+            basis.evaluate(self.NODES)
+
+    def test_evaluate_many(self):
+        s_vals = np.linspace(0.0, 1.0, 5)
+        basis = self._make_one(2, s_vals)
+        nodes_stack = np.stack([self.NODES, 2.0 * self.NODES + 1.0])
+        result = basis.evaluate_many(nodes_stack)
+        self.assertEqual(result.shape, (2, 5, 2))
+        for index in range(2):
+            expected = basis.evaluate(nodes_stack[index])
+            self.assertTrue(np.allclose(result[index], expected))
+
+    def test_evaluate_many_empty(self):
+        basis = self._make_one(2, [0.5])
+        result = basis.evaluate_many(np.zeros((0, 3, 2)))
+        self.assertEqual(result.shape, (0, 1, 2))
+
+    def test_evaluate_many_bad_shape(self):
+        basis = self._make_one(2, [0.5])
+        with self.assertRaises(ValueError):
+            basis.evaluate_many(self.NODES)
+
+    def test_evaluate_many_wrong_degree(self):
+        basis = self._make_one(1, [0.5])
+        with self.assertRaises(ValueError):
+            basis.evaluate_many(np.zeros((2, 3, 2)))
@@ -0,0 +1,446 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+class Test__metadata(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(values, num_shapes, default, copy):
+        from bezier import collection
+
+        return collection._metadata(values, num_shapes, default, copy)
+
+    def test_default(self):
+        result = self._call_function_under_test(None, 3, 1.0, True)
+        self.assertEqual(result, np.asfortranarray([1.0, 1.0, 1.0]))
+        self.assertFalse(result.flags.writeable)
+
+    def test_copy(self):
+        values = np.asfortranarray([0.5, 0.25])
+        result = self._call_function_under_test(values, 2, 0.0, True)
+        self.assertEqual(result, values)
+        self.assertFalse(np.may_share_memory(result, values))
+        self.assertFalse(result.flags.writeable)
+        self.assertTrue(values.flags.writeable)
+
+    def test_no_copy(self):
+        values = np.asfortranarray([0.5, 0.25])
+        result = self._call_function_under_test(values, 2, 0.0, False)
+        self.assertTrue(np.may_share_memory(result, values))
+        self.assertFalse(result.flags.writeable)
+        self.assertTrue(values.flags.writeable)
+
+    def test_bad_shape(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test([0.0, 1.0], 3, 0.0, True)
+
+
+class Test__surface_elevation_matrix(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import collection
+
+        return collection._surface_elevation_matrix(degree)
+
+    def test_cached(self):
+        cache = {}
+        patch = mock.patch(
+            'bezier.collection._SURFACE_ELEVATION_MATRICES', new=cache)
+        with patch:
+            matrix = self._call_function_under_test(1)
+            self.assertEqual(list(cache.keys()), [1])
+            self.assertFalse(matrix.flags.writeable)
+            self.assertEqual(matrix.shape, (6, 3))
+            expected = np.asfortranarray([
+                [1.0, 0.0, 0.0],
+                [0.5, 0.5, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.5, 0.0, 0.5],
+                [0.0, 0.5, 0.5],
+                [0.0, 0.0, 1.0],
+            ])
+            self.assertEqual(matrix, expected)
+            # Make sure the matrix is re-used.
+            self.assertIs(self._call_function_under_test(1), matrix)
+
+
+class Test_Collection(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import collection
+
+        return collection._Collection
+
+    def test__num_nodes(self):
+        klass = self._get_target_class()
+        with self.assertRaises(NotImplementedError):
+            klass._num_nodes(1)
+
+    def test__get_shape(self):
+        klass = self._get_target_class()
+        collection = klass.__new__(klass)
+        with self.assertRaises(NotImplementedError):
+            collection._get_shape(0)
+
+
+class TestCurveCollection(utils.NumPyTestCase):
+
+    NODES = np.asfortranarray([
+        [[0.0, 0.0], [1.0, 2.0], [2.0, 0.0]],
+        [[0.0, 1.0], [2.0, 1.0], [4.0, 1.0]],
+        [[1.0, 0.0], [1.0, 1.0], [-1.0, 3.0]],
+    ])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import collection
+
+        return collection.CurveCollection
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_curves(self):
+        import bezier
+
+        return [
+            bezier.Curve(self.NODES[index], 2, start=0.125 * index)
+            for index in range(3)
+        ]
+
+    def test_constructor(self):
+        curves = self._make_one(self.NODES, 2)
+        self.assertEqual(curves._degree, 2)
+        self.assertEqual(curves._nodes.tolist(), self.NODES.tolist())
+        self.assertFalse(np.may_share_memory(curves._nodes, self.NODES))
+        self.assertFalse(curves._nodes.flags.writeable)
+        self.assertEqual(curves._starts.tolist(), [0.0, 0.0, 0.0])
+        self.assertEqual(curves._ends.tolist(), [1.0, 1.0, 1.0])
+
+    def test_constructor_no_copy(self):
+        starts = np.asfortranarray([0.0, 0.25, 0.5])
+        curves = self._make_one(self.NODES, 2, starts=starts, _copy=False)
+        self.assertTrue(np.may_share_memory(curves._nodes, self.NODES))
+        self.assertFalse(curves._nodes.flags.writeable)
+        self.assertTrue(self.NODES.flags.writeable)
+        self.assertEqual(curves._starts, starts)
+
+    def test_constructor_wrong_degree(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.NODES, 1)
+
+    def test_constructor_not_stack(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.NODES[0], 2)
+
+    def test_constructor_bad_metadata(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.NODES, 2, ends=[1.0, 1.0])
+
+    def test_from_curves(self):
+        klass = self._get_target_class()
+        curves = klass.from_curves(self._make_curves())
+        self.assertIsInstance(curves, klass)
+        self.assertEqual(curves._nodes.tolist(), self.NODES.tolist())
+        self.assertEqual(curves._starts.tolist(), [0.0, 0.125, 0.25])
+
+    def test_from_curves_empty(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError):
+            klass.from_curves([])
+
+    def test_from_curves_mixed(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curves = self._make_curves()
+        curves.append(bezier.Curve(self.NODES[0, :2, :], 1))
+        with self.assertRaises(ValueError):
+            klass.from_curves(curves)
+
+    def test_properties(self):
+        curves = self._make_one(self.NODES, 2)
+        self.assertEqual(curves.degree, 2)
+        self.assertEqual(curves.dimension, 2)
+        for name in ('nodes', 'starts', 'ends'):
+            value = getattr(curves, name)
+            internal = getattr(curves, '_' + name)
+            self.assertEqual(value.tolist(), internal.tolist())
+            self.assertIsNot(value, internal)
+            self.assertTrue(value.flags.writeable)
+
+    def test___dict___property(self):
+        curves = self._make_one(self.NODES, 2)
+        props_dict = curves.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()),
+            ['_degree', '_ends', '_nodes', '_starts'])
+        self.assertIs(props_dict['_nodes'], curves._nodes)
+
+    def test___len__(self):
+        curves = self._make_one(self.NODES, 2)
+        self.assertEqual(len(curves), 3)
+
+    def test___repr__(self):
+        curves = self._make_one(self.NODES, 2)
+        self.assertEqual(
+            repr(curves),
+            '<CurveCollection (num_shapes=3, degree=2, dimension=2)>')
+
+    def test___getitem__(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curves = klass.from_curves(self._make_curves())
+        curve = curves[1]
+        self.assertIsInstance(curve, bezier.Curve)
+        self.assertEqual(curve._nodes, np.asfortranarray(self.NODES[1]))
+        self.assertTrue(curve._nodes.flags.writeable)
+        self.assertEqual(curve._degree, 2)
+        self.assertEqual(curve._start, 0.125)
+        self.assertEqual(curve._end, 1.0)
+        self.assertEqual(curves[-1]._start, 0.25)
+
+    def test___getitem__out_of_range(self):
+        curves = self._make_one(self.NODES, 2)
+        with self.assertRaises(IndexError):
+            curves.__getitem__(3)
+        with self.assertRaises(IndexError):
+            curves.__getitem__(-4)
+
+    def test___iter__(self):
+        curves = self._make_one(self.NODES, 2)
+        nodes = [curve._nodes for curve in curves]
+        self.assertEqual(len(nodes), 3)
+        for index, curve_nodes in enumerate(nodes):
+            self.assertEqual(
+                curve_nodes, np.asfortranarray(self.NODES[index]))
+
+    def test_evaluate_multi(self):
+        curves = self._make_one(self.NODES, 2)
+        s_vals = np.linspace(0.0, 1.0, 5)
+        result = curves.evaluate_multi(s_vals)
+        self.assertEqual(result.shape, (3, 5, 2))
+        for index, curve in enumerate(curves):
+            expected = curve.evaluate_multi(s_vals)
+            self.assertTrue(np.allclose(result[index], expected))
+
+    def test_subdivide(self):
+        klass = self._get_target_class()
+        curves = klass.from_curves(self._make_curves())
+        left, right = curves.subdivide()
+        self.assertIsInstance(left, klass)
+        self.assertIsInstance(right, klass)
+        for index, curve in enumerate(curves):
+            expected_left, expected_right = curve.subdivide()
+            for halves, expected in ((left, expected_left),
+                                     (right, expected_right)):
+                half = halves[index]
+                self.assertEqual(half._nodes, expected._nodes)
+                self.assertEqual(half._start, expected._start)
+                self.assertEqual(half._end, expected._end)
+
+    def test_bbox(self):
+        curves = self._make_one(self.NODES, 2)
+        expected = np.asfortranarray([
+            [0.0, 2.0, 0.0, 2.0],
+            [0.0, 4.0, 1.0, 1.0],
+            [-1.0, 1.0, 0.0, 3.0],
+        ])
+        self.assertEqual(np.asfortranarray(curves.bbox()), expected)
+
+    def test_bbox_wrong_dimension(self):
+        nodes = np.zeros((2, 2, 3))
+        curves = self._make_one(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            curves.bbox()
+
+    def test_length(self):
+        nodes = np.asfortranarray([
+            [[0.0, 0.0], [3.0, 4.0]],
+            [[1.0, 1.0], [1.0, 2.0]],
+        ])
+        curves = self._make_one(nodes, 1)
+        self.assertEqual(curves.length().tolist(), [5.0, 1.0])
+
+    def test_elevate(self):
+        klass = self._get_target_class()
+        curves = klass.from_curves(self._make_curves())
+        elevated = curves.elevate()
+        self.assertIsInstance(elevated, klass)
+        self.assertEqual(elevated.degree, 3)
+        self.assertEqual(elevated._starts, curves._starts)
+        for index, curve in enumerate(curves):
+            expected = curve.elevate()
+            self.assertTrue(np.allclose(
+                elevated._nodes[index], expected._nodes))
+
+
+class TestSurfaceCollection(utils.NumPyTestCase):
+
+    NODES = np.asfortranarray([
+        [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0],
+         [0.0, 1.0], [1.0, 1.0], [0.0, 2.0]],
+        [[1.0, 1.0], [2.0, 0.5], [3.0, 1.0],
+         [1.5, 2.0], [2.5, 2.0], [2.0, 3.0]],
+    ])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import collection
+
+        return collection.SurfaceCollection
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_surfaces(self):
+        import bezier
+
+        return [
+            bezier.Surface(
+                self.NODES[0], 2, base_x=0.25, base_y=0.5, width=0.25),
+            bezier.Surface(self.NODES[1], 2),
+        ]
+
+    def test_constructor(self):
+        surfaces = self._make_one(self.NODES, 2)
+        self.assertEqual(surfaces._degree, 2)
+        self.assertEqual(surfaces._nodes.tolist(), self.NODES.tolist())
+        self.assertFalse(surfaces._nodes.flags.writeable)
+        self.assertEqual(surfaces._base_x.tolist(), [0.0, 0.0])
+        self.assertEqual(surfaces._base_y.tolist(), [0.0, 0.0])
+        self.assertEqual(surfaces._widths.tolist(), [1.0, 1.0])
+
+    def test_constructor_wrong_degree(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.NODES, 1)
+
+    def test_from_surfaces(self):
+        klass = self._get_target_class()
+        surfaces = klass.from_surfaces(self._make_surfaces())
+        self.assertIsInstance(surfaces, klass)
+        self.assertEqual(surfaces._nodes.tolist(), self.NODES.tolist())
+        self.assertEqual(surfaces._base_x.tolist(), [0.25, 0.0])
+        self.assertEqual(surfaces._base_y.tolist(), [0.5, 0.0])
+        self.assertEqual(surfaces._widths.tolist(), [0.25, 1.0])
+
+    def test_from_surfaces_empty(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError):
+            klass.from_surfaces([])
+
+    def test_from_surfaces_mixed(self):
+        import bezier
+
+        klass = self._get_target_class()
+        surfaces = self._make_surfaces()
+        surfaces.append(bezier.Surface(self.NODES[0, :3, :], 1))
+        with self.assertRaises(ValueError):
+            klass.from_surfaces(surfaces)
+
+    def test_properties(self):
+        klass = self._get_target_class()
+        surfaces = klass.from_surfaces(self._make_surfaces())
+        self.assertEqual(surfaces.degree, 2)
+        self.assertEqual(surfaces.dimension, 2)
+        self.assertEqual(surfaces.base_x.tolist(), [0.25, 0.0])
+        self.assertEqual(surfaces.base_y.tolist(), [0.5, 0.0])
+        self.assertEqual(surfaces.widths.tolist(), [0.25, 1.0])
+        self.assertIsNot(surfaces.widths, surfaces._widths)
+
+    def test___dict___property(self):
+        surfaces = self._make_one(self.NODES, 2)
+        props_dict = surfaces.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()),
+            ['_base_x', '_base_y', '_degree', '_nodes', '_widths'])
+
+    def test___repr__(self):
+        surfaces = self._make_one(self.NODES, 2)
+        self.assertEqual(
+            repr(surfaces),
+            '<SurfaceCollection (num_shapes=2, degree=2, dimension=2)>')
+
+    def test___getitem__(self):
+        import bezier
+
+        klass = self._get_target_class()
+        surfaces = klass.from_surfaces(self._make_surfaces())
+        surface = surfaces[0]
+        self.assertIsInstance(surface, bezier.Surface)
+        self.assertEqual(
+            surface._nodes, np.asfortranarray(self.NODES[0]))
+        self.assertEqual(surface._degree, 2)
+        self.assertEqual(surface._base_x, 0.25)
+        self.assertEqual(surface._base_y, 0.5)
+        self.assertEqual(surface._width, 0.25)
+
+    def test_evaluate_cartesian_multi(self):
+        surfaces = self._make_one(self.NODES, 2)
+        param_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [0.25, 0.5],
+            [1.0, 0.0],
+        ])
+        result = surfaces.evaluate_cartesian_multi(param_vals)
+        self.assertEqual(result.shape, (2, 3, 2))
+        for index, surface in enumerate(surfaces):
+            expected = surface.evaluate_cartesian_multi(param_vals)
+            self.assertTrue(np.allclose(result[index], expected))
+
+    def test_subdivide(self):
+        klass = self._get_target_class()
+        surfaces = klass.from_surfaces(self._make_surfaces())
+        sub_surfaces = surfaces.subdivide()
+        self.assertEqual(len(sub_surfaces), 4)
+        for index, surface in enumerate(surfaces):
+            expected = surface.subdivide()
+            for children, child in zip(sub_surfaces, expected):
+                self.assertIsInstance(children, klass)
+                sub_surface = children[index]
+                self.assertTrue(np.allclose(
+                    sub_surface._nodes, child._nodes))
+                self.assertEqual(sub_surface._base_x, child._base_x)
+                self.assertEqual(sub_surface._base_y, child._base_y)
+                self.assertEqual(sub_surface._width, child._width)
+
+    def test_bbox(self):
+        surfaces = self._make_one(self.NODES, 2)
+        expected = np.asfortranarray([
+            [0.0, 2.0, 0.0, 2.0],
+            [1.0, 3.0, 0.5, 3.0],
+        ])
+        self.assertEqual(np.asfortranarray(surfaces.bbox()), expected)
+
+    def test_elevate(self):
+        klass = self._get_target_class()
+        surfaces = klass.from_surfaces(self._make_surfaces())
+        elevated = surfaces.elevate()
+        self.assertIsInstance(elevated, klass)
+        self.assertEqual(elevated.degree, 3)
+        self.assertEqual(elevated._widths, surfaces._widths)
+        for index, surface in enumerate(surfaces):
+            expected = surface.elevate()
+            self.assertTrue(np.allclose(
+                elevated._nodes[index], expected._nodes))
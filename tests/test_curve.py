@@ -182,6 +182,8 @@ class TestCurve(utils.NumPyTestCase):
             '_edge_index': None,
             '_next_edge': None,
             '_previous_edge': None,
+            '_subdivision': None,
+            '_bbox': None,
         }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``curve``.
@@ -310,6 +312,28 @@ class TestCurve(utils.NumPyTestCase):
         call = ax.plot.mock_calls[0]
         utils.check_plot_call(self, call, nodes, color=color, alpha=alpha)
 
+    def test_flatten(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ])
+        curve = self._make_one(nodes, 2)
+        result = curve.flatten(0.25)
+        expected = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, 0.0],
+        ])
+        self.assertEqual(result, expected)
+
+    def test_flatten_bad_tolerance(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(ValueError):
+            curve.flatten(0.0)
+        with self.assertRaises(ValueError):
+            curve.flatten(np.nan)
+
     def test_subdivide_multilevel_root(self):
         curve = self._make_one(self.ZEROS, 1)
         left, right = curve.subdivide()
@@ -452,6 +476,34 @@ class TestCurve(utils.NumPyTestCase):
         self.assertEqual(curve.degree, degree)
         self._subdivide_points_check(curve)
 
+    def test_subdivide_cached(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 3.0],
+            [2.0, 1.0],
+        ])
+        curve = self._make_one(nodes, 2)
+        cache = curve.enable_subdivision_cache()
+
+        left, right = curve.subdivide()
+        self.assertEqual(left._subdivision, (cache, 1, 0))
+        self.assertEqual(right._subdivision, (cache, 1, 1))
+        self.assertIs(left.root, curve)
+        self.assertEqual(right.start, 0.5)
+        result = curve.subdivide()
+        self.assertIs(result[0], left)
+        self.assertIs(result[1], right)
+
+        _, right_right = right.subdivide()
+        self.assertIs(right_right.subdivision_cache, cache)
+        self.assertEqual(right_right._subdivision, (cache, 2, 3))
+        self.assertEqual(right_right.start, 0.75)
+        self.assertIs(right.subdivide()[1], right_right)
+        self.assertEqual(len(cache), 2)
+
+        curve.disable_subdivision_cache()
+        self.assertIsNot(curve.subdivide()[0], left)
+
     def test_intersect_empty(self):
         nodes1 = np.asfortranarray([
             [0.0, 0.0],
@@ -508,6 +560,40 @@ class TestCurve(utils.NumPyTestCase):
     def test_intersect(self):
         self._intersect_helper()
 
+    def test_intersect_cached(self):
+        nodes_left = np.asfortranarray([
+            [0.25, 0.4375],
+            [0.625, 1.0],
+            [1.0, 1.0],
+        ])
+        left = self._make_one(nodes_left, 2)
+        nodes_right = np.asfortranarray([
+            [0.0, 1.0],
+            [0.375, 1.0],
+            [0.75, 0.4375],
+        ])
+        right = self._make_one(nodes_right, 2)
+        cache_left = left.enable_subdivision_cache()
+        cache_right = right.enable_subdivision_cache()
+
+        # Make sure neither the struct-of-arrays pool nor the compiled
+        # version (if present) is used.
+        patch = mock.patch(
+            'bezier._intersection_helpers._geometric_intersections',
+            side_effect=AssertionError)
+        expected = np.asfortranarray([[0.5, 0.75]])
+        with patch:
+            self.assertEqual(left.intersect(right), expected)
+            num_entries = (len(cache_left), len(cache_right))
+            self.assertGreater(min(num_entries), 0)
+
+            no_subdivide = mock.patch.object(
+                type(left), '_subdivide', side_effect=AssertionError)
+            with no_subdivide:
+                self.assertEqual(left.intersect(right), expected)
+
+        self.assertEqual((len(cache_left), len(cache_right)), num_entries)
+
     def test_intersect_no_verify(self):
         self._intersect_helper(_verify=False)
 
@@ -624,3 +710,384 @@ class TestCurve(utils.NumPyTestCase):
         point = curve.evaluate_multi(np.asfortranarray([s_val]))
         result = curve.locate(point)
         self.assertEqual(result, s_val)
+
+    def test_locate_cached(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, -1.0],
+            [5.0, 1.0],
+        ])
+        curve = self._make_one(nodes, 3)
+        cache = curve.enable_subdivision_cache()
+        point = curve.evaluate_multi(np.asfortranarray([0.75]))
+        # Make sure the compiled version (if present) is not used.
+        patch = mock.patch(
+            'bezier._curve_helpers.locate_point', side_effect=AssertionError)
+        with patch:
+            self.assertEqual(curve.locate(point), 0.75)
+            num_entries = len(cache)
+            self.assertGreater(num_entries, 0)
+
+            # A second call is served entirely from the cache.
+            no_subdivide = mock.patch.object(
+                type(curve), '_subdivide', side_effect=AssertionError)
+            with no_subdivide:
+                self.assertEqual(curve.locate(point), 0.75)
+
+        self.assertEqual(len(cache), num_entries)
+
+    def test_locate_multi_wrong_shape(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ])
+        curve = self._make_one(nodes, 1)
+        points = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            curve.locate_multi(points)
+        with self.assertRaises(ValueError):
+            curve.locate_multi(np.asfortranarray([0.0, 1.0]))
+
+    def test_locate_multi(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, -1.0],
+            [5.0, 1.0],
+        ])
+        curve = self._make_one(nodes, 3)
+        s_vals = np.asfortranarray([0.75, 0.25])
+        points = curve.evaluate_multi(s_vals)
+        points = np.vstack([points, [[5.0, 5.0]]])
+        result = curve.locate_multi(points)
+        self.assertEqual(result[:2], s_vals)
+        self.assertTrue(np.isnan(result[2]))
+
+    def test_locate_multi_cached(self):
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, -1.0],
+            [5.0, 1.0],
+        ])
+        curve = self._make_one(nodes, 3)
+        cache = curve.enable_subdivision_cache()
+        s_vals = np.asfortranarray([0.75, 0.25])
+        points = curve.evaluate_multi(s_vals)
+        points = np.vstack([points, [[5.0, 5.0]]])
+        patch = mock.patch(
+            'bezier._curve_helpers.locate_point_multi',
+            side_effect=AssertionError)
+        with patch:
+            result = curve.locate_multi(points)
+            num_entries = len(cache)
+            self.assertGreater(num_entries, 0)
+
+            no_subdivide = mock.patch.object(
+                type(curve), '_subdivide', side_effect=AssertionError)
+            with no_subdivide:
+                new_result = curve.locate_multi(points)
+
+        self.assertEqual(result[:2], s_vals)
+        self.assertTrue(np.isnan(result[2]))
+        self.assertEqual(new_result[:2], s_vals)
+        self.assertTrue(np.isnan(new_result[2]))
+        self.assertEqual(len(cache), num_entries)
+
+
+class Test_intersect_many(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(curves_a, curves_b, **kwargs):
+        from bezier import curve
+
+        return curve.intersect_many(curves_a, curves_b, **kwargs)
+
+    @staticmethod
+    def _make_curve(nodes, degree):
+        from bezier import curve
+
+        return curve.Curve(nodes, degree)
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test([None], [])
+
+    def test_non_curve(self):
+        line = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), 1)
+        with self.assertRaises(TypeError):
+            self._call_function_under_test([line], [None])
+
+    def test_unsupported_dimension(self):
+        line = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), 1)
+        line3d = self._make_curve(np.asfortranarray([
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+        ]), 1)
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test([line], [line3d])
+
+    def test_empty(self):
+        pair_indices, points, failed = self._call_function_under_test([], [])
+        self.assertEqual(pair_indices, np.zeros((0,), dtype=int))
+        self.assertEqual(points, np.zeros((0, 2), order='F'))
+        self.assertEqual(failed, np.zeros((0,), dtype=int))
+
+    def _check_pairs(self, **kwargs):
+        curve = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.375, 0.75],
+            [0.75, 0.375],
+        ]), 2)
+        line1 = self._make_curve(np.asfortranarray([
+            [0.5, 0.0],
+            [0.5, 0.75],
+        ]), 1)
+        line2 = self._make_curve(np.asfortranarray([
+            [0.0, 0.46875],
+            [1.0, 0.46875],
+        ]), 1)
+        line3 = self._make_curve(np.asfortranarray([
+            [2.0, 0.0],
+            [2.0, 1.0],
+        ]), 1)
+
+        pair_indices, points, failed = self._call_function_under_test(
+            [curve, line3, curve, line1],
+            [line1, curve, line2, line2], **kwargs)
+
+        self.assertEqual(pair_indices, np.asfortranarray([0, 2, 2, 3]))
+        self.assertEqual(failed.shape, (0,))
+        expected = np.asfortranarray([
+            [0.5, 0.5],
+            [0.375, 0.46875],
+            [0.625, 0.46875],
+            [0.5, 0.46875],
+        ])
+        self.assertTrue(np.allclose(points, expected, atol=0.0, rtol=1e-14))
+
+    def test_geometric(self):
+        self._check_pairs()
+
+    def test_algebraic(self):
+        from bezier import curve
+
+        self._check_pairs(strategy=curve.IntersectionStrategy.algebraic)
+
+    def test_no_verify(self):
+        self._check_pairs(_verify=False)
+
+    def _check_failed(self, **kwargs):
+        curve = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), 2)
+        # NOTE: This is tangent to ``curve`` at s = 1/2.
+        line1 = self._make_curve(np.asfortranarray([
+            [0.0, 0.5],
+            [1.0, 0.5],
+        ]), 1)
+        line2 = self._make_curve(np.asfortranarray([
+            [0.0, 0.375],
+            [1.0, 0.375],
+        ]), 1)
+
+        return self._call_function_under_test(
+            [curve, curve, curve], [line1, line2, curve], **kwargs)
+
+    def test_failed_geometric(self):
+        pair_indices, points, failed = self._check_failed()
+        # NOTE: The tangent pair is fine, but a curve matched with itself
+        #       is "all" intersection.
+        self.assertEqual(pair_indices.tolist(), [0, 1, 1])
+        expected = np.asfortranarray([
+            [0.5, 0.5],
+            [0.25, 0.375],
+            [0.75, 0.375],
+        ])
+        self.assertTrue(np.allclose(points, expected, atol=0.0, rtol=1e-14))
+        self.assertEqual(failed.tolist(), [2])
+
+    def test_failed_algebraic(self):
+        from bezier import curve
+
+        pair_indices, points, failed = self._check_failed(
+            strategy=curve.IntersectionStrategy.algebraic)
+        # NOTE: The "intersection polynomial" for the tangent pair has
+        #       a double root.
+        self.assertEqual(pair_indices.tolist(), [1, 1])
+        expected = np.asfortranarray([
+            [0.25, 0.375],
+            [0.75, 0.375],
+        ])
+        self.assertTrue(np.allclose(points, expected, atol=0.0, rtol=1e-14))
+        self.assertEqual(failed.tolist(), [0, 2])
+
+
+class Test_intersect_network(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(curves, **kwargs):
+        from bezier import curve
+
+        return curve.intersect_network(curves, **kwargs)
+
+    @staticmethod
+    def _make_curve(nodes, degree):
+        from bezier import curve
+
+        return curve.Curve(nodes, degree)
+
+    def test_non_curve(self):
+        with self.assertRaises(TypeError):
+            self._call_function_under_test([None])
+
+    def test_unsupported_dimension(self):
+        line3d = self._make_curve(np.asfortranarray([
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+        ]), 1)
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test([line3d])
+
+    def test_empty(self):
+        pairs, points, failed = self._call_function_under_test([])
+        self.assertEqual(pairs.shape, (0, 2))
+        self.assertEqual(points, np.zeros((0, 2), order='F'))
+        self.assertEqual(failed.shape, (0, 2))
+
+    def _check_network(self, **kwargs):
+        from bezier import curve as curve_mod
+
+        curve = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), 2)
+        line1 = self._make_curve(np.asfortranarray([
+            [0.5, 0.0],
+            [0.5, 1.0],
+        ]), 1)
+        line2 = self._make_curve(np.asfortranarray([
+            [3.0, 0.0],
+            [4.0, 1.0],
+        ]), 1)
+        line3 = self._make_curve(np.asfortranarray([
+            [0.0, 0.375],
+            [1.0, 0.375],
+        ]), 1)
+
+        patch = mock.patch(
+            'bezier.curve.intersect_many',
+            wraps=curve_mod.intersect_many)
+        with patch as mocked:
+            pairs, points, failed = self._call_function_under_test(
+                [line2, curve, line3, line1], **kwargs)
+            # Make sure ``line2`` never reaches the narrow phase.
+            curves_a, curves_b = mocked.call_args[0]
+            self.assertEqual(curves_a, [curve, curve, line3])
+            self.assertEqual(curves_b, [line3, line1, line1])
+
+        self.assertEqual(pairs.tolist(), [[1, 2], [1, 2], [1, 3], [2, 3]])
+        self.assertEqual(failed.shape, (0, 2))
+        expected = np.asfortranarray([
+            [0.25, 0.375],
+            [0.75, 0.375],
+            [0.5, 0.5],
+            [0.5, 0.375],
+        ])
+        self.assertTrue(np.allclose(points, expected, atol=0.0, rtol=1e-14))
+
+    def test_geometric(self):
+        self._check_network()
+
+    def test_algebraic(self):
+        from bezier import curve
+
+        self._check_network(strategy=curve.IntersectionStrategy.algebraic)
+
+    def test_no_verify(self):
+        self._check_network(_verify=False)
+
+    def test_failed(self):
+        from bezier import curve as curve_mod
+
+        curve = self._make_curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), 2)
+        # NOTE: This is tangent to ``curve`` at s = 1/2.
+        line1 = self._make_curve(np.asfortranarray([
+            [0.0, 0.5],
+            [1.0, 0.5],
+        ]), 1)
+        line2 = self._make_curve(np.asfortranarray([
+            [0.0, 0.375],
+            [1.0, 0.375],
+        ]), 1)
+
+        strategy = curve_mod.IntersectionStrategy.algebraic
+        pairs, points, failed = self._call_function_under_test(
+            [line1, curve, line2], strategy=strategy)
+        self.assertEqual(pairs.tolist(), [[1, 2], [1, 2]])
+        expected = np.asfortranarray([
+            [0.25, 0.375],
+            [0.75, 0.375],
+        ])
+        self.assertTrue(np.allclose(points, expected, atol=0.0, rtol=1e-14))
+        self.assertEqual(failed.tolist(), [[0, 1]])
+
+
+class Test_curves_from_buffer(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import curve
+
+        return curve.curves_from_buffer(nodes, degree)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+            [2.0, 0.0],
+            [3.0, -2.0],
+            [4.0, 0.0],
+        ])
+        curves = self._call_function_under_test(nodes, 2)
+        self.assertEqual(len(curves), 2)
+        for index, curve in enumerate(curves):
+            self.assertIsInstance(curve, bezier.Curve)
+            self.assertEqual(curve.degree, 2)
+            self.assertEqual(curve.dimension, 2)
+            self.assertIs(curve._nodes.base, nodes)
+            self.assertEqual(
+                curve.evaluate(0.5).tolist(),
+                [[2.0 * index + 1.0, 1.0 - 2.0 * index]])
+
+    def test_read_only(self):
+        nodes = np.asfortranarray([
+            [0.0, 1.0],
+            [1.0, 1.0],
+        ])
+        nodes.flags.writeable = False
+        curve, = self._call_function_under_test(nodes, 1)
+        self.assertEqual(curve.evaluate(0.5).tolist(), [[0.5, 1.0]])
+        _, right = curve.subdivide()
+        self.assertEqual(right._nodes.tolist(), [[0.5, 1.0], [1.0, 1.0]])
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((5, 2), order='F'), 2)
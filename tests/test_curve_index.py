@@ -0,0 +1,225 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import numpy as np
+
+from tests import utils
+
+
+class TestCurveIndex(utils.NumPyTestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve_index
+
+        return curve_index.CurveIndex
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    @staticmethod
+    def _make_lines(x_vals):
+        import bezier
+
+        curves = []
+        for x_val in x_vals:
+            nodes = np.asfortranarray([
+                [x_val, 0.0],
+                [x_val, 1.0],
+            ])
+            curves.append(bezier.Curve(nodes, degree=1))
+        return curves
+
+    def test_constructor(self):
+        curves = self._make_lines([0.25, 0.5, 2.0])
+        index = self._make_one(curves)
+        self.assertEqual(index._curves, tuple(curves))
+        expected = np.asfortranarray([
+            [0.25, 0.25, 0.0, 1.0],
+            [0.5, 0.5, 0.0, 1.0],
+            [2.0, 2.0, 0.0, 1.0],
+        ])
+        self.assertEqual(np.asfortranarray(index._boxes), expected)
+        self.assertEqual(len(index._tree), 3)
+
+    def test_constructor_empty(self):
+        index = self._make_one([])
+        self.assertEqual(index._curves, ())
+        self.assertEqual(index._boxes.shape, (0, 4))
+
+    def test_constructor_non_curve(self):
+        with self.assertRaises(TypeError):
+            self._make_one([object()])
+
+    def test_constructor_wrong_dimension(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+        ])
+        curve = bezier.Curve(nodes, degree=1)
+        with self.assertRaises(NotImplementedError):
+            self._make_one([curve])
+
+    def test_constructor_without_verify(self):
+        curve = mock.Mock(spec=['_get_bbox'])
+        curve._get_bbox.return_value = (0.0, 1.0, 0.0, 1.0)
+        index = self._make_one([curve], _verify=False)
+        self.assertEqual(index._curves, (curve,))
+        self.assertEqual(index._boxes.tolist(), [[0.0, 1.0, 0.0, 1.0]])
+
+    def test_curves_property(self):
+        curves = self._make_lines([0.0, 1.0])
+        index = self._make_one(curves)
+        self.assertEqual(index.curves, tuple(curves))
+
+    def test___dict___property(self):
+        index = self._make_one(self._make_lines([0.0]))
+        props_dict = index.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()), ['_boxes', '_curves', '_tree'])
+        self.assertIs(props_dict['_curves'], index._curves)
+
+    def test___len__(self):
+        index = self._make_one(self._make_lines([0.0, 1.0, 2.0]))
+        self.assertEqual(len(index), 3)
+
+    def test___repr__(self):
+        index = self._make_one(self._make_lines([0.0, 1.0]))
+        self.assertEqual(repr(index), '<CurveIndex (num_curves=2)>')
+
+    def test_query_box(self):
+        index = self._make_one(self._make_lines([0.0, 1.0, 2.0, 3.0]))
+        result = index.query_box(0.5, 2.0, 0.5, 2.0)
+        self.assertEqual(result.tolist(), [1, 2])
+        result = index.query_box(0.5, 0.75, 0.5, 2.0)
+        self.assertEqual(result.tolist(), [])
+
+    def test_query_box_many(self):
+        x_vals = np.linspace(0.0, 1.0, 33)
+        index = self._make_one(self._make_lines(x_vals))
+        result = index.query_box(0.3, 0.6, 0.25, 0.5)
+        expected = np.where((0.3 <= x_vals) & (x_vals <= 0.6))[0]
+        self.assertEqual(result.tolist(), expected.tolist())
+
+    def test_query_intersections(self):
+        import bezier
+
+        index = self._make_one(self._make_lines([0.25, 0.5, 2.0]))
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        curve = bezier.Curve(nodes, degree=2)
+
+        patch = mock.patch(
+            'bezier.curve.intersect_many',
+            wraps=bezier.curve.intersect_many)
+        with patch as mocked:
+            curve_indices, points, failed = index.query_intersections(
+                curve)
+            # Make sure the curve with a disjoint bounding box is pruned.
+            curves_a, curves_b = mocked.call_args[0]
+            self.assertEqual(curves_a, list(index.curves[:2]))
+            self.assertEqual(curves_b, [curve, curve])
+
+        self.assertEqual(curve_indices.tolist(), [0, 1])
+        expected = np.asfortranarray([
+            [0.25, 0.375],
+            [0.5, 0.5],
+        ])
+        self.assertEqual(points, expected)
+        self.assertEqual(failed.shape, (0,))
+
+    def test_query_intersections_none(self):
+        import bezier
+
+        index = self._make_one(self._make_lines([0.25, 0.5]))
+        nodes = np.asfortranarray([
+            [0.0, 2.0],
+            [1.0, 2.0],
+        ])
+        curve = bezier.Curve(nodes, degree=1)
+        curve_indices, points, failed = index.query_intersections(curve)
+        self.assertEqual(curve_indices.shape, (0,))
+        self.assertEqual(points.shape, (0, 2))
+        self.assertEqual(failed.shape, (0,))
+
+    def test_query_intersections_failed(self):
+        import bezier
+
+        index = self._make_one([
+            bezier.Curve(np.asfortranarray([
+                [0.0, 0.5],
+                [1.0, 0.5],
+            ]), degree=1),
+            bezier.Curve(np.asfortranarray([
+                [0.0, 0.375],
+                [1.0, 0.375],
+            ]), degree=1),
+        ])
+        # NOTE: The first indexed curve is tangent to ``curve``.
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ]), degree=2)
+        strategy = bezier.curve.IntersectionStrategy.algebraic
+        curve_indices, points, failed = index.query_intersections(
+            curve, strategy=strategy)
+        self.assertEqual(curve_indices.tolist(), [1, 1])
+        self.assertEqual(points.shape, (2, 2))
+        self.assertEqual(failed.tolist(), [0])
+
+    def test_query_intersections_non_curve(self):
+        index = self._make_one(self._make_lines([0.25]))
+        with self.assertRaises(TypeError):
+            index.query_intersections(object())
+
+    def test_query_point(self):
+        import bezier
+
+        curves = self._make_lines([0.25, 0.5])
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 1.0],
+            [1.0, 0.0],
+        ])
+        curves.append(bezier.Curve(nodes, degree=2))
+        index = self._make_one(curves)
+
+        point = np.asfortranarray([[0.25, 0.375]])
+        curve_indices, s_vals = index.query_point(point)
+        self.assertEqual(curve_indices.tolist(), [0, 2])
+        self.assertEqual(s_vals, np.asfortranarray([0.375, 0.25]))
+
+        point = np.asfortranarray([[0.5, 0.25]])
+        curve_indices, s_vals = index.query_point(point)
+        self.assertEqual(curve_indices.tolist(), [1])
+        self.assertEqual(s_vals, np.asfortranarray([0.25]))
+
+    def test_query_point_none(self):
+        index = self._make_one(self._make_lines([0.25, 0.5]))
+        point = np.asfortranarray([[3.0, 0.5]])
+        curve_indices, s_vals = index.query_point(point)
+        self.assertEqual(curve_indices.shape, (0,))
+        self.assertEqual(s_vals.shape, (0,))
+
+    def test_query_point_bad_shape(self):
+        index = self._make_one(self._make_lines([0.25]))
+        point = np.asfortranarray([[0.25, 0.5, 0.0]])
+        with self.assertRaises(ValueError):
+            index.query_point(point)
@@ -145,3 +145,77 @@ class TestCurvedPolygon(utils.NumPyTestCase):
         new_axis_mock.assert_not_called()
         add_patch_mock.assert_called_once_with(
             ax, color, pts_per_edge, *curved_poly._edges)
+
+    def test_tessellate(self):
+        curved_poly = self._make_default()
+        vertices, segments = curved_poly.tessellate(3)
+        expected = np.asfortranarray([
+            [0.5, -0.5],
+            [1.0, 0.0],
+            [0.5, 0.5],
+            [0.0, 0.0],
+        ])
+        self.assertEqual(vertices, expected)
+        self.assertEqual(
+            segments.tolist(), [[0, 1], [1, 2], [2, 3], [3, 0]])
+
+    def test_tessellate_bad_pts_per_edge(self):
+        curved_poly = self._make_default()
+        with self.assertRaises(ValueError):
+            curved_poly.tessellate(1)
+
+
+class Test_tessellate_polygons(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(polygons, pts_per_edge, **kwargs):
+        from bezier import curved_polygon
+
+        return curved_polygon.tessellate_polygons(
+            polygons, pts_per_edge, **kwargs)
+
+    @staticmethod
+    def _make_triangle(shift):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]) + shift
+        edges = [
+            bezier.Curve(nodes[[0, 1], :], 1),
+            bezier.Curve(nodes[[1, 2], :], 1),
+            bezier.Curve(nodes[[2, 0], :], 1),
+        ]
+        return bezier.CurvedPolygon(*edges)
+
+    def test_chunks(self):
+        polygons = (self._make_triangle(shift) for shift in range(3))
+        chunks = list(self._call_function_under_test(
+            polygons, 3, max_vertices=12))
+        self.assertEqual(len(chunks), 2)
+
+        vertices, segments, polygon_ids = chunks[0]
+        self.assertEqual(vertices.shape, (12, 2))
+        expected_vertices, _ = self._make_triangle(1).tessellate(3)
+        self.assertEqual(
+            np.asfortranarray(vertices[6:, :]), expected_vertices)
+        self.assertEqual(segments[5, :].tolist(), [5, 0])
+        self.assertEqual(segments[11, :].tolist(), [11, 6])
+        self.assertEqual(polygon_ids.tolist(), [0] * 6 + [1] * 6)
+
+        vertices, segments, polygon_ids = chunks[1]
+        expected_vertices, expected_segments = (
+            self._make_triangle(2).tessellate(3))
+        self.assertEqual(vertices, expected_vertices)
+        self.assertEqual(segments.tolist(), expected_segments.tolist())
+        self.assertEqual(polygon_ids.tolist(), [2] * 6)
+
+    def test_empty(self):
+        chunks = self._call_function_under_test([], 4)
+        self.assertEqual(list(chunks), [])
+
+    def test_bad_pts_per_edge(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test([], 1)
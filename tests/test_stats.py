@@ -0,0 +1,270 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+import numpy as np
+
+
+class TestRecord(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import stats
+
+        return stats.Record
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        record = self._make_one('intersect')
+        self.assertEqual(record.name, 'intersect')
+        self.assertIsNone(record.seconds)
+        self.assertEqual(record.counters, {})
+
+    def test___repr__(self):
+        record = self._make_one('curve.locate')
+        self.assertEqual(repr(record), '<Record (name=\'curve.locate\')>')
+
+
+class TestStats(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import stats
+
+        return stats.Stats
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        stats = self._make_one()
+        self.assertEqual(stats.counters, {})
+        self.assertEqual(stats.timings, {})
+        self.assertEqual(stats.calls, [])
+        self.assertIsNone(stats._callback)
+        self.assertEqual(stats._stack, [])
+
+    def test_increment(self):
+        stats = self._make_one()
+        stats.increment('a')
+        stats.increment('a', 3)
+        stats.increment('b', 2)
+        self.assertEqual(stats.counters, {'a': 4, 'b': 2})
+
+    def test_maximum(self):
+        stats = self._make_one()
+        stats.maximum('a', 3)
+        stats.maximum('a', 1)
+        self.assertEqual(stats.counters, {'a': 3})
+        stats.maximum('a', 5)
+        self.assertEqual(stats.counters, {'a': 5})
+
+    def test_record(self):
+        stats = self._make_one()
+        stats.increment('a')
+        with stats.record('outer') as outer:
+            stats.increment('a', 2)
+            with stats.record('inner') as inner:
+                stats.increment('a', 4)
+                stats.maximum('b', 7)
+            with stats.record('inner'):
+                pass
+
+        self.assertEqual(stats.counters, {'a': 7, 'b': 7})
+        self.assertEqual(outer.counters, {'a': 6, 'b': 7})
+        self.assertEqual(inner.counters, {'a': 4, 'b': 7})
+        self.assertEqual(
+            [record.name for record in stats.calls],
+            ['inner', 'inner', 'outer'])
+        self.assertIs(stats.calls[0], inner)
+        self.assertIs(stats.calls[2], outer)
+        self.assertGreaterEqual(outer.seconds, inner.seconds)
+        self.assertEqual(sorted(stats.timings), ['inner', 'outer'])
+        self.assertEqual(stats.timings['outer'], outer.seconds)
+        self.assertEqual(stats._stack, [])
+
+    def test_record_failure(self):
+        stats = self._make_one()
+        with self.assertRaises(KeyError):
+            with stats.record('bad'):
+                raise KeyError('broken')
+
+        record, = stats.calls
+        self.assertEqual(record.name, 'bad')
+        self.assertIsNotNone(record.seconds)
+        self.assertEqual(stats._stack, [])
+
+    def test_record_callback(self):
+        callback = mock.Mock(spec=[])
+        stats = self._make_one(callback=callback)
+        with stats.record('intersect') as record:
+            pass
+
+        self.assertEqual(stats.calls, [])
+        callback.assert_called_once_with(record)
+
+
+class Test_active(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test():
+        from bezier import stats
+
+        return stats.active()
+
+    def test_disabled(self):
+        self.assertIsNone(self._call_function_under_test())
+
+    def test_enabled(self):
+        from bezier import stats as stats_mod
+
+        with stats_mod.collect() as stats:
+            self.assertIs(self._call_function_under_test(), stats)
+
+
+class Test_collect(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(**kwargs):
+        from bezier import stats
+
+        return stats.collect(**kwargs)
+
+    def test_it(self):
+        from bezier import stats as stats_mod
+
+        with self._call_function_under_test() as stats:
+            self.assertIsInstance(stats, stats_mod.Stats)
+            self.assertIs(stats_mod._ACTIVE, stats)
+            self.assertIsNone(stats._callback)
+
+        self.assertIsNone(stats_mod._ACTIVE)
+
+    def test_callback(self):
+        callback = mock.Mock(spec=[])
+        with self._call_function_under_test(callback=callback) as stats:
+            self.assertIs(stats._callback, callback)
+
+    def test_nested(self):
+        from bezier import stats as stats_mod
+
+        with self._call_function_under_test() as outer:
+            with self._call_function_under_test() as inner:
+                self.assertIs(stats_mod._ACTIVE, inner)
+            self.assertIs(stats_mod._ACTIVE, outer)
+
+        self.assertIsNone(stats_mod._ACTIVE)
+
+    def test_failure(self):
+        from bezier import stats as stats_mod
+
+        with self.assertRaises(ValueError):
+            with self._call_function_under_test():
+                raise ValueError('broken')
+
+        self.assertIsNone(stats_mod._ACTIVE)
+
+    def test_curve_locate(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ]), degree=2)
+        point = np.asfortranarray([[1.0, 1.0]])
+        with self._call_function_under_test() as stats:
+            self.assertEqual(curve.locate(point), 0.5)
+
+        record, = stats.calls
+        self.assertEqual(record.name, 'curve.locate')
+        self.assertEqual(sorted(stats.timings), ['curve.locate'])
+
+    def test_surface_locate(self):
+        import bezier
+
+        surface = bezier.Surface(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]), degree=1)
+        point = np.asfortranarray([[0.25, 0.5]])
+        with self._call_function_under_test() as stats:
+            self.assertEqual(surface.locate(point), (0.25, 0.5))
+
+        record, = stats.calls
+        self.assertEqual(record.name, 'surface.locate')
+
+    def test_intersect(self):
+        import bezier
+
+        curve1 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 1.0],
+        ]), degree=1)
+        curve2 = bezier.Curve(np.asfortranarray([
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]), degree=1)
+        with self._call_function_under_test() as stats:
+            curve1.intersect(curve2)
+            bezier.intersect_many([curve1], [curve2])
+
+        self.assertEqual(
+            [record.name for record in stats.calls],
+            ['intersect', 'intersect'])
+
+
+class Test_timed(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(name):
+        from bezier import stats
+
+        return stats.timed(name)
+
+    def test_disabled(self):
+        from bezier import stats as stats_mod
+
+        def func(value, scale=1):
+            """Scale a value."""
+            self.assertIsNone(stats_mod.active())
+            return scale * value
+
+        wrapped = self._call_function_under_test('scale')(func)
+        self.assertEqual(wrapped.__name__, 'func')
+        self.assertEqual(wrapped.__doc__, 'Scale a value.')
+        self.assertEqual(wrapped(3, scale=2), 6)
+
+    def test_enabled(self):
+        from bezier import stats as stats_mod
+
+        def func(value):
+            stats_mod.active().increment('calls')
+            return 2 * value
+
+        wrapped = self._call_function_under_test('double')(func)
+        with stats_mod.collect() as stats:
+            self.assertEqual(wrapped(4), 8)
+            self.assertEqual(wrapped(5), 10)
+
+        self.assertEqual(stats.counters, {'calls': 2})
+        self.assertEqual(len(stats.calls), 2)
+        for record in stats.calls:
+            self.assertEqual(record.name, 'double')
+            self.assertEqual(record.counters, {'calls': 1})
@@ -0,0 +1,321 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tests import utils
+
+
+class Test__align(unittest.TestCase):
+
+    @staticmethod
+    def _call_function_under_test(offset):
+        from bezier import storage
+
+        return storage._align(offset)
+
+    def test_it(self):
+        self.assertEqual(self._call_function_under_test(0), 0)
+        self.assertEqual(self._call_function_under_test(1), 64)
+        self.assertEqual(self._call_function_under_test(64), 64)
+        self.assertEqual(self._call_function_under_test(65), 128)
+
+
+class _TempDirMixin(object):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _filename(self, name='shapes.bin'):
+        return os.path.join(self.temp_dir, name)
+
+
+class Test_save_shapes(_TempDirMixin, utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(filename, shapes):
+        from bezier import storage
+
+        return storage.save_shapes(filename, shapes)
+
+    def test_layout(self):
+        import bezier
+        from bezier import storage
+
+        linear = bezier.Curve(np.asfortranarray([
+            [0.0, 1.0],
+            [2.0, 3.0],
+        ]), 1)
+        quadratic = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [2.0, 0.0],
+        ]), 2)
+        filename = self._filename()
+        self._call_function_under_test(
+            filename, [linear, quadratic, linear])
+
+        header, data_start = storage._read_header(filename)
+        self.assertEqual(data_start % 64, 0)
+        self.assertEqual(header['num_shapes'], 3)
+        self.assertEqual(len(header['groups']), 2)
+        group = header['groups'][0]
+        self.assertEqual(group['kind'], 'curve')
+        self.assertEqual(group['degree'], 1)
+        self.assertEqual(group['count'], 2)
+        for group in header['groups']:
+            self.assertEqual(group['nodes_offset'] % 64, 0)
+            self.assertEqual(group['params_offset'] % 64, 0)
+
+        # The nodes in each group are stored contiguously.
+        with open(filename, 'rb') as file_obj:
+            file_obj.seek(data_start + header['groups'][0]['nodes_offset'])
+            raw = file_obj.read(2 * 4 * 8)
+        values = np.frombuffer(raw, dtype='<f8')
+        self.assertEqual(values.tolist(), [0.0, 2.0, 1.0, 3.0] * 2)
+
+    def test_bad_shape(self):
+        with self.assertRaises(TypeError):
+            self._call_function_under_test(self._filename(), [object()])
+
+
+class TestShapeLibrary(_TempDirMixin, utils.NumPyTestCase):
+
+    CURVE_NODES = np.asfortranarray([
+        [0.0, 0.0, 1.0],
+        [1.0, 2.0, 1.0],
+        [3.0, 1.0, 0.0],
+        [4.0, 0.0, 0.0],
+    ])
+    SURFACE_NODES = np.asfortranarray([
+        [0.0, 0.0],
+        [0.5, -0.25],
+        [1.0, 0.0],
+        [0.25, 0.5],
+        [0.75, 0.75],
+        [0.0, 1.0],
+    ])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import storage
+
+        return storage.ShapeLibrary
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_shapes(self):
+        import bezier
+
+        curve = bezier.Curve(self.CURVE_NODES, 3)
+        sub_curve = curve.specialize(0.25, 0.75)
+        surface = bezier.Surface(
+            self.SURFACE_NODES, 2, base_x=0.5, base_y=0.25, width=0.125)
+        edge0 = bezier.Curve(np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, -1.0],
+            [2.0, 0.0],
+        ]), 2)
+        edge1 = bezier.Curve(np.asfortranarray([
+            [2.0, 0.0],
+            [0.0, 0.0],
+        ]), 1)
+        polygon = bezier.CurvedPolygon(edge0, edge1)
+        return [curve, surface, polygon, sub_curve]
+
+    def _save(self, shapes):
+        import bezier
+
+        filename = self._filename()
+        bezier.save_shapes(filename, shapes)
+        return filename
+
+    def test_constructor(self):
+        filename = self._save(self._make_shapes())
+        library = self._make_one(filename)
+        self.assertEqual(library._filename, filename)
+        self.assertTrue(library._copy)
+        # Curves (3D), surfaces and the (2D) curves from the curved polygon
+        # edges.
+        self.assertEqual(library._groups, (
+            ('curve', 3, 3),
+            ('surface', 2, 2),
+            ('curve', 2, 2),
+            ('curve', 1, 2),
+        ))
+        self.assertEqual(
+            library._records.tolist(),
+            [[0, 0], [1, 0], [-1, 0], [0, 1]])
+        self.assertEqual(library._polygon_offsets.tolist(), [0, 2])
+        self.assertEqual(
+            library._polygon_edges.tolist(), [[2, 0], [3, 0]])
+
+        # The blocks are (read-only) views of the memory-mapped file.
+        for block in library._nodes:
+            self.assertFalse(block.flags.owndata)
+            self.assertFalse(block.flags.writeable)
+
+    def test_constructor_empty(self):
+        library = self._make_one(self._save([]))
+        self.assertEqual(len(library), 0)
+        self.assertEqual(library._groups, ())
+
+    def test_constructor_bad_magic(self):
+        filename = self._filename()
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(b'not a shape library')
+
+        with self.assertRaises(ValueError):
+            self._make_one(filename)
+
+    def test_constructor_bad_version(self):
+        import json
+
+        from bezier import storage
+
+        filename = self._filename()
+        header = json.dumps({'version': 1000}).encode('utf-8')
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(storage._MAGIC)
+            file_obj.write(np.asarray(len(header), dtype='<u8').tobytes())
+            file_obj.write(header)
+
+        with self.assertRaises(ValueError):
+            self._make_one(filename)
+
+    def test_filename_property(self):
+        filename = self._save([])
+        library = self._make_one(filename)
+        self.assertEqual(library.filename, filename)
+
+    def test___dict___property(self):
+        library = self._make_one(self._save([]))
+        props_dict = library.__dict__
+        expected_keys = [
+            '_copy', '_filename', '_groups', '_nodes', '_params',
+            '_polygon_edges', '_polygon_offsets', '_records',
+        ]
+        self.assertEqual(sorted(props_dict.keys()), expected_keys)
+        self.assertIs(props_dict['_records'], library._records)
+
+    def test___len__(self):
+        library = self._make_one(self._save(self._make_shapes()))
+        self.assertEqual(len(library), 4)
+
+    def test___repr__(self):
+        library = self._make_one(self._save(self._make_shapes()))
+        self.assertEqual(
+            repr(library), '<ShapeLibrary (num_shapes=4, num_groups=4)>')
+
+    def test___getitem__curve(self):
+        import bezier
+
+        shapes = self._make_shapes()
+        library = self._make_one(self._save(shapes))
+        curve = library[3]
+        self.assertIsInstance(curve, bezier.Curve)
+        self.assertEqual(curve._nodes, shapes[3]._nodes)
+        self.assertEqual(curve._degree, 3)
+        self.assertEqual(curve._start, 0.25)
+        self.assertEqual(curve._end, 0.75)
+        self.assertIs(curve._root, curve)
+        # The nodes are a copy (not a view of the file).
+        self.assertTrue(curve._nodes.flags.owndata)
+        self.assertTrue(curve._nodes.flags.writeable)
+
+    def test___getitem__no_copy(self):
+        shapes = self._make_shapes()
+        library = self._make_one(self._save(shapes), copy=False)
+        surface = library[1]
+        self.assertEqual(surface._nodes, self.SURFACE_NODES)
+        # The nodes are a (read-only) view of the file.
+        self.assertFalse(surface._nodes.flags.owndata)
+        self.assertFalse(surface._nodes.flags.writeable)
+        self.assertTrue(surface._nodes.flags.f_contiguous)
+        self.assertEqual(
+            surface.evaluate_cartesian(0.25, 0.25),
+            shapes[1].evaluate_cartesian(0.25, 0.25))
+
+        polygon = library[2]
+        for edge in polygon._edges:
+            self.assertFalse(edge._nodes.flags.owndata)
+
+    def test___getitem__surface(self):
+        import bezier
+
+        library = self._make_one(self._save(self._make_shapes()))
+        surface = library[1]
+        self.assertIsInstance(surface, bezier.Surface)
+        self.assertEqual(surface._nodes, self.SURFACE_NODES)
+        self.assertEqual(surface._degree, 2)
+        self.assertEqual(surface._base_x, 0.5)
+        self.assertEqual(surface._base_y, 0.25)
+        self.assertEqual(surface._width, 0.125)
+
+    def test___getitem__curved_polygon(self):
+        import bezier
+
+        shapes = self._make_shapes()
+        library = self._make_one(self._save(shapes))
+        polygon = library[2]
+        self.assertIsInstance(polygon, bezier.CurvedPolygon)
+        self.assertEqual(polygon.num_sides, 2)
+        for edge, expected in zip(polygon._edges, shapes[2]._edges):
+            self.assertEqual(edge._nodes, expected._nodes)
+            self.assertEqual(edge._degree, expected._degree)
+
+    def test___getitem__negative(self):
+        library = self._make_one(self._save(self._make_shapes()))
+        curve = library[-1]
+        self.assertEqual(curve._start, 0.25)
+
+    def test___getitem__out_of_range(self):
+        library = self._make_one(self._save(self._make_shapes()))
+        with self.assertRaises(IndexError):
+            library.__getitem__(4)
+        with self.assertRaises(IndexError):
+            library.__getitem__(-5)
+
+    def test___iter__(self):
+        shapes = self._make_shapes()
+        library = self._make_one(self._save(shapes))
+        loaded = list(library)
+        self.assertEqual(len(loaded), 4)
+        for shape, expected in zip(loaded, shapes):
+            self.assertIsInstance(shape, type(expected))
+
+    def test_many(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ])
+        surfaces = [
+            bezier.Surface(nodes + float(index), 1)
+            for index in range(100)
+        ]
+        library = self._make_one(self._save(surfaces))
+        self.assertEqual(len(library), 100)
+        self.assertEqual(len(library._groups), 1)
+        self.assertEqual(library[57]._nodes, nodes + 57.0)
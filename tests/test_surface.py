@@ -569,6 +569,38 @@ class TestSurface(utils.NumPyTestCase):
             self, call, self.UNIT_TRIANGLE,
             color='black', marker='o', linestyle='None')
 
+    def test_tessellate(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        vertices, triangles = surface.tessellate(pts_per_edge=4)
+        self.assertEqual(vertices.shape, (10, 2))
+        self.assertEqual(triangles.shape, (9, 3))
+        param_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0 / 3.0, 1.0 / 3.0],
+            [0.0, 1.0],
+        ])
+        expected = surface.evaluate_cartesian_multi(param_vals)
+        self.assertTrue(np.allclose(vertices[[0, 5, 9], :], expected))
+
+    def test_tessellate_adaptive(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        vertices, triangles = surface.tessellate(tolerance=0.02)
+        # The estimated error is ~0.45, so 5 intervals are required.
+        self.assertEqual(vertices.shape, (21, 2))
+        self.assertEqual(triangles.shape, (25, 3))
+
+        linear = self._make_one(self.UNIT_TRIANGLE, 1)
+        vertices, triangles = linear.tessellate(tolerance=0.125)
+        self.assertEqual(vertices, self.UNIT_TRIANGLE)
+        self.assertEqual(triangles.tolist(), [[0, 1, 2]])
+
+    def test_tessellate_bad_resolution(self):
+        surface = self._make_one(self.UNIT_TRIANGLE, 1)
+        with self.assertRaises(ValueError):
+            surface.tessellate()
+        with self.assertRaises(ValueError):
+            surface.tessellate(pts_per_edge=2, tolerance=0.5)
+
     def _subdivide_helper(self, nodes, expected_a, expected_b,
                           expected_c, expected_d):
         klass = self._get_target_class()
@@ -800,6 +832,27 @@ class TestSurface(utils.NumPyTestCase):
         self.assertEqual(surface.degree, 5)
         self._subdivide_points_check(surface)
 
+    def test_subdivide_cached(self):
+        surface = self._make_one(self.UNIT_TRIANGLE, 1)
+        cache = surface.enable_subdivision_cache()
+
+        sub_surfaces = surface.subdivide()
+        for index, sub_surface in enumerate(sub_surfaces):
+            self.assertEqual(sub_surface._subdivision, (cache, 1, index))
+        self.assertEqual(surface.subdivide(), sub_surfaces)
+
+        sub_surface_b = sub_surfaces[1]
+        grandchildren = sub_surface_b.subdivide()
+        self.assertEqual(grandchildren[2]._subdivision, (cache, 2, 6))
+        self.assertEqual(grandchildren[2]._base_x, 0.25)
+        self.assertEqual(grandchildren[2]._width, -0.25)
+        self.assertEqual(sub_surface_b.subdivide(), grandchildren)
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        new_sub_surfaces = surface.subdivide()
+        self.assertIsNot(new_sub_surfaces[0], sub_surfaces[0])
+
     def test__compute_valid_valid_linear(self):
         surface = self._make_one(self.UNIT_TRIANGLE, 1)
         self.assertTrue(surface._compute_valid())
@@ -917,6 +970,8 @@ class TestSurface(utils.NumPyTestCase):
             '_area': None,
             '_edges': None,
             '_is_valid': None,
+            '_subdivision': None,
+            '_bbox': None,
         }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``surface``.
@@ -930,6 +985,27 @@ class TestSurface(utils.NumPyTestCase):
         self.assertEqual(s, 0.5)
         self.assertEqual(t, 0.25)
 
+    def test_locate_cached(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        cache = surface.enable_subdivision_cache()
+        point = surface.evaluate_cartesian(0.5, 0.25)
+        # Make sure the compiled version (if present) is not used.
+        patch = mock.patch(
+            'bezier._surface_multi.locate_point',
+            side_effect=AssertionError)
+        with patch:
+            self.assertEqual(surface.locate(point), (0.5, 0.25))
+            num_entries = len(cache)
+            self.assertGreater(num_entries, 0)
+
+            # A second call is served entirely from the cache.
+            no_subdivide = mock.patch.object(
+                type(surface), '_subdivide', side_effect=AssertionError)
+            with no_subdivide:
+                self.assertEqual(surface.locate(point), (0.5, 0.25))
+
+        self.assertEqual(len(cache), num_entries)
+
     def test_locate_no_verify(self):
         surface = self._make_one(self.QUADRATIC, 2)
         s = 0.125
@@ -963,6 +1039,72 @@ class TestSurface(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             surface.locate(point2)
 
+    def test_locate_multi(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        param_vals = np.asfortranarray([
+            [0.5, 0.25],
+            [0.125, 0.125],
+        ])
+        points = surface.evaluate_cartesian_multi(param_vals)
+        points = np.vstack([points, [[10.0, 10.0]]])
+        result = surface.locate_multi(points)
+        self.assertEqual(np.asfortranarray(result[:2, :]), param_vals)
+        self.assertTrue(np.all(np.isnan(result[2, :])))
+
+    def test_locate_multi_cached(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        cache = surface.enable_subdivision_cache()
+        param_vals = np.asfortranarray([
+            [0.5, 0.25],
+            [0.125, 0.125],
+        ])
+        points = surface.evaluate_cartesian_multi(param_vals)
+        points = np.vstack([points, [[10.0, 10.0]]])
+        patch = mock.patch(
+            'bezier._surface_multi.locate_point_multi',
+            side_effect=AssertionError)
+        with patch:
+            result = surface.locate_multi(points)
+            num_entries = len(cache)
+            self.assertGreater(num_entries, 0)
+
+            no_subdivide = mock.patch.object(
+                type(surface), '_subdivide', side_effect=AssertionError)
+            with no_subdivide:
+                new_result = surface.locate_multi(points)
+
+        for values in (result, new_result):
+            self.assertEqual(np.asfortranarray(values[:2, :]), param_vals)
+            self.assertTrue(np.all(np.isnan(values[2, :])))
+        self.assertEqual(len(cache), num_entries)
+
+    def test_locate_multi_no_verify(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        points = surface.evaluate_cartesian_multi(
+            np.asfortranarray([[0.5, 0.25]]))
+        patch = mock.patch(
+            'bezier._surface_multi.locate_point_multi',
+            return_value=mock.sentinel.result)
+        with patch as mocked:
+            result = surface.locate_multi(points, _verify=False)
+            self.assertIs(result, mock.sentinel.result)
+            mocked.assert_called_once_with(surface, points)
+
+    def test_locate_multi_bad_dimension(self):
+        nodes = np.asfortranarray([[0.0], [1.0], [2.0]])
+        surface = self._make_one(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            surface.locate_multi(None)
+
+    def test_locate_multi_bad_points(self):
+        surface = self._make_one(self.QUADRATIC, 2)
+        points1 = np.asfortranarray([0.0, 1.0])
+        points2 = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            surface.locate_multi(points1)
+        with self.assertRaises(ValueError):
+            surface.locate_multi(points2)
+
     def _basic_intersect_helper(self, **kwargs):
         import bezier
 
@@ -1082,3 +1224,200 @@ class TestSurface(utils.NumPyTestCase):
         main_vals = surface.evaluate_cartesian_multi(self.REF_TRIANGLE3)
         sub_vals = elevated.evaluate_cartesian_multi(self.REF_TRIANGLE3)
         self.assertEqual(main_vals, sub_vals)
+
+
+class Test_evaluate_surfaces(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes_stack, degree, param_vals, **kwargs):
+        from bezier import surface
+
+        return surface.evaluate_surfaces(
+            nodes_stack, degree, param_vals, **kwargs)
+
+    def test_it(self):
+        import bezier
+
+        nodes_stack = np.stack([
+            utils.get_random_nodes(shape=(6, 2), seed=seed, num_bits=8)
+            for seed in (11, 12, 13)
+        ])
+        param_vals = np.asfortranarray([
+            [0.0, 0.0],
+            [0.25, 0.5],
+            [0.125, 0.75],
+            [1.0, 0.0],
+        ])
+        result = self._call_function_under_test(nodes_stack, 2, param_vals)
+        self.assertEqual(result.shape, (3, 4, 2))
+        for index in range(3):
+            surface = bezier.Surface(
+                np.asfortranarray(nodes_stack[index, :, :]), 2)
+            expected = surface.evaluate_cartesian_multi(param_vals)
+            self.assertTrue(np.allclose(
+                result[index, :, :], expected, atol=0.0, rtol=0.5**50))
+
+    def test_three_dimensional(self):
+        nodes_stack = np.asfortranarray([[
+            [0.0, 0.0, 1.0],
+            [1.0, 0.0, 2.0],
+            [0.0, 1.0, 3.0],
+        ]])
+        param_vals = np.asfortranarray([[0.25, 0.5]])
+        result = self._call_function_under_test(nodes_stack, 1, param_vals)
+        expected = np.asarray([[[0.25, 0.5, 2.25]]])
+        self.assertTrue(np.all(result == expected))
+
+    def test_bad_nodes(self):
+        param_vals = np.asfortranarray([[0.25, 0.5]])
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                np.zeros((3, 2)), 1, param_vals)
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                np.zeros((1, 4, 2)), 1, param_vals)
+
+    def test_bad_param_vals(self):
+        nodes_stack = np.zeros((1, 3, 2))
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                nodes_stack, 1, np.asfortranarray([0.25, 0.5]))
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                nodes_stack, 1, np.asfortranarray([[0.25, 0.5, 0.25]]))
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(
+                nodes_stack, 1, np.asfortranarray([[0.75, 0.5]]))
+
+    def test_without_verify(self):
+        nodes_stack = np.asfortranarray([[
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]])
+        param_vals = np.asfortranarray([[0.75, 0.5]])
+        result = self._call_function_under_test(
+            nodes_stack, 1, param_vals, _verify=False)
+        expected = np.asarray([[[0.75, 0.5]]])
+        self.assertTrue(np.all(result == expected))
+
+
+class Test_tessellate_surfaces(utils.NumPyTestCase):
+
+    UNIT_TRIANGLE = np.asfortranarray([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+    ])
+
+    @staticmethod
+    def _call_function_under_test(surfaces, **kwargs):
+        from bezier import surface
+
+        return surface.tessellate_surfaces(surfaces, **kwargs)
+
+    def test_chunks(self):
+        import bezier
+
+        surfaces = (
+            bezier.Surface(self.UNIT_TRIANGLE + shift, 1)
+            for shift in range(3))
+        chunks = list(self._call_function_under_test(
+            surfaces, pts_per_edge=3, max_vertices=12))
+        self.assertEqual(len(chunks), 2)
+
+        vertices, triangles, surface_ids = chunks[0]
+        self.assertEqual(vertices.shape, (12, 2))
+        expected_vertices, expected_triangles = bezier.Surface(
+            self.UNIT_TRIANGLE + 1.0, 1).tessellate(pts_per_edge=3)
+        self.assertEqual(
+            np.asfortranarray(vertices[6:, :]), expected_vertices)
+        self.assertEqual(
+            triangles[4:, :].tolist(), (expected_triangles + 6).tolist())
+        self.assertEqual(surface_ids.tolist(), [0] * 4 + [1] * 4)
+
+        vertices, triangles, surface_ids = chunks[1]
+        self.assertEqual(vertices.shape, (6, 2))
+        self.assertEqual(surface_ids.tolist(), [2] * 4)
+
+    def test_adaptive(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [0.5, 0.5],
+            [1.0, 0.0],
+            [0.0, 0.5],
+            [0.5, 0.5],
+            [0.0, 1.0],
+        ])
+        surfaces = [
+            bezier.Surface(self.UNIT_TRIANGLE, 1),
+            bezier.Surface(nodes, 2),
+        ]
+        chunks = list(self._call_function_under_test(
+            surfaces, tolerance=0.125))
+        self.assertEqual(len(chunks), 1)
+        vertices, triangles, surface_ids = chunks[0]
+        # The linear surface needs 1 interval, the quadratic needs 2.
+        self.assertEqual(vertices.shape, (3 + 6, 2))
+        self.assertEqual(surface_ids.tolist(), [0] + [1] * 4)
+        self.assertEqual(triangles[0, :].tolist(), [0, 1, 2])
+        self.assertEqual(triangles.min(), 0)
+        self.assertEqual(triangles.max(), 8)
+
+    def test_mixed_dimension(self):
+        import bezier
+
+        nodes3d = np.asfortranarray([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+        ])
+        surfaces = [
+            bezier.Surface(self.UNIT_TRIANGLE, 1),
+            bezier.Surface(nodes3d, 1),
+        ]
+        chunks = self._call_function_under_test(surfaces, pts_per_edge=2)
+        with self.assertRaises(ValueError):
+            list(chunks)
+
+    def test_bad_resolution(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test([], pts_per_edge=1)
+        with self.assertRaises(ValueError):
+            self._call_function_under_test([], tolerance=0.0)
+
+
+class Test_surfaces_from_buffer(utils.NumPyTestCase):
+
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import surface
+
+        return surface.surfaces_from_buffer(nodes, degree)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([
+            [0.0, 0.0],
+            [1.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [3.0, 1.0],
+            [1.0, 3.0],
+        ])
+        surfaces = self._call_function_under_test(nodes, 1)
+        self.assertEqual(len(surfaces), 2)
+        for index, surface in enumerate(surfaces):
+            self.assertIsInstance(surface, bezier.Surface)
+            self.assertEqual(surface.degree, 1)
+            self.assertIs(surface._nodes.base, nodes)
+            self.assertEqual(
+                surface.evaluate_barycentric(0.0, 1.0, 0.0).tolist(),
+                [[2.0 * index + 1.0, float(index)]])
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((4, 2), order='F'), 1)